@@ -0,0 +1,147 @@
+"""Compare OCRing each block of a page on its own, the `individual_blocks` OCR mode, with OCRing
+the blocks stitched into one image (`OCR_INDIVIDUAL_BLOCKS_BATCHED`), on OCR time per page and
+per-block text.
+
+The blocks of each page are the text blocks tesseract finds on it. Texts are compared with
+whitespace normalized; `accuracy` is the mean text accuracy of the batched text of a block against
+its per-block text.
+
+Examples:
+  uv run --active --frozen --no-sync scripts/performance/individual_blocks_ocr_bench.py \
+    --doc example-docs/pdf/DA-1p.pdf --doc example-docs/img/layout-parser-paper-fast.jpg
+
+  uv run --active --frozen --no-sync scripts/performance/individual_blocks_ocr_bench.py \
+    --doc-dir scans/ --padding 12 --json-out individual_blocks.json
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PIL import Image, ImageSequence  # noqa: E402
+
+from unstructured.metrics.text_extraction import calculate_accuracy  # noqa: E402
+from unstructured.partition.pdf_image.block_ocr import ocr_blocks  # noqa: E402
+from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_images  # noqa: E402
+from unstructured.partition.utils.ocr_models.tesseract_ocr import OCRAgentTesseract  # noqa: E402
+
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp"}
+
+
+def _load_pages(doc: Path) -> list[Image.Image]:
+    if doc.suffix.lower() == ".pdf":
+        return list(convert_pdf_to_images(filename=str(doc)))
+    with Image.open(doc) as images:
+        return [frame.convert("RGB") for frame in ImageSequence.Iterator(images)]
+
+
+def _collect_docs(doc_args: list[str], doc_dir_args: list[str]) -> list[Path]:
+    docs = [Path(d) for d in doc_args]
+    for doc_dir in doc_dir_args:
+        docs.extend(
+            p
+            for p in sorted(Path(doc_dir).rglob("*"))
+            if p.suffix.lower() in IMAGE_SUFFIXES | {".pdf"}
+        )
+    if not docs:
+        raise ValueError("Provide at least one --doc or --doc-dir")
+    return list(dict.fromkeys(docs))
+
+
+def _per_block(agent: OCRAgentTesseract, image: Image.Image, block_coords, padding: int):
+    return [
+        agent.get_text_from_image(
+            image.crop((x1 - padding, y1 - padding, x2 + padding, y2 + padding))
+        )
+        for x1, y1, x2, y2 in block_coords
+    ]
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.split())
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="individual_blocks OCR batching benchmark")
+    parser.add_argument("--doc", action="append", default=[], help="PDF or image (repeatable)")
+    parser.add_argument("--doc-dir", action="append", default=[], help="Directory of documents")
+    parser.add_argument("--padding", type=int, default=0, help="IMAGE_CROP_PAD of the crops")
+    parser.add_argument("--language", default="eng")
+    parser.add_argument("--json-out", default="", help="Optional JSON output path")
+    args = parser.parse_args()
+
+    agent = OCRAgentTesseract(language=args.language)
+    page_times: dict[str, list[float]] = {"per_block": [], "batched": []}
+    block_matches: list[bool] = []
+    block_accuracies: list[float] = []
+    results: list[dict[str, object]] = []
+
+    for doc in _collect_docs(args.doc, args.doc_dir):
+        pages = _load_pages(doc)
+        print(f"FILE {doc} pages={len(pages)}", flush=True)
+        for page_number, image in enumerate(pages, start=1):
+            block_coords = agent.get_layout_elements_from_image(image).element_coords
+            texts: dict[str, list[str]] = {}
+            for name, ocr in (
+                ("per_block", lambda: _per_block(agent, image, block_coords, args.padding)),
+                ("batched", lambda: ocr_blocks(image, block_coords, agent, args.padding)),
+            ):
+                start = time.perf_counter()
+                texts[name] = ocr()
+                page_times[name].append(time.perf_counter() - start)
+
+            matches = [
+                _normalize(a) == _normalize(b) for a, b in zip(texts["per_block"], texts["batched"])
+            ]
+            accuracies = [
+                calculate_accuracy(_normalize(b), _normalize(a)) if _normalize(a) else 1.0
+                for a, b in zip(texts["per_block"], texts["batched"])
+            ]
+            block_matches.extend(matches)
+            block_accuracies.extend(accuracies)
+            row = {
+                "doc": str(doc),
+                "page": page_number,
+                "blocks": len(block_coords),
+                "per_block_s": page_times["per_block"][-1],
+                "batched_s": page_times["batched"][-1],
+                "matching_blocks": sum(matches),
+                "mean_accuracy": statistics.mean(accuracies) if accuracies else 1.0,
+            }
+            results.append(row)
+            print(
+                f"  page={page_number} blocks={row['blocks']} "
+                f"per_block={row['per_block_s']:.3f}s batched={row['batched_s']:.3f}s "
+                f"matching={row['matching_blocks']}/{row['blocks']} "
+                f"accuracy={row['mean_accuracy']:.4f}",
+                flush=True,
+            )
+
+    summary = {
+        "mean_per_block_page_s": statistics.mean(page_times["per_block"]),
+        "mean_batched_page_s": statistics.mean(page_times["batched"]),
+        "matching_block_rate": (sum(block_matches) / len(block_matches) if block_matches else 1.0),
+        "mean_block_accuracy": statistics.mean(block_accuracies) if block_accuracies else 1.0,
+    }
+    print(
+        "SUMMARY "
+        f"per_block={summary['mean_per_block_page_s']:.4f}s/page "
+        f"batched={summary['mean_batched_page_s']:.4f}s/page "
+        f"matching_blocks={summary['matching_block_rate']:.2%} "
+        f"accuracy={summary['mean_block_accuracy']:.4f}",
+        flush=True,
+    )
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps({"pages": results, "summary": summary}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
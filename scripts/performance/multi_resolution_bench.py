@@ -0,0 +1,141 @@
+"""Compare hi_res partitioning at a single render DPI with multi-resolution rendering.
+
+With `PDF_LAYOUT_RENDER_DPI` set below the page image DPI, layout detection runs on pages
+rendered at that lower DPI and only the region of each page that needs OCR is rendered at the
+page image DPI. This script times both modes per document and scores the text of each
+multi-resolution run against the single-DPI run (or a reference transcript) with
+`unstructured.metrics.text_extraction`.
+
+Examples:
+  uv run --active --frozen --no-sync scripts/performance/multi_resolution_bench.py \
+    --doc example-docs/pdf/layout-parser-paper.pdf --layout-dpi 72 --layout-dpi 100
+
+  # score every mode against reference transcripts (<doc stem>.txt in the directory)
+  uv run --active --frozen --no-sync scripts/performance/multi_resolution_bench.py \
+    --doc-dir scans/ --ground-truth-dir scans/transcripts/ --pdf-image-dpi 300
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from unstructured.metrics.text_extraction import (  # noqa: E402
+    calculate_accuracy,
+    calculate_percent_missing_text,
+)
+from unstructured.partition.pdf import partition_pdf  # noqa: E402
+
+SINGLE_DPI = "single_dpi"
+
+
+def _partition(doc: Path, pdf_image_dpi: int, layout_dpi: int) -> tuple[float, str]:
+    os.environ["PDF_LAYOUT_RENDER_DPI"] = str(layout_dpi)
+    start = time.perf_counter()
+    elements = partition_pdf(str(doc), strategy="hi_res", pdf_image_dpi=pdf_image_dpi)
+    elapsed = time.perf_counter() - start
+    return elapsed, "\n\n".join(el.text for el in elements if el.text)
+
+
+def _collect_docs(doc_args: list[str], doc_dir_args: list[str]) -> list[Path]:
+    docs = [Path(d) for d in doc_args]
+    for doc_dir in doc_dir_args:
+        docs.extend(p for p in sorted(Path(doc_dir).rglob("*")) if p.suffix.lower() == ".pdf")
+    if not docs:
+        raise ValueError("Provide at least one --doc or --doc-dir")
+    return list(dict.fromkeys(docs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Multi-resolution hi_res rendering benchmark")
+    parser.add_argument("--doc", action="append", default=[], help="PDF (repeatable)")
+    parser.add_argument("--doc-dir", action="append", default=[], help="Directory of PDFs")
+    parser.add_argument(
+        "--layout-dpi",
+        action="append",
+        type=int,
+        default=[],
+        help="Layout detection DPI to compare (repeatable), default 72",
+    )
+    parser.add_argument("--pdf-image-dpi", type=int, default=200, help="Page image DPI")
+    parser.add_argument(
+        "--ground-truth-dir",
+        default="",
+        help="Directory of <doc stem>.txt transcripts; defaults to the single-DPI output",
+    )
+    parser.add_argument("--json-out", default="", help="Optional JSON output path")
+    args = parser.parse_args()
+
+    modes = {SINGLE_DPI: 0}
+    modes.update({f"layout_dpi_{dpi}": dpi for dpi in args.layout_dpi or [72]})
+    previous_layout_dpi = os.environ.get("PDF_LAYOUT_RENDER_DPI")
+    results: list[dict[str, object]] = []
+    times: dict[str, list[float]] = {mode: [] for mode in modes}
+    accuracies: dict[str, list[float]] = {mode: [] for mode in modes}
+    missing: dict[str, list[float]] = {mode: [] for mode in modes}
+
+    try:
+        for doc in _collect_docs(args.doc, args.doc_dir):
+            print(f"FILE {doc}", flush=True)
+            texts: dict[str, str] = {}
+            mode_rows: dict[str, dict[str, float]] = {}
+            for mode, layout_dpi in modes.items():
+                elapsed, texts[mode] = _partition(doc, args.pdf_image_dpi, layout_dpi)
+                times[mode].append(elapsed)
+                mode_rows[mode] = {"elapsed_s": elapsed}
+
+            ground_truth_path = Path(args.ground_truth_dir) / f"{doc.stem}.txt"
+            if args.ground_truth_dir and ground_truth_path.exists():
+                reference = ground_truth_path.read_text()
+            else:
+                reference = texts[SINGLE_DPI]
+            for mode in modes:
+                accuracy = calculate_accuracy(texts[mode], reference)
+                percent_missing = calculate_percent_missing_text(texts[mode], reference)
+                accuracies[mode].append(accuracy)
+                missing[mode].append(percent_missing)
+                row = mode_rows[mode]
+                row.update({"accuracy": accuracy, "percent_missing_text": percent_missing})
+                print(
+                    f"  {mode} time={row['elapsed_s']:.2f}s accuracy={accuracy:.4f} "
+                    f"missing={percent_missing:.4f}",
+                    flush=True,
+                )
+            results.append({"doc": str(doc), **mode_rows})
+    finally:
+        if previous_layout_dpi is None:
+            os.environ.pop("PDF_LAYOUT_RENDER_DPI", None)
+        else:
+            os.environ["PDF_LAYOUT_RENDER_DPI"] = previous_layout_dpi
+
+    summary: dict[str, object] = {}
+    print("SUMMARY", flush=True)
+    for mode in modes:
+        stats = {
+            "total_s": sum(times[mode]),
+            "median_doc_s": statistics.median(times[mode]),
+            "speedup": sum(times[SINGLE_DPI]) / sum(times[mode]),
+            "mean_accuracy": statistics.mean(accuracies[mode]),
+            "mean_percent_missing_text": statistics.mean(missing[mode]),
+        }
+        summary[mode] = stats
+        print(
+            f"  {mode} total={stats['total_s']:.2f}s median_doc={stats['median_doc_s']:.2f}s "
+            f"speedup={stats['speedup']:.2f}x accuracy={stats['mean_accuracy']:.4f} "
+            f"missing={stats['mean_percent_missing_text']:.4f}",
+            flush=True,
+        )
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps({"docs": results, "summary": summary}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
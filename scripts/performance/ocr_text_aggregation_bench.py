@@ -0,0 +1,103 @@
+"""Compare aggregating OCR text into layout blocks one block at a time with the single-pass
+aggregation `merge_out_layout_with_ocr_layout` uses, on synthetic pages.
+
+Each page has `--words` OCR words laid out in lines across the page and `--blocks` layout blocks
+without text tiling it, so every word falls in one block.
+
+Examples:
+  uv run --active --frozen --no-sync scripts/performance/ocr_text_aggregation_bench.py
+
+  uv run --active --frozen --no-sync scripts/performance/ocr_text_aggregation_bench.py \
+    --words 20000 --blocks 1000 --repeats 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+from unstructured_inference.inference.elements import TextRegions  # noqa: E402
+
+from unstructured.partition.pdf_image.pdfminer_processing import (  # noqa: E402
+    aggregate_embedded_text_by_block,
+    aggregate_embedded_text_by_blocks,
+)
+
+PAGE_WIDTH = 1700
+PAGE_HEIGHT = 2200
+
+
+def _synthetic_page(n_words: int, n_blocks: int) -> tuple[TextRegions, TextRegions]:
+    words_per_line = max(int(np.sqrt(n_words * PAGE_WIDTH / PAGE_HEIGHT)), 1)
+    n_lines = -(-n_words // words_per_line)
+    word_width = PAGE_WIDTH / words_per_line
+    line_height = PAGE_HEIGHT / n_lines
+    index = np.arange(n_words)
+    x1 = (index % words_per_line) * word_width
+    y1 = (index // words_per_line) * line_height
+    words = TextRegions(
+        element_coords=np.stack(
+            [x1 + 1, y1 + 1, x1 + word_width - 2, y1 + line_height - 2], axis=1
+        ),
+        texts=np.array([f"word{i}" for i in index], dtype=object),
+    )
+
+    blocks_per_row = max(int(np.sqrt(n_blocks)), 1)
+    n_rows = -(-n_blocks // blocks_per_row)
+    block_width = PAGE_WIDTH / blocks_per_row
+    block_height = PAGE_HEIGHT / n_rows
+    index = np.arange(n_blocks)
+    bx1 = (index % blocks_per_row) * block_width
+    by1 = (index // blocks_per_row) * block_height
+    blocks = TextRegions(
+        element_coords=np.stack([bx1, by1, bx1 + block_width, by1 + block_height], axis=1),
+        texts=np.array([None] * n_blocks, dtype=object),
+    )
+    return blocks, words
+
+
+def _per_block(blocks: TextRegions, words: TextRegions) -> list[str]:
+    return [
+        aggregate_embedded_text_by_block(blocks.slice([i]), words)[0] for i in range(len(blocks))
+    ]
+
+
+def _single_pass(blocks: TextRegions, words: TextRegions) -> list[str]:
+    return aggregate_embedded_text_by_blocks(blocks, words)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="OCR text aggregation benchmark")
+    parser.add_argument("--words", type=int, default=5000, help="OCR words per page")
+    parser.add_argument("--blocks", type=int, default=300, help="Layout blocks per page")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    blocks, words = _synthetic_page(args.words, args.blocks)
+    print(f"PAGE words={len(words)} blocks={len(blocks)}", flush=True)
+
+    results: dict[str, list[str]] = {}
+    for name, aggregate in (("per_block", _per_block), ("single_pass", _single_pass)):
+        times = []
+        for _ in range(args.repeats):
+            start = time.perf_counter()
+            results[name] = aggregate(blocks, words)
+            times.append(time.perf_counter() - start)
+        print(
+            f"  {name} median={statistics.median(times):.4f}s min={min(times):.4f}s",
+            flush=True,
+        )
+
+    if results["per_block"] != results["single_pass"]:
+        raise SystemExit("single_pass texts differ from per_block texts")
+    print("  texts match", flush=True)
+
+
+if __name__ == "__main__":
+    main()
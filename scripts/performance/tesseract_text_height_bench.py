@@ -0,0 +1,156 @@
+"""Compare the tesseract text height estimators on OCR time per page and text accuracy.
+
+"ocr" OCRs each page once to measure the text height and OCRs it again when the page has to be
+zoomed; "connected_components" measures the text height before OCR so each page is OCRed once.
+
+Examples:
+  uv run --active --frozen --no-sync scripts/performance/tesseract_text_height_bench.py \
+    --doc example-docs/pdf/DA-1p.pdf --doc example-docs/img/layout-parser-paper-fast.jpg
+
+  # score both estimators against reference transcripts (<doc stem>.txt in the directory)
+  uv run --active --frozen --no-sync scripts/performance/tesseract_text_height_bench.py \
+    --doc-dir scans/ --ground-truth-dir scans/transcripts/
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Any
+from unittest.mock import patch
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from PIL import Image, ImageSequence  # noqa: E402
+
+from unstructured.metrics.text_extraction import calculate_accuracy  # noqa: E402
+from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_images  # noqa: E402
+from unstructured.partition.utils.constants import (  # noqa: E402
+    TESSERACT_TEXT_HEIGHT_ESTIMATOR_CONNECTED_COMPONENTS,
+    TESSERACT_TEXT_HEIGHT_ESTIMATOR_OCR,
+)
+from unstructured.partition.utils.ocr_models.tesseract_ocr import OCRAgentTesseract  # noqa: E402
+
+ESTIMATORS = [
+    TESSERACT_TEXT_HEIGHT_ESTIMATOR_OCR,
+    TESSERACT_TEXT_HEIGHT_ESTIMATOR_CONNECTED_COMPONENTS,
+]
+IMAGE_SUFFIXES = {".jpg", ".jpeg", ".png", ".tif", ".tiff", ".bmp"}
+
+
+def _load_pages(doc: Path) -> list[Image.Image]:
+    if doc.suffix.lower() == ".pdf":
+        return list(convert_pdf_to_images(filename=str(doc)))
+    with Image.open(doc) as images:
+        return [frame.convert("RGB") for frame in ImageSequence.Iterator(images)]
+
+
+def _ocr_page(agent: OCRAgentTesseract, image: Image.Image, estimator: str) -> dict[str, Any]:
+    os.environ["TESSERACT_TEXT_HEIGHT_ESTIMATOR"] = estimator
+    with patch.object(
+        agent,
+        "image_to_data_with_character_confidence_filter",
+        wraps=agent.image_to_data_with_character_confidence_filter,
+    ) as mock_ocr:
+        start = time.perf_counter()
+        regions = agent.get_layout_from_image(image)
+        elapsed = time.perf_counter() - start
+    return {
+        "elapsed_s": elapsed,
+        "tesseract_runs": mock_ocr.call_count,
+        "text": " ".join(regions.texts.tolist()),
+    }
+
+
+def _collect_docs(doc_args: list[str], doc_dir_args: list[str]) -> list[Path]:
+    docs = [Path(d) for d in doc_args]
+    for doc_dir in doc_dir_args:
+        docs.extend(
+            p
+            for p in sorted(Path(doc_dir).rglob("*"))
+            if p.suffix.lower() in IMAGE_SUFFIXES | {".pdf"}
+        )
+    if not docs:
+        raise ValueError("Provide at least one --doc or --doc-dir")
+    return list(dict.fromkeys(docs))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tesseract text height estimator benchmark")
+    parser.add_argument("--doc", action="append", default=[], help="PDF or image (repeatable)")
+    parser.add_argument("--doc-dir", action="append", default=[], help="Directory of documents")
+    parser.add_argument(
+        "--ground-truth-dir",
+        default="",
+        help="Directory of <doc stem>.txt transcripts; defaults to the 'ocr' output as reference",
+    )
+    parser.add_argument("--language", default="eng")
+    parser.add_argument("--json-out", default="", help="Optional JSON output path")
+    args = parser.parse_args()
+
+    agent = OCRAgentTesseract(language=args.language)
+    previous_estimator = os.environ.get("TESSERACT_TEXT_HEIGHT_ESTIMATOR")
+    results: list[dict[str, object]] = []
+    page_times: dict[str, list[float]] = {estimator: [] for estimator in ESTIMATORS}
+    page_runs: dict[str, list[int]] = {estimator: [] for estimator in ESTIMATORS}
+    accuracies: dict[str, list[float]] = {estimator: [] for estimator in ESTIMATORS}
+
+    try:
+        for doc in _collect_docs(args.doc, args.doc_dir):
+            pages = _load_pages(doc)
+            print(f"FILE {doc} pages={len(pages)}", flush=True)
+            texts: dict[str, list[str]] = {estimator: [] for estimator in ESTIMATORS}
+            for image in pages:
+                for estimator in ESTIMATORS:
+                    row = _ocr_page(agent, image, estimator)
+                    page_times[estimator].append(row["elapsed_s"])
+                    page_runs[estimator].append(row["tesseract_runs"])
+                    texts[estimator].append(str(row["text"]))
+
+            doc_row: dict[str, object] = {"doc": str(doc), "pages": len(pages)}
+            ground_truth_path = Path(args.ground_truth_dir) / f"{doc.stem}.txt"
+            if args.ground_truth_dir and ground_truth_path.exists():
+                reference = ground_truth_path.read_text()
+            else:
+                reference = " ".join(texts[TESSERACT_TEXT_HEIGHT_ESTIMATOR_OCR])
+            for estimator in ESTIMATORS:
+                accuracy = calculate_accuracy(" ".join(texts[estimator]), reference)
+                accuracies[estimator].append(accuracy)
+                doc_row[estimator] = {"accuracy": accuracy}
+                print(f"  {estimator} accuracy={accuracy:.4f}", flush=True)
+            results.append(doc_row)
+    finally:
+        if previous_estimator is None:
+            os.environ.pop("TESSERACT_TEXT_HEIGHT_ESTIMATOR", None)
+        else:
+            os.environ["TESSERACT_TEXT_HEIGHT_ESTIMATOR"] = previous_estimator
+
+    summary: dict[str, object] = {}
+    print("SUMMARY", flush=True)
+    for estimator in ESTIMATORS:
+        stats = {
+            "mean_page_s": statistics.mean(page_times[estimator]),
+            "median_page_s": statistics.median(page_times[estimator]),
+            "mean_tesseract_runs_per_page": statistics.mean(page_runs[estimator]),
+            "mean_accuracy": statistics.mean(accuracies[estimator]),
+        }
+        summary[estimator] = stats
+        print(
+            f"  {estimator} mean_page={stats['mean_page_s']:.4f}s "
+            f"median_page={stats['median_page_s']:.4f}s "
+            f"runs_per_page={stats['mean_tesseract_runs_per_page']:.2f} "
+            f"accuracy={stats['mean_accuracy']:.4f}",
+            flush=True,
+        )
+
+    if args.json_out:
+        Path(args.json_out).write_text(json.dumps({"docs": results, "summary": summary}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""Time the XY-cut reading order sort against the number of boxes on a page.
+
+Each synthetic page has `n` text-line boxes in `--columns` columns of small print, the layout of
+dense tables and multi-column OCR output. For every size the iterative `recursive_xy_cut_swapped`
+(the default `sort_page_elements` path) is timed against the recursive implementation it replaced,
+which is kept below as a reference, and both orders are checked to be identical.
+
+Examples:
+  uv run --active --frozen --no-sync scripts/performance/xycut_sort_bench.py
+
+  uv run --active --frozen --no-sync scripts/performance/xycut_sort_bench.py \
+    --sizes 1000 5000 20000 --columns 3 --repeats 5
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import numpy as np  # noqa: E402
+
+from unstructured.partition.utils.xycut import (  # noqa: E402
+    projection_by_bboxes,
+    recursive_xy_cut_swapped,
+    split_projection_profile,
+)
+
+PAGE_WIDTH = 1700
+
+
+def _synthetic_page(n_boxes: int, n_columns: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    column_width = PAGE_WIDTH // n_columns
+    lines_per_column = -(-n_boxes // n_columns)
+    index = np.arange(n_boxes)
+    column = index // lines_per_column
+    line = index % lines_per_column
+    x1 = column * column_width + 20 + rng.integers(0, 10, n_boxes)
+    x2 = (column + 1) * column_width - 20 - rng.integers(0, column_width // 2, n_boxes)
+    y1 = line * 12 + 40
+    y2 = y1 + 9
+    boxes = np.stack([x1, y1, x2, y2], axis=1)
+    return boxes[rng.permutation(n_boxes)]
+
+
+def _reference_xy_cut_swapped(boxes: np.ndarray, indices: np.ndarray, res: list[int]):
+    """The recursive XY-cut `recursive_xy_cut_swapped` used before it was made iterative."""
+    _indices = boxes[:, 0].argsort()
+    x_sorted_boxes = boxes[_indices]
+    x_sorted_indices = indices[_indices]
+    pos_x = split_projection_profile(projection_by_bboxes(boxes=x_sorted_boxes, axis=0), 0, 1)
+    if not pos_x:
+        return
+    for c0, c1 in zip(*pos_x):
+        _indices = (c0 <= x_sorted_boxes[:, 0]) & (x_sorted_boxes[:, 0] < c1)
+        x_sorted_boxes_chunk = x_sorted_boxes[_indices]
+        x_sorted_indices_chunk = x_sorted_indices[_indices]
+        _indices = x_sorted_boxes_chunk[:, 1].argsort()
+        y_sorted_boxes_chunk = x_sorted_boxes_chunk[_indices]
+        y_sorted_indices_chunk = x_sorted_indices_chunk[_indices]
+        pos_y = split_projection_profile(
+            projection_by_bboxes(boxes=y_sorted_boxes_chunk, axis=1), 0, 1
+        )
+        if not pos_y:
+            continue
+        if len(pos_y[0]) == 1:
+            res.extend(y_sorted_indices_chunk)
+            continue
+        for r0, r1 in zip(*pos_y):
+            _indices = (r0 <= y_sorted_boxes_chunk[:, 1]) & (y_sorted_boxes_chunk[:, 1] < r1)
+            _reference_xy_cut_swapped(
+                y_sorted_boxes_chunk[_indices], y_sorted_indices_chunk[_indices], res
+            )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="XY-cut sort benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 1000, 5000, 10000, 20000])
+    parser.add_argument("--columns", type=int, default=2, help="Text columns per page")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    # -- compile the numba projection used by the reference before timing it --
+    _reference_xy_cut_swapped(_synthetic_page(10, 1), np.arange(10), [])
+
+    for n_boxes in args.sizes:
+        boxes = _synthetic_page(n_boxes, args.columns)
+        print(f"PAGE boxes={n_boxes} columns={args.columns}", flush=True)
+        orders: dict[str, list[int]] = {}
+        for name, xy_cut in (
+            ("recursive", _reference_xy_cut_swapped),
+            ("iterative", recursive_xy_cut_swapped),
+        ):
+            times = []
+            for _ in range(args.repeats):
+                res: list[int] = []
+                start = time.perf_counter()
+                try:
+                    xy_cut(boxes, np.arange(n_boxes), res)
+                except RecursionError:
+                    print(f"  {name} RecursionError", flush=True)
+                    break
+                times.append(time.perf_counter() - start)
+            else:
+                orders[name] = [int(i) for i in res]
+                print(
+                    f"  {name} median={statistics.median(times):.4f}s min={min(times):.4f}s",
+                    flush=True,
+                )
+
+        if len(orders) == 2 and orders["recursive"] != orders["iterative"]:
+            raise SystemExit("iterative order differs from recursive order")
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ from unstructured.documents.elements import (
     Header,
     ListItem,
     NarrativeText,
+    PageBreak,
     Text,
     Title,
 )
@@ -82,6 +83,17 @@ class Describe_set_element_hierarchy:
         assert result[4].metadata.parent_id == "2"  # Title1 is under Header0
         assert result[5].metadata.parent_id == "4"  # Text2 is under Title1, which is under Header0
 
+    def it_continues_the_hierarchy_across_batches_that_share_a_stack(self):
+        stack: list[Element] = []
+        first_batch = [Title(element_id="0", text="Title0"), Text(element_id="1", text="Text0")]
+        second_batch = [Text(element_id="2", text="Text1"), Title(element_id="3", text="Title1")]
+
+        set_element_hierarchy(first_batch, stack=stack)
+        result = set_element_hierarchy(second_batch, stack=stack)
+
+        assert result[0].metadata.parent_id == "0"  # Text1 is under Title0 from the first batch
+        assert result[1].metadata.parent_id is None
+
     def it_applies_category_depth_when_element_category_is_the_same(self):
         elements = [
             Title(element_id="0", text="Title0", metadata=ElementMetadata(category_depth=1)),
@@ -518,6 +530,23 @@ def test_assign_hash_ids_leaves_unknown_parent_id_unchanged():
     assert orphan.metadata.parent_id == external_parent_id
 
 
+def test_assign_hash_ids_carries_page_sequence_numbers_across_batches():
+    def document() -> list[list[Element]]:
+        return [
+            [Text(text="Element", metadata=ElementMetadata(page_number=n)), PageBreak(text="")]
+            for n in (1, 2, 3)
+        ]
+
+    expected = _assign_hash_ids([e for batch in document() for e in batch])
+    page_seq_counts: dict[int | None, int] = {}
+    elements = [
+        e for batch in document() for e in _assign_hash_ids(batch, page_seq_counts=page_seq_counts)
+    ]
+
+    assert [e.id for e in elements] == [e.id for e in expected]
+    assert len({e.id for e in elements}) == 6
+
+
 def test_partition_html_parent_child_relationships_preserved_with_hash_ids():
     """Integration: partition_html with unique_element_ids=False preserves parent-child links."""
     from unstructured.partition.html import partition_html
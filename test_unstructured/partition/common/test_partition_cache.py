@@ -0,0 +1,151 @@
+"""Test suite for `unstructured.partition.common.partition_cache` module."""
+
+from __future__ import annotations
+
+import io
+import os
+from unittest.mock import patch
+
+import pytest
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.documents.elements import ElementMetadata, NarrativeText, Title
+from unstructured.partition import auto
+from unstructured.partition.auto import partition
+from unstructured.partition.common.partition_cache import (
+    PartitionCache,
+    apply_call_metadata,
+    hash_content,
+    partition_cache_key,
+)
+
+
+def _elements(text: str = "Hello"):
+    title = Title("Title", metadata=ElementMetadata(filename="a.txt"))
+    body = NarrativeText(text, metadata=ElementMetadata(filename="a.txt", parent_id=title.id))
+    return [title, body]
+
+
+def test_partition_cache_round_trips_elements(tmp_path):
+    cache = PartitionCache(str(tmp_path))
+    elements = _elements()
+
+    assert cache.get("ab" * 32) is None
+    cache.put("ab" * 32, elements)
+    cached = cache.get("ab" * 32)
+
+    assert cached == elements
+    assert cache.stats() == {"hits": 1, "misses": 1, "stores": 1, "evictions": 0}
+
+
+def test_partition_cache_leaves_no_temporary_files(tmp_path):
+    cache = PartitionCache(str(tmp_path))
+
+    cache.put("cd" * 32, _elements())
+
+    assert [name for _, _, names in os.walk(tmp_path) for name in names] == ["cd" * 32 + ".json"]
+
+
+def test_partition_cache_evicts_least_recently_used_entries(tmp_path):
+    cache = PartitionCache(str(tmp_path), max_bytes=0)
+    keys = [f"{i:02d}" * 32 for i in range(3)]
+    for i, key in enumerate(keys):
+        cache.put(key, _elements())
+        os.utime(cache._entry_path(key), (i, i))
+    entry_size = os.path.getsize(cache._entry_path(keys[0]))
+    # -- reading the oldest entry makes it the most recently used one --
+    cache.get(keys[0])
+
+    cache.max_bytes = 2 * entry_size
+    cache.put("ff" * 32, _elements())
+
+    assert cache.evictions == 2
+    assert cache.get(keys[0]) is not None
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) is None
+    assert cache.get("ff" * 32) is not None
+
+
+def test_partition_cache_discards_unreadable_entries(tmp_path):
+    cache = PartitionCache(str(tmp_path))
+    path = cache._entry_path("ee" * 32)
+    os.makedirs(os.path.dirname(path))
+    with open(path, "w") as f:
+        f.write("{not json")
+
+    assert cache.get("ee" * 32) is None
+    assert not os.path.exists(path)
+
+
+def test_hash_content_is_the_same_for_filename_and_file():
+    filename = example_doc_path("fake-text.txt")
+    with open(filename, "rb") as f:
+        f.seek(3)
+        assert hash_content(file=f) == hash_content(filename=filename)
+        assert f.tell() == 3
+
+
+def test_partition_cache_key_ignores_per_call_arguments():
+    key = partition_cache_key("0" * 64, {"strategy": "fast", "metadata_filename": "a.txt"})
+
+    assert key == partition_cache_key("0" * 64, {"strategy": "fast", "metadata_filename": "b.txt"})
+    assert key != partition_cache_key("0" * 64, {"strategy": "hi_res"})
+    assert key != partition_cache_key("1" * 64, {"strategy": "fast"})
+
+
+def test_partition_cache_key_depends_on_environment_settings(monkeypatch):
+    key = partition_cache_key("0" * 64, {"strategy": "hi_res"})
+    monkeypatch.setenv("PDF_RENDER_DPI", "123")
+
+    assert partition_cache_key("0" * 64, {"strategy": "hi_res"}) != key
+
+
+@pytest.mark.parametrize(
+    "call_args",
+    [
+        {"language_fallback": lambda text: None},
+        {"extract_image_block_types": ["Image"], "extract_image_block_to_payload": False},
+        {"date_from_file_object": True},
+    ],
+)
+def test_partition_cache_key_is_none_for_uncacheable_calls(call_args):
+    assert partition_cache_key("0" * 64, call_args) is None
+
+
+def test_apply_call_metadata_rehashes_ids_and_parent_links():
+    elements = _elements()
+    original_ids = [el.id for el in elements]
+
+    apply_call_metadata(elements, metadata_filename="/docs/b.txt")
+
+    assert [el.metadata.filename for el in elements] == ["b.txt", "b.txt"]
+    assert elements[0].metadata.file_directory == "/docs"
+    assert elements[1].metadata.parent_id == elements[0].id
+    assert all(el.id != original_id for el, original_id in zip(elements, original_ids))
+
+
+def test_partition_returns_cached_elements_without_partitioning(tmp_path):
+    cache = PartitionCache(str(tmp_path / "cache"))
+    filename = example_doc_path("fake-text.txt")
+    elements = partition(filename, partition_cache=cache)
+
+    with patch.object(auto._PartitionerLoader, "get") as get_partitioner, open(filename, "rb") as f:
+        cached_elements = partition(file=f, metadata_filename="copy.txt", partition_cache=cache)
+
+    get_partitioner.assert_not_called()
+    assert cache.stats()["hits"] == 1
+    assert [el.text for el in cached_elements] == [el.text for el in elements]
+    assert {el.metadata.filename for el in cached_elements} == {"copy.txt"}
+    assert all(el.metadata.filetype == "text/plain" for el in cached_elements)
+
+
+def test_partition_uses_the_cache_in_partition_cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("PARTITION_CACHE_DIR", str(tmp_path))
+    file = io.BytesIO(b"Some text to partition.")
+
+    partition(file=file)
+    with patch.object(auto._PartitionerLoader, "get") as get_partitioner:
+        file.seek(0)
+        partition(file=file)
+
+    get_partitioner.assert_not_called()
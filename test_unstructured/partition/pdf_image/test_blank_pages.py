@@ -0,0 +1,65 @@
+import io
+
+import pytest
+from PIL import Image, ImageDraw
+from pypdf import PdfReader, PdfWriter
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.partition.pdf_image import blank_pages
+from unstructured.partition.pdf_image.pdfminer_utils import (
+    PDFMinerPage,
+    open_pdfminer_pages_generator,
+)
+
+DOC = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+
+
+def _pdf_with_a_blank_second_page() -> bytes:
+    reader = PdfReader(DOC)
+    writer = PdfWriter()
+    writer.add_page(reader.pages[0])
+    writer.add_blank_page(width=612, height=792)
+    writer.add_page(reader.pages[1])
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def _page_with_text() -> Image.Image:
+    image = Image.new("RGB", (850, 1100), "white")
+    draw = ImageDraw.Draw(image)
+    for y in range(100, 1000, 40):
+        draw.text((100, y), "Lorem ipsum dolor sit amet, consectetur adipiscing elit", fill="black")
+    return image
+
+
+def test_ink_coverage_of_a_white_page_is_zero():
+    assert blank_pages.ink_coverage(Image.new("RGB", (850, 1100), "white")) == 0.0
+
+
+def test_ink_coverage_of_a_page_with_text_exceeds_the_blank_page_threshold():
+    assert blank_pages.ink_coverage(_page_with_text()) > 0.001
+
+
+def test_find_blank_pages_of_a_multi_page_image(tmp_path):
+    filename = str(tmp_path / "scan.tiff")
+    frames = [_page_with_text(), Image.new("RGB", (850, 1100), "white"), _page_with_text()]
+    frames[0].save(filename, save_all=True, append_images=frames[1:])
+
+    assert blank_pages.find_blank_pages(filename=filename, is_image=True) == {1: 0.0}
+    assert blank_pages.find_blank_pages(filename=filename, is_image=True, page_indices=[0, 2]) == {}
+
+
+@pytest.mark.parametrize("with_pdfminer_pages", [False, True])
+def test_find_blank_pages_of_a_pdf(with_pdfminer_pages):
+    data = _pdf_with_a_blank_second_page()
+    pdfminer_pages = (
+        [
+            PDFMinerPage(page_layout, [], [])
+            for _, page_layout in open_pdfminer_pages_generator(io.BytesIO(data))
+        ]
+        if with_pdfminer_pages
+        else None
+    )
+
+    assert blank_pages.find_blank_pages(file=data, pdfminer_pages=pdfminer_pages) == {1: 0.0}
@@ -0,0 +1,75 @@
+import numpy as np
+from PIL import Image, ImageDraw
+from unstructured_inference.inference.elements import TextRegions
+
+from unstructured.partition.pdf_image import block_ocr
+
+
+class InkBoxAgent:
+    """Recognizes every dark square of an image as the word named after its gray level."""
+
+    def __init__(self):
+        self.layout_calls = 0
+        self.text_calls = 0
+
+    def get_layout_from_image(self, image: Image.Image) -> TextRegions:
+        self.layout_calls += 1
+        pixels = np.asarray(image.convert("L"))
+        coords, texts = [], []
+        for level in np.unique(pixels[pixels < 128]):
+            ys, xs = np.nonzero(pixels == level)
+            coords.append([xs.min(), ys.min(), xs.max() + 1, ys.max() + 1])
+            texts.append(f"word{level}")
+        return TextRegions(
+            element_coords=np.array(coords, dtype=float).reshape(-1, 4),
+            texts=np.array(texts, dtype=object),
+        )
+
+    def get_text_from_image(self, image: Image.Image) -> str:
+        self.text_calls += 1
+        return " ".join(self.get_layout_from_image(image).texts.tolist())
+
+
+def _page_with_blocks(block_coords: np.ndarray) -> Image.Image:
+    image = Image.new("RGB", (1000, 1200), "white")
+    draw = ImageDraw.Draw(image)
+    for level, (x1, y1, x2, y2) in enumerate(block_coords, start=10):
+        draw.rectangle((x1 + 10, y1 + 10, x1 + 30, y1 + 30), fill=(level,) * 3)
+        draw.rectangle((x2 - 30, y2 - 30, x2 - 10, y2 - 10), fill=(level + 50,) * 3)
+    return image
+
+
+BLOCKS = np.array(
+    [[100, 100, 900, 300], [100, 350, 450, 700], [500, 350, 900, 700], [100, 800, 900, 1100]],
+    dtype=float,
+)
+
+
+def test_ocr_blocks_ocrs_the_blocks_in_one_call_and_maps_words_back_to_them():
+    agent = InkBoxAgent()
+
+    texts = block_ocr.ocr_blocks(_page_with_blocks(BLOCKS), BLOCKS, agent)
+
+    assert texts == ["word10 word60", "word11 word61", "word12 word62", "word13 word63"]
+    assert (agent.layout_calls, agent.text_calls) == (1, 0)
+
+
+def test_ocr_blocks_matches_ocring_each_block_on_its_own():
+    image = _page_with_blocks(BLOCKS)
+    agent = InkBoxAgent()
+    per_block_texts = [
+        agent.get_text_from_image(image.crop(tuple(coords + [-5, -5, 5, 5]))) for coords in BLOCKS
+    ]
+
+    assert block_ocr.ocr_blocks(image, BLOCKS, InkBoxAgent(), padding=5) == per_block_texts
+
+
+def test_ocr_blocks_falls_back_to_ocring_a_block_on_its_own(monkeypatch):
+    monkeypatch.setattr(block_ocr, "MAX_CANVAS_HEIGHT", 700)
+    agent = InkBoxAgent()
+
+    texts = block_ocr.ocr_blocks(_page_with_blocks(BLOCKS), BLOCKS, agent)
+
+    # -- the first two blocks share a canvas, the last two are too tall to share one --
+    assert texts == ["word10 word60", "word11 word61", "word12 word62", "word13 word63"]
+    assert (agent.layout_calls, agent.text_calls) == (3, 2)
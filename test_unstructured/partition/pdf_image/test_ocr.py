@@ -29,11 +29,14 @@ from unstructured.partition.utils.constants import (
     OCR_AGENT_TESSERACT,
     Source,
 )
+from unstructured.partition.utils.ocr_models import tesseract_ocr
 from unstructured.partition.utils.ocr_models.google_vision_ocr import OCRAgentGoogleVision
 from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.partition.utils.ocr_models.ocr_result_cache import OCRResultCache
 from unstructured.partition.utils.ocr_models.paddle_ocr import OCRAgentPaddle
 from unstructured.partition.utils.ocr_models.tesseract_ocr import (
     OCRAgentTesseract,
+    estimate_text_height,
     zoom_image,
 )
 
@@ -486,6 +489,55 @@ def test_get_table_tokens(mock_ocr_layout):
         assert table_tokens == expected_tokens
 
 
+def test_get_table_tokens_from_page_ocr(mock_ocr_layout):
+    # -- Token1 lies inside the crop, Token2 is mostly outside of it --
+    table_tokens = ocr.get_table_tokens_from_page_ocr(mock_ocr_layout, (10, 20, 41, 70))
+
+    assert table_tokens == [
+        {
+            "bbox": [5.0, 5.0, 25.0, 25.0],
+            "text": "Token1",
+            "span_num": 0,
+            "line_num": 0,
+            "block_num": 0,
+        },
+    ]
+
+
+@pytest.mark.parametrize(
+    ("page_ocr_regions", "expected_crop_ocr_calls"),
+    [
+        ([TextRegion.from_coords(x1=15, y1=25, x2=35, y2=45, text="Token1")], 0),
+        ([TextRegion.from_coords(x1=80, y1=80, x2=90, y2=90, text="Outside")], 1),
+    ],
+)
+def test_supplement_element_with_table_extraction_reuses_page_ocr(
+    page_ocr_regions, expected_crop_ocr_calls, mock_ocr_layout
+):
+    elements = LayoutElements(
+        element_coords=np.array([[10.0, 20.0, 50.0, 70.0]]),
+        texts=np.array(["foo"]),
+        sources=np.array(["yolox_sg"]),
+        element_class_ids=np.array([0]),
+        element_class_id_map={0: "Table"},
+    )
+    tables_agent = MagicMock()
+    tables_agent.predict.return_value = ""
+    ocr_agent = MagicMock()
+    ocr_agent.get_layout_from_image.return_value = mock_ocr_layout
+
+    ocr.supplement_element_with_table_extraction(
+        elements=elements,
+        image=Image.new("RGB", (100, 100)),
+        tables_agent=tables_agent,
+        ocr_agent=ocr_agent,
+        page_ocr_layout=TextRegions.from_list(page_ocr_regions),
+    )
+
+    assert ocr_agent.get_layout_from_image.call_count == expected_crop_ocr_calls
+    assert tables_agent.predict.call_args.kwargs["ocr_tokens"][0]["text"] == "Token1"
+
+
 def test_auto_zoom_not_exceed_tesseract_limit(monkeypatch):
     monkeypatch.setenv("TESSERACT_MIN_TEXT_HEIGHT", "1000")
     monkeypatch.setenv("TESSERACT_OPTIMUM_TEXT_HEIGHT", "100000")
@@ -513,6 +565,52 @@ def test_auto_zoom_not_exceed_tesseract_limit(monkeypatch):
     ]
 
 
+def test_estimate_text_height_returns_none_without_text():
+    assert estimate_text_height(Image.new("RGB", (1000, 1000), "white")) is None
+
+
+def test_estimate_text_height_scales_with_the_image():
+    image = Image.open(example_doc_path("img/layout-parser-paper-fast.jpg")).convert("RGB")
+    text_height = estimate_text_height(image)
+    assert text_height is not None
+
+    half_size_text_height = estimate_text_height(
+        image.resize((image.width // 2, image.height // 2), Image.LANCZOS)
+    )
+    assert half_size_text_height == pytest.approx(text_height / 2, rel=0.2)
+
+
+@pytest.mark.parametrize(
+    ("estimator", "estimated_height", "expected_calls"),
+    [
+        ("connected_components", 5.0, 1),
+        ("connected_components", None, 2),
+        ("ocr", 5.0, 2),
+    ],
+)
+def test_get_layout_from_image_picks_zoom_before_ocr(
+    monkeypatch, estimator, estimated_height, expected_calls
+):
+    monkeypatch.setenv("TESSERACT_TEXT_HEIGHT_ESTIMATOR", estimator)
+    monkeypatch.setattr(
+        tesseract_ocr, "estimate_text_height", lambda *args, **kwargs: estimated_height
+    )
+    ocr_df = pd.DataFrame(
+        {"left": [10], "top": [5], "width": [15], "height": [5], "text": ["Hello"]},
+    )
+    image = Image.new("RGB", (100, 100))
+    ocr_agent = OCRAgentTesseract()
+
+    with patch.object(
+        ocr_agent, "image_to_data_with_character_confidence_filter", return_value=ocr_df
+    ) as mock_ocr:
+        ocr_agent.get_layout_from_image(image)
+
+    assert mock_ocr.call_count == expected_calls
+    # -- text 5px tall is zoomed to the optimum 20px before the final OCR pass --
+    assert mock_ocr.call_args.args[0].shape[:2] == (400, 400)
+
+
 def test_merge_out_layout_with_cid_code(mock_out_layout, mock_ocr_regions):
     # the code should ignore this invalid text and use ocr region's text
     mock_out_layout.texts = mock_out_layout.texts.astype(object)
@@ -673,3 +771,131 @@ def test_pass_down_agents(mock_ocr_get_instance, mocker, mock_page):
         "language": "eng",
         "ocr_agent_module": OCR_AGENT_TESSERACT,
     }
+
+
+def _page_with_elements(elements: list[LayoutElement], width=1000, height=1000):
+    page = MagicMock(PageLayout)
+    page.elements_array = LayoutElements.from_list(elements)
+    page.image_metadata = {"width": width, "height": height}
+    return page
+
+
+def test_get_ocr_region_bounds_the_elements_without_text():
+    page = _page_with_elements(
+        [
+            LayoutElement.from_coords(100, 100, 200, 150, text="embedded", type="Text"),
+            LayoutElement.from_coords(300, 400, 500, 450, text="", type="Text"),
+            LayoutElement.from_coords(250, 600, 400, 700, text=None, type="Text"),
+        ]
+    )
+
+    assert ocr.get_ocr_region(page, padding=10) == (240, 390, 510, 710)
+
+
+def test_get_ocr_region_includes_tables_and_clips_to_the_page():
+    page = _page_with_elements(
+        [
+            LayoutElement.from_coords(5, 100, 200, 150, text="embedded", type=ElementType.TABLE),
+            LayoutElement.from_coords(300, 400, 995, 450, text="", type="Text"),
+        ]
+    )
+
+    assert ocr.get_ocr_region(page, padding=10) == (290, 390, 1000, 460)
+    assert ocr.get_ocr_region(page, infer_table_structure=True, padding=10) == (0, 90, 1000, 460)
+
+
+def test_get_ocr_region_is_none_when_every_element_has_text():
+    page = _page_with_elements(
+        [LayoutElement.from_coords(100, 100, 200, 150, text="embedded", type="Text")]
+    )
+
+    assert ocr.get_ocr_region(page) is None
+
+
+def test_process_page_images_with_ocr_only_ocrs_the_region(mocker):
+    page = _page_with_elements(
+        [
+            LayoutElement.from_coords(100, 100, 200, 150, text="embedded", type="Text"),
+            LayoutElement.from_coords(300, 400, 500, 450, text="", type="Text"),
+        ]
+    )
+    doc = MagicMock(DocumentLayout)
+    doc.pages = [page]
+    store = MagicMock()
+    store.get_region.return_value = Image.new("RGB", (240, 90))
+    ocr_agent = MagicMock()
+    ocr_agent.get_layout_from_image.return_value = TextRegions.from_list(
+        [TextRegion.from_coords(25, 25, 215, 65, text="ocr text")]
+    )
+    mocker.patch.object(OCRAgent, "get_instance", return_value=ocr_agent)
+
+    ocr.process_page_images_with_ocr(
+        page_image_store=store,
+        out_layout=doc,
+        extracted_layout=[],
+        ocr_regions_only=True,
+    )
+
+    store.get_image.assert_not_called()
+    store.get_region.assert_called_once_with(1, (280, 380, 520, 470))
+    assert ocr_agent.get_layout_from_image.call_args[0][0].size == (240, 90)
+    assert page.elements_array.texts[1] == "ocr text"
+    np.testing.assert_array_almost_equal(
+        page.elements_array.element_coords[:2],
+        [[100, 100, 200, 150], [300, 400, 500, 450]],
+    )
+
+
+def test_process_page_images_with_ocr_logs_the_ocr_result_cache_lookups_of_the_document(
+    mocker, caplog
+):
+    cache = OCRResultCache(max_entries=8)
+    mocker.patch.object(ocr, "get_ocr_result_cache", return_value=cache)
+    ocr_agent = MagicMock()
+    ocr_agent.get_layout_from_image.side_effect = lambda image: cache.get_or_compute(
+        "page", lambda: TextRegions.from_list([TextRegion.from_coords(0, 0, 10, 10, text="ocr")])
+    )
+    mocker.patch.object(OCRAgent, "get_instance", return_value=ocr_agent)
+    store = MagicMock()
+    store.get_region.return_value = Image.new("RGB", (240, 90))
+
+    def process_document():
+        doc = MagicMock(DocumentLayout)
+        doc.pages = [_page_with_elements([LayoutElement.from_coords(0, 0, 50, 50, text="")])]
+        ocr.process_page_images_with_ocr(
+            page_image_store=store, out_layout=doc, extracted_layout=[], ocr_regions_only=True
+        )
+
+    process_document()
+    with caplog.at_level("INFO", logger="unstructured"):
+        process_document()
+
+    assert "OCR result cache: 1 hits (0 from disk), 0 misses" in caplog.text
+
+
+def test_supplement_page_layout_with_ocr_batches_individual_blocks(monkeypatch, mocker):
+    monkeypatch.setenv("OCR_INDIVIDUAL_BLOCKS_BATCHED", "true")
+    page = _page_with_elements(
+        [
+            LayoutElement.from_coords(100, 100, 200, 150, text="", type="Text"),
+            LayoutElement.from_coords(100, 200, 200, 250, text="embedded", type="Text"),
+            LayoutElement.from_coords(300, 400, 500, 450, text=None, type="Text"),
+        ]
+    )
+    ocr_agent = MagicMock()
+    # -- the blocks without text are stacked 40px apart: at y=40..90 and y=130..180 --
+    ocr_agent.get_layout_from_image.return_value = TextRegions.from_list(
+        [
+            TextRegion.from_coords(10, 50, 60, 80, text="first"),
+            TextRegion.from_coords(10, 140, 90, 170, text="second"),
+        ]
+    )
+    mocker.patch.object(OCRAgent, "get_instance", return_value=ocr_agent)
+
+    ocr.supplement_page_layout_with_ocr(
+        page, Image.new("RGB", (1000, 1000), "white"), ocr_mode="individual_blocks"
+    )
+
+    assert ocr_agent.get_layout_from_image.call_args[0][0].size == (200, 220)
+    ocr_agent.get_text_from_image.assert_not_called()
+    assert page.elements_array.texts.tolist() == ["first", "embedded", "second"]
@@ -0,0 +1,151 @@
+import io
+import os
+from unittest.mock import patch
+
+import pytest
+from pypdf import PdfReader
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.documents.elements import ElementMetadata, PageBreak, Text
+from unstructured.partition.pdf_image import page_checkpoint
+
+DOC = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+
+
+def _fake_partition_checkpoint_range(data, pdfminer_pages, partition_kwargs):
+    starting_page_number = partition_kwargs["starting_page_number"]
+    num_pages = len(PdfReader(io.BytesIO(data)).pages)
+    return [
+        Text(f"page {page_number}", metadata=ElementMetadata(page_number=page_number))
+        for page_number in range(starting_page_number, starting_page_number + num_pages)
+    ]
+
+
+def _checkpoint_files(checkpoint_dir):
+    return [name for _, _, names in os.walk(checkpoint_dir) for name in names]
+
+
+def test_partition_pdf_pages_with_checkpoints_resumes_at_the_first_unfinished_page(tmp_path):
+    def fail_on_second_page(data, pdfminer_pages, partition_kwargs):
+        if partition_kwargs["starting_page_number"] == 4:
+            raise MemoryError
+        return _fake_partition_checkpoint_range(data, pdfminer_pages, partition_kwargs)
+
+    with (
+        patch.object(
+            page_checkpoint, "_partition_checkpoint_range", side_effect=fail_on_second_page
+        ),
+        pytest.raises(MemoryError),
+    ):
+        page_checkpoint.partition_pdf_pages_with_checkpoints(
+            str(tmp_path), filename=DOC, starting_page_number=3, hi_res_model_name="yolox"
+        )
+    assert len(_checkpoint_files(tmp_path)) == 1
+
+    with patch.object(
+        page_checkpoint,
+        "_partition_checkpoint_range",
+        side_effect=_fake_partition_checkpoint_range,
+    ) as mock_partition:
+        elements = page_checkpoint.partition_pdf_pages_with_checkpoints(
+            str(tmp_path),
+            filename=DOC,
+            starting_page_number=3,
+            hi_res_model_name="yolox",
+            metadata_last_modified="2024-01-01T00:00:00",
+        )
+
+    assert mock_partition.call_count == 1
+    assert mock_partition.call_args.args[2]["starting_page_number"] == 4
+    assert [el.text for el in elements] == ["page 3", "page 4"]
+    assert {el.metadata.last_modified for el in elements} == {"2024-01-01T00:00:00"}
+    assert _checkpoint_files(tmp_path) == []
+
+
+def test_partition_pdf_pages_with_checkpoints_does_not_resume_with_other_parameters(tmp_path):
+    with (
+        patch.object(
+            page_checkpoint,
+            "_partition_checkpoint_range",
+            side_effect=[[Text("page 1", metadata=ElementMetadata(page_number=1))], MemoryError],
+        ),
+        pytest.raises(MemoryError),
+    ):
+        page_checkpoint.partition_pdf_pages_with_checkpoints(
+            str(tmp_path), filename=DOC, hi_res_model_name="yolox"
+        )
+
+    with patch.object(
+        page_checkpoint,
+        "_partition_checkpoint_range",
+        side_effect=_fake_partition_checkpoint_range,
+    ) as mock_partition:
+        elements = page_checkpoint.partition_pdf_pages_with_checkpoints(
+            str(tmp_path), filename=DOC, hi_res_model_name="detectron2_onnx"
+        )
+
+    assert mock_partition.call_count == 2
+    assert [el.text for el in elements] == ["page 1", "page 2"]
+
+
+@pytest.mark.parametrize("include_page_breaks", [False, True])
+def test_partition_pdf_pages_with_checkpoints_restores_page_breaks(tmp_path, include_page_breaks):
+    with patch.object(
+        page_checkpoint,
+        "_partition_checkpoint_range",
+        side_effect=_fake_partition_checkpoint_range,
+    ):
+        elements = page_checkpoint.partition_pdf_pages_with_checkpoints(
+            str(tmp_path),
+            filename=DOC,
+            pages_per_range=2,
+            include_page_breaks=include_page_breaks,
+            hi_res_model_name="yolox",
+        )
+
+    assert [type(el) for el in elements] == (
+        [Text, PageBreak, Text, PageBreak] if include_page_breaks else [Text, Text]
+    )
+
+
+def test_partition_pdf_pages_with_checkpoints_keeps_last_modified_when_none_is_given(tmp_path):
+    def partition_with_last_modified(data, pdfminer_pages, partition_kwargs):
+        elements = _fake_partition_checkpoint_range(data, pdfminer_pages, partition_kwargs)
+        for element in elements:
+            element.metadata.last_modified = "2024-01-01T00:00:00"
+        return elements
+
+    with patch.object(
+        page_checkpoint,
+        "_partition_checkpoint_range",
+        side_effect=partition_with_last_modified,
+    ):
+        elements = page_checkpoint.partition_pdf_pages_with_checkpoints(
+            str(tmp_path), filename=DOC, hi_res_model_name="yolox"
+        )
+
+    assert {el.metadata.last_modified for el in elements} == {"2024-01-01T00:00:00"}
+
+
+def test_partition_pdf_pages_with_checkpoints_only_partitions_selected_pages(tmp_path):
+    with patch.object(
+        page_checkpoint,
+        "_partition_checkpoint_range",
+        side_effect=_fake_partition_checkpoint_range,
+    ) as mock_partition:
+        elements = page_checkpoint.partition_pdf_pages_with_checkpoints(
+            str(tmp_path), filename=DOC, page_indices=[1], hi_res_model_name="yolox"
+        )
+
+    assert mock_partition.call_count == 1
+    assert [el.text for el in elements] == ["page 2"]
+
+
+def test_partition_pdf_pages_with_checkpoints_is_skipped_for_unserializable_parameters(tmp_path):
+    with patch.object(page_checkpoint, "_partition_checkpoint_range") as mock_partition:
+        elements = page_checkpoint.partition_pdf_pages_with_checkpoints(
+            str(tmp_path), filename=DOC, language_fallback=lambda text: None
+        )
+
+    assert elements is None
+    mock_partition.assert_not_called()
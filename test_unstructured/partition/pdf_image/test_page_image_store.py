@@ -0,0 +1,279 @@
+import io
+from unittest.mock import MagicMock, patch
+
+import pypdfium2
+import pytest
+from pypdf import PdfReader, PdfWriter
+from unstructured_inference.inference.elements import TextRegions
+from unstructured_inference.inference.layout import DocumentLayout, PageLayout
+from unstructured_inference.inference.layoutelement import LayoutElements
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.errors import UnprocessableEntityError
+from unstructured.partition.pdf_image import ocr
+from unstructured.partition.pdf_image.page_image_store import (
+    PAGE_CONSUMER_ANALYSIS,
+    PAGE_CONSUMER_IMAGE_BLOCKS,
+    PAGE_CONSUMER_OCR,
+    PageImageStore,
+)
+from unstructured.partition.pdf_image.page_memory_budget import PageMemoryBudget
+from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_image
+
+
+@pytest.mark.parametrize("file_mode", ["filename", "rb"])
+def test_page_image_store_renders_each_page_once(file_mode):
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    with patch.object(pypdfium2, "PdfDocument", wraps=pypdfium2.PdfDocument) as mock_open:
+        if file_mode == "filename":
+            store = PageImageStore(filename=filename, dpi=72)
+        else:
+            with open(filename, "rb") as f:
+                store = PageImageStore(file=f, dpi=72)
+
+        assert len(store) == 2
+        first = store.get_image(1)
+        assert store.get_image(1) is first
+        store.get_image(2)
+        store.close()
+
+    mock_open.assert_called_once()
+    assert store.render_count == 2
+    assert first.size == (612, 792)
+
+
+@pytest.mark.parametrize("is_image", [False, True])
+def test_page_image_store_raises_file_not_found_on_read_without_a_document(is_image):
+    store = PageImageStore(filename="", is_image=is_image)
+
+    with pytest.raises(FileNotFoundError):
+        store.get_image(1)
+
+
+def test_page_image_store_renders_pages_like_convert_pdf_to_image():
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    expected = convert_pdf_to_image(filename=filename, dpi=72, first_page=2, last_page=2)[0]
+
+    with PageImageStore(filename=filename, dpi=72) as store:
+        image = store.get_image(2)
+
+        assert list(image.getdata()) == list(expected.getdata())
+        assert image.info["pdf_rotation_correction"] == 0
+
+
+@pytest.mark.parametrize("rotation", [90, 180, 270])
+def test_page_image_store_renders_rotated_pages_like_convert_pdf_to_image(rotation):
+    writer = PdfWriter()
+    writer.add_page(PdfReader(example_doc_path("pdf/layout-parser-paper-fast.pdf")).pages[0])
+    writer.pages[0].rotate(rotation)
+    data = io.BytesIO()
+    writer.write(data)
+    expected = convert_pdf_to_image(filename=None, file=data.getvalue(), dpi=72)[0]
+
+    with PageImageStore(file=data.getvalue(), dpi=72) as store:
+        image = store.get_image(1)
+
+        assert image.info == expected.info
+        assert list(image.getdata()) == list(expected.getdata())
+
+
+def test_page_image_store_releases_page_after_last_consumer():
+    store = PageImageStore(
+        filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"),
+        dpi=72,
+        consumers=[PAGE_CONSUMER_OCR, PAGE_CONSUMER_IMAGE_BLOCKS],
+    )
+
+    first = store.get_image(1).copy()
+    store.release(1, PAGE_CONSUMER_OCR)
+    # -- the page waits for its other consumer in a temporary file, not in memory --
+    assert store.cached_page_numbers == []
+    assert store.spill_count == 1
+    assert list(store.get_region(1, (0, 0, 612, 792)).getdata()) == list(first.getdata())
+    assert store.cached_page_numbers == []
+
+    assert list(store.get_image(1).getdata()) == list(first.getdata())
+    store.release(1, PAGE_CONSUMER_IMAGE_BLOCKS)
+    assert store.cached_page_numbers == []
+    assert store.render_count == 1
+
+
+def test_page_image_store_release_all():
+    store = PageImageStore(
+        filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"),
+        dpi=72,
+        consumers=[PAGE_CONSUMER_IMAGE_BLOCKS],
+    )
+
+    list(store.iter_images())
+    assert store.cached_page_numbers == [1, 2]
+
+    store.release_all(PAGE_CONSUMER_IMAGE_BLOCKS)
+    assert store.cached_page_numbers == []
+    assert store.render_count == 2
+
+
+def test_page_image_store_loads_image_frames():
+    with PageImageStore(filename=example_doc_path("img/DA-1p.jpg"), is_image=True) as store:
+        image = store.get_image(1)
+        assert len(store) == 1
+        assert image.mode == "RGB"
+        assert image.format == "JPEG"
+
+    assert store.cached_page_numbers == []
+
+
+def test_page_image_store_raises_on_out_of_range_page():
+    store = PageImageStore(filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"), dpi=72)
+
+    with pytest.raises(IndexError):
+        store.get_image(3)
+
+
+def test_process_data_with_ocr_reads_pages_from_store():
+    store = MagicMock(spec=PageImageStore)
+    pages = [PageLayout(number=i + 1, image=None) for i in range(2)]
+    for page in pages:
+        page.elements_array = LayoutElements.from_list([])
+    out_layout = DocumentLayout.from_pages(pages)
+
+    with patch.object(
+        ocr, "supplement_page_layout_with_ocr", side_effect=lambda **kw: kw["page_layout"]
+    ):
+        result = ocr.process_data_with_ocr(
+            b"",
+            out_layout,
+            extracted_layout=[TextRegions.from_list([])],
+            page_image_store=store,
+        )
+
+    assert result.pages == pages
+    assert [c.args for c in store.get_image.call_args_list] == [(1,), (2,)]
+    assert [c.args for c in store.release.call_args_list] == [
+        (1, PAGE_CONSUMER_OCR),
+        (2, PAGE_CONSUMER_OCR),
+    ]
+
+
+def test_page_image_store_spills_pages_over_memory_budget():
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    # NOTE: one 612x792 RGB page fits the budget, two do not
+    store = PageImageStore(filename=filename, dpi=72, memory_budget=612 * 792 * 3)
+
+    first = store.get_image(1).copy()
+    store.get_image(2)
+    assert store.cached_page_numbers == [2]
+    assert store.spill_count == 1
+
+    assert list(store.get_image(1).getdata()) == list(first.getdata())
+    assert store.cached_page_numbers == [1]
+    assert store.render_count == 2
+
+    store.close()
+    assert store.cached_page_numbers == []
+
+
+def test_page_image_stores_share_the_page_memory_budget():
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    page_nbytes = 612 * 792 * 3
+    budget = PageMemoryBudget(limit=page_nbytes)
+    store = PageImageStore(
+        filename=filename, dpi=72, consumers=[PAGE_CONSUMER_OCR], page_memory_budget=budget
+    )
+    other_store = PageImageStore(filename=filename, dpi=72, page_memory_budget=budget)
+
+    store.get_image(1)
+    store.get_image(2)
+    assert store.spill_count == 1
+    assert budget.in_use == page_nbytes
+
+    with patch.object(budget, "acquire", wraps=budget.acquire) as mock_acquire:
+        store.release_all(PAGE_CONSUMER_OCR)
+        other_store.get_image(1)
+    mock_acquire.assert_not_called()
+    assert budget.in_use == page_nbytes
+
+    other_store.close()
+    store.close()
+    assert budget.in_use == 0
+
+
+def test_page_image_store_reads_memoryview():
+    with open(example_doc_path("pdf/layout-parser-paper-fast.pdf"), "rb") as f:
+        data = memoryview(f.read())
+
+    with PageImageStore(file=data, dpi=72) as store:
+        assert len(store) == 2
+        assert store.get_image(1).size == (612, 792)
+
+
+@pytest.mark.parametrize("rotation", [90, 180, 270])
+@pytest.mark.parametrize("bbox", [(50, 60, 400, 300), (-10, -20, 100, 90), (500, 500, 900, 900)])
+def test_page_image_store_renders_regions_of_rotated_pages_like_the_page(rotation, bbox):
+    writer = PdfWriter()
+    writer.add_page(PdfReader(example_doc_path("pdf/layout-parser-paper-fast.pdf")).pages[0])
+    writer.pages[0].rotate(rotation)
+    data = io.BytesIO()
+    writer.write(data)
+
+    with PageImageStore(file=data.getvalue(), dpi=72) as store:
+        page = store.get_image(1)
+        assert page.info["pdf_rotation_correction"] == rotation
+        expected = page.crop(bbox)
+    with PageImageStore(file=data.getvalue(), dpi=72) as store:
+        region = store.get_region(1, bbox)
+        assert store.cached_page_numbers == []
+
+    assert region.size == expected.size
+    assert list(region.getdata()) == list(expected.getdata())
+
+
+def test_page_image_store_refuses_to_render_regions_of_oversized_pages(monkeypatch):
+    monkeypatch.setenv("PDF_RENDER_MAX_PIXELS_PER_PAGE", "1000")
+
+    with (
+        PageImageStore(
+            filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"), dpi=72
+        ) as store,
+        pytest.raises(UnprocessableEntityError),
+    ):
+        store.get_region(1, (0, 0, 10, 10))
+
+
+def test_process_data_with_ocr_renders_in_memory():
+    pages = [PageLayout(number=i + 1, image=None) for i in range(2)]
+    for page in pages:
+        page.elements_array = LayoutElements.from_list([])
+    with open(example_doc_path("pdf/layout-parser-paper-fast.pdf"), "rb") as f:
+        data = f.read()
+
+    with (
+        patch.object(
+            ocr, "supplement_page_layout_with_ocr", side_effect=lambda **kw: kw["page_layout"]
+        ) as mock_supplement,
+        patch("tempfile.TemporaryDirectory") as mock_tmp_dir,
+    ):
+        ocr.process_data_with_ocr(
+            data,
+            DocumentLayout.from_pages(pages),
+            extracted_layout=[],
+            pdf_image_dpi=72,
+        )
+
+    mock_tmp_dir.assert_not_called()
+    assert [c.kwargs["image"].size for c in mock_supplement.call_args_list] == [(612, 792)] * 2
+
+
+def test_analysis_drawer_releases_each_page_after_drawing_it(tmp_path):
+    from unstructured.partition.pdf_image.analysis.bbox_visualisation import AnalysisDrawer
+
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    store = PageImageStore(filename=filename, dpi=72, consumers=[PAGE_CONSUMER_ANALYSIS])
+    drawer = AnalysisDrawer(
+        filename=filename, is_image=False, save_dir=tmp_path, page_image_store=store
+    )
+
+    for image in drawer.load_source_image():
+        assert image.size == (612, 792)
+        assert store.cached_page_numbers == []
+    assert store.render_count == 2
@@ -0,0 +1,57 @@
+import threading
+import time
+
+from unstructured.partition.pdf_image import page_memory_budget
+from unstructured.partition.pdf_image.page_memory_budget import PageMemoryBudget
+
+
+def test_page_memory_budget_waits_until_the_request_fits():
+    budget = PageMemoryBudget(limit=100)
+    budget.acquire(60)
+    assert budget.try_acquire(60) is False
+
+    acquired = threading.Event()
+
+    def acquire():
+        budget.acquire(60)
+        acquired.set()
+
+    thread = threading.Thread(target=acquire)
+    thread.start()
+    time.sleep(0.1)
+    assert not acquired.is_set()
+
+    budget.release(60)
+    thread.join(timeout=5)
+    assert acquired.is_set()
+    assert budget.in_use == 60
+
+
+def test_page_memory_budget_grants_a_request_over_the_limit_when_nothing_is_reserved():
+    budget = PageMemoryBudget(limit=100)
+
+    assert budget.try_acquire(500) is True
+    assert budget.in_use == 500
+
+
+def test_page_memory_budget_grants_a_request_after_waiting_max_wait():
+    budget = PageMemoryBudget(limit=100, max_wait=0.05)
+    budget.acquire(100)
+
+    budget.acquire(10)
+
+    assert budget.in_use == 110
+
+
+def test_get_page_memory_budget(monkeypatch):
+    assert page_memory_budget.get_page_memory_budget() is None
+
+    monkeypatch.setenv("PAGE_IMAGE_MEMORY_LIMIT", "1000")
+    budget = page_memory_budget.get_page_memory_budget()
+    assert budget is not None
+    assert budget.limit == 1000
+    assert page_memory_budget.get_page_memory_budget() is budget
+
+    inherited = PageMemoryBudget(limit=10)
+    monkeypatch.setattr(page_memory_budget, "_inherited_page_memory_budget", inherited)
+    assert page_memory_budget.get_page_memory_budget() is inherited
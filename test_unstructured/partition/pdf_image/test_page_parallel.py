@@ -0,0 +1,150 @@
+import io
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+from pypdf import PdfReader
+from unstructured_inference.inference.layout import DocumentLayout, PageLayout
+from unstructured_inference.inference.layoutelement import LayoutElement, LayoutElements
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.documents.elements import ElementMetadata, PageBreak, Text
+from unstructured.partition import pdf
+from unstructured.partition.pdf_image import page_parallel
+from unstructured.partition.utils.constants import OCR_AGENT_PADDLE
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+
+
+@pytest.mark.parametrize(("pages_per_range", "expected_ranges"), [(1, [0, 1]), (8, [0])])
+def test_split_pdf_into_page_ranges(pages_per_range, expected_ranges):
+    with open(example_doc_path("pdf/layout-parser-paper-fast.pdf"), "rb") as f:
+        data = f.read()
+
+    page_ranges = page_parallel.split_pdf_into_page_ranges(data, pages_per_range)
+
+    assert [first_page_index for first_page_index, _ in page_ranges] == expected_ranges
+    assert sum(len(PdfReader(io.BytesIO(chunk)).pages) for _, chunk in page_ranges) == 2
+
+
+def _fake_partition_page_range(data, starting_page_number, partition_kwargs):
+    num_pages = len(PdfReader(io.BytesIO(data)).pages)
+    elements = []
+    for page_number in range(starting_page_number, starting_page_number + num_pages):
+        elements.append(
+            Text(f"page {page_number}", metadata=ElementMetadata(page_number=page_number))
+        )
+        if partition_kwargs["include_page_breaks"]:
+            elements.append(PageBreak(text=""))
+    return elements
+
+
+@pytest.mark.parametrize("include_page_breaks", [False, True])
+def test_partition_pdf_pages_in_parallel_merges_ranges_in_page_order(include_page_breaks):
+    with (
+        patch.object(
+            page_parallel,
+            "_get_executor",
+            side_effect=lambda max_workers, initargs: ThreadPoolExecutor(max_workers),
+        ),
+        patch.object(
+            page_parallel, "_partition_page_range", side_effect=_fake_partition_page_range
+        ) as mock_partition,
+    ):
+        elements = page_parallel.partition_pdf_pages_in_parallel(
+            filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"),
+            max_workers=2,
+            pages_per_range=1,
+            hi_res_model_name="yolox",
+            starting_page_number=3,
+            include_page_breaks=include_page_breaks,
+        )
+
+    assert mock_partition.call_count == 2
+    assert [el.text for el in elements if not isinstance(el, PageBreak)] == ["page 3", "page 4"]
+    assert [isinstance(el, PageBreak) for el in elements].count(True) == 2 * include_page_breaks
+
+
+def _fake_partition_local(file, starting_page_number=1, include_page_breaks=False, **kwargs):
+    """Elements of every page of `file` through `document_to_element_list`, like hi_res. Pages
+    without embedded text have no elements."""
+    pages = []
+    for page_number, pdf_page in enumerate(PdfReader(file).pages, start=1):
+        text = f"text of page {starting_page_number + page_number - 1}"
+        page = PageLayout(number=page_number, image=None)
+        page.elements_array = LayoutElements.from_list(
+            [
+                LayoutElement.from_coords(0, 0, 10, 10, text=text, type="Text"),
+                LayoutElement.from_coords(0, 20, 10, 30, text="more text", type="Text"),
+            ]
+            if pdf_page.extract_text().strip()
+            else []
+        )
+        page.image_metadata = {"width": 100, "height": 100}
+        pages.append(page)
+    return pdf.document_to_element_list(
+        DocumentLayout.from_pages(pages),
+        sortable=True,
+        include_page_breaks=include_page_breaks,
+        starting_page_number=starting_page_number,
+    )
+
+
+@pytest.mark.parametrize("include_page_breaks", [False, True])
+@pytest.mark.parametrize(
+    ("doc", "pages_per_range"),
+    [
+        ("pdf/layout-parser-paper-fast.pdf", 1),
+        # -- the empty pages 2 and 3 end and start a range --
+        ("pdf/layout-parser-paper-with-empty-pages.pdf", 2),
+    ],
+)
+def test_partition_pdf_pages_in_parallel_matches_a_serial_run(
+    doc, pages_per_range, include_page_breaks
+):
+    filename = example_doc_path(doc)
+    with (
+        patch.object(
+            page_parallel,
+            "_get_executor",
+            side_effect=lambda max_workers, initargs: ThreadPoolExecutor(max_workers),
+        ),
+        patch.object(pdf, "_partition_pdf_or_image_local", side_effect=_fake_partition_local),
+    ):
+        elements = page_parallel.partition_pdf_pages_in_parallel(
+            filename=filename,
+            max_workers=2,
+            pages_per_range=pages_per_range,
+            hi_res_model_name="yolox",
+            include_page_breaks=include_page_breaks,
+        )
+    with open(filename, "rb") as f:
+        serial_elements = _fake_partition_local(f, include_page_breaks=include_page_breaks)
+
+    assert [(type(el), el.text, el.metadata.page_number) for el in elements] == [
+        (type(el), el.text, el.metadata.page_number) for el in serial_elements
+    ]
+
+
+def test_init_hi_res_worker_loads_the_ocr_agent_the_pages_use():
+    with (
+        patch("unstructured_inference.models.base.get_model"),
+        patch.object(OCRAgent, "get_instance") as mock_get_instance,
+    ):
+        page_parallel._init_hi_res_worker("yolox", OCR_AGENT_PADDLE, "eng")
+
+    # -- the paddle agent is keyed by its own language code, like in `get_ocr_agent()` --
+    mock_get_instance.assert_called_once_with(ocr_agent_module=OCR_AGENT_PADDLE, language="en")
+
+
+@pytest.mark.parametrize(
+    ("is_image", "max_workers", "analysis", "expected"),
+    [
+        (False, 4, False, True),
+        (False, None, False, False),
+        (False, 1, False, False),
+        (True, 4, False, False),
+        (False, 4, True, False),
+    ],
+)
+def test_page_parallel_is_supported(is_image, max_workers, analysis, expected):
+    assert page_parallel.page_parallel_is_supported(is_image, max_workers, analysis) is expected
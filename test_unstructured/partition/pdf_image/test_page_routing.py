@@ -0,0 +1,142 @@
+from unittest.mock import patch
+
+import pytest
+from pypdf import PdfReader
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.documents.elements import ElementMetadata, PageBreak, Text
+from unstructured.partition import pdf
+from unstructured.partition.pdf_image.page_routing import (
+    PageRoute,
+    group_page_routes,
+    route_pdf_pages,
+    score_page_text_quality,
+)
+from unstructured.partition.utils.constants import PartitionStrategy
+
+
+def _pdfminer_pages(filename):
+    pdfminer_pages = []
+    pdf.extractable_elements(filename=example_doc_path(filename), pdfminer_pages=pdfminer_pages)
+    return pdfminer_pages
+
+
+def test_score_page_text_quality_is_high_for_born_digital_pages():
+    pages = _pdfminer_pages("pdf/layout-parser-paper-fast.pdf")
+
+    assert all(score_page_text_quality(page.layout) > 0.9 for page in pages)
+
+
+def test_route_pdf_pages_sends_pages_with_hidden_ocr_text_to_the_deficient_strategy():
+    routes = route_pdf_pages(
+        _pdfminer_pages("pdf/pdf-with-ocr-text.pdf"),
+        deficient_page_strategy=PartitionStrategy.OCR_ONLY,
+    )
+
+    assert {route.strategy for route in routes} == {PartitionStrategy.OCR_ONLY}
+    assert all(route.score < 0.9 for route in routes)
+
+
+def test_route_pdf_pages_honors_min_text_quality():
+    pages = _pdfminer_pages("pdf/layout-parser-paper-fast.pdf")
+
+    routes = route_pdf_pages(pages, min_text_quality=1.01)
+
+    assert [route.strategy for route in routes] == [PartitionStrategy.HI_RES] * 2
+
+
+def test_group_page_routes_groups_consecutive_pages():
+    routes = [
+        PageRoute(PartitionStrategy.FAST, 1.0),
+        PageRoute(PartitionStrategy.FAST, 0.95),
+        PageRoute(PartitionStrategy.HI_RES, 0.1),
+        PageRoute(PartitionStrategy.FAST, 0.99),
+    ]
+
+    assert group_page_routes(routes) == [
+        (PartitionStrategy.FAST, 0, 2),
+        (PartitionStrategy.HI_RES, 2, 3),
+        (PartitionStrategy.FAST, 3, 4),
+    ]
+
+
+def _fake_partition_local(file, starting_page_number, include_page_breaks, **kwargs):
+    elements = []
+    for page_number in range(
+        starting_page_number, starting_page_number + len(PdfReader(file).pages)
+    ):
+        elements.append(Text("scanned", metadata=ElementMetadata(page_number=page_number)))
+        if include_page_breaks:
+            elements.append(PageBreak(text=""))
+    return elements
+
+
+@pytest.mark.parametrize("include_page_breaks", [False, True])
+def test_partition_pdf_with_page_routing_only_partitions_deficient_pages_with_hi_res(
+    include_page_breaks,
+):
+    routes = [PageRoute(PartitionStrategy.HI_RES, 0.2), PageRoute(PartitionStrategy.FAST, 1.0)]
+    with (
+        patch("unstructured.partition.pdf_image.page_routing.route_pdf_pages", return_value=routes),
+        patch.object(pdf, "determine_pdf_or_image_strategy", return_value=PartitionStrategy.HI_RES),
+        patch.object(
+            pdf, "_partition_pdf_or_image_local", side_effect=_fake_partition_local
+        ) as mock_local,
+    ):
+        elements = pdf.partition_pdf(
+            filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"),
+            pdf_page_routing=True,
+            include_page_breaks=include_page_breaks,
+        )
+
+    mock_local.assert_called_once()
+    assert len(mock_local.call_args.kwargs["pdfminer_pages"]) == 1
+    assert mock_local.call_args.kwargs["pdf_text_extractable"] is True
+    assert elements[0].text == "scanned"
+    assert {el.metadata.page_number for el in elements[1:] if not isinstance(el, PageBreak)} == {2}
+    assert [isinstance(el, PageBreak) for el in elements].count(True) == 2 * include_page_breaks
+    assert elements[0].metadata.routing == PartitionStrategy.HI_RES
+    assert elements[0].metadata.routing_score == 0.2
+    assert elements[-1].metadata.routing == PartitionStrategy.FAST
+
+
+def test_partition_pdf_with_page_routing_keeps_the_page_breaks_of_a_single_strategy_run():
+    filename = example_doc_path("pdf/layout-parser-paper-with-empty-pages.pdf")
+    expected = pdf.partition_pdf(
+        filename=filename, strategy=PartitionStrategy.FAST, include_page_breaks=True
+    )
+
+    # -- the empty pages 2 and 3 end the fast run --
+    routes = [
+        PageRoute(PartitionStrategy.HI_RES, 0.2),
+        PageRoute(PartitionStrategy.FAST, 1.0),
+        PageRoute(PartitionStrategy.FAST, 1.0),
+        PageRoute(PartitionStrategy.HI_RES, 0.2),
+    ]
+    with (
+        patch("unstructured.partition.pdf_image.page_routing.route_pdf_pages", return_value=routes),
+        patch.object(pdf, "determine_pdf_or_image_strategy", return_value=PartitionStrategy.HI_RES),
+        patch.object(pdf, "_partition_pdf_or_image_local", side_effect=_fake_partition_local),
+    ):
+        elements = pdf.partition_pdf(
+            filename=filename, pdf_page_routing=True, include_page_breaks=True
+        )
+
+    page_breaks = [el for el in elements if isinstance(el, PageBreak)]
+    assert len(page_breaks) == len([el for el in expected if isinstance(el, PageBreak)]) == 4
+    assert isinstance(elements[-1], PageBreak)
+
+
+def test_partition_pdf_with_page_routing_falls_back_when_every_page_is_deficient():
+    routes = [PageRoute(PartitionStrategy.HI_RES, 0.2), PageRoute(PartitionStrategy.HI_RES, 0.1)]
+    with (
+        patch("unstructured.partition.pdf_image.page_routing.route_pdf_pages", return_value=routes),
+        patch.object(pdf, "_partition_pdf_with_pdfparser", return_value=[]) as mock_fast,
+    ):
+        pdf.partition_pdf(
+            filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"), pdf_page_routing=True
+        )
+
+    # -- the whole document goes through the single strategy `auto` picks, here fast --
+    mock_fast.assert_called_once()
+    assert len(mock_fast.call_args.kwargs["extracted_elements"]) == 2
@@ -0,0 +1,168 @@
+import io
+from unittest.mock import patch
+
+import pytest
+from pdfminer.pdfinterp import PDFPageInterpreter
+from PIL import Image
+from pypdf import PdfReader
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.documents.elements import ElementMetadata, Text
+from unstructured.partition import pdf
+from unstructured.partition.image import partition_image
+from unstructured.partition.pdf_image.page_selection import (
+    count_image_frames,
+    group_page_runs,
+    iter_image_frame_subranges,
+    resolve_page_selection,
+)
+from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_images
+from unstructured.partition.pdf_image.pdfminer_utils import open_pdfminer_pages_generator
+
+
+@pytest.mark.parametrize(
+    ("pages", "expected"),
+    [
+        (3, [2]),
+        ([4, 1, 4], [0, 3]),
+        (range(2, 5), [1, 2, 3]),
+        ("1-3, 7", [0, 1, 2, 6]),
+        ("9-", [8, 9]),
+        ("5,5-6", [4, 5]),
+    ],
+)
+def test_resolve_page_selection(pages, expected):
+    assert resolve_page_selection(pages, page_count=10) == expected
+
+
+@pytest.mark.parametrize("pages", [0, 11, [2, 12], "3-1", "a-b", "", [], [True], ["2"]])
+def test_resolve_page_selection_rejects_invalid_selections(pages):
+    with pytest.raises(ValueError):
+        resolve_page_selection(pages, page_count=10)
+
+
+def test_group_page_runs():
+    assert group_page_runs([0, 1, 2, 5, 7, 8]) == [(0, 3), (5, 6), (7, 9)]
+    assert group_page_runs([]) == []
+
+
+def test_iter_image_frame_subranges_writes_the_selected_frames():
+    filename = example_doc_path("img/layout-parser-paper-combined.tiff")
+
+    (first_page_index, data), *rest = iter_image_frame_subranges(
+        filename=filename, page_ranges=[(1, 2)]
+    )
+
+    assert (first_page_index, rest) == (1, [])
+    with Image.open(filename) as image, Image.open(io.BytesIO(data)) as subrange:
+        image.seek(1)
+        assert getattr(subrange, "n_frames", 1) == 1
+        assert subrange.convert("RGB").tobytes() == image.convert("RGB").tobytes()
+
+
+def test_count_image_frames_keeps_the_file_position():
+    with open(example_doc_path("img/layout-parser-paper-combined.tiff"), "rb") as f:
+        f.seek(5)
+        assert count_image_frames(file=f) == 2
+        assert f.tell() == 5
+
+
+def test_open_pdfminer_pages_generator_only_interprets_the_selected_pages():
+    with open(example_doc_path("pdf/layout-parser-paper-with-empty-pages.pdf"), "rb") as f:
+        all_pages = [page for page, _ in open_pdfminer_pages_generator(f)]
+        f.seek(0)
+        with patch.object(
+            PDFPageInterpreter,
+            "process_page",
+            autospec=True,
+            side_effect=PDFPageInterpreter.process_page,
+        ) as process_page:
+            selected_pages = [
+                page for page, _ in open_pdfminer_pages_generator(f, page_indices=[1, 3])
+            ]
+
+    assert process_page.call_count == 2
+    assert [page.pageid for page in selected_pages] == [
+        all_pages[1].pageid,
+        all_pages[3].pageid,
+    ]
+
+
+def test_convert_pdf_to_images_only_renders_the_selected_pages():
+    with (
+        patch("pdf2image.pdfinfo_from_path", return_value={"Pages": 4}),
+        patch(
+            "unstructured.partition.pdf_image.pdf_image_utils.render_pdf_to_image",
+            side_effect=lambda first_page, last_page, **kwargs: [
+                Image.new("RGB", (1, 1)) for _ in range(first_page, last_page + 1)
+            ],
+        ) as render,
+    ):
+        images = list(
+            convert_pdf_to_images(
+                example_doc_path("pdf/layout-parser-paper-with-empty-pages.pdf"),
+                chunk_size=10,
+                page_indices=[0, 2, 3],
+            )
+        )
+
+    assert len(images) == 3
+    assert [(c.kwargs["first_page"], c.kwargs["last_page"]) for c in render.call_args_list] == [
+        (1, 1),
+        (3, 4),
+    ]
+
+
+def _fake_partition_pdf_or_image_local(file, starting_page_number, pdfminer_pages, **kwargs):
+    num_pages = len(PdfReader(file).pages)
+    assert pdfminer_pages is None or len(pdfminer_pages) == num_pages
+    return [
+        Text(f"page {page_number}", metadata=ElementMetadata(page_number=page_number))
+        for page_number in range(starting_page_number, starting_page_number + num_pages)
+    ]
+
+
+def test_partition_pdf_with_hi_res_only_partitions_the_selected_pages():
+    with patch.object(
+        pdf, "_partition_pdf_or_image_local", side_effect=_fake_partition_pdf_or_image_local
+    ) as partition_local:
+        elements = pdf.partition_pdf(
+            example_doc_path("pdf/layout-parser-paper-with-empty-pages.pdf"),
+            strategy="hi_res",
+            pages="1,3-4",
+            starting_page_number=5,
+        )
+
+    assert partition_local.call_count == 2
+    assert [el.text for el in elements] == ["page 5", "page 7", "page 8"]
+
+
+def test_partition_image_with_hi_res_only_partitions_the_selected_frames():
+    def fake_partition_image(file, starting_page_number, is_image, **kwargs):
+        with Image.open(file) as image:
+            assert is_image
+            assert getattr(image, "n_frames", 1) == 1
+        return [Text("frame", metadata=ElementMetadata(page_number=starting_page_number))]
+
+    with patch.object(
+        pdf, "_partition_pdf_or_image_local", side_effect=fake_partition_image
+    ) as partition_local:
+        elements = partition_image(
+            example_doc_path("img/layout-parser-paper-combined.tiff"), strategy="hi_res", pages=2
+        )
+
+    assert partition_local.call_count == 1
+    assert [el.metadata.page_number for el in elements] == [2]
+
+
+def test_partition_pdf_with_fast_numbers_the_selected_pages_as_in_the_document():
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+
+    elements = pdf.partition_pdf(filename, strategy="fast", pages=[2])
+    all_elements = pdf.partition_pdf(filename, strategy="fast")
+
+    assert elements
+    assert {el.metadata.page_number for el in elements} == {2}
+    assert [el.text for el in elements] == [
+        el.text for el in all_elements if el.metadata.page_number == 2
+    ]
@@ -18,7 +18,7 @@ from unittest import mock
 import pytest
 from pdf2image.exceptions import PDFPageCountError
 from PIL import Image
-from pypdf import PdfWriter
+from pypdf import PdfReader, PdfWriter
 from pypdf.errors import LimitReachedError
 from pypdf.generic import ArrayObject, DecodedStreamObject, NameObject, NullObject
 from pytest_mock import MockFixture
@@ -39,6 +39,7 @@ from unstructured.documents.elements import (
     Header,
     ListItem,
     NarrativeText,
+    PageBreak,
     Text,
     Title,
 )
@@ -236,6 +237,26 @@ def test_rotation_corrections_from_layout_defaults_to_zero_on_missing_metadata()
     assert pdf._rotation_corrections_from_layout(document_layout) == [0, 0, 0]
 
 
+@pytest.mark.parametrize(
+    ("pdf_rotation", "detect_vertical", "keeps_pdfminer_pages"),
+    [(0, None, True), (90, None, False), (90, True, True)],
+)
+def test_enable_detect_vertical_if_rotated_drops_stale_pdfminer_pages(
+    pdf_rotation, detect_vertical, keeps_pdfminer_pages
+):
+    document_layout = SimpleNamespace(
+        pages=[SimpleNamespace(image_metadata={"pdf_rotation": pdf_rotation})]
+    )
+    pdfminer_pages = [mock.Mock()]
+
+    pdfminer_config, pages = pdf._enable_detect_vertical_if_rotated(
+        document_layout, pdf.PDFMinerConfig(detect_vertical=detect_vertical), pdfminer_pages
+    )
+
+    assert pdfminer_config.detect_vertical == (True if pdf_rotation else None)
+    assert (pages is pdfminer_pages) is keeps_pdfminer_pages
+
+
 @pytest.mark.parametrize(
     ("file_arg", "model_target", "pdfminer_target"),
     [
@@ -514,6 +535,57 @@ def test_partition_pdf_with_fast_strategy():
         assert element.metadata.filename == "layout-parser-paper-fast.pdf"
 
 
+@pytest.mark.parametrize("include_page_breaks", [False, True])
+def test_iter_partition_pdf_with_fast_strategy_matches_partition_pdf(include_page_breaks):
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    expected = pdf.partition_pdf(
+        filename=filename, strategy=PartitionStrategy.FAST, include_page_breaks=include_page_breaks
+    )
+
+    pages = list(
+        pdf.iter_partition_pdf(
+            filename=filename,
+            strategy=PartitionStrategy.FAST,
+            include_page_breaks=include_page_breaks,
+        )
+    )
+
+    assert len(pages) == 2
+    assert {el.metadata.page_number for el in pages[1]} == {2}
+    elements = [el for page in pages for el in page]
+    assert [el.id for el in elements] == [el.id for el in expected]
+    assert [el.text for el in elements] == [el.text for el in expected]
+    assert [el.metadata.parent_id for el in elements] == [el.metadata.parent_id for el in expected]
+    assert all(el.metadata.filename == "layout-parser-paper-fast.pdf" for el in elements)
+
+
+def test_iter_partition_pdf_with_hi_res_strategy_partitions_one_page_at_a_time(monkeypatch):
+    calls = []
+
+    def fake_partition_local(file, starting_page_number, **kwargs):
+        calls.append(len(PdfReader(file).pages))
+        metadata = ElementMetadata(page_number=starting_page_number)
+        return [Text(f"page {starting_page_number}", metadata=metadata)]
+
+    monkeypatch.setattr(pdf, "_partition_pdf_or_image_local", fake_partition_local)
+
+    pages = pdf.iter_partition_pdf(
+        filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"),
+        strategy=PartitionStrategy.HI_RES,
+        include_page_breaks=True,
+    )
+
+    page_1 = next(pages)
+    assert [el.text for el in page_1] == ["page 1", ""]
+    assert calls == [1]
+    page_2 = next(pages)
+    assert [el.text for el in page_2] == ["page 2", ""]
+    assert calls == [1, 1]
+    # -- the page break of each page hashes to its own id, as when partitioned in one go --
+    ids = [el.id for el in page_1 + page_2]
+    assert len(set(ids)) == 4
+
+
 def test_partition_pdf_with_fast_neg_coordinates():
     filename = example_doc_path("pdf/negative-coords.pdf")
     elements = pdf.partition_pdf(filename=filename, url=None, strategy=PartitionStrategy.FAST)
@@ -2167,6 +2239,25 @@ def test_document_to_element_list_sets_category_depth_titles():
     assert elements[3].metadata.category_depth == 0
 
 
+def test_iter_layout_element_records_matches_layout_element_to_dict():
+    # -- the mock element has no probability, which the array stores as NaN --
+    elements_array = MockDocumentLayout().pages[0].elements_array
+
+    records = list(pdf._iter_layout_element_records(elements_array))
+
+    assert len(records) == len(elements_array)
+    for record, layout_element in zip(records, elements_array.iter_elements()):
+        expected = layout_element.to_dict()
+        assert {key: record[key] for key in expected} == expected
+        assert record["bbox"] == [
+            layout_element.bbox.x1,
+            layout_element.bbox.y1,
+            layout_element.bbox.x2,
+            layout_element.bbox.y2,
+        ]
+    assert records[0]["prob"] is None
+
+
 @pytest.mark.parametrize("file_mode", ["filename", "rb", "spool"])
 @pytest.mark.parametrize(
     "strategy",
@@ -2261,3 +2352,74 @@ def test_hi_res_groups_rotated_page_text_into_words():
     assert len(single_chars) == 0, (
         f"Rotated page produced {len(single_chars)} single-char elements: {single_chars[:10]}"
     )
+
+
+@pytest.mark.parametrize(
+    ("layout_dpi", "is_image", "analysis", "expected"),
+    [
+        (0, False, False, 200),
+        (100, False, False, 100),
+        (300, False, False, 200),
+        (100, True, False, 200),
+        (100, False, True, 200),
+    ],
+)
+def test_layout_render_dpi(monkeypatch, layout_dpi, is_image, analysis, expected):
+    monkeypatch.setenv("PDF_LAYOUT_RENDER_DPI", str(layout_dpi))
+
+    assert pdf._layout_render_dpi(200, is_image=is_image, analysis=analysis) == expected
+
+
+def test_hi_res_scales_the_low_dpi_layout_to_the_page_image_dpi(monkeypatch):
+    monkeypatch.setenv("PDF_LAYOUT_RENDER_DPI", "100")
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    skip_ocr = mock.Mock(side_effect=lambda source, layout, **kwargs: layout)
+    with (
+        mock.patch.object(ocr, "process_data_with_ocr", skip_ocr),
+        mock.patch.object(ocr, "process_file_with_ocr", skip_ocr),
+    ):
+        elements = pdf.partition_pdf(filename, strategy=PartitionStrategy.HI_RES, pdf_image_dpi=200)
+
+    assert skip_ocr.call_args.kwargs["ocr_regions_only"] is True
+    page_one_elements = [el for el in elements if el.metadata.page_number == 1]
+    assert page_one_elements
+    coordinate_system = page_one_elements[0].metadata.coordinates.system
+    assert (coordinate_system.width, coordinate_system.height) == (1700, 2200)
+
+
+@pytest.mark.parametrize("include_page_breaks", [False, True])
+def test_hi_res_skips_blank_pages(monkeypatch, include_page_breaks):
+    monkeypatch.setenv("HI_RES_SKIP_BLANK_PAGES", "true")
+    reader = PdfReader(example_doc_path("pdf/layout-parser-paper-fast.pdf"))
+    writer = PdfWriter()
+    writer.add_page(reader.pages[0])
+    writer.add_blank_page(width=612, height=792)
+    writer.add_page(reader.pages[1])
+    file = io.BytesIO()
+    writer.write(file)
+    file.seek(0)
+
+    def fake_hi_res(page_indices, starting_page_number, **kwargs):
+        return [
+            Text(f"page {page_index + 1}", metadata=ElementMetadata(page_number=page_index + 1))
+            for page_index in page_indices
+        ]
+
+    with mock.patch.object(
+        pdf, "_partition_pdf_or_image_with_hi_res", side_effect=fake_hi_res
+    ) as mock_hi_res:
+        elements = pdf.partition_pdf(
+            file=file, strategy=PartitionStrategy.HI_RES, include_page_breaks=include_page_breaks
+        )
+
+    assert mock_hi_res.call_args.kwargs["page_indices"] == [0, 2]
+    assert mock_hi_res.call_args.kwargs["include_page_breaks"] is False
+    if include_page_breaks:
+        assert [el.text for el in elements] == ["page 1", "", "", "page 3", ""]
+        blank_page_break = elements[2]
+        assert isinstance(blank_page_break, PageBreak)
+        assert blank_page_break.metadata.page_number == 2
+        assert blank_page_break.metadata.routing == "blank"
+        assert blank_page_break.metadata.routing_score == 0.0
+    else:
+        assert [el.text for el in elements] == ["page 1", "page 3"]
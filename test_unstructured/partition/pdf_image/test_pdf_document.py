@@ -0,0 +1,136 @@
+import io
+import logging
+from unittest.mock import patch
+
+import pytest
+
+from test_unstructured.unit_utils import example_doc_path
+from unstructured.partition import pdf
+from unstructured.partition.pdf_image import pdf_document
+from unstructured.partition.pdf_image.pdf_document import PdfDocumentHandle
+from unstructured.partition.pdf_image.pdfminer_utils import open_pdfminer_pages_generator
+
+
+def test_pdf_document_handle_requires_filename_or_file():
+    with pytest.raises(ValueError, match="Either 'file' or 'filename' must be provided."):
+        PdfDocumentHandle()
+
+
+@pytest.mark.parametrize("file_mode", ["filename", "rb", "bytes"])
+def test_pdf_document_handle_counts_pages(file_mode):
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    with open(filename, "rb") as f:
+        data = f.read()
+    source = {
+        "filename": {"filename": filename},
+        "rb": {"file": io.BytesIO(data)},
+        "bytes": {"file": data},
+    }[file_mode]
+
+    document = PdfDocumentHandle(**source)
+
+    assert document.page_count == 2
+    assert document.file_size == len(data)
+
+
+def test_pdf_document_handle_does_not_move_the_file_cursor():
+    with open(example_doc_path("pdf/layout-parser-paper-fast.pdf"), "rb") as f:
+        file = io.BytesIO(f.read())
+    file.seek(7)
+
+    assert PdfDocumentHandle(file=file).page_count == 2
+    assert file.tell() == 7
+
+
+def test_pdf_document_handle_decrypts_with_password():
+    document = PdfDocumentHandle(filename=example_doc_path("pdf/password.pdf"), password="password")
+
+    assert "File with password" in document.reader.pages[0].extract_text()
+
+
+def test_partition_pdf_parses_the_pdf_with_pypdf_once():
+    with patch.object(pdf_document, "PdfReader", wraps=pdf_document.PdfReader) as mock_reader:
+        pdf.partition_pdf(
+            filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"),
+            strategy="fast",
+        )
+
+    assert mock_reader.call_count == 1
+
+
+def _pdf_with_a_broken_page_dict(num_pages: int, broken_page_index: int) -> bytes:
+    """A PDF whose page at `broken_page_index` has a dictionary with a key but no value, which
+    pdfminer rejects as an invalid dictionary construct and pikepdf repairs."""
+    font = b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"
+    objs = [b"<< /Type /Catalog /Pages 2 0 R >>", b"", font]
+    kids = []
+    for page_index in range(num_pages):
+        stream = b"BT /F1 24 Tf 72 700 Td (Page %d) Tj ET" % (page_index + 1)
+        objs.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        objs.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Resources << /Font << /F1 3 0"
+            b" R >> >> /Contents %d 0 R%s >>"
+            % (len(objs), b" /Stray" if page_index == broken_page_index else b"")
+        )
+        kids.append(b"%d 0 R" % len(objs))
+    objs[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), num_pages)
+
+    pdf = io.BytesIO()
+    pdf.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objs, start=1):
+        offsets.append(pdf.tell())
+        pdf.write(b"%d 0 obj\n%s\nendobj\n" % (number, obj))
+    xref_offset = pdf.tell()
+    pdf.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objs) + 1))
+    pdf.writelines(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf.write(
+        b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n"
+        % (len(objs) + 1, xref_offset)
+    )
+    return pdf.getvalue()
+
+
+def _page_texts(pages) -> list[str]:
+    return [
+        "".join(obj.get_text() for obj in page_layout if hasattr(obj, "get_text")).strip()
+        for _, page_layout in pages
+    ]
+
+
+def test_pdf_document_handle_repairs_the_document_once():
+    import pikepdf
+
+    data = _pdf_with_a_broken_page_dict(num_pages=2, broken_page_index=1)
+    document = PdfDocumentHandle(file=data)
+
+    with patch.object(pikepdf.Pdf, "open", wraps=pikepdf.Pdf.open) as mock_open:
+        repaired_data = document.repair()
+        assert document.repair() == repaired_data
+
+    mock_open.assert_called_once()
+    assert document.is_repaired
+    assert document.data == repaired_data != data
+    assert document.page_count == 2
+
+
+def test_pdfminer_passes_share_the_repaired_document(caplog):
+    caplog.set_level(logging.INFO)
+    data = _pdf_with_a_broken_page_dict(num_pages=3, broken_page_index=1)
+    document = PdfDocumentHandle(file=data)
+
+    first_pass = _page_texts(open_pdfminer_pages_generator(io.BytesIO(data), pdf_document=document))
+    second_pass = _page_texts(
+        open_pdfminer_pages_generator(io.BytesIO(data), pdf_document=document)
+    )
+
+    assert first_pass == second_pass == ["Page 1", "Page 2", "Page 3"]
+    assert caplog.text.count("Repairing the PDF document ...") == 1
+
+
+def test_open_pdfminer_pages_generator_repairs_a_selection_of_pages():
+    data = _pdf_with_a_broken_page_dict(num_pages=3, broken_page_index=0)
+
+    pages = open_pdfminer_pages_generator(io.BytesIO(data), page_indices=[0, 2])
+
+    assert _page_texts(pages) == ["Page 1", "Page 3"]
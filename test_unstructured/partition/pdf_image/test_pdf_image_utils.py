@@ -11,7 +11,7 @@ from unstructured_inference.inference import pdf_image
 
 from test_unstructured.unit_utils import example_doc_path
 from unstructured.documents.coordinates import PixelSpace
-from unstructured.documents.elements import ElementMetadata, ElementType, Image, Table
+from unstructured.documents.elements import ElementMetadata, ElementType, Image, Table, Text
 from unstructured.errors import UnprocessableEntityError
 from unstructured.partition.pdf_image import pdf_image_utils
 
@@ -249,6 +249,100 @@ def test_save_elements(
                 assert not el.metadata.image_mime_type
 
 
+def test_save_elements_crops_pages_held_by_page_image_store():
+    from unstructured.partition.pdf_image.page_image_store import PageImageStore
+
+    store = PageImageStore(filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"))
+    store.get_image(2)
+    elements = [
+        Image(
+            text="Image Text 1",
+            coordinates=((78, 86), (78, 519), (512, 519), (512, 86)),
+            coordinate_system=PixelSpace(width=1575, height=1166),
+            metadata=ElementMetadata(page_number=2),
+        ),
+    ]
+
+    with patch.object(store, "_render_region") as mock_render_region:
+        pdf_image_utils.save_elements(
+            elements=elements,
+            starting_page_number=1,
+            element_category_to_save=ElementType.IMAGE,
+            pdf_image_dpi=200,
+            filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"),
+            extract_image_block_to_payload=True,
+            page_image_store=store,
+        )
+
+    mock_render_region.assert_not_called()
+    assert store.render_count == 1
+    image = PILImg.open(io.BytesIO(base64.b64decode(elements[0].metadata.image_base64)))
+    assert image.size == (434, 433)
+
+
+def test_save_image_blocks_renders_only_the_regions_of_the_blocks(tmp_path):
+    from unstructured.partition.pdf_image.page_image_store import PageImageStore
+
+    elements = [
+        Image(
+            text="Image Text 1",
+            coordinates=((78, 86), (78, 519), (512, 519), (512, 86)),
+            coordinate_system=PixelSpace(width=1700, height=2200),
+            metadata=ElementMetadata(page_number=2),
+        ),
+        Table(
+            text="Table 1",
+            coordinates=((1062, 86), (1062, 519), (1496, 519), (1496, 86)),
+            coordinate_system=PixelSpace(width=1700, height=2200),
+            metadata=ElementMetadata(page_number=2),
+        ),
+        Text(text="Text", metadata=ElementMetadata(page_number=1)),
+    ]
+
+    with patch.object(PageImageStore, "_render") as mock_render_page:
+        pdf_image_utils.save_image_blocks(
+            elements=elements,
+            starting_page_number=1,
+            element_categories_to_save=[ElementType.IMAGE, ElementType.TABLE],
+            pdf_image_dpi=200,
+            filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"),
+            output_dir_path=str(tmp_path),
+        )
+
+    mock_render_page.assert_not_called()
+    assert elements[0].metadata.image_path == str(tmp_path / "figure-2-1.jpg")
+    assert elements[1].metadata.image_path == str(tmp_path / "table-2-1.jpg")
+    assert PILImg.open(elements[1].metadata.image_path).size == (434, 433)
+    assert elements[2].metadata.image_path is None
+
+
+def test_page_image_store_region_outside_the_page_is_black():
+    from unstructured.partition.pdf_image.page_image_store import PageImageStore
+
+    with PageImageStore(
+        filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"), dpi=72
+    ) as store:
+        region = store.get_region(1, (-10, -10, 20, 20))
+        cropped = store.get_image(1).crop((-10, -10, 20, 20))
+
+    assert region.size == (30, 30)
+    assert region.getpixel((5, 5)) == (0, 0, 0)
+    assert region.getpixel((25, 25)) == cropped.getpixel((25, 25))
+
+
+@pytest.mark.parametrize("dpi", [72, 144])
+def test_page_image_store_renders_region_at_dpi(dpi):
+    from unstructured.partition.pdf_image.page_image_store import PageImageStore
+
+    with PageImageStore(
+        filename=example_doc_path("pdf/layout-parser-paper-fast.pdf"), dpi=72
+    ) as store:
+        region = store.get_region(1, (100, 100, 300, 200), dpi=dpi)
+
+    assert region.size == (200 * dpi // 72, 100 * dpi // 72)
+    assert store.cached_page_numbers == []
+
+
 @pytest.mark.parametrize("storage_enabled", [False, True])
 def test_save_elements_with_output_dir_path_none(
     monkeypatch, storage_enabled, isolated_global_working_dir
@@ -4,7 +4,7 @@ from unittest.mock import Mock, patch
 
 import numpy as np
 import pytest
-from pdfminer.layout import LAParams, LTChar, LTContainer
+from pdfminer.layout import LAParams, LTAnno, LTChar, LTContainer, LTTextBoxHorizontal
 from PIL import Image
 from unstructured_inference.constants import IsExtracted
 from unstructured_inference.constants import Source as InferenceSource
@@ -24,10 +24,14 @@ from unstructured.partition.pdf_image.pdfminer_processing import (
     _rotate_bboxes,
     _validate_bbox,
     aggregate_embedded_text_by_block,
+    aggregate_embedded_text_by_blocks,
     bboxes1_is_almost_subregion_of_bboxes2,
     boxes_self_iou,
     clean_pdfminer_inner_elements,
     get_widget_text_from_annots,
+    get_words_from_obj,
+    map_bbox_and_index,
+    map_bboxes_and_indices,
     process_file_with_pdfminer,
     remove_duplicate_elements,
     text_is_embedded,
@@ -238,6 +242,33 @@ def test_aggregate_not_filling_target():
     assert extracted.value == "false"
 
 
+def test_aggregate_by_blocks_matches_aggregate_by_block():
+    embedded_regions = TextRegions.from_list(
+        [
+            TextRegion.from_coords(0, 0, 300, 20, "Inside region1"),
+            TextRegion.from_coords(0, 20, 300, 80, None),
+            TextRegion.from_coords(0, 80, 200, 300, "Inside region2"),
+            TextRegion.from_coords(250, 250, 350, 350, "Outside region"),
+            TextRegion.from_coords(400, 0, 420, 20, "In the small block"),
+        ]
+    )
+    target_regions = TextRegions.from_list(
+        [
+            TextRegion.from_coords(0, 0, 300, 300),
+            TextRegion.from_coords(390, 0, 500, 30),
+            TextRegion.from_coords(600, 600, 700, 700),
+        ]
+    )
+
+    texts = aggregate_embedded_text_by_blocks(target_regions, embedded_regions)
+
+    assert texts == [
+        aggregate_embedded_text_by_block(target_regions.slice([i]), embedded_regions)[0]
+        for i in range(len(target_regions))
+    ]
+    assert texts == ["Inside region1 Inside region2", "In the small block", ""]
+
+
 @pytest.mark.parametrize(
     ("coords1", "coords2", "expected"),
     [
@@ -309,9 +340,8 @@ def test_remove_duplicate_elements():
 
 
 def test_remove_duplicate_elements_dense_page_is_not_decimated():
-    """Pages with more than ~2000 elements are chunked internally; the dedup mask for each
-    chunk must be offset by the chunk's global index. Otherwise rows in later chunks match
-    themselves and are wrongly dropped, decimating dense pages."""
+    """A box is dropped only for a later near-duplicate; on dense pages boxes must not match
+    themselves or earlier boxes, which would decimate the page."""
     # 2500 unique, non-overlapping boxes on a 50x50 grid (zero IoU between any two)
     unique = [
         EmbeddedTextRegion(
@@ -320,13 +350,13 @@ def test_remove_duplicate_elements_dense_page_is_not_decimated():
         )
         for i in range(2500)
     ]
-    # one exact duplicate of the first box, appended last so the pair spans two chunks
+    # one exact duplicate of the first box, appended last
     duplicate = EmbeddedTextRegion(bbox=Rectangle(0, 0, 10, 10), text="Text 0 dup")
     sample_elements = TextRegions.from_list([*unique, duplicate])
 
     result = remove_duplicate_elements(sample_elements)
 
-    # only the single cross-chunk duplicate pair collapses; every unique box is kept
+    # only the single duplicate pair collapses; every unique box is kept
     assert len(result) == 2500
     # the later element of the duplicate pair is the one retained
     assert "Text 0 dup" in result.texts.tolist()
@@ -340,6 +370,27 @@ def test_process_file_with_pdfminer():
     assert links[0][0]["url"] == "https://layout-parser.github.io"
 
 
+def test_process_file_with_pdfminer_reuses_pages_from_extractable_elements():
+    from unstructured.partition.pdf import extractable_elements
+    from unstructured.partition.pdf_image import pdfminer_processing
+
+    filename = example_doc_path("pdf/layout-parser-paper-fast.pdf")
+    pdfminer_pages = []
+    extractable_elements(filename=filename, pdfminer_pages=pdfminer_pages)
+    expected_layout, expected_links = process_file_with_pdfminer(filename)
+
+    with patch.object(pdfminer_processing, "open_pdfminer_pages_generator") as mock_generator:
+        layout, links = process_file_with_pdfminer(filename, pdfminer_pages=pdfminer_pages)
+
+    mock_generator.assert_not_called()
+    assert len(pdfminer_pages) == 2
+    assert [page.texts.tolist() for page in layout] == [
+        page.texts.tolist() for page in expected_layout
+    ]
+    np.testing.assert_array_equal(layout[0].element_coords, expected_layout[0].element_coords)
+    assert links == expected_links
+
+
 def test_process_file_with_pdfminer_is_extracted_array():
     layout, _ = process_file_with_pdfminer(example_doc_path("pdf/layout-parser-paper-fast.pdf"))
     # first page contains rotated text that are considered low fidelity, i.e., is_extracted=partial
@@ -680,3 +731,53 @@ class TestDeduplicateLtchars:
         assert len(result) == 5
         text = "".join(c.get_text() for c in result)
         assert text == "HELLO"
+
+
+# -- Tests for word extraction from text boxes --
+
+
+def _mock_ltchar(text: str, x0: float, width: float = 5.0) -> Mock:
+    char = Mock(spec=LTChar)
+    char.get_text.return_value = text
+    char.x0, char.y0, char.x1, char.y1 = x0, 10.0, x0 + width, 18.0
+    return char
+
+
+def _text_box(*lines: list) -> LTTextBoxHorizontal:
+    text_box = LTTextBoxHorizontal()
+    text_box._objs = list(lines)
+    return text_box
+
+
+def test_get_words_from_obj():
+    a, b, duplicate_b = _mock_ltchar("a", 0.0), _mock_ltchar("b", 6.0), _mock_ltchar("b", 6.5)
+    c, comma, space = _mock_ltchar("c", 20.0), _mock_ltchar(",", 26.0), _mock_ltchar(" ", 31.0)
+    text_box = _text_box([a, b, duplicate_b, LTAnno(" "), c, comma, LTAnno("\n")], [space, c])
+
+    characters, words = get_words_from_obj(text_box, height=100.0)
+
+    assert characters == [a, b, c, comma, space, c]
+    assert words == [
+        {"text": "ab", "bbox": (0.0, 82.0, 11.0, 90.0), "start_index": 0},
+        {"text": "c", "bbox": (20.0, 82.0, 25.0, 90.0), "start_index": 4},
+        {"text": ",", "bbox": (26.0, 82.0, 31.0, 90.0), "start_index": 5},
+        # -- the leading space starts a word, which ends at the letter and is emitted; the letter
+        # -- is left open at the end of its line --
+        {"text": " ", "bbox": (31.0, 82.0, 36.0, 90.0), "start_index": 7},
+    ]
+
+
+def test_map_bboxes_and_indices_matches_map_bbox_and_index():
+    words = [
+        {"text": "Visit", "bbox": (0.0, 0.0, 30.0, 10.0), "start_index": 0},
+        {"text": "our", "bbox": (35.0, 0.0, 55.0, 10.0), "start_index": 6},
+        {"text": "site", "bbox": (60.0, 0.0, 85.0, 10.0), "start_index": 10},
+    ]
+    annots = [{"bbox": (34.0, 1.0, 86.0, 9.0)}, {"bbox": (58.0, 0.0, 31.0, 10.0)}]
+
+    mapped = map_bboxes_and_indices(words, [dict(annot) for annot in annots])
+
+    assert mapped == [map_bbox_and_index(words, dict(annot)) for annot in annots]
+    assert mapped[0]["text"] == "our site"
+    assert mapped[0]["start_index"] == 6
+    assert mapped[1]["text"] == "site"
@@ -313,6 +313,24 @@ class TestGetTextWithDeduplication:
         result = get_text_with_deduplication(mock_container, threshold=3.0)
         assert result == "T"
 
+    def test_with_container_does_not_compare_chars_across_lines(self):
+        """A char is only a duplicate of the last kept char of its own line."""
+        lines = []
+        for _ in range(2):
+            chars = [
+                _create_mock_ltchar("T", 10.0, 20.0),
+                _create_mock_ltchar("T", 10.5, 20.0),  # Duplicate
+            ]
+            mock_text_line = MagicMock(spec=LTTextLine)
+            mock_text_line.__iter__ = lambda self, chars=chars: iter(chars)
+            lines.append(mock_text_line)
+
+        mock_container = MagicMock(spec=LTContainer)
+        mock_container.__iter__ = lambda self: iter(lines)
+
+        result = get_text_with_deduplication(mock_container, threshold=3.0)
+        assert result == "TT"
+
     def test_with_generic_object(self):
         """Should fall back to get_text() for non-standard objects."""
         mock_obj = MagicMock()
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from unstructured.partition.pdf_image import pdfminer_processing
+from unstructured.partition.pdf_image.spatial_index import candidate_box_pairs
+
+
+def _random_boxes(rng, n, max_width, max_height):
+    x1 = rng.uniform(0, 1000, n)
+    y1 = rng.uniform(0, 1300, n)
+    return np.stack(
+        [x1, y1, x1 + rng.uniform(0, max_width, n), y1 + rng.uniform(0, max_height, n)], axis=1
+    ).round(1)
+
+
+def _intersecting_pairs(coords1, coords2):
+    inter_area, _, _ = pdfminer_processing.areas_of_boxes_and_intersection_area(coords1, coords2)
+    return set(zip(*np.nonzero(inter_area > 0)))
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_candidate_box_pairs_include_every_intersecting_pair(seed):
+    rng = np.random.default_rng(seed)
+    coords1 = _random_boxes(rng, 300, 15, 15)
+    coords2 = _random_boxes(rng, 40, 400, 200)
+
+    rows, cols = candidate_box_pairs(coords1, coords2)
+
+    assert _intersecting_pairs(coords1, coords2) <= set(zip(rows, cols))
+    assert len(set(zip(rows, cols))) == len(rows)
+
+
+def test_candidate_box_pairs_uses_the_inclusive_pixel_convention():
+    # -- boxes sharing only an edge pixel intersect; the grid is fine enough that a box far away
+    # -- is not a candidate --
+    coords1 = np.array([[0, 0, 10, 10]] + [[500 + i, 500 + i, 501 + i, 501 + i] for i in range(99)])
+    coords2 = np.array([[10, 10, 20, 20], [900, 900, 950, 950]])
+
+    rows, cols = candidate_box_pairs(coords1, coords2)
+
+    assert (0, 0) in set(zip(rows, cols))
+    assert (0, 1) not in set(zip(rows, cols))
+
+
+def test_candidate_box_pairs_of_empty_groups():
+    rows, cols = candidate_box_pairs(np.zeros((0, 4)), np.array([[0, 0, 10, 10]]))
+
+    assert rows.size == cols.size == 0
+
+
+@pytest.mark.parametrize("threshold", [0.1, 0.5, 0.9])
+def test_spatial_index_matches_all_pairs_comparison(monkeypatch, threshold):
+    rng = np.random.default_rng(0)
+    coords1 = _random_boxes(rng, 500, 20, 20)
+    coords2 = np.concatenate([_random_boxes(rng, 60, 300, 150), coords1[:30]])
+
+    monkeypatch.setenv("BBOX_SPATIAL_INDEX_MIN_PAIRS", "0")
+    expected_subregion = pdfminer_processing.bboxes1_is_almost_subregion_of_bboxes2(
+        coords1, coords2, threshold
+    )
+    expected_iou = pdfminer_processing.boxes_iou(coords1, coords2, threshold)
+    monkeypatch.setenv("BBOX_SPATIAL_INDEX_MIN_PAIRS", "1")
+
+    np.testing.assert_array_equal(
+        pdfminer_processing.bboxes1_is_almost_subregion_of_bboxes2(coords1, coords2, threshold),
+        expected_subregion,
+    )
+    np.testing.assert_array_equal(
+        pdfminer_processing.boxes_iou(coords1, coords2, threshold), expected_iou
+    )
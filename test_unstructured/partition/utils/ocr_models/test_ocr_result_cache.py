@@ -0,0 +1,133 @@
+"""Unit-test suite for the `unstructured.partition.utils.ocr_models.ocr_result_cache` module."""
+
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from PIL import Image
+
+from unstructured.partition.utils.ocr_models import ocr_result_cache, tesseract_ocr
+from unstructured.partition.utils.ocr_models.ocr_result_cache import (
+    OCRResultCache,
+    cache_ocr_result,
+    ocr_result_key,
+)
+
+
+class FakeAgent:
+    def __init__(self, language: str = "eng"):
+        self.language = language
+        self.calls = 0
+
+    @cache_ocr_result
+    def get_text_from_image(self, image: Image.Image) -> list[str]:
+        self.calls += 1
+        return [f"text of {image.size}"]
+
+
+@pytest.fixture
+def ocr_cache_enabled(monkeypatch):
+    monkeypatch.setenv("OCR_RESULT_CACHE_SIZE", "8")
+    ocr_result_cache._ocr_result_cache.cache_clear()
+    yield
+    ocr_result_cache._ocr_result_cache.cache_clear()
+
+
+class DescribeOCRResultCache:
+    """Unit-test suite for `unstructured.partition.utils...ocr_result_cache.OCRResultCache`."""
+
+    def it_computes_a_result_once_and_counts_the_time_saved(self):
+        cache = OCRResultCache(max_entries=2)
+        cache.get_or_compute("a", lambda: ["x"])
+
+        assert cache.get_or_compute("a", lambda: ["y"]) == ["x"]
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+        assert cache.stats()["hit_rate"] == 0.5
+        assert cache.stats()["time_saved_s"] >= 0.0
+
+    def it_hands_out_copies_of_cached_results(self):
+        cache = OCRResultCache(max_entries=2)
+        cache.get_or_compute("a", lambda: ["x"]).append("modified")
+
+        assert cache.get_or_compute("a", lambda: ["y"]) == ["x"]
+
+    def it_evicts_the_least_recently_used_result(self):
+        cache = OCRResultCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.get_or_compute(key, lambda: [key])
+        cache.get_or_compute("a", lambda: ["a again"])
+        cache.get_or_compute("c", lambda: ["c"])
+
+        assert cache.get_or_compute("a", lambda: ["a again"]) == ["a"]
+        assert cache.get_or_compute("b", lambda: ["b again"]) == ["b again"]
+
+    def it_logs_its_lookups_since_a_snapshot_of_its_stats(self, caplog):
+        cache = OCRResultCache(max_entries=2)
+        cache.get_or_compute("a", lambda: ["x"])
+        snapshot = cache.stats()
+
+        with caplog.at_level("INFO", logger="unstructured"):
+            cache.log_stats(since=snapshot)
+            assert caplog.records == []
+
+            cache.get_or_compute("a", lambda: ["y"])
+            cache.get_or_compute("b", lambda: ["z"])
+            cache.log_stats(since=snapshot)
+
+        assert "OCR result cache: 1 hits (0 from disk), 1 misses" in caplog.text
+
+    def it_shares_results_through_the_cache_dir(self, tmp_path):
+        OCRResultCache(max_entries=2, cache_dir=str(tmp_path)).get_or_compute("a", lambda: ["x"])
+        other_process_cache = OCRResultCache(max_entries=2, cache_dir=str(tmp_path))
+
+        assert other_process_cache.get_or_compute("a", lambda: ["y"]) == ["x"]
+        assert other_process_cache.stats()["disk_hits"] == 1
+        assert [p.name for p in tmp_path.iterdir()] == ["a.pkl"]
+
+
+def test_ocr_result_key_depends_on_agent_language_method_and_pixels():
+    image = Image.new("RGB", (10, 10))
+    key = ocr_result_key(FakeAgent(), "get_text_from_image", image)
+
+    assert key == ocr_result_key(FakeAgent(), "get_text_from_image", image.copy())
+    assert key != ocr_result_key(FakeAgent("deu"), "get_text_from_image", image)
+    assert key != ocr_result_key(FakeAgent(), "get_layout_from_image", image)
+    assert key != ocr_result_key(FakeAgent(), "get_text_from_image", Image.new("RGB", (10, 11)))
+    assert key != ocr_result_key(
+        FakeAgent(), "get_text_from_image", Image.new("RGB", (10, 10), "white")
+    )
+
+
+def test_cache_ocr_result_is_off_by_default():
+    agent = FakeAgent()
+    image = Image.new("RGB", (10, 10))
+
+    agent.get_text_from_image(image)
+    agent.get_text_from_image(image)
+
+    assert agent.calls == 2
+
+
+def test_cache_ocr_result_reuses_results_for_identical_images(ocr_cache_enabled):
+    agent = FakeAgent()
+
+    agent.get_text_from_image(Image.new("RGB", (10, 10)))
+    text = agent.get_text_from_image(Image.new("RGB", (10, 10)))
+
+    assert text == ["text of (10, 10)"]
+    assert agent.calls == 1
+    assert ocr_result_cache.get_ocr_result_cache().stats()["hits"] == 1
+
+
+def test_tesseract_agent_text_is_cached(ocr_cache_enabled):
+    agent = tesseract_ocr.OCRAgentTesseract()
+    image = Image.new("RGB", (10, 10))
+    with patch.object(
+        tesseract_ocr.unstructured_pytesseract, "image_to_string", return_value="text"
+    ) as image_to_string:
+        assert agent.get_text_from_image(image) == "text"
+        assert agent.get_text_from_image(image) == "text"
+
+    image_to_string.assert_called_once()
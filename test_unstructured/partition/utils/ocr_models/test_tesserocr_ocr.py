@@ -0,0 +1,87 @@
+"""Unit-test suite for the `unstructured.partition.utils.ocr_models.tesserocr_ocr` module."""
+
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from unstructured.partition.utils.ocr_models import tesserocr_ocr
+from unstructured.partition.utils.ocr_models.tesserocr_ocr import OCRAgentTesserocr
+
+HOCR_PAGE = (
+    "<div class='ocr_page' title='bbox 0 0 100 40'>"
+    "<span class='ocrx_word' title='bbox 10 9 70 22; x_wconf 96'>"
+    "<span class='ocrx_cinfo' title='x_bboxes 0 0 0 0; x_conf 99.0'>h</span>"
+    "<span class='ocrx_cinfo' title='x_bboxes 0 0 0 0; x_conf 98.0'>i</span>"
+    "<span class='ocrx_cinfo' title='x_bboxes 0 0 0 0; x_conf 40.0'>!</span>"
+    "</span></div>"
+)
+
+
+def _fake_engine(lang: str = "eng"):
+    api = MagicMock()
+    api.GetHOCRText.return_value = HOCR_PAGE
+    api.GetUTF8Text.return_value = "hi!\n"
+    api.GetPageSegMode.return_value = 3
+    api.GetVariableAsString.return_value = "0"
+    return api
+
+
+class DescribeOCRAgentTesserocr:
+    """Unit-test suite for `unstructured.partition.utils...tesserocr_ocr.OCRAgentTesserocr`."""
+
+    def it_parses_the_hocr_of_the_in_process_engine(self):
+        with patch.object(tesserocr_ocr, "_load_engine", side_effect=_fake_engine):
+            df = OCRAgentTesserocr().image_to_data_with_character_confidence_filter(
+                np.zeros((40, 100, 3), dtype=np.uint8), character_confidence_threshold=0.5
+            )
+
+        assert df.to_dict("records") == [
+            {"left": 10, "top": 9, "text": "hi", "width": 60, "height": 13}
+        ]
+
+    def it_loads_the_engine_once_per_language(self):
+        agent = OCRAgentTesserocr()
+        image = np.zeros((40, 100, 3), dtype=np.uint8)
+
+        with patch.object(tesserocr_ocr, "_load_engine", side_effect=_fake_engine) as load_engine:
+            for _ in range(3):
+                agent.image_to_data_with_character_confidence_filter(image, lang="eng")
+            agent.get_text_from_image(MagicMock())
+            agent.image_to_data_with_character_confidence_filter(image, lang="deu")
+
+        assert [c.args for c in load_engine.call_args_list] == [("eng",), ("deu",)]
+
+    def it_gives_concurrent_calls_their_own_engine(self):
+        agent = OCRAgentTesserocr()
+        engines = []
+
+        def load_engine(lang):
+            engines.append(_fake_engine())
+            return engines[-1]
+
+        with patch.object(tesserocr_ocr, "_load_engine", side_effect=load_engine):
+            with agent._engine("eng") as first, agent._engine("eng") as second:
+                assert first is not second
+            with ThreadPoolExecutor(2) as executor:
+                list(executor.map(lambda _: agent.get_text_from_image(MagicMock()), range(8)))
+
+        assert len(engines) <= 4
+
+    def it_restores_the_engine_config_after_each_call(self):
+        api = _fake_engine()
+
+        with tesserocr_ocr._engine_config(api, "--psm 6 -c preserve_interword_spaces=1"):
+            api.SetPageSegMode.assert_called_once_with(6)
+            api.SetVariable.assert_called_once_with("preserve_interword_spaces", "1")
+
+        api.SetPageSegMode.assert_called_with(3)
+        api.SetVariable.assert_called_with("preserve_interword_spaces", "0")
+
+    def it_rejects_unsupported_config_options(self):
+        with pytest.raises(ValueError, match="--oem"):
+            with tesserocr_ocr._engine_config(_fake_engine(), "--oem 1"):
+                pass
@@ -58,6 +58,73 @@ def test_recursive_xy_cut(recursive_func, expected):
     assert res == expected
 
 
+@pytest.mark.parametrize(
+    "boxes",
+    [
+        np.array([[10, 20, 50, 60], [30, 40, 70, 80]]),
+        np.array([[0, 0, 20, 20], [200, 0, 230, 30], [0, 40, 50, 50]]),
+        # -- touching boxes, a box without extent and a gap of one pixel --
+        np.array([[0, 0, 5, 5], [5, 5, 9, 9], [12, 12, 12, 30], [10, 10, 15, 15], [16, 2, 20, 4]]),
+    ],
+)
+@pytest.mark.parametrize("axis", [0, 1])
+def test_split_boxes_along_axis_matches_projection_profile(boxes, axis):
+    sorted_boxes = boxes[boxes[:, axis].argsort()]
+
+    result = xycut.split_boxes_along_axis(sorted_boxes, axis)
+
+    expected = xycut.split_projection_profile(xycut.projection_by_bboxes(sorted_boxes, axis), 0, 1)
+    assert np.array_equal(result, expected)
+
+
+def test_split_boxes_along_axis_returns_none_when_no_box_has_extent():
+    assert xycut.split_boxes_along_axis(np.array([[3, 3, 3, 8], [6, 1, 6, 2]]), 0) is None
+
+
+def _nested_boxes(levels: int) -> np.ndarray:
+    """Each level is a band across the top of the region and a bar down its left side, around the
+    next level; cutting it takes one more nested cut per level."""
+    size = 3 * levels + 10
+    boxes = []
+    for level in range(levels):
+        boxes.append([3 * level, 3 * level, size, 3 * level + 1])
+        boxes.append([3 * level, 3 * level + 2, 3 * level + 1, size])
+    return np.array(boxes)
+
+
+def test_recursive_xy_cut_handles_regions_nested_deeper_than_the_recursion_limit():
+    boxes = _nested_boxes(2000)
+    res = []
+
+    xycut.recursive_xy_cut(boxes, np.arange(len(boxes)), res, max_depth=5000)
+
+    assert res == list(range(len(boxes)))
+
+
+@pytest.mark.parametrize("recursive_func", [xycut.recursive_xy_cut, xycut.recursive_xy_cut_swapped])
+def test_recursive_xy_cut_orders_regions_deeper_than_max_depth_with_fallback(recursive_func):
+    boxes = _nested_boxes(10)
+    res = []
+
+    recursive_func(
+        boxes,
+        np.arange(len(boxes)),
+        res,
+        max_depth=0,
+        fallback=lambda boxes, indices: list(indices[::-1]),
+    )
+
+    assert sorted(res) == list(range(len(boxes)))
+    assert res != list(range(len(boxes)))
+
+
+def test_sweep_line_order():
+    # -- two lines, the second with a box slightly higher than its neighbour --
+    boxes = np.array([[50, 0, 90, 10], [0, 2, 40, 12], [60, 21, 90, 30], [0, 20, 40, 30]])
+
+    assert xycut.sweep_line_order(boxes, np.array([10, 11, 12, 13])) == [11, 10, 13, 12]
+
+
 def test_points_to_bbox():
     # Test a valid case
     points = [10, 20, 30, 40, 50, 60, 70, 80]
@@ -16,6 +16,13 @@ from unstructured.logger import logger
 from unstructured.partition.common import UnsupportedFileFormatError
 from unstructured.partition.common.common import exactly_one
 from unstructured.partition.common.lang import check_language_args
+from unstructured.partition.common.partition_cache import (
+    PartitionCache,
+    apply_call_metadata,
+    get_default_partition_cache,
+    hash_content,
+    partition_cache_key,
+)
 from unstructured.partition.utils.constants import PartitionStrategy
 from unstructured.safe_http import safe_get
 from unstructured.telemetry import partition_runtime_telemetry, set_partition_document_type
@@ -51,6 +58,7 @@ def partition(
     hi_res_model_name: Optional[str] = None,
     model_name: Optional[str] = None,  # to be deprecated
     starting_page_number: int = 1,
+    partition_cache: Optional[PartitionCache] = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Partitions a document into its constituent elements.
@@ -138,6 +146,12 @@ def partition(
         Indicates what page number should be assigned to the first page in the document.
         This information will be reflected in elements' metadata and can be be especially
         useful when partitioning a document that is part of a larger document.
+    partition_cache
+        The on-disk cache of partitioning results to read from and write to. When the same content
+        was already partitioned with the same output-affecting arguments, the cached elements are
+        returned without partitioning, with this call's metadata (e.g. `metadata_filename`)
+        applied. Defaults to the cache in the `PARTITION_CACHE_DIR` directory when that is set,
+        otherwise results are not cached.
     """
     exactly_one(file=file, filename=filename, url=url)
 
@@ -193,8 +207,6 @@ def partition(
         )
     )
 
-    partitioner_loader = _PartitionerLoader()
-
     # -- extracting this post-processing to allow multiple exit-points from function --
     def augment_metadata(elements: list[Element]) -> list[Element]:
         """Add some metadata fields to each element."""
@@ -209,6 +221,54 @@ def partition(
 
         return elements
 
+    def finish(elements: list[Element]) -> list[Element]:
+        """Cache the partitioned elements when caching applies, then augment their metadata."""
+        if cache_key is not None:
+            assert partition_cache is not None
+            partition_cache.put(cache_key, elements)
+        return augment_metadata(elements)
+
+    partition_cache = partition_cache or get_default_partition_cache()
+    cache_key = (
+        partition_cache_key(
+            hash_content(filename=filename, file=file),
+            {
+                **kwargs,
+                "file_type": file_type.name,
+                "encoding": encoding,
+                "content_type": content_type,
+                "strategy": strategy,
+                "languages": languages,
+                "detect_language_per_element": detect_language_per_element,
+                "language_fallback": language_fallback,
+                "infer_table_structure": infer_table_structure,
+                "extract_images_in_pdf": extract_images_in_pdf,
+                "extract_image_block_types": extract_image_block_types,
+                "extract_image_block_output_dir": extract_image_block_output_dir,
+                "extract_image_block_to_payload": extract_image_block_to_payload,
+                "hi_res_model_name": hi_res_model_name or model_name,
+                "starting_page_number": starting_page_number,
+            },
+        )
+        if partition_cache is not None and file_type != FileType.EMPTY
+        else None
+    )
+    if cache_key is not None:
+        assert partition_cache is not None
+        cached_elements = partition_cache.get(cache_key)
+        if cached_elements is not None:
+            return augment_metadata(
+                apply_call_metadata(
+                    cached_elements,
+                    filename=filename,
+                    metadata_filename=kwargs.get("metadata_filename"),
+                    metadata_last_modified=kwargs.get("metadata_last_modified"),
+                    unique_element_ids=kwargs.get("unique_element_ids", False),
+                )
+            )
+
+    partitioner_loader = _PartitionerLoader()
+
     # -- handle PDF/Image partitioning separately because they have a lot of special-case
     # -- parameters. We'll come back to this after sorting out the other file types.
     if file_type == FileType.PDF:
@@ -230,7 +290,7 @@ def partition(
             starting_page_number=starting_page_number,
             **kwargs,
         )
-        return augment_metadata(elements)
+        return finish(elements)
 
     if file_type.partitioner_shortname and file_type.partitioner_shortname == "image":
         partition_image = partitioner_loader.get(file_type)
@@ -251,14 +311,14 @@ def partition(
             starting_page_number=starting_page_number,
             **kwargs,
         )
-        return augment_metadata(elements)
+        return finish(elements)
 
     # -- JSON/NDJSON are special cases: not document formats per se and insensitive to most
     # -- parameters that apply to other file types.
     if file_type in (FileType.JSON, FileType.NDJSON):
         partitioner = partitioner_loader.get(file_type)
         elements = partitioner(filename=filename, file=file, **kwargs)
-        return augment_metadata(elements)
+        return finish(elements)
 
     # -- EMPTY is also a special case because while we can't determine the file type, we can be
     # -- sure it doesn't contain any elements.
@@ -282,7 +342,7 @@ def partition(
 
     partition = partitioner_loader.get(file_type)
     elements = partition(filename=filename, file=file, **partitioning_kwargs)
-    return augment_metadata(elements)
+    return finish(elements)
 
 
 def file_and_type_from_url(
@@ -97,15 +97,21 @@ def category_depth_from_html_tag(
 
 
 def set_element_hierarchy(
-    elements: Sequence[Element], ruleset: dict[str, list[str]] = HIERARCHY_RULE_SET
+    elements: Sequence[Element],
+    ruleset: dict[str, list[str]] = HIERARCHY_RULE_SET,
+    stack: list[Element] | None = None,
 ) -> list[Element]:
     """Sets `.metadata.parent_id` for each element it applies to.
 
     `parent_id` assignment is based on the element's category and depth. The importance of an
     element's category is determined by a rule set. The rule set trumps category_depth. That is,
     category_depth is only relevant when elements are of the same category.
+
+    `stack` holds the candidate parents and is updated in place, so passing the same list for
+    consecutive batches of a document (e.g. when elements are streamed page by page) produces the
+    same hierarchy as a single call over all of them.
     """
-    stack: list[Element] = []
+    stack = [] if stack is None else stack
     for element in elements:
         if element.metadata.parent_id is not None:
             continue
@@ -196,92 +202,111 @@ def apply_metadata(
         def wrapper(*args: _P.args, **kwargs: _P.kwargs) -> list[Element]:
             elements = func(*args, **kwargs)
             call_args = get_call_args_applying_defaults(func, *args, **kwargs)
+            return postprocess_elements(elements, call_args, file_type)
 
-            # ------------------------------------------------------------------------------------
-            # unique-ify elements
-            # ------------------------------------------------------------------------------------
-            # Do this first to ensure all following operations behave as expected. It's easy for a
-            # partitioner to re-use an element or metadata instance when its values are common to
-            # multiple elements. This can lead to very hard-to diagnose bugs downstream when
-            # mutating one element unexpectedly also mutates others (because they are the same
-            # instance).
-            # ------------------------------------------------------------------------------------
-
-            elements = _uniqueify_elements_and_metadata(elements)
-
-            # ------------------------------------------------------------------------------------
-            # apply metadata - do this first because it affects the hash computation.
-            # ------------------------------------------------------------------------------------
-
-            # -- `language` - auto-detect language (e.g. eng, spa) --
-            languages = call_args.get("languages")
-            detect_language_per_element = call_args.get("detect_language_per_element", False)
-            language_fallback = call_args.get("language_fallback")
-            elements = list(
-                apply_lang_metadata(
-                    elements=elements,
-                    languages=languages,
-                    detect_language_per_element=detect_language_per_element,
-                    language_fallback=language_fallback,
-                )
-            )
-
-            # == apply filetype, filename, last_modified, and url metadata ===================
-            metadata_kwargs: dict[str, Any] = {}
-
-            # -- `filetype` (MIME-type) metadata --
-            metadata_file_type = call_args.get("metadata_file_type") or file_type
-            if metadata_file_type is not None:
-                metadata_kwargs["filetype"] = metadata_file_type.mime_type
-
-            # -- `filename` metadata - override with metadata_filename when it's present --
-            filename = call_args.get("metadata_filename") or call_args.get("filename")
-            if filename:
-                metadata_kwargs["filename"] = filename
+        return wrapper
 
-            # -- `last_modified` metadata - override with metadata_last_modified when present --
-            metadata_last_modified = call_args.get("metadata_last_modified")
-            if metadata_last_modified:
-                metadata_kwargs["last_modified"] = metadata_last_modified
+    return decorator
 
-            # -- `url` metadata - record url when present --
-            url = call_args.get("url")
-            if url:
-                metadata_kwargs["url"] = url
 
-            # -- update element.metadata in single pass --
-            for element in elements:
-                # NOTE(robinson) - Attached files have already run through this logic in their own
-                # partitioning function
-                if element.metadata.attached_to_filename:
-                    continue
-                element.metadata.update(ElementMetadata(**metadata_kwargs))
+def postprocess_elements(
+    elements: list[Element],
+    call_args: dict[str, Any],
+    file_type: FileType | None = None,
+    hierarchy_stack: list[Element] | None = None,
+    page_seq_counts: dict[int | None, int] | None = None,
+) -> list[Element]:
+    """Apply the post-processing of `apply_metadata()` to `elements`.
 
-            # ------------------------------------------------------------------------------------
-            # compute hash ids (when so requestsd)
-            # ------------------------------------------------------------------------------------
+    `call_args` are the partitioner's call arguments with defaults applied. Partitioners that emit
+    a document in batches (e.g. page by page) can call this once per batch, passing the same
+    `hierarchy_stack` list and `page_seq_counts` dict to every call so `parent_id` links can span
+    batches and hash ids match those of partitioning the document in one go.
+    """
 
-            # -- Compute and apply hash-ids if the user does not want UUIDs. Note this mutates the
-            # -- elements themselves, not their metadata.
-            unique_element_ids: bool = call_args.get("unique_element_ids", False)
-            if unique_element_ids is False:
-                elements = _assign_hash_ids(elements)
+    # ------------------------------------------------------------------------------------
+    # unique-ify elements
+    # ------------------------------------------------------------------------------------
+    # Do this first to ensure all following operations behave as expected. It's easy for a
+    # partitioner to re-use an element or metadata instance when its values are common to
+    # multiple elements. This can lead to very hard-to diagnose bugs downstream when
+    # mutating one element unexpectedly also mutates others (because they are the same
+    # instance).
+    # ------------------------------------------------------------------------------------
+
+    elements = _uniqueify_elements_and_metadata(elements)
+
+    # ------------------------------------------------------------------------------------
+    # apply metadata - do this first because it affects the hash computation.
+    # ------------------------------------------------------------------------------------
+
+    # -- `language` - auto-detect language (e.g. eng, spa) --
+    languages = call_args.get("languages")
+    detect_language_per_element = call_args.get("detect_language_per_element", False)
+    language_fallback = call_args.get("language_fallback")
+    elements = list(
+        apply_lang_metadata(
+            elements=elements,
+            languages=languages,
+            detect_language_per_element=detect_language_per_element,
+            language_fallback=language_fallback,
+        )
+    )
+
+    # == apply filetype, filename, last_modified, and url metadata ===================
+    metadata_kwargs: dict[str, Any] = {}
+
+    # -- `filetype` (MIME-type) metadata --
+    metadata_file_type = call_args.get("metadata_file_type") or file_type
+    if metadata_file_type is not None:
+        metadata_kwargs["filetype"] = metadata_file_type.mime_type
+
+    # -- `filename` metadata - override with metadata_filename when it's present --
+    filename = call_args.get("metadata_filename") or call_args.get("filename")
+    if filename:
+        metadata_kwargs["filename"] = filename
+
+    # -- `last_modified` metadata - override with metadata_last_modified when present --
+    metadata_last_modified = call_args.get("metadata_last_modified")
+    if metadata_last_modified:
+        metadata_kwargs["last_modified"] = metadata_last_modified
+
+    # -- `url` metadata - record url when present --
+    url = call_args.get("url")
+    if url:
+        metadata_kwargs["url"] = url
+
+    # -- update element.metadata in single pass --
+    for element in elements:
+        # NOTE(robinson) - Attached files have already run through this logic in their own
+        # partitioning function
+        if element.metadata.attached_to_filename:
+            continue
+        element.metadata.update(ElementMetadata(**metadata_kwargs))
 
-            # ------------------------------------------------------------------------------------
-            # assign parent-id - do this after hash computation so parent-id is stable.
-            # ------------------------------------------------------------------------------------
+    # ------------------------------------------------------------------------------------
+    # compute hash ids (when so requestsd)
+    # ------------------------------------------------------------------------------------
 
-            # -- `parent_id` - process category-level etc. to assign parent-id --
-            elements = set_element_hierarchy(elements)
+    # -- Compute and apply hash-ids if the user does not want UUIDs. Note this mutates the
+    # -- elements themselves, not their metadata.
+    unique_element_ids: bool = call_args.get("unique_element_ids", False)
+    if unique_element_ids is False:
+        elements = _assign_hash_ids(elements, page_seq_counts=page_seq_counts)
 
-            return elements
+    # ------------------------------------------------------------------------------------
+    # assign parent-id - do this after hash computation so parent-id is stable.
+    # ------------------------------------------------------------------------------------
 
-        return wrapper
+    # -- `parent_id` - process category-level etc. to assign parent-id --
+    elements = set_element_hierarchy(elements, stack=hierarchy_stack)
 
-    return decorator
+    return elements
 
 
-def _assign_hash_ids(elements: list[Element]) -> list[Element]:
+def _assign_hash_ids(
+    elements: list[Element], page_seq_counts: dict[int | None, int] | None = None
+) -> list[Element]:
     """Converts `.id` of each element from UUID to hash and remaps `parent_id` accordingly.
 
     The hash is based on the `.text` of the element, but also on its page-number and sequence number
@@ -292,9 +317,13 @@ def _assign_hash_ids(elements: list[Element]) -> list[Element]:
     updated to the corresponding new hash ID. Parent IDs that do not appear in the mapping (e.g.
     because the parent element was filtered out before hashing, or the ID was set manually to an
     external value) are left unchanged.
+
+    `page_seq_counts` holds the number of elements already seen on each page; pass the same dict
+    when hashing a document batch by batch so sequence numbers carry over from one batch to the
+    next. It is updated in place.
     """
     # -- generate sequence number for each element on a page --
-    page_seq_counts = {}
+    page_seq_counts = {} if page_seq_counts is None else page_seq_counts
     id_mapping = {}
     for element in elements:
         page_number = element.metadata.page_number
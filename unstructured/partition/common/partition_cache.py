@@ -0,0 +1,273 @@
+"""Content-addressed on-disk cache of `partition()` results.
+
+A cache entry is keyed by the SHA-256 of the input bytes together with a hash of the canonicalized
+arguments that affect the partitioning output (strategy, languages, models, chunking arguments,
+...), the library version and the `unstructured` environment settings in effect. Per-call metadata
+(`metadata_filename`, `metadata_last_modified`, `url`, ...) is not part of the key; it is applied
+again to the cached elements on every hit.
+
+Entries are the elements serialized with `elements_to_json()`. Each one is written to a temporary
+file that is atomically renamed into place, so concurrent processes can share a cache directory.
+The least recently used entries are evicted once the directory grows beyond its size budget.
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import uuid
+from typing import IO, Any, Optional
+
+from unstructured.__version__ import __version__
+from unstructured.documents.elements import Element
+from unstructured.logger import logger
+from unstructured.partition.common.metadata import _assign_hash_ids, get_last_modified_date
+from unstructured.partition.utils.config import env_config
+from unstructured.staging.base import elements_from_json, elements_to_json
+
+# -- call arguments that only carry per-call metadata; they are re-applied on a cache hit --
+PER_CALL_ARGUMENTS = frozenset(
+    (
+        "filename",
+        "file",
+        "url",
+        "headers",
+        "ssl_verify",
+        "request_timeout",
+        "data_source_metadata",
+        "metadata_filename",
+        "metadata_last_modified",
+        "unique_element_ids",
+    )
+)
+
+_CACHE_ENTRY_SUFFIX = ".json"
+_HASH_CHUNK_SIZE = 1 << 20
+
+
+class PartitionCache:
+    """A size-bounded, content-addressed cache of partitioned elements in `cache_dir`.
+
+    `max_bytes` bounds the total size of the cache entries (env_config.PARTITION_CACHE_MAX_BYTES
+    by default, 0 for no limit). `hits`, `misses`, `stores` and `evictions` count this instance's
+    cache operations.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = (
+            max_bytes if max_bytes is not None else env_config.PARTITION_CACHE_MAX_BYTES
+        )
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def stats(self) -> dict[str, int]:
+        """The hit, miss, store and eviction counts of this instance."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "evictions": self.evictions,
+        }
+
+    def get(self, key: str) -> Optional[list[Element]]:
+        """The elements cached under `key`, or None when there is no (readable) entry."""
+        path = self._entry_path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                elements = elements_from_json(text=f.read())
+            # -- mark the entry as recently used for LRU eviction --
+            os.utime(path)
+        except FileNotFoundError:
+            elements = None
+        except (OSError, ValueError):
+            logger.warning(f"Discarding unreadable partition cache entry {path}", exc_info=True)
+            _remove_file(path)
+            elements = None
+
+        with self._lock:
+            if elements is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return elements
+
+    def put(self, key: str, elements: list[Element]) -> None:
+        """Store `elements` under `key`, then evict the least recently used entries over budget.
+
+        Failing to write the entry only logs a warning, the cache never fails a partitioning.
+        """
+        path = self._entry_path(key)
+        tmp_path = ""
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w",
+                encoding="utf-8",
+                dir=os.path.dirname(path),
+                prefix=".tmp-",
+                suffix=_CACHE_ENTRY_SUFFIX,
+                delete=False,
+            ) as f:
+                tmp_path = f.name
+                f.write(elements_to_json(elements))
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning(f"Could not write partition cache entry {path}", exc_info=True)
+            _remove_file(tmp_path)
+            return
+
+        with self._lock:
+            self.stores += 1
+        if self.max_bytes > 0:
+            self._evict(keep=path)
+
+    def discard(self, key: str) -> None:
+        """Remove the entry cached under `key`, if any."""
+        _remove_file(self._entry_path(key))
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key[:2], key + _CACHE_ENTRY_SUFFIX)
+
+    def _evict(self, keep: str) -> None:
+        entries: list[tuple[float, int, str]] = []
+        for directory, _, filenames in os.walk(self.cache_dir):
+            for name in filenames:
+                if not name.endswith(_CACHE_ENTRY_SUFFIX) or name.startswith(".tmp-"):
+                    continue
+                path = os.path.join(directory, name)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            if _remove_file(path):
+                with self._lock:
+                    self.evictions += 1
+            total -= size
+
+
+@functools.lru_cache(maxsize=None)
+def _partition_cache_for_dir(cache_dir: str) -> PartitionCache:
+    return PartitionCache(cache_dir)
+
+
+def get_default_partition_cache() -> Optional[PartitionCache]:
+    """The process-wide cache in env_config.PARTITION_CACHE_DIR, or None when it is not set."""
+    cache_dir = env_config.PARTITION_CACHE_DIR
+    return _partition_cache_for_dir(cache_dir) if cache_dir else None
+
+
+def hash_content(filename: Optional[str] = None, file: Optional[IO[bytes]] = None) -> str:
+    """SHA-256 hex digest of the bytes of `file`, or of the file at `filename`.
+
+    The position of `file` is restored after reading it.
+    """
+    digest = hashlib.sha256()
+    if file is not None:
+        original_pos = file.tell()
+        file.seek(0)
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk if isinstance(chunk, bytes) else chunk.encode())
+        file.seek(original_pos)
+    else:
+        assert filename is not None
+        with open(filename, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK_SIZE):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def partition_cache_key(content_hash: str, call_args: dict[str, Any]) -> Optional[str]:
+    """The cache key of a `partition()` call on content with hash `content_hash`.
+
+    `call_args` are the call's arguments; the per-call ones in `PER_CALL_ARGUMENTS` are left out.
+    Returns None when the call can not be cached: an argument does not serialize to JSON (e.g. a
+    `language_fallback` callable), images are extracted to files, or the last-modified date is
+    read from the file object.
+    """
+    params = {k: v for k, v in call_args.items() if k not in PER_CALL_ARGUMENTS}
+    if params.get("date_from_file_object"):
+        return None
+    if (params.get("extract_images_in_pdf") or params.get("extract_image_block_types")) and not (
+        params.get("extract_image_block_to_payload")
+    ):
+        return None
+
+    params["__version__"] = __version__
+    params["__env__"] = {
+        name: value
+        for name, value in env_config.settings_from_environment().items()
+        if not name.startswith("PARTITION_CACHE_")
+    }
+    try:
+        canonical_params = json.dumps(params, sort_keys=True, separators=(",", ":"))
+    except (TypeError, ValueError):
+        return None
+    params_hash = hashlib.sha256(canonical_params.encode()).hexdigest()
+    return hashlib.sha256(f"{content_hash}:{params_hash}".encode()).hexdigest()
+
+
+def apply_call_metadata(
+    elements: list[Element],
+    filename: Optional[str] = None,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    unique_element_ids: bool = False,
+) -> list[Element]:
+    """Apply the per-call metadata of a `partition()` call to cached `elements`.
+
+    Sets `filename`, `file_directory` and `last_modified` the way the partitioners do and assigns
+    new element ids (hashes of the new filename, or UUIDs when `unique_element_ids`), remapping the
+    `parent_id` links. Elements of attached files keep their own metadata.
+    """
+    name = metadata_filename or filename
+    directory, basename = os.path.split(name) if name else ("", None)
+    if not directory and filename:
+        directory = os.path.dirname(filename)
+    last_modified = metadata_last_modified or (
+        get_last_modified_date(filename) if filename else None
+    )
+
+    for element in elements:
+        if element.metadata.attached_to_filename:
+            continue
+        element.metadata.filename = basename
+        element.metadata.file_directory = directory or None
+        element.metadata.last_modified = last_modified
+
+    if not unique_element_ids:
+        return _assign_hash_ids(elements)
+
+    id_mapping = {}
+    for element in elements:
+        original_id = element.id
+        element._element_id = str(uuid.uuid4())
+        id_mapping[original_id] = element.id
+    for element in elements:
+        if element.metadata.parent_id in id_mapping:
+            element.metadata.parent_id = id_mapping[element.metadata.parent_id]
+    return elements
+
+
+def _remove_file(path: str) -> bool:
+    try:
+        os.remove(path)
+        return True
+    except OSError:
+        return False
@@ -8,6 +8,7 @@ from unstructured.file_utils.filetype import add_metadata
 from unstructured.partition.common.common import exactly_one
 from unstructured.partition.common.lang import check_language_args
 from unstructured.partition.pdf import partition_pdf_or_image
+from unstructured.partition.pdf_image.page_selection import PageSelection
 from unstructured.partition.utils.constants import PartitionStrategy
 from unstructured.telemetry import partition_runtime_telemetry
 
@@ -36,6 +37,7 @@ def partition_image(
     extract_forms: bool = False,
     form_extraction_skip_tables: bool = True,
     password: Optional[str] = None,
+    pages: Optional[PageSelection] = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Parses an image into a list of interpreted elements.
@@ -97,6 +99,12 @@ def partition_image(
         Whether the form extraction logic should ignore regions designated as Tables.
     password
         The password to decrypt the PDF file.
+    pages
+        The pages (frames) of a multi-page image such as a TIFF to partition, as 1-based page
+        numbers: a page number, a list (or range) of page numbers or a string of page numbers and
+        inclusive ranges such as "1-3,7". Unselected frames never go through layout detection or
+        OCR, and the `page_number` metadata of every element is its page number in the whole
+        image. By default every page is partitioned.
     """
     exactly_one(filename=filename, file=file)
 
@@ -121,5 +129,6 @@ def partition_image(
         extract_forms=extract_forms,
         form_extraction_skip_tables=form_extraction_skip_tables,
         password=password,
+        pages=pages,
         **kwargs,
     )
@@ -3,11 +3,12 @@ from __future__ import annotations
 import contextlib
 import copy
 import io
+import itertools
 import os
 import re
 import warnings
 from pathlib import Path
-from typing import IO, TYPE_CHECKING, Any, Optional, Union, cast
+from typing import IO, TYPE_CHECKING, Any, Iterator, Optional, Sequence, Union, cast
 
 import numpy as np
 import wrapt
@@ -52,16 +53,29 @@ from unstructured.partition.common.common import (
     spooled_to_bytes_io_if_needed,
 )
 from unstructured.partition.common.lang import check_language_args, prepare_languages_for_tesseract
-from unstructured.partition.common.metadata import apply_metadata, get_last_modified_date
+from unstructured.partition.common.metadata import (
+    apply_metadata,
+    get_last_modified_date,
+    postprocess_elements,
+)
+from unstructured.partition.pdf_image.page_selection import (
+    PageSelection,
+    count_image_frames,
+    group_page_runs,
+    iter_image_frame_subranges,
+    resolve_page_selection,
+)
+from unstructured.partition.pdf_image.pdf_document import PdfDocumentHandle
 from unstructured.partition.pdf_image.pdfminer_processing import (
     check_annotations_within_element,
     get_uris,
     get_widget_text_from_annots,
     get_words_from_obj,
-    map_bbox_and_index,
+    map_bboxes_and_indices,
 )
 from unstructured.partition.pdf_image.pdfminer_utils import (
     PDFMinerConfig,
+    PDFMinerPage,
     get_text_with_deduplication,
     open_pdfminer_pages_generator,
     rect_to_bbox,
@@ -85,11 +99,11 @@ from unstructured.telemetry import (
     set_partition_document_type,
     set_partition_strategy_used,
 )
-from unstructured.utils import first, requires_dependencies
+from unstructured.utils import requires_dependencies
 
 if TYPE_CHECKING:
     from unstructured_inference.inference.layout import DocumentLayout
-    from unstructured_inference.inference.layoutelement import LayoutElement
+    from unstructured_inference.inference.layoutelement import LayoutElements
 
 
 # Correct a bug that was introduced by a previous patch to
@@ -166,6 +180,10 @@ def partition_pdf(
     pdfminer_char_margin: Optional[float] = None,
     pdfminer_line_overlap: Optional[float] = None,
     pdfminer_word_margin: Optional[float] = 0.185,
+    pdf_hi_res_max_workers: Optional[int] = None,
+    pdf_page_routing: bool = False,
+    pages: Optional[PageSelection] = None,
+    pdf_hi_res_checkpoint_dir: Optional[str] = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Parses a pdf document into a list of interpreted elements.
@@ -237,6 +255,30 @@ def partition_pdf(
         If two characters on the same line are further apart than this margin then they are
         considered to be two separate words, and an intermediate space will be added for
         readability. The margin is specified relative to the width of the character.
+    pdf_hi_res_max_workers
+        Only applicable if `strategy=hi_res`.
+        When set to 2 or more, ranges of consecutive pages are partitioned in that many worker
+        processes and merged back in page order. The output is the same as a serial run.
+    pdf_page_routing
+        Only applicable if `strategy=auto`.
+        If True, the strategy is chosen per page instead of for the whole document: pages whose
+        embedded text is usable are partitioned with `fast` and only the remaining pages (e.g.
+        scanned pages) go through layout detection and OCR. The strategy and text quality score
+        of each page are recorded in the `routing` and `routing_score` metadata fields.
+    pages
+        The pages to partition, as 1-based page numbers of the document: a page number, a list
+        (or range) of page numbers or a string of page numbers and inclusive ranges such as
+        "1-3,7,10-". Unselected pages are never interpreted, rendered, OCR-ed or passed through
+        layout detection, and the `page_number` metadata of every element is its page number in
+        the whole document (offset by `starting_page_number - 1` as usual). Page routing is not
+        applied to a page selection. By default every page is partitioned.
+    pdf_hi_res_checkpoint_dir
+        Only applicable if `strategy=hi_res` without `pdf_hi_res_max_workers`.
+        A directory where the elements of every finished page are checkpointed, so that a rerun
+        of the same document with the same parameters resumes at the first unfinished page
+        instead of starting over. The checkpoints are removed once the run completes. Defaults to
+        the `PDF_HI_RES_CHECKPOINT_DIR` environment variable; checkpointing is off when neither
+        is set.
     """
 
     exactly_one(filename=filename, file=file)
@@ -264,6 +306,10 @@ def partition_pdf(
         pdfminer_char_margin=pdfminer_char_margin,
         pdfminer_line_overlap=pdfminer_line_overlap,
         pdfminer_word_margin=pdfminer_word_margin,
+        pdf_hi_res_max_workers=pdf_hi_res_max_workers,
+        pdf_page_routing=pdf_page_routing,
+        pages=pages,
+        pdf_hi_res_checkpoint_dir=pdf_hi_res_checkpoint_dir,
         **kwargs,
     )
 
@@ -293,6 +339,10 @@ def partition_pdf_or_image(
     pdfminer_word_margin: Optional[float] = 0.185,
     ocr_agent: str = OCR_AGENT_TESSERACT,
     table_ocr_agent: str = OCR_AGENT_TESSERACT,
+    pdf_hi_res_max_workers: Optional[int] = None,
+    pdf_page_routing: bool = False,
+    pages: Optional[PageSelection] = None,
+    pdf_hi_res_checkpoint_dir: Optional[str] = None,
     **kwargs: Any,
 ) -> list[Element]:
     """Parses a pdf or image document into a list of interpreted elements."""
@@ -316,10 +366,22 @@ def partition_pdf_or_image(
 
     extracted_elements: list[list[Element]] = []
     pdf_text_extractable = False
+    # NOTE: the pdfminer layout pass below is kept so hi_res can reuse it instead of parsing
+    # the whole document with pdfminer a second time
+    pdfminer_pages: Optional[list[PDFMinerPage]] = (
+        [] if strategy in (PartitionStrategy.AUTO, PartitionStrategy.HI_RES) else None
+    )
+    # NOTE: the PDF is parsed with pypdf once and the reader shared by the complexity check, the
+    # page limit and page splitting
+    pdf_document = (
+        PdfDocumentHandle(filename=filename, file=file, password=password) if not is_image else None
+    )
+    # NOTE: `page_indices` is None when every page is partitioned
+    page_indices = _resolve_page_indices(pages, filename, file, pdf_document)
 
     if not is_image:
         try:
-            if is_pdf_too_complex(filename=filename, file=file):
+            if is_pdf_too_complex(filename=filename, file=file, pdf_document=pdf_document):
                 logger.info(
                     "PDF is too complex for text extraction based on heuristic checks. "
                     "Falling back to hi_res strategy without text extraction."
@@ -334,6 +396,9 @@ def partition_pdf_or_image(
                     starting_page_number=starting_page_number,
                     password=password,
                     pdfminer_config=pdfminer_config,
+                    pdfminer_pages=pdfminer_pages,
+                    page_indices=page_indices,
+                    pdf_document=pdf_document,
                     **kwargs,
                 )
                 pdf_text_extractable = any(
@@ -344,6 +409,47 @@ def partition_pdf_or_image(
         except Exception as e:
             logger.debug(e)
             logger.info("PDF text extraction failed, skip text extraction...")
+            pdfminer_pages = None
+
+    if languages is None:
+        logger.warning("No languages specified, defaulting to English.")
+        languages = ["eng"]
+    ocr_languages = prepare_languages_for_tesseract(languages)
+
+    if (
+        pdf_page_routing
+        and strategy == PartitionStrategy.AUTO
+        and not is_image
+        and page_indices is None
+        and pdf_text_extractable
+        and pdfminer_pages
+        and len(pdfminer_pages) == len(extracted_elements)
+        and not (infer_table_structure or extract_images_in_pdf or extract_image_block_types)
+    ):
+        if file is not None:
+            file.seek(0)
+        elements = _partition_pdf_by_page_route(
+            filename=filename,
+            file=spooled_to_bytes_io_if_needed(file),
+            extracted_elements=extracted_elements,
+            pdfminer_pages=pdfminer_pages,
+            include_page_breaks=include_page_breaks,
+            languages=languages,
+            ocr_languages=ocr_languages,
+            metadata_last_modified=metadata_last_modified or last_modified,
+            hi_res_model_name=hi_res_model_name,
+            starting_page_number=starting_page_number,
+            extract_forms=extract_forms,
+            form_extraction_skip_tables=form_extraction_skip_tables,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdf_document=pdf_document,
+            ocr_agent=ocr_agent,
+            table_ocr_agent=table_ocr_agent,
+            **kwargs,
+        )
+        if elements is not None:
+            return elements
 
     strategy = determine_pdf_or_image_strategy(
         strategy,
@@ -358,42 +464,93 @@ def partition_pdf_or_image(
     if file is not None:
         file.seek(0)
 
-    if languages is None:
-        logger.warning("No languages specified, defaulting to English.")
-        languages = ["eng"]
-    ocr_languages = prepare_languages_for_tesseract(languages)
-
     if strategy == PartitionStrategy.HI_RES:
-        # NOTE(robinson): Catches a UserWarning that occurs when detection is called
-        with warnings.catch_warnings():
-            warnings.simplefilter("ignore")
-            return _partition_pdf_or_image_local(
+        blank_pages: dict[int, float] = {}
+        if env_config.HI_RES_SKIP_BLANK_PAGES and not kwargs.get("analysis", False):
+            from unstructured.partition.pdf_image.blank_pages import find_blank_pages
+
+            blank_pages = find_blank_pages(
                 filename=filename,
-                file=spooled_to_bytes_io_if_needed(file),
+                file=file,
                 is_image=is_image,
-                infer_table_structure=infer_table_structure,
-                include_page_breaks=include_page_breaks,
-                languages=languages,
-                ocr_languages=ocr_languages,
-                metadata_last_modified=metadata_last_modified or last_modified,
-                hi_res_model_name=hi_res_model_name,
-                pdf_text_extractable=pdf_text_extractable,
-                extract_images_in_pdf=extract_images_in_pdf,
-                extract_image_block_types=extract_image_block_types,
-                extract_image_block_output_dir=extract_image_block_output_dir,
-                extract_image_block_to_payload=extract_image_block_to_payload,
-                starting_page_number=starting_page_number,
-                extract_forms=extract_forms,
-                form_extraction_skip_tables=form_extraction_skip_tables,
+                page_indices=page_indices,
+                pdfminer_pages=pdfminer_pages or None,
+                pdf_document=pdf_document,
                 password=password,
-                pdfminer_config=pdfminer_config,
-                ocr_agent=ocr_agent,
-                table_ocr_agent=table_ocr_agent,
-                **kwargs,
             )
-            # NOTE(crag): do not call _process_uncategorized_text_elements here, because
-            # extracted elements (which are text blocks outside of OD-determined blocks)
-            # are likely not Titles and should not be identified as such.
+        selected_page_indices = page_indices
+        if blank_pages:
+            selected_page_indices = (
+                page_indices
+                if page_indices is not None
+                else list(
+                    range(
+                        pdf_document.page_count
+                        if pdf_document is not None
+                        else count_image_frames(filename=filename, file=file)
+                    )
+                )
+            )
+            logger.info(
+                f"Skipping layout detection and OCR of {len(blank_pages)} blank pages of "
+                f"{len(selected_page_indices)}."
+            )
+            if pdfminer_pages:
+                pdfminer_pages = [
+                    pdfminer_page
+                    for page_index, pdfminer_page in zip(selected_page_indices, pdfminer_pages)
+                    if page_index not in blank_pages
+                ]
+            page_indices = [
+                page_index for page_index in selected_page_indices if page_index not in blank_pages
+            ]
+            if not page_indices:
+                return _merge_blank_pages(
+                    [],
+                    blank_pages,
+                    selected_page_indices,
+                    starting_page_number,
+                    include_page_breaks,
+                )
+
+        elements = _partition_pdf_or_image_with_hi_res(
+            filename=filename,
+            file=file,
+            is_image=is_image,
+            infer_table_structure=infer_table_structure,
+            include_page_breaks=include_page_breaks and not blank_pages,
+            languages=languages,
+            ocr_languages=ocr_languages,
+            metadata_last_modified=metadata_last_modified or last_modified,
+            hi_res_model_name=hi_res_model_name,
+            pdf_text_extractable=pdf_text_extractable,
+            extract_images_in_pdf=extract_images_in_pdf,
+            extract_image_block_types=extract_image_block_types,
+            extract_image_block_output_dir=extract_image_block_output_dir,
+            extract_image_block_to_payload=extract_image_block_to_payload,
+            starting_page_number=starting_page_number,
+            extract_forms=extract_forms,
+            form_extraction_skip_tables=form_extraction_skip_tables,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdfminer_pages=pdfminer_pages,
+            pdf_document=pdf_document,
+            ocr_agent=ocr_agent,
+            table_ocr_agent=table_ocr_agent,
+            page_indices=page_indices,
+            pdf_hi_res_max_workers=pdf_hi_res_max_workers,
+            pdf_hi_res_checkpoint_dir=pdf_hi_res_checkpoint_dir,
+            **kwargs,
+        )
+        if blank_pages:
+            return _merge_blank_pages(
+                elements,
+                blank_pages,
+                cast(list[int], selected_page_indices),
+                starting_page_number,
+                include_page_breaks,
+            )
+        return elements
 
     elif strategy == PartitionStrategy.FAST:
         return _partition_pdf_with_pdfparser(
@@ -403,11 +560,12 @@ def partition_pdf_or_image(
         )
 
     elif strategy == PartitionStrategy.OCR_ONLY:
+        source_filename, source_file = _pdf_document_source(filename, file, pdf_document)
         # NOTE(robinson): Catches file conversion warnings when running with PDFs
         with warnings.catch_warnings():
             elements = _partition_pdf_or_image_with_ocr(
-                filename=filename,
-                file=file,
+                filename=source_filename,
+                file=source_file,
                 include_page_breaks=include_page_breaks,
                 languages=languages,
                 ocr_languages=ocr_languages,
@@ -415,6 +573,7 @@ def partition_pdf_or_image(
                 metadata_last_modified=metadata_last_modified or last_modified,
                 starting_page_number=starting_page_number,
                 password=password,
+                page_indices=page_indices,
                 **kwargs,
             )
             return _process_uncategorized_text_elements(elements)
@@ -422,6 +581,689 @@ def partition_pdf_or_image(
     raise ValueError(f"Unsupported partitioning strategy: {strategy}")
 
 
+def _partition_pdf_or_image_with_hi_res(
+    filename: str,
+    file: Optional[IO[bytes]],
+    is_image: bool,
+    infer_table_structure: bool,
+    include_page_breaks: bool,
+    languages: list[str],
+    ocr_languages: str,
+    metadata_last_modified: Optional[str],
+    hi_res_model_name: Optional[str],
+    pdf_text_extractable: bool,
+    extract_images_in_pdf: bool,
+    extract_image_block_types: Optional[list[str]],
+    extract_image_block_output_dir: Optional[str],
+    extract_image_block_to_payload: bool,
+    starting_page_number: int,
+    extract_forms: bool,
+    form_extraction_skip_tables: bool,
+    password: Optional[str],
+    pdfminer_config: PDFMinerConfig,
+    pdfminer_pages: Optional[list[PDFMinerPage]],
+    pdf_document: Optional[PdfDocumentHandle],
+    ocr_agent: str,
+    table_ocr_agent: str,
+    page_indices: Optional[list[int]],
+    pdf_hi_res_max_workers: Optional[int],
+    pdf_hi_res_checkpoint_dir: Optional[str],
+    **kwargs: Any,
+) -> list[Element]:
+    """Partition the document, or only the pages at `page_indices`, with the hi_res strategy:
+    page-parallel, checkpointed, page by page for a selection or in one pass."""
+    from unstructured.partition.pdf_image.page_parallel import (
+        page_parallel_is_supported,
+        partition_pdf_pages_in_parallel,
+    )
+
+    if page_parallel_is_supported(
+        is_image, pdf_hi_res_max_workers, analysis=kwargs.get("analysis", False)
+    ):
+        return partition_pdf_pages_in_parallel(
+            filename=filename,
+            file=spooled_to_bytes_io_if_needed(file),
+            max_workers=cast(int, pdf_hi_res_max_workers),
+            infer_table_structure=infer_table_structure,
+            include_page_breaks=include_page_breaks,
+            languages=languages,
+            ocr_languages=ocr_languages,
+            metadata_last_modified=metadata_last_modified,
+            hi_res_model_name=hi_res_model_name,
+            pdf_text_extractable=pdf_text_extractable,
+            extract_images_in_pdf=extract_images_in_pdf,
+            extract_image_block_types=extract_image_block_types,
+            extract_image_block_output_dir=extract_image_block_output_dir,
+            extract_image_block_to_payload=extract_image_block_to_payload,
+            starting_page_number=starting_page_number,
+            extract_forms=extract_forms,
+            form_extraction_skip_tables=form_extraction_skip_tables,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdf_document=pdf_document,
+            ocr_agent=ocr_agent,
+            table_ocr_agent=table_ocr_agent,
+            page_indices=page_indices,
+            **kwargs,
+        )
+
+    checkpoint_dir = pdf_hi_res_checkpoint_dir or env_config.PDF_HI_RES_CHECKPOINT_DIR
+    if checkpoint_dir and not is_image and not kwargs.get("analysis", False):
+        from unstructured.partition.pdf_image.page_checkpoint import (
+            partition_pdf_pages_with_checkpoints,
+        )
+
+        elements = partition_pdf_pages_with_checkpoints(
+            checkpoint_dir=checkpoint_dir,
+            filename=filename,
+            file=spooled_to_bytes_io_if_needed(file),
+            infer_table_structure=infer_table_structure,
+            include_page_breaks=include_page_breaks,
+            languages=languages,
+            ocr_languages=ocr_languages,
+            metadata_last_modified=metadata_last_modified,
+            hi_res_model_name=hi_res_model_name,
+            pdf_text_extractable=pdf_text_extractable,
+            extract_images_in_pdf=extract_images_in_pdf,
+            extract_image_block_types=extract_image_block_types,
+            extract_image_block_output_dir=extract_image_block_output_dir,
+            extract_image_block_to_payload=extract_image_block_to_payload,
+            starting_page_number=starting_page_number,
+            extract_forms=extract_forms,
+            form_extraction_skip_tables=form_extraction_skip_tables,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdfminer_pages=pdfminer_pages or None,
+            pdf_document=pdf_document,
+            ocr_agent=ocr_agent,
+            table_ocr_agent=table_ocr_agent,
+            page_indices=page_indices,
+            **kwargs,
+        )
+        if elements is not None:
+            return elements
+        if file is not None:
+            file.seek(0)
+
+    if page_indices is not None:
+        return _partition_selected_pages_with_hi_res(
+            filename=filename,
+            file=spooled_to_bytes_io_if_needed(file),
+            is_image=is_image,
+            page_indices=page_indices,
+            infer_table_structure=infer_table_structure,
+            include_page_breaks=include_page_breaks,
+            languages=languages,
+            ocr_languages=ocr_languages,
+            metadata_last_modified=metadata_last_modified,
+            hi_res_model_name=hi_res_model_name,
+            pdf_text_extractable=pdf_text_extractable,
+            extract_images_in_pdf=extract_images_in_pdf,
+            extract_image_block_types=extract_image_block_types,
+            extract_image_block_output_dir=extract_image_block_output_dir,
+            extract_image_block_to_payload=extract_image_block_to_payload,
+            starting_page_number=starting_page_number,
+            extract_forms=extract_forms,
+            form_extraction_skip_tables=form_extraction_skip_tables,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdfminer_pages=pdfminer_pages or None,
+            pdf_document=pdf_document,
+            ocr_agent=ocr_agent,
+            table_ocr_agent=table_ocr_agent,
+            **kwargs,
+        )
+
+    # NOTE(robinson): Catches a UserWarning that occurs when detection is called
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return _partition_pdf_or_image_local(
+            filename=filename,
+            file=spooled_to_bytes_io_if_needed(file),
+            is_image=is_image,
+            infer_table_structure=infer_table_structure,
+            include_page_breaks=include_page_breaks,
+            languages=languages,
+            ocr_languages=ocr_languages,
+            metadata_last_modified=metadata_last_modified,
+            hi_res_model_name=hi_res_model_name,
+            pdf_text_extractable=pdf_text_extractable,
+            extract_images_in_pdf=extract_images_in_pdf,
+            extract_image_block_types=extract_image_block_types,
+            extract_image_block_output_dir=extract_image_block_output_dir,
+            extract_image_block_to_payload=extract_image_block_to_payload,
+            starting_page_number=starting_page_number,
+            extract_forms=extract_forms,
+            form_extraction_skip_tables=form_extraction_skip_tables,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdfminer_pages=pdfminer_pages or None,
+            pdf_document=pdf_document,
+            ocr_agent=ocr_agent,
+            table_ocr_agent=table_ocr_agent,
+            **kwargs,
+        )
+        # NOTE(crag): do not call _process_uncategorized_text_elements here, because
+        # extracted elements (which are text blocks outside of OD-determined blocks)
+        # are likely not Titles and should not be identified as such.
+
+
+def _merge_blank_pages(
+    elements: list[Element],
+    blank_pages: dict[int, float],
+    page_indices: list[int],
+    starting_page_number: int,
+    include_page_breaks: bool,
+) -> list[Element]:
+    """Merge the elements of the partitioned pages, put in page order, with the skipped blank pages.
+
+    `elements` were partitioned without page breaks. When `include_page_breaks` is True, a page
+    break follows every page, the last too, like in a hi_res run over every page, and every blank
+    page is represented by a page break with its page number, `routing` set to "blank" and its
+    ink coverage as the `routing_score`.
+    """
+    elements_by_page_index: dict[int, list[Element]] = {}
+    for element in elements:
+        page_number = element.metadata.page_number
+        page_index = page_number - starting_page_number if page_number is not None else -1
+        elements_by_page_index.setdefault(page_index, []).append(element)
+
+    merged: list[Element] = elements_by_page_index.pop(-1, [])
+    for page_index in page_indices:
+        if page_index in blank_pages:
+            if include_page_breaks:
+                page_break = PageBreak(text="")
+                page_break.metadata.page_number = starting_page_number + page_index
+                page_break.metadata.routing = "blank"
+                page_break.metadata.routing_score = blank_pages[page_index]
+                merged.append(page_break)
+            continue
+        merged.extend(elements_by_page_index.get(page_index, []))
+        if include_page_breaks:
+            merged.append(PageBreak(text=""))
+    return merged
+
+
+def _pdf_document_source(
+    filename: str,
+    file: Optional[IO[bytes]],
+    pdf_document: Optional[PdfDocumentHandle],
+) -> tuple[str, Optional[IO[bytes]]]:
+    """The `filename` and `file` to render the document from: the repaired bytes of
+    `pdf_document` when pdfminer had it repaired, so poppler reads the repaired document too."""
+    if pdf_document is not None and pdf_document.is_repaired:
+        return "", io.BytesIO(pdf_document.data)
+    return filename, file
+
+
+def _resolve_page_indices(
+    pages: Optional[PageSelection],
+    filename: str,
+    file: Optional[bytes | IO[bytes]],
+    pdf_document: Optional[PdfDocumentHandle],
+) -> Optional[list[int]]:
+    """The sorted 0-based indices of the pages selected by `pages`, or None when every page of
+    the document (or every frame of the image, when `pdf_document` is None) is selected."""
+    if pages is None:
+        return None
+    page_count = (
+        pdf_document.page_count
+        if pdf_document is not None
+        else count_image_frames(filename=filename, file=file)
+    )
+    page_indices = resolve_page_selection(pages, page_count)
+    return page_indices if len(page_indices) < page_count else None
+
+
+def _partition_pdf_by_page_route(
+    filename: str,
+    file: Optional[IO[bytes]],
+    extracted_elements: list[list[Element]],
+    pdfminer_pages: list[PDFMinerPage],
+    include_page_breaks: bool,
+    languages: list[str],
+    ocr_languages: str,
+    metadata_last_modified: Optional[str],
+    hi_res_model_name: Optional[str],
+    starting_page_number: int,
+    extract_forms: bool,
+    form_extraction_skip_tables: bool,
+    password: Optional[str],
+    pdfminer_config: PDFMinerConfig,
+    pdf_document: Optional[PdfDocumentHandle],
+    ocr_agent: str,
+    table_ocr_agent: str,
+    **kwargs: Any,
+) -> Optional[list[Element]]:
+    """Partition the pages with usable embedded text with the fast strategy and only the other
+    pages with layout detection and OCR, merging the results in page order.
+
+    Returns None when every page needs layout detection and OCR, so the caller partitions the
+    whole document with the usual single strategy instead.
+    """
+    from unstructured.partition.pdf_image.page_parallel import iter_pdf_page_subranges
+    from unstructured.partition.pdf_image.page_routing import group_page_routes, route_pdf_pages
+
+    deficient_page_strategy = determine_pdf_or_image_strategy(
+        PartitionStrategy.HI_RES, pdf_text_extractable=True
+    )
+    routes = route_pdf_pages(pdfminer_pages, deficient_page_strategy=deficient_page_strategy)
+    runs = group_page_routes(routes)
+    if len(runs) == 1 and runs[0][0] != PartitionStrategy.FAST:
+        return None
+
+    logger.info(
+        f"Routing {sum(route.strategy != PartitionStrategy.FAST for route in routes)} of "
+        f"{len(routes)} pages to {deficient_page_strategy}, the rest to {PartitionStrategy.FAST}."
+    )
+    set_partition_strategy_used(
+        PartitionStrategy.FAST
+        if all(route.strategy == PartitionStrategy.FAST for route in routes)
+        else deficient_page_strategy
+    )
+
+    deficient_pdfs = dict(
+        iter_pdf_page_subranges(
+            pdf_document or filename or cast(IO[bytes], file),
+            [(first, stop) for strategy, first, stop in runs if strategy != PartitionStrategy.FAST],
+            password=password,
+        )
+    )
+
+    elements: list[Element] = []
+    for strategy, first, stop in runs:
+        if strategy == PartitionStrategy.FAST:
+            run_elements = _partition_pdf_with_pdfparser(
+                extracted_elements=extracted_elements[first:stop],
+                include_page_breaks=include_page_breaks,
+                **kwargs,
+            )
+        elif strategy == PartitionStrategy.HI_RES:
+            # -- merge the embedded text of the pages into the inferred layout as a whole-document
+            # -- hi_res run does when they have any
+            pdf_text_extractable = any(
+                isinstance(el, Text) and el.text.strip()
+                for page_elements in extracted_elements[first:stop]
+                for el in page_elements
+            )
+            # NOTE(robinson): Catches a UserWarning that occurs when detection is called
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                run_elements = _partition_pdf_or_image_local(
+                    file=io.BytesIO(deficient_pdfs[first]),
+                    include_page_breaks=include_page_breaks,
+                    languages=languages,
+                    ocr_languages=ocr_languages,
+                    metadata_last_modified=metadata_last_modified,
+                    hi_res_model_name=hi_res_model_name,
+                    starting_page_number=starting_page_number + first,
+                    extract_forms=extract_forms,
+                    form_extraction_skip_tables=form_extraction_skip_tables,
+                    pdfminer_config=pdfminer_config,
+                    pdf_text_extractable=pdf_text_extractable,
+                    pdfminer_pages=pdfminer_pages[first:stop],
+                    ocr_agent=ocr_agent,
+                    table_ocr_agent=table_ocr_agent,
+                    **kwargs,
+                )
+        else:
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                run_elements = _process_uncategorized_text_elements(
+                    _partition_pdf_or_image_with_ocr(
+                        file=io.BytesIO(deficient_pdfs[first]),
+                        include_page_breaks=include_page_breaks,
+                        languages=languages,
+                        ocr_languages=ocr_languages,
+                        metadata_last_modified=metadata_last_modified,
+                        starting_page_number=starting_page_number + first,
+                        **kwargs,
+                    )
+                )
+
+        # -- every strategy ends each page, the last one too, with a PageBreak --
+        elements.extend(run_elements)
+
+    for element in elements:
+        page_number = element.metadata.page_number
+        if isinstance(element, PageBreak) or page_number is None:
+            continue
+        if not 0 <= page_number - starting_page_number < len(routes):
+            continue
+        route = routes[page_number - starting_page_number]
+        element.metadata.routing = route.strategy
+        element.metadata.routing_score = route.score
+
+    return elements
+
+
+def _partition_selected_pages_with_hi_res(
+    filename: str,
+    file: Optional[IO[bytes]],
+    is_image: bool,
+    page_indices: list[int],
+    starting_page_number: int,
+    password: Optional[str],
+    pdfminer_pages: Optional[list[PDFMinerPage]],
+    pdf_document: Optional[PdfDocumentHandle],
+    **kwargs: Any,
+) -> list[Element]:
+    """Partition only the pages at `page_indices` with the hi_res strategy.
+
+    Layout detection renders every page of the document it is given, so each run of consecutive
+    selected pages is copied into a standalone in-memory document (a PDF, or a TIFF of the
+    selected frames of an image) and partitioned on its own, numbered from the page number of
+    its first page in the source document. `pdfminer_pages` holds the layouts of the selected
+    pages only.
+    """
+    from unstructured.partition.pdf_image.page_parallel import iter_pdf_page_subranges
+
+    check_pdf_hi_res_max_pages_exceeded(
+        pdf_hi_res_max_pages=kwargs.pop("pdf_hi_res_max_pages", None),
+        pdf_document=pdf_document,
+        page_indices=page_indices,
+    )
+    runs = group_page_runs(page_indices)
+    run_documents = (
+        iter_image_frame_subranges(filename=filename, file=file, page_ranges=runs)
+        if is_image
+        else iter_pdf_page_subranges(
+            pdf_document or filename or cast(IO[bytes], file), runs, password=password
+        )
+    )
+
+    elements: list[Element] = []
+    selected_page_position = 0
+    for (first, stop), (_, run_data) in zip(runs, run_documents):
+        run_pdfminer_pages = (
+            pdfminer_pages[selected_page_position : selected_page_position + stop - first]
+            if pdfminer_pages
+            else None
+        )
+        selected_page_position += stop - first
+        # NOTE(robinson): Catches a UserWarning that occurs when detection is called
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            elements.extend(
+                _partition_pdf_or_image_local(
+                    file=io.BytesIO(run_data),
+                    is_image=is_image,
+                    starting_page_number=starting_page_number + first,
+                    password=password,
+                    pdfminer_pages=run_pdfminer_pages,
+                    **kwargs,
+                )
+            )
+    return elements
+
+
+def iter_partition_pdf(
+    filename: Optional[str] = None,
+    file: Optional[IO[bytes]] = None,
+    include_page_breaks: bool = False,
+    strategy: str = PartitionStrategy.AUTO,
+    infer_table_structure: bool = False,
+    ocr_languages: Optional[str] = None,
+    languages: Optional[list[str]] = None,
+    detect_language_per_element: bool = False,
+    metadata_filename: Optional[str] = None,
+    metadata_last_modified: Optional[str] = None,
+    unique_element_ids: bool = False,
+    hi_res_model_name: Optional[str] = None,
+    starting_page_number: int = 1,
+    password: Optional[str] = None,
+    pdfminer_line_margin: Optional[float] = None,
+    pdfminer_char_margin: Optional[float] = None,
+    pdfminer_line_overlap: Optional[float] = None,
+    pdfminer_word_margin: Optional[float] = 0.185,
+    ocr_agent: str = OCR_AGENT_TESSERACT,
+    table_ocr_agent: str = OCR_AGENT_TESSERACT,
+    **kwargs: Any,
+) -> Iterator[list[Element]]:
+    """Partitions a pdf document page by page, yielding the elements of each page as soon as that
+    page is complete.
+
+    Takes the same arguments as `partition_pdf()` and applies the same metadata, hash ids and
+    parent links, so concatenating the yielded lists matches the output of `partition_pdf()`.
+    Only one page's image, layout and elements are held in memory at a time, so peak memory does
+    not grow with the page count. The differences with `partition_pdf()` are:
+
+    - chunking is not supported; chunk the collected elements instead.
+    - language auto-detection runs on each page rather than on the whole document.
+    - with the "hi_res" strategy each page is partitioned as its own single-page PDF, so image
+      blocks written to `extract_image_block_output_dir` are numbered per page.
+    """
+    exactly_one(filename=filename, file=file)
+
+    call_args = {
+        "filename": filename,
+        "languages": languages,
+        "detect_language_per_element": detect_language_per_element,
+        "metadata_filename": metadata_filename,
+        "metadata_last_modified": metadata_last_modified,
+        "unique_element_ids": unique_element_ids,
+        **kwargs,
+    }
+    filename = filename or ""
+    file = spooled_to_bytes_io_if_needed(file)
+    languages = check_language_args(languages or [], ocr_languages)
+    validate_strategy(strategy, is_image=False)
+
+    metadata_last_modified = metadata_last_modified or (
+        get_last_modified_date(filename) if filename else None
+    )
+    pdfminer_config = PDFMinerConfig(
+        line_margin=pdfminer_line_margin,
+        char_margin=pdfminer_char_margin,
+        line_overlap=pdfminer_line_overlap,
+        word_margin=pdfminer_word_margin,
+    )
+
+    pdf_document = PdfDocumentHandle(filename=filename, file=file, password=password)
+    pdf_text_extractable = False
+    if strategy in (PartitionStrategy.AUTO, PartitionStrategy.HI_RES):
+        pdf_text_extractable = _pdf_has_extractable_text(
+            filename=filename,
+            file=file,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdf_document=pdf_document,
+        )
+    strategy = determine_pdf_or_image_strategy(
+        strategy,
+        is_image=False,
+        pdf_text_extractable=pdf_text_extractable,
+        infer_table_structure=infer_table_structure,
+        extract_images_in_pdf=kwargs.get("extract_images_in_pdf", False),
+        extract_image_block_types=kwargs.get("extract_image_block_types"),
+    )
+    set_partition_strategy_used(strategy)
+
+    if languages is None:
+        logger.warning("No languages specified, defaulting to English.")
+        languages = ["eng"]
+
+    if strategy == PartitionStrategy.FAST:
+        pages = _iter_fast_pages(
+            filename=filename,
+            file=file,
+            include_page_breaks=include_page_breaks,
+            languages=languages,
+            metadata_last_modified=metadata_last_modified,
+            starting_page_number=starting_page_number,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdf_document=pdf_document,
+            **kwargs,
+        )
+    elif strategy == PartitionStrategy.HI_RES:
+        pages = _iter_hi_res_pages(
+            filename=filename,
+            file=file,
+            include_page_breaks=include_page_breaks,
+            infer_table_structure=infer_table_structure,
+            languages=languages,
+            ocr_languages=prepare_languages_for_tesseract(languages),
+            metadata_last_modified=metadata_last_modified,
+            hi_res_model_name=hi_res_model_name,
+            pdf_text_extractable=pdf_text_extractable,
+            starting_page_number=starting_page_number,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdf_document=pdf_document,
+            ocr_agent=ocr_agent,
+            table_ocr_agent=table_ocr_agent,
+            **kwargs,
+        )
+    elif strategy == PartitionStrategy.OCR_ONLY:
+        source_filename, source_file = _pdf_document_source(filename, file, pdf_document)
+        pages = _iter_ocr_only_pages(
+            filename=source_filename,
+            file=source_file,
+            include_page_breaks=include_page_breaks,
+            languages=languages,
+            ocr_languages=prepare_languages_for_tesseract(languages),
+            metadata_last_modified=metadata_last_modified,
+            starting_page_number=starting_page_number,
+            password=password,
+            **kwargs,
+        )
+    else:
+        raise ValueError(f"Unsupported partitioning strategy: {strategy}")
+
+    hierarchy_stack: list[Element] = []
+    page_seq_counts: dict[Optional[int], int] = {}
+    for page_elements in pages:
+        yield postprocess_elements(
+            page_elements,
+            call_args,
+            FileType.PDF,
+            hierarchy_stack=hierarchy_stack,
+            page_seq_counts=page_seq_counts,
+        )
+
+
+def _pdf_has_extractable_text(
+    filename: str,
+    file: Optional[IO[bytes]],
+    password: Optional[str],
+    pdfminer_config: PDFMinerConfig,
+    pdf_document: Optional[PdfDocumentHandle] = None,
+) -> bool:
+    """Whether any page of the PDF has text pdfminer can extract. Stops at the first such page and
+    holds one page in memory at a time."""
+    try:
+        if is_pdf_too_complex(filename=filename, file=file, pdf_document=pdf_document):
+            logger.info(
+                "PDF is too complex for text extraction based on heuristic checks. "
+                "Falling back to hi_res strategy without text extraction."
+            )
+            return False
+        with open_filename(filename, "rb") if filename else contextlib.nullcontext(file) as fp:
+            for page_elements in _iter_pdfminer_page_elements(
+                fp=cast(IO[bytes], fp),
+                filename=filename,
+                metadata_last_modified=None,
+                password=password,
+                pdfminer_config=pdfminer_config,
+                pdf_document=pdf_document,
+            ):
+                if any(isinstance(el, Text) and el.text.strip() for el in page_elements):
+                    return True
+    except Exception as e:
+        logger.debug(e)
+        logger.info("PDF text extraction failed, skip text extraction...")
+    finally:
+        if file is not None:
+            file.seek(0)
+    return False
+
+
+def _iter_fast_pages(
+    filename: str,
+    file: Optional[IO[bytes]],
+    include_page_breaks: bool,
+    languages: Optional[list[str]],
+    metadata_last_modified: Optional[str],
+    starting_page_number: int,
+    password: Optional[str],
+    pdfminer_config: PDFMinerConfig,
+    pdf_document: Optional[PdfDocumentHandle] = None,
+    **kwargs: Any,
+) -> Iterator[list[Element]]:
+    with open_filename(filename, "rb") if filename else contextlib.nullcontext(file) as fp:
+        for page_elements in _iter_pdfminer_page_elements(
+            fp=cast(IO[bytes], fp),
+            filename=filename,
+            metadata_last_modified=metadata_last_modified,
+            languages=languages,
+            starting_page_number=starting_page_number,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdf_document=pdf_document,
+        ):
+            yield _partition_pdf_with_pdfparser(
+                extracted_elements=[page_elements],
+                include_page_breaks=include_page_breaks,
+                **kwargs,
+            )
+
+
+def _iter_hi_res_pages(
+    filename: str,
+    file: Optional[IO[bytes]],
+    include_page_breaks: bool,
+    starting_page_number: int,
+    password: Optional[str],
+    pdf_document: Optional[PdfDocumentHandle] = None,
+    **kwargs: Any,
+) -> Iterator[list[Element]]:
+    from unstructured.partition.pdf_image.page_parallel import iter_pdf_page_ranges
+
+    pdf_document = pdf_document or PdfDocumentHandle(
+        filename=filename, file=file, password=password
+    )
+    check_pdf_hi_res_max_pages_exceeded(
+        pdf_hi_res_max_pages=kwargs.pop("pdf_hi_res_max_pages", None), pdf_document=pdf_document
+    )
+    for page_index, page_data in iter_pdf_page_ranges(pdf_document, 1, password=password):
+        # NOTE(robinson): Catches a UserWarning that occurs when detection is called
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            page_elements = _partition_pdf_or_image_local(
+                file=io.BytesIO(page_data),
+                include_page_breaks=False,
+                starting_page_number=starting_page_number + page_index,
+                **kwargs,
+            )
+        # -- like `document_to_element_list()`, a page break follows every page, the last too --
+        if include_page_breaks:
+            page_elements.append(PageBreak(text=""))
+        yield page_elements
+
+
+def _iter_ocr_only_pages(
+    filename: str,
+    file: Optional[IO[bytes]],
+    starting_page_number: int,
+    password: Optional[str],
+    **kwargs: Any,
+) -> Iterator[list[Element]]:
+    from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_images
+
+    for page_number, image in enumerate(
+        convert_pdf_to_images(filename, file, chunk_size=1, password=password),
+        start=starting_page_number,
+    ):
+        # NOTE(robinson): Catches file conversion warnings when running with PDFs
+        with warnings.catch_warnings():
+            page_elements = _partition_pdf_or_image_with_ocr_from_image(
+                image=image, page_number=page_number, **kwargs
+            )
+        yield _process_uncategorized_text_elements(page_elements)
+        image.close()
+
+
 def extractable_elements(
     filename: str = "",
     file: Optional[bytes | IO[bytes]] = None,
@@ -430,6 +1272,9 @@ def extractable_elements(
     starting_page_number: int = 1,
     password: Optional[str] = None,
     pdfminer_config: Optional[PDFMinerConfig] = None,
+    pdfminer_pages: Optional[list[PDFMinerPage]] = None,
+    page_indices: Optional[Sequence[int]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
     **kwargs: Any,
 ) -> list[list[Element]]:
     if isinstance(file, bytes):
@@ -442,6 +1287,9 @@ def extractable_elements(
         starting_page_number=starting_page_number,
         password=password,
         pdfminer_config=pdfminer_config,
+        pdfminer_pages=pdfminer_pages,
+        page_indices=page_indices,
+        pdf_document=pdf_document,
         **kwargs,
     )
 
@@ -454,6 +1302,9 @@ def _partition_pdf_with_pdfminer(
     starting_page_number: int = 1,
     password: Optional[str] = None,
     pdfminer_config: Optional[PDFMinerConfig] = None,
+    pdfminer_pages: Optional[list[PDFMinerPage]] = None,
+    page_indices: Optional[Sequence[int]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
     **kwargs: Any,
 ) -> list[list[Element]]:
     """Partitions a PDF using PDFMiner instead of using a layoutmodel. Used for faster
@@ -462,6 +1313,11 @@ def _partition_pdf_with_pdfminer(
     Implementation is based on the `extract_text` implementation in pdfminer.six, but
     modified to support tracking page numbers and working with file-like objects.
 
+    When `pdfminer_pages` is a list, the pdfminer layout of every page is appended to it so the
+    hi_res pipeline can reuse it without parsing the document again. When `page_indices` is
+    given, only the pages at those 0-based indices are processed. A document pdfminer cannot
+    parse is repaired through `pdf_document`, its handle, when it is given.
+
     ref: https://github.com/pdfminer/pdfminer.six/blob/master/pdfminer/high_level.py
     """
 
@@ -477,6 +1333,9 @@ def _partition_pdf_with_pdfminer(
                 starting_page_number=starting_page_number,
                 password=password,
                 pdfminer_config=pdfminer_config,
+                pdfminer_pages=pdfminer_pages,
+                page_indices=page_indices,
+                pdf_document=pdf_document,
                 **kwargs,
             )
 
@@ -489,6 +1348,9 @@ def _partition_pdf_with_pdfminer(
             starting_page_number=starting_page_number,
             password=password,
             pdfminer_config=pdfminer_config,
+            pdfminer_pages=pdfminer_pages,
+            page_indices=page_indices,
+            pdf_document=pdf_document,
             **kwargs,
         )
 
@@ -505,20 +1367,65 @@ def _process_pdfminer_pages(
     starting_page_number: int = 1,
     password: Optional[str] = None,
     pdfminer_config: Optional[PDFMinerConfig] = None,
+    pdfminer_pages: Optional[list[PDFMinerPage]] = None,
+    page_indices: Optional[Sequence[int]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
     **kwargs,
 ) -> list[list[Element]]:
-    """Uses PDFMiner to split a document into pages and process them."""
+    """Uses PDFMiner to split a document into pages and process them. When `pdfminer_pages`
+    is a list, the layout and resolved annotations of each page are appended to it."""
 
-    elements = []
+    return list(
+        _iter_pdfminer_page_elements(
+            fp=fp,
+            filename=filename,
+            metadata_last_modified=metadata_last_modified,
+            languages=languages,
+            annotation_threshold=annotation_threshold,
+            starting_page_number=starting_page_number,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            pdfminer_pages=pdfminer_pages,
+            page_indices=page_indices,
+            pdf_document=pdf_document,
+        )
+    )
 
-    for page_number, (page, page_layout) in enumerate(
-        open_pdfminer_pages_generator(fp, password=password, pdfminer_config=pdfminer_config),
-        start=starting_page_number,
+
+@requires_dependencies("pdfminer")
+def _iter_pdfminer_page_elements(
+    fp: IO[bytes],
+    filename: str,
+    metadata_last_modified: Optional[str],
+    languages: Optional[list[str]] = None,
+    annotation_threshold: Optional[float] = env_config.PDF_ANNOTATION_THRESHOLD,
+    starting_page_number: int = 1,
+    password: Optional[str] = None,
+    pdfminer_config: Optional[PDFMinerConfig] = None,
+    pdfminer_pages: Optional[list[PDFMinerPage]] = None,
+    page_indices: Optional[Sequence[int]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
+) -> Iterator[list[Element]]:
+    """Generates the elements of each page of a document as soon as pdfminer has processed it.
+    When `page_indices` is given, only the pages at those 0-based indices are processed and
+    numbered by their position in the document."""
+
+    for page_index, (page, page_layout) in zip(
+        page_indices if page_indices is not None else itertools.count(),
+        open_pdfminer_pages_generator(
+            fp,
+            password=password,
+            pdfminer_config=pdfminer_config,
+            page_indices=page_indices,
+            pdf_document=pdf_document,
+        ),
     ):
+        page_number = starting_page_number + page_index
         width, height = page_layout.width, page_layout.height
 
         page_elements: list[Element] = []
         annotation_list = []
+        widget_list = []
 
         coordinate_system = PixelSpace(
             width=width,
@@ -526,6 +1433,9 @@ def _process_pdfminer_pages(
         )
         if page.annots:
             annotation_list = get_uris(page.annots, height, coordinate_system, page_number)
+            widget_list = get_widget_text_from_annots(page.annots, height)
+        if pdfminer_pages is not None:
+            pdfminer_pages.append(PDFMinerPage(page_layout, annotation_list, widget_list))
 
         for obj in page_layout:
             x1, y1, x2, y2 = rect_to_bbox(obj.bbox, height)
@@ -540,9 +1450,9 @@ def _process_pdfminer_pages(
                     page_number,
                     annotation_threshold,
                 )
-                _, words = get_words_from_obj(obj, height)
-                for annot in annotations_within_element:
-                    urls_metadata.append(map_bbox_and_index(words, annot))
+                if annotations_within_element:
+                    _, words = get_words_from_obj(obj, height)
+                    urls_metadata.extend(map_bboxes_and_indices(words, annotations_within_element))
 
             if hasattr(obj, "get_text"):
                 # Use deduplication to handle fake bold text (characters rendered twice)
@@ -581,7 +1491,6 @@ def _process_pdfminer_pages(
 
         # Filled AcroForm field values live in widget annotations rather than the page
         # content stream, so pdfminer's layout pass misses them; recover them here.
-        widget_list = get_widget_text_from_annots(page.annots, height) if page.annots else []
         for widget in widget_list:
             wx1, wy1, wx2, wy2 = widget["bbox"]
             points = ((wx1, wy1), (wx1, wy2), (wx2, wy2), (wx2, wy1))
@@ -601,16 +1510,17 @@ def _process_pdfminer_pages(
             page_elements.append(element)
 
         page_elements = _combine_list_elements(page_elements, coordinate_system)
-        elements.append(page_elements)
-
-    return elements
+        yield page_elements
 
 
 def _get_pdf_page_number(
     filename: str = "",
     file: Optional[bytes | IO[bytes]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
 ) -> int:
-    if file:
+    if pdf_document is not None:
+        number_of_pages = pdf_document.page_count
+    elif file:
         number_of_pages = PdfReader(file).get_num_pages()
         file.seek(0)
     elif filename:
@@ -624,10 +1534,17 @@ def check_pdf_hi_res_max_pages_exceeded(
     filename: str = "",
     file: Optional[bytes | IO[bytes]] = None,
     pdf_hi_res_max_pages: int = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
+    page_indices: Optional[Sequence[int]] = None,
 ) -> None:
-    """Checks whether PDF exceeds pdf_hi_res_max_pages limit."""
+    """Checks whether PDF exceeds pdf_hi_res_max_pages limit. When `page_indices` is given, only
+    the selected pages count toward the limit."""
     if pdf_hi_res_max_pages:
-        document_pages = _get_pdf_page_number(filename=filename, file=file)
+        document_pages = (
+            len(page_indices)
+            if page_indices is not None
+            else _get_pdf_page_number(filename=filename, file=file, pdf_document=pdf_document)
+        )
         if document_pages > pdf_hi_res_max_pages:
             raise PageCountExceededError(
                 document_pages=document_pages, pdf_hi_res_max_pages=pdf_hi_res_max_pages
@@ -645,6 +1562,7 @@ def is_pdf_too_complex(
     max_content_stream_array_entries: int = DEFAULT_MAX_CONTENT_STREAM_ARRAY_ENTRIES,
     max_total_stream_bytes: int = DEFAULT_MAX_TOTAL_STREAM_BYTES,
     max_total_array_entries: int = DEFAULT_MAX_TOTAL_ARRAY_ENTRIES,
+    pdf_document: Optional[PdfDocumentHandle] = None,
 ) -> bool:
     """Check if a PDF is likely a complex vector drawing (e.g., CAD/engineering docs)
     that would be extremely slow or produce garbage results with PDFMiner text extraction.
@@ -691,6 +1609,9 @@ def is_pdf_too_complex(
     max_total_array_entries
         Document-wide cap on array entries traversed (default 1,000,000), charged for
         every slot so non-stream entries count too. Exceeding it logs at warning.
+    pdf_document
+        The already opened document, used instead of `filename` and `file` so the streams
+        decoded here stay cached for the rest of the partitioning call.
     """
 
     original_pos: Optional[int] = None
@@ -701,7 +1622,9 @@ def is_pdf_too_complex(
             original_pos = file.tell()
 
         # Skip for small files
-        if file is not None:
+        if pdf_document is not None:
+            file_size = pdf_document.file_size
+        elif file is not None:
             if isinstance(file, bytes):
                 file_size = len(file)
             else:
@@ -717,7 +1640,9 @@ def is_pdf_too_complex(
             return False
 
         # Build reader
-        if file is not None:
+        if pdf_document is not None:
+            reader = pdf_document.reader
+        elif file is not None:
             if isinstance(file, bytes):
                 reader = PdfReader(io.BytesIO(file))
             else:
@@ -879,13 +1804,17 @@ def is_pdf_too_complex(
 def _enable_detect_vertical_if_rotated(
     inferred_document_layout,
     pdfminer_config: Optional["PDFMinerConfig"],
-) -> Optional["PDFMinerConfig"]:
-    """Enable detect_vertical in pdfminer when the PDF has rotated pages."""
+    pdfminer_pages: Optional[list[PDFMinerPage]] = None,
+) -> tuple[Optional["PDFMinerConfig"], Optional[list[PDFMinerPage]]]:
+    """Enable detect_vertical in pdfminer when the PDF has rotated pages. Previously extracted
+    `pdfminer_pages` are dropped when that changes the pdfminer layout parameters."""
     if any((p.image_metadata or {}).get("pdf_rotation", 0) for p in inferred_document_layout.pages):
         pdfminer_config = pdfminer_config or PDFMinerConfig()
+        if not pdfminer_config.detect_vertical:
+            pdfminer_pages = None
         pdfminer_config.detect_vertical = True
 
-    return pdfminer_config
+    return pdfminer_config, pdfminer_pages
 
 
 def _rotation_corrections_from_layout(inferred_document_layout) -> list[int]:
@@ -897,6 +1826,27 @@ def _rotation_corrections_from_layout(inferred_document_layout) -> list[int]:
     ]
 
 
+def _layout_render_dpi(pdf_image_dpi: int, is_image: bool, analysis: bool = False) -> int:
+    """The DPI at which hi_res layout detection renders PDF pages: env_config.PDF_LAYOUT_RENDER_DPI
+    when it is set below `pdf_image_dpi`, otherwise `pdf_image_dpi`. Images keep their own
+    resolution, and analysis draws on full-resolution pages, so neither uses a lower DPI."""
+    layout_dpi = env_config.PDF_LAYOUT_RENDER_DPI
+    if is_image or analysis or not 0 < layout_dpi < pdf_image_dpi:
+        return pdf_image_dpi
+    return layout_dpi
+
+
+def _scale_inferred_layout(inferred_document_layout: "DocumentLayout", scale: float) -> None:
+    """Scale the element coordinates and image sizes of an inferred layout in place, e.g. from
+    the layout rendering DPI to the page image DPI shared by pdfminer, OCR and the elements."""
+    for page in inferred_document_layout.pages:
+        page.elements_array.element_coords = page.elements_array.element_coords * scale
+        if page.image_metadata:
+            for key in ("width", "height"):
+                if page.image_metadata.get(key):
+                    page.image_metadata[key] = round(page.image_metadata[key] * scale)
+
+
 @requires_dependencies("unstructured_inference")
 def _partition_pdf_or_image_local(
     filename: str = "",
@@ -924,6 +1874,8 @@ def _partition_pdf_or_image_local(
     pdf_hi_res_max_pages: Optional[int] = None,
     password: Optional[str] = None,
     pdfminer_config: Optional[PDFMinerConfig] = None,
+    pdfminer_pages: Optional[list[PDFMinerPage]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
     ocr_agent: str = OCR_AGENT_TESSERACT,
     table_ocr_agent: str = OCR_AGENT_TESSERACT,
     **kwargs: Any,
@@ -945,9 +1897,15 @@ def _partition_pdf_or_image_local(
     from unstructured.partition.pdf_image.analysis.tools import save_analysis_artifiacts
     from unstructured.partition.pdf_image.form_extraction import run_form_extraction
     from unstructured.partition.pdf_image.ocr import process_data_with_ocr, process_file_with_ocr
+    from unstructured.partition.pdf_image.page_image_store import (
+        PAGE_CONSUMER_ANALYSIS,
+        PAGE_CONSUMER_IMAGE_BLOCKS,
+        PAGE_CONSUMER_OCR,
+        PageImageStore,
+    )
     from unstructured.partition.pdf_image.pdf_image_utils import (
         check_element_types_to_extract,
-        save_elements,
+        save_image_blocks,
     )
     from unstructured.partition.pdf_image.pdfminer_processing import (
         clean_pdfminer_inner_elements,
@@ -959,6 +1917,7 @@ def _partition_pdf_or_image_local(
     hi_res_model_name = hi_res_model_name or model_name or default_hi_res_model()
     if pdf_image_dpi is None:
         pdf_image_dpi = env_config.PDF_RENDER_DPI
+    layout_dpi = _layout_render_dpi(pdf_image_dpi, is_image=is_image, analysis=analysis)
     model_render_kwargs = (
         {"pdf_render_max_pixels_per_page": env_config.PDF_RENDER_MAX_PIXELS_PER_PAGE}
         if not is_image
@@ -967,7 +1926,10 @@ def _partition_pdf_or_image_local(
 
     if not is_image:
         check_pdf_hi_res_max_pages_exceeded(
-            filename=filename, file=file, pdf_hi_res_max_pages=pdf_hi_res_max_pages
+            filename=filename,
+            file=file,
+            pdf_hi_res_max_pages=pdf_hi_res_max_pages,
+            pdf_document=pdf_document,
         )
 
     od_model_layout_dumper: Optional[ObjectDetectionLayoutDumper] = None
@@ -976,27 +1938,49 @@ def _partition_pdf_or_image_local(
     final_layout_dumper: Optional[FinalLayoutDumper] = None
 
     skip_analysis_dump = env_config.ANALYSIS_DUMP_OD_SKIP
+    extract_image_block_types = check_element_types_to_extract(extract_image_block_types)
+
+    # NOTE: every page is rendered once at `pdf_image_dpi` and shared by OCR, table extraction,
+    # image block extraction and analysis; a page is dropped after its last consumer is done and
+    # waits in a temporary file between the OCR and the later consumers
+    page_consumers = [PAGE_CONSUMER_OCR]
+    if extract_images_in_pdf or extract_image_block_types:
+        page_consumers.append(PAGE_CONSUMER_IMAGE_BLOCKS)
+    if analysis and not (env_config.ANALYSIS_BBOX_SKIP or skip_analysis_dump):
+        page_consumers.append(PAGE_CONSUMER_ANALYSIS)
+    page_image_store = PageImageStore(
+        filename=filename if file is None else "",
+        file=file,
+        is_image=is_image,
+        dpi=pdf_image_dpi,
+        password=password,
+        consumers=page_consumers,
+    )
 
     def _run_layout_inference(processor, source):
         try:
-            return processor(
+            inferred_document_layout = processor(
                 source,
                 is_image=is_image,
                 model_name=hi_res_model_name,
-                pdf_image_dpi=pdf_image_dpi,
+                pdf_image_dpi=layout_dpi,
                 password=password,
                 **model_render_kwargs,
             )
         except PdfRenderTooLargeError as exc:
             raise UnprocessableEntityError(str(exc)) from exc
+        if layout_dpi != pdf_image_dpi:
+            _scale_inferred_layout(inferred_document_layout, pdf_image_dpi / layout_dpi)
+        return inferred_document_layout
 
     if file is None:
         inferred_document_layout = _run_layout_inference(process_file_with_model, filename)
         _record_image_layout_document_type(inferred_document_layout, is_image)
 
-        pdfminer_config = _enable_detect_vertical_if_rotated(
+        pdfminer_config, pdfminer_pages = _enable_detect_vertical_if_rotated(
             inferred_document_layout,
             pdfminer_config,
+            pdfminer_pages,
         )
 
         extracted_layout, layouts_links = (
@@ -1006,6 +1990,8 @@ def _partition_pdf_or_image_local(
                 password=password,
                 pdfminer_config=pdfminer_config,
                 rotation_corrections=_rotation_corrections_from_layout(inferred_document_layout),
+                pdfminer_pages=pdfminer_pages,
+                pdf_document=pdf_document,
             )
             if pdf_text_extractable
             else ([], [])
@@ -1049,6 +2035,8 @@ def _partition_pdf_or_image_local(
             ocr_layout_dumper=ocr_layout_dumper,
             password=password,
             table_ocr_agent=table_ocr_agent,
+            page_image_store=page_image_store,
+            ocr_regions_only=layout_dpi != pdf_image_dpi,
         )
     else:
         inferred_document_layout = _run_layout_inference(process_data_with_model, file)
@@ -1057,9 +2045,10 @@ def _partition_pdf_or_image_local(
         if hasattr(file, "seek"):
             file.seek(0)
 
-        pdfminer_config = _enable_detect_vertical_if_rotated(
+        pdfminer_config, pdfminer_pages = _enable_detect_vertical_if_rotated(
             inferred_document_layout,
             pdfminer_config,
+            pdfminer_pages,
         )
 
         extracted_layout, layouts_links = (
@@ -1069,6 +2058,8 @@ def _partition_pdf_or_image_local(
                 password=password,
                 pdfminer_config=pdfminer_config,
                 rotation_corrections=_rotation_corrections_from_layout(inferred_document_layout),
+                pdfminer_pages=pdfminer_pages,
+                pdf_document=pdf_document,
             )
             if pdf_text_extractable
             else ([], [])
@@ -1114,6 +2105,8 @@ def _partition_pdf_or_image_local(
             ocr_layout_dumper=ocr_layout_dumper,
             password=password,
             table_ocr_agent=table_ocr_agent,
+            page_image_store=page_image_store,
+            ocr_regions_only=layout_dpi != pdf_image_dpi,
         )
 
     # vectorization of the data structure ends here
@@ -1134,37 +2127,25 @@ def _partition_pdf_or_image_local(
         **kwargs,
     )
 
-    extract_image_block_types = check_element_types_to_extract(extract_image_block_types)
     #  NOTE(christine): `extract_images_in_pdf` would deprecate
     #  (but continue to support for a while)
-    if extract_images_in_pdf:
-        save_elements(
+    element_categories_to_save = list(extract_image_block_types)
+    if extract_images_in_pdf and ElementType.IMAGE not in element_categories_to_save:
+        element_categories_to_save.insert(0, ElementType.IMAGE)
+    if element_categories_to_save:
+        save_image_blocks(
             elements=elements,
             starting_page_number=starting_page_number,
-            element_category_to_save=ElementType.IMAGE,
-            filename=filename,
-            file=file,
-            is_image=is_image,
-            pdf_image_dpi=pdf_image_dpi,
-            extract_image_block_to_payload=extract_image_block_to_payload,
-            output_dir_path=extract_image_block_output_dir,
-        )
-
-    for el_type in extract_image_block_types:
-        if extract_images_in_pdf and el_type == ElementType.IMAGE:
-            continue
-
-        save_elements(
-            elements=elements,
-            starting_page_number=starting_page_number,
-            element_category_to_save=el_type,
+            element_categories_to_save=element_categories_to_save,
             filename=filename,
             file=file,
             is_image=is_image,
             pdf_image_dpi=pdf_image_dpi,
             extract_image_block_to_payload=extract_image_block_to_payload,
             output_dir_path=extract_image_block_output_dir,
+            page_image_store=page_image_store,
         )
+    page_image_store.release_all(PAGE_CONSUMER_IMAGE_BLOCKS)
 
     out_elements = []
     for el in elements:
@@ -1224,7 +2205,9 @@ def _partition_pdf_or_image_local(
             draw_caption=env_config.ANALYSIS_BBOX_DRAW_CAPTION,
             resize=env_config.ANALYSIS_BBOX_RESIZE,
             format=env_config.ANALYSIS_BBOX_FORMAT,
+            page_image_store=page_image_store,
         )
+    page_image_store.close()
 
     return out_elements
 
@@ -1276,19 +2259,29 @@ def _partition_pdf_or_image_with_ocr(
     metadata_last_modified: Optional[str] = None,
     starting_page_number: int = 1,
     password: Optional[str] = None,
+    page_indices: Optional[Sequence[int]] = None,
     **kwargs: Any,
 ):
     """Partitions an image or PDF using OCR. For PDFs, each page is converted
-    to an image prior to processing."""
+    to an image prior to processing. When `page_indices` is given, only the pages (or image
+    frames) at those 0-based indices are converted and processed."""
     from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_images
 
     elements = []
     if is_image:
         images = []
         image = PILImage.open(file) if file is not None else PILImage.open(filename)
-        images.append(image)
+        if page_indices is None:
+            images.append(image)
+        else:
+            for page_index in page_indices:
+                image.seek(page_index)
+                images.append(image.copy())
 
-        for page_number, image in enumerate(images, start=starting_page_number):
+        for page_index, image in zip(
+            page_indices if page_indices is not None else itertools.count(), images
+        ):
+            page_number = starting_page_number + page_index
             page_elements = _partition_pdf_or_image_with_ocr_from_image(
                 image=image,
                 languages=languages,
@@ -1300,9 +2293,11 @@ def _partition_pdf_or_image_with_ocr(
             )
             elements.extend(page_elements)
     else:
-        for page_number, image in enumerate(
-            convert_pdf_to_images(filename, file, password=password), start=starting_page_number
+        for page_index, image in zip(
+            page_indices if page_indices is not None else itertools.count(),
+            convert_pdf_to_images(filename, file, password=password, page_indices=page_indices),
         ):
+            page_number = starting_page_number + page_index
             page_elements = _partition_pdf_or_image_with_ocr_from_image(
                 image=image,
                 languages=languages,
@@ -1535,6 +2530,51 @@ def check_coords_within_boundary(
     return x_within_boundary and y_within_boundary
 
 
+def _iter_layout_element_records(elements_array: "LayoutElements") -> Iterator[dict[str, Any]]:
+    """Yield one dict per element of `elements_array`, in the form of `LayoutElement.to_dict()`
+    plus the `bbox` coordinates and table fields, which `normalize_layout_element` accepts.
+
+    The columns are converted to Python values once for the whole page instead of building a
+    `LayoutElement` (and its `Rectangle` and `to_dict()`) for every element.
+    """
+    class_id_map = elements_array.element_class_id_map
+    for (
+        bbox,
+        text,
+        prob,
+        class_id,
+        source,
+        is_extracted,
+        text_as_html,
+        table_as_cells,
+        method,
+    ) in zip(
+        elements_array.element_coords.tolist(),
+        elements_array.texts.tolist(),
+        elements_array.element_probs.tolist(),
+        elements_array.element_class_ids.tolist(),
+        elements_array.sources.tolist(),
+        elements_array.is_extracted_array.tolist(),
+        elements_array.text_as_html.tolist(),
+        elements_array.table_as_cells.tolist(),
+        elements_array.table_extraction_method.tolist(),
+    ):
+        x1, y1, x2, y2 = bbox
+        yield {
+            "bbox": bbox,
+            "coordinates": ((x1, y1), (x1, y2), (x2, y2), (x2, y1)),
+            "text": text,
+            "type": class_id_map[class_id] if class_id is not None and class_id_map else None,
+            "prob": None if prob is None or np.isnan(prob) else prob,
+            "source": source,
+            "is_extracted": is_extracted,
+            "text_as_html": text_as_html,
+            "table_as_cells": table_as_cells,
+            "table_extraction_method": method,
+            "image_path": None,
+        }
+
+
 def document_to_element_list(
     document: DocumentLayout,
     sortable: bool = False,
@@ -1550,9 +2590,16 @@ def document_to_element_list(
     **kwargs: Any,
 ) -> list[Element]:
     """Converts a DocumentLayout object to a list of unstructured elements."""
+    from unstructured_inference.inference.elements import Rectangle
+
     from unstructured.partition.pdf_image.pdfminer_processing import get_links_in_element
 
     elements: list[Element] = []
+    # Filter out parameters from kwargs that conflict with explicit parameters
+    # (fixes issue where e.g. coordinates=True boolean conflicts with coordinate tuple data)
+    filtered_kwargs = {
+        k: v for k, v in kwargs.items() if k not in ("coordinates", "coordinate_system")
+    }
 
     num_pages = len(document.pages)
     for page_number, page in enumerate(document.pages, start=starting_page_number):
@@ -1564,8 +2611,6 @@ def document_to_element_list(
         image_width = page_image_metadata.get("width")
         image_height = page_image_metadata.get("height")
 
-        translation_mapping: list[tuple["LayoutElement", Element]] = []
-
         links = (
             layouts_links[page_number - starting_page_number]
             if layouts_links and layouts_links[0]
@@ -1585,18 +2630,20 @@ def document_to_element_list(
         else:
             has_headline = False
 
-        for layout_element in page.elements_array.iter_elements():
-            if (
-                image_width
-                and image_height
-                and not np.isnan(getattr(layout_element.bbox, "x1", np.nan))
-            ):
+        # NOTE: elements are linked to their parent through an identity-keyed lookup, so linking
+        # stays linear in the number of elements on the page
+        element_by_layout_id: dict[int, Element] = {}
+        translation_mapping: list[tuple[dict[str, Any], Element]] = []
+
+        for layout_record in _iter_layout_element_records(page.elements_array):
+            x1, y1, x2, y2 = layout_record["bbox"]
+            if image_width and image_height and not np.isnan(x1):
                 coordinate_system = PixelSpace(width=image_width, height=image_height)
             else:
                 coordinate_system = None
 
             element = normalize_layout_element(
-                layout_element,
+                layout_record,
                 coordinate_system=coordinate_system,
                 infer_list_items=infer_list_items,
                 source_format=source_format if source_format else "html",
@@ -1607,20 +2654,20 @@ def document_to_element_list(
                         el.metadata.last_modified = last_modification_date
                     el.metadata.page_number = page_number
                 page_elements.extend(element)
-                translation_mapping.extend([(layout_element, el) for el in element])
+                translation_mapping.extend([(layout_record, el) for el in element])
+                if element:
+                    element_by_layout_id.setdefault(id(layout_record), element[0])
                 continue
             else:
                 element.metadata.links = (
-                    get_links_in_element(links, layout_element.bbox) if links else []
+                    get_links_in_element(links, Rectangle(x1, y1, x2, y2)) if links else []
                 )
 
                 if last_modification_date:
                     element.metadata.last_modified = last_modification_date
-                element.metadata.text_as_html = getattr(layout_element, "text_as_html", None)
-                element.metadata.table_as_cells = getattr(layout_element, "table_as_cells", None)
-                element.metadata.table_extraction_method = getattr(
-                    layout_element, "table_extraction_method", None
-                )
+                element.metadata.text_as_html = layout_record["text_as_html"]
+                element.metadata.table_as_cells = layout_record["table_as_cells"]
+                element.metadata.table_extraction_method = layout_record["table_extraction_method"]
 
                 if (isinstance(element, Title) and element.metadata.category_depth is None) and (
                     has_headline
@@ -1628,20 +2675,12 @@ def document_to_element_list(
                     element.metadata.category_depth = 0
 
                 page_elements.append(element)
-                translation_mapping.append((layout_element, element))
+                translation_mapping.append((layout_record, element))
+                element_by_layout_id.setdefault(id(layout_record), element)
             coordinates = (
                 element.metadata.coordinates.points if element.metadata.coordinates else None
             )
 
-            el_image_path = (
-                layout_element.image_path if hasattr(layout_element, "image_path") else None
-            )
-
-            # Filter out parameters from kwargs that conflict with explicit parameters
-            # (fixes issue where e.g. coordinates=True boolean conflicts with coordinate tuple data)
-            filtered_kwargs = {
-                k: v for k, v in kwargs.items() if k not in ("coordinates", "coordinate_system")
-            }
             add_element_metadata(
                 element,
                 page_number=page_number,
@@ -1649,18 +2688,16 @@ def document_to_element_list(
                 coordinates=coordinates,
                 coordinate_system=coordinate_system,
                 category_depth=element.metadata.category_depth,
-                image_path=el_image_path,
+                image_path=layout_record["image_path"],
                 detection_origin=detection_origin,
                 languages=languages,
                 **filtered_kwargs,
             )
 
-        for layout_element, element in translation_mapping:
-            if hasattr(layout_element, "parent") and layout_element.parent is not None:
-                element_parent = first(
-                    (el for l_el, el in translation_mapping if l_el is layout_element.parent),
-                )
-                element.metadata.parent_id = element_parent.id
+        for layout_record, element in translation_mapping:
+            parent = layout_record.get("parent")
+            if parent is not None:
+                element.metadata.parent_id = element_by_layout_id[id(parent)].id
         sorted_page_elements = page_elements
         if sortable and sort_mode != SORT_MODE_DONT:
             sorted_page_elements = sort_page_elements(page_elements, sort_mode)
@@ -15,6 +15,10 @@ from PIL import Image, ImageDraw, ImageFont
 from unstructured_inference.constants import ElementType
 
 from unstructured.partition.pdf_image.analysis.processor import AnalysisProcessor
+from unstructured.partition.pdf_image.page_image_store import (
+    PAGE_CONSUMER_ANALYSIS,
+    PageImageStore,
+)
 from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_image
 
 PageImage = TypeVar("PageImage", Image.Image, np.ndarray)
@@ -562,6 +566,7 @@ class AnalysisDrawer(AnalysisProcessor):
         draw_grid: bool = False,
         resize: Optional[float] = None,
         format: str = "png",
+        page_image_store: Optional[PageImageStore] = None,
     ):
         self.draw_caption = draw_caption
         self.draw_grid = draw_grid
@@ -570,6 +575,7 @@ class AnalysisDrawer(AnalysisProcessor):
         self.format = format
         self.drawers = []
         self.file = file
+        self.page_image_store = page_image_store
 
         super().__init__(filename, save_dir)
 
@@ -670,6 +676,13 @@ class AnalysisDrawer(AnalysisProcessor):
         return new_im
 
     def load_source_image(self) -> Generator[Image.Image, None, None]:
+        if self.page_image_store is not None:
+            for page_number in range(1, len(self.page_image_store) + 1):
+                image = self.page_image_store.get_image(page_number).convert("RGB")
+                self.page_image_store.release(page_number, PAGE_CONSUMER_ANALYSIS)
+                yield image
+            return
+
         with tempfile.TemporaryDirectory() as temp_dir:
             image_paths = []
             if self.is_image:
@@ -20,6 +20,7 @@ from unstructured.partition.pdf_image.analysis.layout_dump import (
     ObjectDetectionLayoutDumper,
     OCRLayoutDumper,
 )
+from unstructured.partition.pdf_image.page_image_store import PageImageStore
 
 
 def _get_drawer_for_dumper(dumper: LayoutDumper) -> Optional[LayoutDrawer]:
@@ -66,6 +67,7 @@ def save_analysis_artifiacts(
     draw_caption: bool = True,
     resize: Optional[float] = None,
     format: str = "png",
+    page_image_store: Optional[PageImageStore] = None,
 ):
     """Save the analysis artifacts for a given file. Loads some settings from
     the environment configuration.
@@ -82,6 +84,8 @@ def save_analysis_artifiacts(
         draw_caption: Flag for drawing the caption above the analyzed page (for e.g. layout source)
         resize: Output image resize value. If not provided, the image will not be resized.
         format: The format for analyzed pages with bboxes drawn on them. Default is 'png'.
+        page_image_store: Optional shared store of the rendered page images. When provided, the
+            pages are drawn on without rendering the document again.
     """
     if not filename:
         filename = _generate_filename(is_image)
@@ -109,6 +113,7 @@ def save_analysis_artifiacts(
             draw_caption=draw_caption,
             resize=resize,
             format=format,
+            page_image_store=page_image_store,
         )
 
         for layout_dumper in layout_dumpers:
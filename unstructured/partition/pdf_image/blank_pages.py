@@ -0,0 +1,141 @@
+"""Detection of blank pages, e.g. scanner separator sheets, that hi_res can skip.
+
+A PDF page whose content stream draws nothing (no text, image or path objects in its pdfminer
+layout) is blank. A page without text that does draw something, typically a scanned sheet, is
+rendered at a low resolution and is blank when almost none of its pixels differ from the
+background, i.e. its ink coverage is at most `BLANK_PAGE_MAX_INK_COVERAGE`. Image frames are
+always judged by their ink coverage.
+"""
+
+from __future__ import annotations
+
+from typing import IO, Iterator, Optional, Sequence
+
+import numpy as np
+from pdfminer.layout import LTPage, LTTextBox
+from PIL import Image as PILImage
+from PIL import ImageSequence
+
+from unstructured.partition.pdf_image.page_selection import open_image
+from unstructured.partition.pdf_image.pdf_document import PdfDocumentHandle
+from unstructured.partition.pdf_image.pdfium_utils import pdfium_lock
+from unstructured.partition.pdf_image.pdfminer_utils import PDFMinerPage
+from unstructured.partition.utils.config import env_config
+
+# -- ink coverage is measured on the page reduced to at most this many pixels on its longest side --
+_INK_SAMPLE_MAX_SIDE = 400
+# -- a pixel is ink when its gray level differs from the background by more than this --
+_INK_MIN_CONTRAST = 48
+
+
+def ink_coverage(image: PILImage.Image) -> float:
+    """The fraction of the pixels of `image` whose gray level differs from the background (the
+    median gray level) by more than `_INK_MIN_CONTRAST`, measured on a reduced copy of the image."""
+    gray = image.convert("L")
+    gray.thumbnail((_INK_SAMPLE_MAX_SIDE, _INK_SAMPLE_MAX_SIDE))
+    pixels = np.asarray(gray, dtype=np.int16)
+    if pixels.size == 0:
+        return 0.0
+    background = int(np.median(pixels))
+    return float(np.count_nonzero(np.abs(pixels - background) > _INK_MIN_CONTRAST) / pixels.size)
+
+
+def page_draws_nothing(page_layout: LTPage) -> bool:
+    """Whether the pdfminer layout of a page has no objects other than whitespace text boxes."""
+    return all(isinstance(obj, LTTextBox) and not obj.get_text().strip() for obj in page_layout)
+
+
+def page_has_text(page_layout: LTPage) -> bool:
+    return any(isinstance(obj, LTTextBox) and obj.get_text().strip() for obj in page_layout)
+
+
+def find_blank_pages(
+    filename: str = "",
+    file: Optional[bytes | IO[bytes]] = None,
+    is_image: bool = False,
+    page_indices: Optional[Sequence[int]] = None,
+    pdfminer_pages: Optional[Sequence[PDFMinerPage]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
+    password: Optional[str] = None,
+    max_ink_coverage: Optional[float] = None,
+) -> dict[int, float]:
+    """The blank pages among the pages at the sorted 0-based `page_indices` (every page by
+    default), as a mapping of page index to ink coverage.
+
+    `pdfminer_pages` are the pdfminer layouts of the selected pages, when they are available; pages
+    with embedded text are never blank and only the others are rendered.
+    """
+    if max_ink_coverage is None:
+        max_ink_coverage = env_config.BLANK_PAGE_MAX_INK_COVERAGE
+
+    if is_image:
+        page_images = _iter_image_frames(filename, file, page_indices)
+    else:
+        if pdf_document is None:
+            pdf_document = PdfDocumentHandle(filename=filename, file=file, password=password)
+        selected_page_indices = (
+            list(page_indices) if page_indices is not None else list(range(pdf_document.page_count))
+        )
+        if pdfminer_pages is not None and len(pdfminer_pages) != len(selected_page_indices):
+            pdfminer_pages = None
+        page_images = _iter_pdf_pages_without_text(
+            pdf_document, selected_page_indices, pdfminer_pages, password
+        )
+
+    blank_pages: dict[int, float] = {}
+    for page_index, image in page_images:
+        coverage = ink_coverage(image) if image is not None else 0.0
+        if coverage <= max_ink_coverage:
+            blank_pages[page_index] = coverage
+    return blank_pages
+
+
+def _iter_image_frames(
+    filename: str, file: Optional[bytes | IO[bytes]], page_indices: Optional[Sequence[int]]
+) -> Iterator[tuple[int, Optional[PILImage.Image]]]:
+    selected = set(page_indices) if page_indices is not None else None
+    with open_image(filename, file) as image:
+        for page_index, frame in enumerate(ImageSequence.Iterator(image)):
+            if selected is None or page_index in selected:
+                yield page_index, frame
+
+
+def _iter_pdf_pages_without_text(
+    pdf_document: PdfDocumentHandle,
+    page_indices: Sequence[int],
+    pdfminer_pages: Optional[Sequence[PDFMinerPage]],
+    password: Optional[str],
+) -> Iterator[tuple[int, Optional[PILImage.Image]]]:
+    """Yield `(page_index, image)` for the pages that have no embedded text, where `image` is the
+    page rendered at a low resolution, or None when the page draws nothing at all."""
+    import pypdfium2 as pdfium
+
+    pages_to_render = []
+    for position, page_index in enumerate(page_indices):
+        if pdfminer_pages is None:
+            pages_to_render.append(page_index)
+            continue
+        page_layout = pdfminer_pages[position].layout
+        if page_draws_nothing(page_layout):
+            yield page_index, None
+        elif not page_has_text(page_layout):
+            pages_to_render.append(page_index)
+    if not pages_to_render:
+        return
+
+    with pdfium_lock:
+        pdf = pdfium.PdfDocument(pdf_document.data, password=password)
+    try:
+        for page_index in pages_to_render:
+            with pdfium_lock:
+                page = pdf[page_index]
+                try:
+                    width, height = page.get_size()
+                    scale = _INK_SAMPLE_MAX_SIDE / max(width, height, 1.0)
+                    image = page.render(scale=scale).to_pil()
+                finally:
+                    page.close()
+            yield page_index, image
+    finally:
+        with pdfium_lock:
+            pdf.close()
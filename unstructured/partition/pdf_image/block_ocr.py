@@ -0,0 +1,90 @@
+"""Batched OCR of the layout blocks of a page for `ocr_mode="individual_blocks"`.
+
+OCRing every block on its own runs the OCR agent once per block, often hundreds of times per page.
+With `OCR_INDIVIDUAL_BLOCKS_BATCHED`, the crops of the blocks are stacked on white canvases with
+whitespace between them, so no OCR line spans two blocks, each canvas is OCRed once in layout mode
+and every recognized word goes to the block whose place on the canvas contains it. A block that
+fits on no canvas with another block is still OCRed on its own.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Sequence
+
+import numpy as np
+from PIL import Image as PILImage
+
+from unstructured.partition.pdf_image.pdfminer_processing import aggregate_embedded_text_by_blocks
+from unstructured.partition.utils.config import env_config
+from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+
+if TYPE_CHECKING:
+    from unstructured_inference.inference.elements import TextRegions
+
+# -- whitespace above, below and between the crops stacked on a canvas, in pixels --
+BLOCK_GAP = 40
+# -- a canvas is at most this many pixels high, about three pages at the default render dpi --
+MAX_CANVAS_HEIGHT = 6600
+
+
+def ocr_blocks(
+    image: PILImage.Image,
+    block_coords: np.ndarray,
+    ocr_agent: OCRAgent,
+    padding: int = 0,
+    subregion_threshold: float = env_config.OCR_LAYOUT_SUBREGION_THRESHOLD,
+) -> list[str]:
+    """The OCR text of each of the blocks of `image` at `block_coords` (rows of x1, y1, x2, y2),
+    each block cropped with `padding` extra pixels around it."""
+    crops = [
+        image.crop((x1 - padding, y1 - padding, x2 + padding, y2 + padding))
+        for x1, y1, x2, y2 in block_coords
+    ]
+    texts = [""] * len(crops)
+    for batch in _pack_crops(crops):
+        if len(batch) == 1:
+            texts[batch[0]] = ocr_agent.get_text_from_image(crops[batch[0]])
+            continue
+        canvas, placements = stitch_crops([crops[i] for i in batch])
+        words = ocr_agent.get_layout_from_image(canvas)
+        batch_texts = aggregate_embedded_text_by_blocks(placements, words, subregion_threshold)
+        for i, text in zip(batch, batch_texts):
+            texts[i] = text
+    return texts
+
+
+def stitch_crops(crops: Sequence[PILImage.Image]) -> tuple[PILImage.Image, TextRegions]:
+    """Stack `crops` on a white canvas, `BLOCK_GAP` pixels apart, and return the canvas with the
+    place of each crop on it."""
+    from unstructured_inference.inference.elements import TextRegions
+
+    width = max(crop.width for crop in crops)
+    height = sum(crop.height for crop in crops) + BLOCK_GAP * (len(crops) + 1)
+    canvas = PILImage.new("RGB", (width, height), "white")
+    placements = np.zeros((len(crops), 4), dtype=float)
+    top = BLOCK_GAP
+    for i, crop in enumerate(crops):
+        canvas.paste(crop.convert("RGB"), (0, top))
+        placements[i] = (0, top, crop.width, top + crop.height)
+        top += crop.height + BLOCK_GAP
+    return canvas, TextRegions(
+        element_coords=placements, texts=np.array([None] * len(crops), dtype=object)
+    )
+
+
+def _pack_crops(crops: Sequence[PILImage.Image]) -> list[list[int]]:
+    """Group the indices of `crops`, in order, into batches that fit on one canvas; a crop too tall
+    to share a canvas makes a batch of its own."""
+    batches: list[list[int]] = []
+    batch: list[int] = []
+    height = BLOCK_GAP
+    for i, crop in enumerate(crops):
+        crop_height = crop.height + BLOCK_GAP
+        if batch and height + crop_height > MAX_CANVAS_HEIGHT:
+            batches.append(batch)
+            batch, height = [], BLOCK_GAP
+        batch.append(i)
+        height += crop_height
+    if batch:
+        batches.append(batch)
+    return batches
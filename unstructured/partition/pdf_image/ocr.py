@@ -1,28 +1,29 @@
 from __future__ import annotations
 
 import os
-import tempfile
-from typing import IO, TYPE_CHECKING, Any, List, Optional, cast
+from typing import IO, TYPE_CHECKING, Any, List, Optional
 
 import numpy as np
 
 # NOTE(yuming): Rename PIL.Image to avoid conflict with
 # unstructured.documents.elements.Image
 from PIL import Image as PILImage
-from PIL import ImageSequence
 
 from unstructured.documents.elements import ElementType
 from unstructured.metrics.table.table_formats import SimpleTableCell
 from unstructured.partition.common.lang import tesseract_to_paddle_language
 from unstructured.partition.pdf_image.analysis.layout_dump import OCRLayoutDumper
-from unstructured.partition.pdf_image.pdf_image_utils import convert_pdf_to_image, valid_text
+from unstructured.partition.pdf_image.block_ocr import ocr_blocks
+from unstructured.partition.pdf_image.page_image_store import PAGE_CONSUMER_OCR, PageImageStore
+from unstructured.partition.pdf_image.pdf_image_utils import valid_text
 from unstructured.partition.pdf_image.pdfminer_processing import (
-    aggregate_embedded_text_by_block,
+    aggregate_embedded_text_by_blocks,
     bboxes1_is_almost_subregion_of_bboxes2,
 )
 from unstructured.partition.utils.config import env_config
 from unstructured.partition.utils.constants import OCR_AGENT_PADDLE, OCR_AGENT_TESSERACT, OCRMode
 from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.partition.utils.ocr_models.ocr_result_cache import get_ocr_result_cache
 from unstructured.telemetry import mark_partition_ocr_used, mark_partition_table_extraction
 from unstructured.utils import requires_dependencies
 
@@ -34,7 +35,7 @@ if TYPE_CHECKING:
 
 
 def process_data_with_ocr(
-    data: bytes | IO[bytes],
+    data: bytes | memoryview | IO[bytes],
     out_layout: "DocumentLayout",
     extracted_layout: List[List["TextRegion"]],
     is_image: bool = False,
@@ -46,14 +47,16 @@ def process_data_with_ocr(
     ocr_layout_dumper: Optional[OCRLayoutDumper] = None,
     password: Optional[str] = None,
     table_ocr_agent: str = OCR_AGENT_TESSERACT,
+    page_image_store: Optional[PageImageStore] = None,
+    ocr_regions_only: bool = False,
 ) -> "DocumentLayout":
     """
     Process OCR data from a given data and supplement the output DocumentLayout
     from unstructured_inference with ocr.
 
     Parameters:
-    - data (Union[bytes, BinaryIO]): The input file data,
-        which can be either bytes or a BinaryIO object.
+    - data (Union[bytes, memoryview, BinaryIO]): The input file data, which can be bytes, a
+        memoryview or a BinaryIO object. It is rendered in memory, without temporary files.
 
     - out_layout (DocumentLayout): The output layout from unstructured-inference.
 
@@ -74,32 +77,52 @@ def process_data_with_ocr(
 
     - ocr_layout_dumper (OCRLayoutDumper, optional): The OCR layout dumper to save the OCR layout.
 
+    - page_image_store (PageImageStore, optional): Shared store of the rendered page images. When
+      provided, pages are read from the store instead of being rendered again.
+
+    - ocr_regions_only (bool, optional): If true, only the region of each page that holds the
+      layout elements needing OCR is rendered and OCR-ed. See `process_page_images_with_ocr`.
+
     Returns:
         DocumentLayout: The merged layout information obtained after OCR processing.
     """
-    data_bytes = data if isinstance(data, bytes) else data.read()
-
-    with tempfile.TemporaryDirectory() as tmp_dir_path:
-        tmp_file_path = os.path.join(tmp_dir_path, "tmp_file")
-        with open(tmp_file_path, "wb") as tmp_file:
-            tmp_file.write(data_bytes)
-
-        merged_layouts = process_file_with_ocr(
-            filename=tmp_file_path,
+    if page_image_store is not None:
+        return process_page_images_with_ocr(
+            page_image_store=page_image_store,
             out_layout=out_layout,
             extracted_layout=extracted_layout,
-            is_image=is_image,
             infer_table_structure=infer_table_structure,
             ocr_agent=ocr_agent,
             ocr_languages=ocr_languages,
             ocr_mode=ocr_mode,
-            pdf_image_dpi=pdf_image_dpi,
             ocr_layout_dumper=ocr_layout_dumper,
-            password=password,
             table_ocr_agent=table_ocr_agent,
+            ocr_regions_only=ocr_regions_only,
         )
 
-    return merged_layouts
+    # NOTE: render straight from the bytes; the store only touches disk when its memory budget
+    # (env_config.PAGE_IMAGE_MEMORY_BUDGET) is exceeded
+    with PageImageStore(
+        file=data,
+        is_image=is_image,
+        dpi=pdf_image_dpi,
+        password=password,
+        consumers=[PAGE_CONSUMER_OCR],
+    ) as own_page_image_store:
+        # -- open the document up front so invalid data fails as it does when rendering it --
+        _ = own_page_image_store.page_count
+        return process_page_images_with_ocr(
+            page_image_store=own_page_image_store,
+            out_layout=out_layout,
+            extracted_layout=extracted_layout,
+            infer_table_structure=infer_table_structure,
+            ocr_agent=ocr_agent,
+            ocr_languages=ocr_languages,
+            ocr_mode=ocr_mode,
+            ocr_layout_dumper=ocr_layout_dumper,
+            table_ocr_agent=table_ocr_agent,
+            ocr_regions_only=ocr_regions_only,
+        )
 
 
 @requires_dependencies("unstructured_inference")
@@ -116,6 +139,8 @@ def process_file_with_ocr(
     ocr_layout_dumper: Optional[OCRLayoutDumper] = None,
     password: Optional[str] = None,
     table_ocr_agent: str = OCR_AGENT_TESSERACT,
+    page_image_store: Optional[PageImageStore] = None,
+    ocr_regions_only: bool = False,
 ) -> "DocumentLayout":
     """
     Process OCR data from a given file and supplement the output DocumentLayout
@@ -144,62 +169,51 @@ def process_file_with_ocr(
     - pdf_image_dpi (int, optional): DPI (dots per inch) for processing PDF images. Defaults to
       env_config.PDF_RENDER_DPI.
 
+    - page_image_store (PageImageStore, optional): Shared store of the rendered page images. When
+      provided, pages are read from the store instead of being rendered again.
+
+    - ocr_regions_only (bool, optional): If true, only the region of each page that holds the
+      layout elements needing OCR is rendered and OCR-ed. See `process_page_images_with_ocr`.
+
     Returns:
         DocumentLayout: The merged layout information obtained after OCR processing.
     """
 
-    from unstructured_inference.inference.layout import DocumentLayout
+    if page_image_store is not None:
+        return process_page_images_with_ocr(
+            page_image_store=page_image_store,
+            out_layout=out_layout,
+            extracted_layout=extracted_layout,
+            infer_table_structure=infer_table_structure,
+            ocr_agent=ocr_agent,
+            ocr_languages=ocr_languages,
+            ocr_mode=ocr_mode,
+            ocr_layout_dumper=ocr_layout_dumper,
+            table_ocr_agent=table_ocr_agent,
+            ocr_regions_only=ocr_regions_only,
+        )
 
-    merged_page_layouts: list[PageLayout] = []
     try:
-        if is_image:
-            with PILImage.open(filename) as images:
-                image_format = images.format
-                for i, image in enumerate(ImageSequence.Iterator(images)):
-                    image = image.convert("RGB")
-                    image.format = image_format
-                    extracted_regions = extracted_layout[i] if i < len(extracted_layout) else None
-                    merged_page_layout = supplement_page_layout_with_ocr(
-                        page_layout=out_layout.pages[i],
-                        image=image,
-                        infer_table_structure=infer_table_structure,
-                        ocr_agent=ocr_agent,
-                        ocr_languages=ocr_languages,
-                        ocr_mode=ocr_mode,
-                        extracted_regions=extracted_regions,
-                        ocr_layout_dumper=ocr_layout_dumper,
-                        table_ocr_agent=table_ocr_agent,
-                    )
-                    merged_page_layouts.append(merged_page_layout)
-                return DocumentLayout.from_pages(merged_page_layouts)
-        else:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                _image_paths = convert_pdf_to_image(
-                    filename,
-                    dpi=pdf_image_dpi,
-                    output_folder=temp_dir,
-                    path_only=True,
-                    password=password,
-                )
-                image_paths = cast(List[str], _image_paths)
-
-                for i, image_path in enumerate(image_paths):
-                    extracted_regions = extracted_layout[i] if i < len(extracted_layout) else None
-                    with PILImage.open(image_path) as image:
-                        merged_page_layout = supplement_page_layout_with_ocr(
-                            page_layout=out_layout.pages[i],
-                            image=image,
-                            infer_table_structure=infer_table_structure,
-                            ocr_agent=ocr_agent,
-                            ocr_languages=ocr_languages,
-                            ocr_mode=ocr_mode,
-                            extracted_regions=extracted_regions,
-                            ocr_layout_dumper=ocr_layout_dumper,
-                            table_ocr_agent=table_ocr_agent,
-                        )
-                        merged_page_layouts.append(merged_page_layout)
-
-                return DocumentLayout.from_pages(merged_page_layouts)
+        with PageImageStore(
+            filename=filename,
+            is_image=is_image,
+            dpi=pdf_image_dpi,
+            password=password,
+            consumers=[PAGE_CONSUMER_OCR],
+        ) as own_page_image_store:
+            _ = own_page_image_store.page_count
+            return process_page_images_with_ocr(
+                page_image_store=own_page_image_store,
+                out_layout=out_layout,
+                extracted_layout=extracted_layout,
+                infer_table_structure=infer_table_structure,
+                ocr_agent=ocr_agent,
+                ocr_languages=ocr_languages,
+                ocr_mode=ocr_mode,
+                ocr_layout_dumper=ocr_layout_dumper,
+                table_ocr_agent=table_ocr_agent,
+                ocr_regions_only=ocr_regions_only,
+            )
     except Exception as e:
         if os.path.isdir(filename) or os.path.isfile(filename):
             raise e
@@ -207,6 +221,144 @@ def process_file_with_ocr(
             raise FileNotFoundError(f'File "{filename}" not found!') from e
 
 
+@requires_dependencies("unstructured_inference")
+def process_page_images_with_ocr(
+    page_image_store: PageImageStore,
+    out_layout: "DocumentLayout",
+    extracted_layout: List[TextRegions],
+    infer_table_structure: bool = False,
+    ocr_agent: str = OCR_AGENT_TESSERACT,
+    ocr_languages: str = "eng",
+    ocr_mode: str = OCRMode.FULL_PAGE.value,
+    ocr_layout_dumper: Optional[OCRLayoutDumper] = None,
+    table_ocr_agent: str = OCR_AGENT_TESSERACT,
+    ocr_regions_only: bool = False,
+) -> "DocumentLayout":
+    """Supplement the output DocumentLayout with OCR using the page images held by
+    `page_image_store`. Each page is released for the OCR consumer as soon as it is processed.
+
+    When `ocr_regions_only` is true, only the region returned by `get_ocr_region()` is rendered
+    (with `PageImageStore.get_region()`) and OCR-ed on each page, and pages without elements that
+    need OCR are not OCR-ed at all. OCR text outside that region is not added to the layout.
+    """
+
+    from unstructured_inference.inference.layout import DocumentLayout
+
+    ocr_result_cache = get_ocr_result_cache()
+    ocr_result_cache_stats = ocr_result_cache.stats() if ocr_result_cache is not None else None
+    merged_page_layouts: list[PageLayout] = []
+    for i, page_layout in enumerate(out_layout.pages):
+        extracted_regions = extracted_layout[i] if i < len(extracted_layout) else None
+        ocr_kwargs: dict[str, Any] = {
+            "infer_table_structure": infer_table_structure,
+            "ocr_agent": ocr_agent,
+            "ocr_languages": ocr_languages,
+            "ocr_mode": ocr_mode,
+            "ocr_layout_dumper": ocr_layout_dumper,
+            "table_ocr_agent": table_ocr_agent,
+        }
+        if ocr_regions_only:
+            merged_page_layout = _supplement_page_region_with_ocr(
+                page_layout=page_layout,
+                page_image_store=page_image_store,
+                page_number=i + 1,
+                extracted_regions=extracted_regions,
+                **ocr_kwargs,
+            )
+        else:
+            merged_page_layout = supplement_page_layout_with_ocr(
+                page_layout=page_layout,
+                image=page_image_store.get_image(i + 1),
+                extracted_regions=extracted_regions,
+                **ocr_kwargs,
+            )
+        merged_page_layouts.append(merged_page_layout)
+        page_image_store.release(i + 1, PAGE_CONSUMER_OCR)
+
+    if ocr_result_cache is not None:
+        ocr_result_cache.log_stats(since=ocr_result_cache_stats)
+    return DocumentLayout.from_pages(merged_page_layouts)
+
+
+def get_ocr_region(
+    page_layout: "PageLayout",
+    infer_table_structure: bool = False,
+    padding: int = env_config.OCR_REGION_PAD,
+) -> Optional[tuple[int, int, int, int]]:
+    """The `(x1, y1, x2, y2)` bounding box, in page image pixels, of the layout elements of
+    `page_layout` that need OCR: the elements without valid embedded text, and the tables when
+    `infer_table_structure` is true. The box is padded by `padding` pixels and clipped to the
+    page. Returns None when no element needs OCR.
+    """
+    elements = page_layout.elements_array
+    if len(elements) == 0:
+        return None
+
+    needs_ocr = np.array([not valid_text(text) for text in elements.texts], dtype=bool)
+    if infer_table_structure:
+        table_id = {v: k for k, v in elements.element_class_id_map.items()}.get(ElementType.TABLE)
+        if table_id is not None:
+            needs_ocr |= elements.element_class_ids == table_id
+    if not needs_ocr.any():
+        return None
+
+    coords = elements.element_coords[needs_ocr]
+    x1, y1 = np.floor(coords[:, :2].min(axis=0) - padding)
+    x2, y2 = np.ceil(coords[:, 2:].max(axis=0) + padding)
+    image_metadata = page_layout.image_metadata or {}
+    width = image_metadata.get("width") or x2
+    height = image_metadata.get("height") or y2
+    return int(max(x1, 0)), int(max(y1, 0)), int(min(x2, width)), int(min(y2, height))
+
+
+def _supplement_page_region_with_ocr(
+    page_layout: "PageLayout",
+    page_image_store: PageImageStore,
+    page_number: int,
+    extracted_regions: Optional[TextRegions] = None,
+    **kwargs: Any,
+) -> "PageLayout":
+    """Run `supplement_page_layout_with_ocr` on the OCR region of a page only.
+
+    The page layout and `extracted_regions` are translated into the region's coordinates while
+    the region is OCR-ed and translated back afterwards, so the merged layout stays in page
+    coordinates.
+    """
+    region = get_ocr_region(page_layout, infer_table_structure=kwargs["infer_table_structure"])
+    if region is None:
+        return page_layout
+
+    image = page_image_store.get_region(page_number, region)
+    offset = np.array([region[0], region[1], region[0], region[1]], dtype=float)
+    page_layout.elements_array.element_coords = page_layout.elements_array.element_coords - offset
+    extracted_coords = extracted_regions.element_coords if extracted_regions is not None else None
+    if extracted_regions is not None:
+        extracted_regions.element_coords = extracted_coords - offset
+    try:
+        page_layout = supplement_page_layout_with_ocr(
+            page_layout=page_layout,
+            image=image,
+            extracted_regions=extracted_regions,
+            **kwargs,
+        )
+    finally:
+        page_layout.elements_array.element_coords = (
+            page_layout.elements_array.element_coords + offset
+        )
+        if extracted_regions is not None:
+            extracted_regions.element_coords = extracted_coords
+    return page_layout
+
+
+def get_ocr_agent(ocr_agent: str, ocr_languages: str) -> OCRAgent:
+    """The `ocr_agent` instance for the tesseract language codes `ocr_languages`, converted to
+    the language codes of the agent when it is not tesseract."""
+    language = ocr_languages
+    if ocr_agent == OCR_AGENT_PADDLE:
+        language = tesseract_to_paddle_language(ocr_languages)
+    return OCRAgent.get_instance(ocr_agent_module=ocr_agent, language=language)
+
+
 @requires_dependencies("unstructured_inference")
 def supplement_page_layout_with_ocr(
     page_layout: "PageLayout",
@@ -227,10 +379,8 @@ def supplement_page_layout_with_ocr(
     with no text and add text from OCR to each element.
     """
 
-    language = ocr_languages
-    if ocr_agent == OCR_AGENT_PADDLE:
-        language = tesseract_to_paddle_language(ocr_languages)
-    _ocr_agent = OCRAgent.get_instance(ocr_agent_module=ocr_agent, language=language)
+    _ocr_agent = get_ocr_agent(ocr_agent, ocr_languages)
+    ocr_layout = None
     if ocr_mode == OCRMode.FULL_PAGE.value:
         mark_partition_ocr_used()
         ocr_layout = _ocr_agent.get_layout_from_image(image)
@@ -243,23 +393,36 @@ def supplement_page_layout_with_ocr(
     elif ocr_mode == OCRMode.INDIVIDUAL_BLOCKS.value:
         # individual block mode still keeps using the list data structure for elements instead of
         # the vectorized page_layout.elements_array data structure
-        for i, text in enumerate(page_layout.elements_array.texts):
-            if text:
-                continue
-            padding = env_config.IMAGE_CROP_PAD
-            cropped_image = image.crop(
-                (
-                    page_layout.elements_array.x1[i] - padding,
-                    page_layout.elements_array.y1[i] - padding,
-                    page_layout.elements_array.x2[i] + padding,
-                    page_layout.elements_array.y2[i] + padding,
-                ),
-            )
-            # Note(yuming): instead of getting OCR layout, we just need
-            # the text extraced from OCR for individual elements
-            mark_partition_ocr_used()
-            text_from_ocr = _ocr_agent.get_text_from_image(cropped_image)
-            page_layout.elements_array.texts[i] = text_from_ocr
+        padding = env_config.IMAGE_CROP_PAD
+        if env_config.OCR_INDIVIDUAL_BLOCKS_BATCHED:
+            indices = [i for i, text in enumerate(page_layout.elements_array.texts) if not text]
+            if indices:
+                mark_partition_ocr_used()
+                texts = ocr_blocks(
+                    image,
+                    page_layout.elements_array.element_coords[indices],
+                    _ocr_agent,
+                    padding=padding,
+                )
+                for i, text_from_ocr in zip(indices, texts):
+                    page_layout.elements_array.texts[i] = text_from_ocr
+        else:
+            for i, text in enumerate(page_layout.elements_array.texts):
+                if text:
+                    continue
+                cropped_image = image.crop(
+                    (
+                        page_layout.elements_array.x1[i] - padding,
+                        page_layout.elements_array.y1[i] - padding,
+                        page_layout.elements_array.x2[i] + padding,
+                        page_layout.elements_array.y2[i] + padding,
+                    ),
+                )
+                # Note(yuming): instead of getting OCR layout, we just need
+                # the text extraced from OCR for individual elements
+                mark_partition_ocr_used()
+                text_from_ocr = _ocr_agent.get_text_from_image(cropped_image)
+                page_layout.elements_array.texts[i] = text_from_ocr
     else:
         raise ValueError(
             "Invalid OCR mode. Parameter `ocr_mode` "
@@ -268,12 +431,7 @@ def supplement_page_layout_with_ocr(
 
     # Note(yuming): use the OCR data from entire page OCR for table extraction
     if infer_table_structure:
-        language = ocr_languages
-        if table_ocr_agent == OCR_AGENT_PADDLE:
-            language = tesseract_to_paddle_language(ocr_languages)
-        _table_ocr_agent = OCRAgent.get_instance(
-            ocr_agent_module=table_ocr_agent, language=language
-        )
+        _table_ocr_agent = get_ocr_agent(table_ocr_agent, ocr_languages)
         from unstructured_inference.models import tables
 
         tables.load_agent()
@@ -286,6 +444,8 @@ def supplement_page_layout_with_ocr(
             tables_agent=tables.tables_agent,
             ocr_agent=_table_ocr_agent,
             extracted_regions=extracted_regions,
+            # NOTE: the full-page OCR words double as table tokens when the same agent made them
+            page_ocr_layout=ocr_layout if table_ocr_agent == ocr_agent else None,
         )
 
     return page_layout
@@ -298,11 +458,16 @@ def supplement_element_with_table_extraction(
     tables_agent: "UnstructuredTableTransformerModel",
     ocr_agent,
     extracted_regions: Optional[TextRegions] = None,
+    page_ocr_layout: Optional[TextRegions] = None,
 ) -> List["LayoutElement"]:
     """Supplement the existing layout with table extraction. Any Table elements
     that are extracted will have a metadata fields "text_as_html" where
     the table's text content is rendered into a html string and "table_as_cells"
     with the raw table cells output from table agent if env_config.EXTRACT_TABLE_AS_CELLS is True
+
+    When `page_ocr_layout` (the full-page OCR of `image`) is given, the OCR words inside each
+    table crop are used as its table tokens; a table crop is only OCR-ed again with `ocr_agent`
+    when the full-page OCR found no words in it.
     """
     from unstructured_inference.models.tables import cells_to_html
 
@@ -315,18 +480,21 @@ def supplement_element_with_table_extraction(
     table_elements = elements.slice(table_ele_indices)
     padding = env_config.TABLE_IMAGE_CROP_PAD
     for i, element_coords in enumerate(table_elements.element_coords):
-        cropped_image = image.crop(
-            (
-                element_coords[0] - padding,
-                element_coords[1] - padding,
-                element_coords[2] + padding,
-                element_coords[3] + padding,
-            ),
-        )
-        table_tokens = get_table_tokens(
-            table_element_image=cropped_image,
-            ocr_agent=ocr_agent,
+        crop_box = (
+            element_coords[0] - padding,
+            element_coords[1] - padding,
+            element_coords[2] + padding,
+            element_coords[3] + padding,
         )
+        cropped_image = image.crop(crop_box)
+        table_tokens = None
+        if page_ocr_layout is not None:
+            table_tokens = get_table_tokens_from_page_ocr(page_ocr_layout, crop_box)
+        if not table_tokens:
+            table_tokens = get_table_tokens(
+                table_element_image=cropped_image,
+                ocr_agent=ocr_agent,
+            )
         mark_partition_table_extraction()
         tatr_cells = tables_agent.predict(
             cropped_image, ocr_tokens=table_tokens, result_format="cells"
@@ -375,6 +543,42 @@ def get_table_tokens(
     return table_tokens
 
 
+def get_table_tokens_from_page_ocr(
+    page_ocr_layout: TextRegions,
+    crop_box: tuple[float, float, float, float],
+    subregion_threshold: float = env_config.OCR_LAYOUT_SUBREGION_THRESHOLD,
+) -> List[dict[str, Any]]:
+    """Get the table tokens of the table crop `crop_box` from the full-page OCR words that lie
+    within it, in the same format as `get_table_tokens()`.
+
+    Word boxes are clipped to the crop and translated into crop-relative coordinates; the words
+    keep the page's OCR order.
+    """
+
+    if len(page_ocr_layout) == 0:
+        return []
+
+    x1, y1, x2, y2 = crop_box
+    inside = bboxes1_is_almost_subregion_of_bboxes2(
+        page_ocr_layout.element_coords,
+        np.array([crop_box], dtype=float),
+        subregion_threshold,
+    )[:, 0]
+    token_coords = page_ocr_layout.element_coords[inside].astype(float)
+    token_coords = np.clip(token_coords, [x1, y1, x1, y1], [x2, y2, x2, y2]) - [x1, y1, x1, y1]
+
+    return [
+        {
+            "bbox": token_coords[i].tolist(),
+            "text": text,
+            "span_num": i,
+            "line_num": 0,
+            "block_num": 0,
+        }
+        for i, text in enumerate(page_ocr_layout.texts[inside])
+    ]
+
+
 def merge_out_layout_with_ocr_layout(
     out_layout: LayoutElements,
     ocr_layout: TextRegions,
@@ -384,10 +588,11 @@ def merge_out_layout_with_ocr_layout(
     """
     Merge the out layout with the OCR-detected text regions on page level.
 
-    This function iterates over each out layout element and aggregates the associated text from
-    the OCR layout using the specified threshold. The out layout's text attribute is then updated
-    with this aggregated text. If `supplement_with_ocr_elements` is `True`, the out layout will be
-    supplemented with the OCR layout.
+    For each out layout element without valid text, this function aggregates the associated text
+    from the OCR layout using the specified threshold, matching all those elements against the OCR
+    layout in one pass. The out layout's text attribute is then updated with this aggregated text.
+    If `supplement_with_ocr_elements` is `True`, the out layout will be supplemented with the OCR
+    layout.
     """
 
     if len(out_layout) == 0 or len(ocr_layout) == 0:
@@ -400,12 +605,14 @@ def merge_out_layout_with_ocr_layout(
     invalid_text_indices = [i for i, text in enumerate(out_layout.texts) if not valid_text(text)]
     out_layout.texts = out_layout.texts.astype(object)
 
-    for idx in invalid_text_indices:
-        out_layout.texts[idx], _ = aggregate_embedded_text_by_block(
-            target_region=out_layout.slice([idx]),
+    if invalid_text_indices:
+        aggregated_texts = aggregate_embedded_text_by_blocks(
+            target_regions=out_layout.slice(invalid_text_indices),
             source_regions=ocr_layout,
             subregion_threshold=subregion_threshold,
         )
+        for idx, text in zip(invalid_text_indices, aggregated_texts):
+            out_layout.texts[idx] = text
 
     final_layout = (
         supplement_layout_with_ocr_elements(out_layout, ocr_layout)
@@ -0,0 +1,223 @@
+"""Per-page checkpoints of serial hi_res runs.
+
+A checkpointed run partitions the document a few consecutive pages at a time and writes the final
+elements of every finished page to a `PartitionCache` directory, keyed by the hash of the document
+bytes, the output-affecting parameters and the page index. A rerun of the same document with the
+same parameters loads the finished pages from the checkpoint directory and only partitions the
+missing ones, so a run that dies on page 850 of 900 resumes at page 850. The checkpoints of a run
+are removed once it completes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import warnings
+from typing import IO, Any, Optional
+
+from unstructured.documents.elements import Element, PageBreak
+from unstructured.logger import logger
+from unstructured.partition.common.common import convert_to_bytes
+from unstructured.partition.common.partition_cache import PartitionCache, partition_cache_key
+from unstructured.partition.pdf_image.page_selection import group_page_runs
+from unstructured.partition.pdf_image.pdf_document import PdfDocumentHandle
+from unstructured.partition.pdf_image.pdfminer_utils import PDFMinerConfig, PDFMinerPage
+from unstructured.partition.utils.config import env_config
+
+
+def checkpoint_run_key(data: bytes, partition_kwargs: dict[str, Any]) -> Optional[str]:
+    """The key of a checkpointed run of `data` with `partition_kwargs`, or None when the
+    parameters do not serialize (e.g. a callable argument) and the run can not be checkpointed."""
+    pdfminer_config = partition_kwargs.get("pdfminer_config")
+    params = {
+        **partition_kwargs,
+        "pdfminer_config": pdfminer_config.model_dump() if pdfminer_config else None,
+    }
+    return partition_cache_key(hashlib.sha256(data).hexdigest(), params)
+
+
+def partition_pdf_pages_with_checkpoints(
+    checkpoint_dir: str,
+    filename: str = "",
+    file: Optional[bytes | IO[bytes]] = None,
+    pages_per_range: Optional[int] = None,
+    starting_page_number: int = 1,
+    include_page_breaks: bool = False,
+    metadata_last_modified: Optional[str] = None,
+    extract_images_in_pdf: bool = False,
+    extract_image_block_types: Optional[list[str]] = None,
+    extract_image_block_output_dir: Optional[str] = None,
+    extract_image_block_to_payload: bool = False,
+    pdf_image_dpi: Optional[int] = None,
+    password: Optional[str] = None,
+    pdfminer_config: Optional[PDFMinerConfig] = None,
+    pdfminer_pages: Optional[list[PDFMinerPage]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
+    page_indices: Optional[list[int]] = None,
+    **kwargs: Any,
+) -> Optional[list[Element]]:
+    """Partition a PDF with the hi_res strategy, checkpointing the elements of every finished page
+    in `checkpoint_dir` and skipping the pages a previous run of the same call already finished.
+
+    Runs of consecutive unfinished pages are partitioned `pages_per_range` pages at a time with
+    `_partition_pdf_or_image_local`, like the page-parallel workers do. When `page_indices` is
+    given, only the pages at those sorted 0-based indices are partitioned and `pdfminer_pages`
+    holds the layouts of those pages only. Image blocks written to
+    `extract_image_block_output_dir` are cropped after the merge so that their file names are
+    numbered across the whole document.
+
+    Returns None when the call can not be checkpointed, so the caller partitions the document
+    without checkpoints instead.
+    """
+    from unstructured.partition.pdf import check_pdf_hi_res_max_pages_exceeded
+    from unstructured.partition.pdf_image.page_parallel import (
+        _save_image_blocks,
+        iter_pdf_page_subranges,
+    )
+
+    if pdf_document is None:
+        pdf_document = PdfDocumentHandle(
+            filename=filename,
+            file=convert_to_bytes(file) if file is not None else None,
+            password=password,
+        )
+    check_pdf_hi_res_max_pages_exceeded(
+        pdf_hi_res_max_pages=kwargs.pop("pdf_hi_res_max_pages", None),
+        pdf_document=pdf_document,
+        page_indices=page_indices,
+    )
+
+    extract_in_ranges = extract_image_block_to_payload or not (
+        extract_images_in_pdf or extract_image_block_types
+    )
+    partition_kwargs = {
+        "starting_page_number": starting_page_number,
+        "pdf_image_dpi": pdf_image_dpi,
+        "extract_images_in_pdf": extract_images_in_pdf and extract_in_ranges,
+        "extract_image_block_types": extract_image_block_types if extract_in_ranges else None,
+        "extract_image_block_to_payload": extract_image_block_to_payload,
+        "pdfminer_config": pdfminer_config,
+        **kwargs,
+    }
+    data = pdf_document.data
+    run_key = checkpoint_run_key(data, partition_kwargs)
+    if run_key is None:
+        logger.info("hi_res parameters can not be checkpointed, partitioning without checkpoints.")
+        return None
+
+    cache = PartitionCache(checkpoint_dir, max_bytes=0)
+    selected_page_indices = (
+        page_indices if page_indices is not None else list(range(pdf_document.page_count))
+    )
+    page_keys = {page_index: f"{run_key}-{page_index}" for page_index in selected_page_indices}
+    page_elements: dict[int, list[Element]] = {}
+    for page_index, page_key in page_keys.items():
+        elements = cache.get(page_key)
+        if elements is not None:
+            page_elements[page_index] = elements
+    if page_elements:
+        logger.info(
+            f"Resuming hi_res run from checkpoints of {len(page_elements)} of "
+            f"{len(selected_page_indices)} pages."
+        )
+
+    if pages_per_range is None:
+        pages_per_range = env_config.PDF_HI_RES_CHECKPOINT_PAGES
+    pages_per_range = max(pages_per_range, 1)
+    pdfminer_page_positions = {
+        page_index: position for position, page_index in enumerate(selected_page_indices)
+    }
+    page_ranges = [
+        (first_page_index, min(first_page_index + pages_per_range, stop_page_index))
+        for run_first_page_index, stop_page_index in group_page_runs(
+            page_index for page_index in selected_page_indices if page_index not in page_elements
+        )
+        for first_page_index in range(run_first_page_index, stop_page_index, pages_per_range)
+    ]
+    for (first_page_index, stop_page_index), (_, range_data) in zip(
+        page_ranges, iter_pdf_page_subranges(pdf_document, page_ranges, password=password)
+    ):
+        position = pdfminer_page_positions[first_page_index]
+        range_elements = _partition_checkpoint_range(
+            range_data,
+            pdfminer_pages[position : position + stop_page_index - first_page_index]
+            if pdfminer_pages
+            else None,
+            {
+                **partition_kwargs,
+                "starting_page_number": starting_page_number + first_page_index,
+                "metadata_last_modified": metadata_last_modified,
+            },
+        )
+        range_page_elements = _split_elements_by_page(
+            range_elements, starting_page_number, first_page_index, stop_page_index
+        )
+        for page_index, elements in range_page_elements.items():
+            cache.put(page_keys[page_index], elements)
+        page_elements.update(range_page_elements)
+
+    elements: list[Element] = []
+    for page_index in selected_page_indices:
+        elements.extend(page_elements[page_index])
+        # -- like `document_to_element_list()`, a page break follows every page, the last too --
+        if include_page_breaks:
+            elements.append(PageBreak(text=""))
+    # -- checkpointed elements were written by a run that may have had another last-modified date
+    if metadata_last_modified is not None:
+        for element in elements:
+            if not isinstance(element, PageBreak):
+                element.metadata.last_modified = metadata_last_modified
+
+    if not extract_in_ranges:
+        _save_image_blocks(
+            elements=elements,
+            data=data,
+            starting_page_number=starting_page_number,
+            extract_images_in_pdf=extract_images_in_pdf,
+            extract_image_block_types=extract_image_block_types,
+            extract_image_block_output_dir=extract_image_block_output_dir,
+            pdf_image_dpi=pdf_image_dpi,
+            password=password,
+        )
+
+    for page_key in page_keys.values():
+        cache.discard(page_key)
+    return elements
+
+
+def _partition_checkpoint_range(
+    data: bytes,
+    pdfminer_pages: Optional[list[PDFMinerPage]],
+    partition_kwargs: dict[str, Any],
+) -> list[Element]:
+    from unstructured.partition.pdf import _partition_pdf_or_image_local
+
+    # NOTE(robinson): Catches a UserWarning that occurs when detection is called
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return _partition_pdf_or_image_local(
+            file=io.BytesIO(data),
+            pdfminer_pages=pdfminer_pages,
+            include_page_breaks=False,
+            **partition_kwargs,
+        )
+
+
+def _split_elements_by_page(
+    elements: list[Element],
+    starting_page_number: int,
+    first_page_index: int,
+    stop_page_index: int,
+) -> dict[int, list[Element]]:
+    """Group the elements of the pages `first_page_index` up to `stop_page_index` by page index.
+    Every page of the range gets an entry, so that pages without elements are checkpointed too."""
+    page_elements: dict[int, list[Element]] = {
+        page_index: [] for page_index in range(first_page_index, stop_page_index)
+    }
+    for element in elements:
+        page_number = element.metadata.page_number
+        page_index = (
+            page_number - starting_page_number if page_number is not None else first_page_index
+        )
+        page_elements.get(page_index, page_elements[first_page_index]).append(element)
+    return page_elements
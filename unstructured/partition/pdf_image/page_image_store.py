@@ -0,0 +1,445 @@
+from __future__ import annotations
+
+import math
+import os
+import tempfile
+import threading
+from io import BytesIO
+from typing import IO, Iterable, Optional, Sequence, cast
+
+from PIL import Image as PILImage
+from PIL import ImageSequence
+
+from unstructured.logger import logger
+from unstructured.partition.common.common import convert_to_bytes, exactly_one
+from unstructured.partition.pdf_image.page_memory_budget import (
+    PageMemoryBudget,
+    get_page_memory_budget,
+)
+from unstructured.partition.pdf_image.pdfium_utils import (
+    check_render_max_pixels,
+    estimate_rotation_corrections,
+    open_pdfium_document,
+    pdfium_lock,
+    render_pdf_page,
+)
+from unstructured.partition.utils.config import env_config
+
+# NOTE: names of the hi_res stages that read page images from a `PageImageStore`. A page is
+# released once every registered consumer has released it.
+PAGE_CONSUMER_OCR = "ocr"
+PAGE_CONSUMER_IMAGE_BLOCKS = "image_blocks"
+PAGE_CONSUMER_ANALYSIS = "analysis"
+
+
+class PageImageStore:
+    """Per-document store of page images rendered once at a fixed DPI.
+
+    Every hi_res stage that needs a page image (OCR, table structure, image-block extraction
+    and analysis drawing) reads it from the same store instead of rendering the document again.
+    Pages are rendered lazily on first access and reference counted by consumer name: a page is
+    dropped from memory as soon as every registered consumer has released it, so a document
+    that is only OCR-ed holds a single page image at a time. A PDF page released by some of its
+    consumers is spilled to a temporary file until the others read it again, so the pages
+    waiting for a later stage do not pile up in memory.
+
+    PDF pages are rendered from one pdfium document opened for the whole store, the same way
+    `convert_pdf_to_image()` renders them, including its text-orientation correction of rotated
+    pages and its `PDF_RENDER_MAX_PIXELS_PER_PAGE` check.
+
+    Everything stays in memory: `file` bytes are rendered straight to image buffers. Only when
+    the held PDF page images exceed `memory_budget` bytes (env_config.PAGE_IMAGE_MEMORY_BUDGET by
+    default, 0 for no limit) are the least recently rendered ones spilled to temporary files,
+    to be read back on their next access.
+
+    Rendered PDF pages also count against `page_memory_budget`, the process-wide budget of page
+    images in flight (see `PAGE_IMAGE_MEMORY_LIMIT`) by default. Before rendering a page that does
+    not fit, the store spills the pages it holds and then waits for other stores to release theirs.
+    """
+
+    def __init__(
+        self,
+        filename: str = "",
+        file: Optional[bytes | memoryview | IO[bytes]] = None,
+        is_image: bool = False,
+        dpi: Optional[int] = None,
+        password: Optional[str] = None,
+        consumers: Iterable[str] = (),
+        memory_budget: Optional[int] = None,
+        page_memory_budget: Optional[PageMemoryBudget] = None,
+    ):
+        # -- a missing document raises `FileNotFoundError` on the first page read, as it does in
+        # -- `convert_pdf_to_image()`, rather than failing here --
+        if filename and file is not None:
+            exactly_one(filename=filename, file=file)
+        self.filename = filename
+        self.is_image = is_image
+        self.dpi = dpi if dpi is not None else env_config.PDF_RENDER_DPI
+        self.password = password
+        self.consumers = frozenset(consumers)
+        self.memory_budget = (
+            memory_budget if memory_budget is not None else env_config.PAGE_IMAGE_MEMORY_BUDGET
+        )
+        self.page_memory_budget = (
+            page_memory_budget if page_memory_budget is not None else get_page_memory_budget()
+        )
+        self._data = _read_bytes(file) if file is not None else None
+        self._images: dict[int, PILImage.Image] = {}
+        self._pending: dict[int, set[str]] = {}
+        self._released: set[int] = set()
+        self._page_count: Optional[int] = None
+        self._frames: Optional[list[Optional[PILImage.Image]]] = None
+        self._spilled: dict[int, tuple[str, str, tuple[int, int]]] = {}
+        self._reserved: dict[int, int] = {}
+        self._spill_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._pdfium_document = None
+        self._rotation_corrections: Optional[dict[int, int]] = None
+        self._lock = threading.RLock()
+        self.render_count = 0
+        self.spill_count = 0
+
+    def __enter__(self) -> PageImageStore:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.page_count
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages (or image frames) in the document."""
+        if self._page_count is None:
+            with self._lock:
+                if self._page_count is None:
+                    self._page_count = (
+                        len(self._load_frames()) if self.is_image else self._count_pdf_pages()
+                    )
+        return self._page_count
+
+    def get_image(self, page_number: int) -> PILImage.Image:
+        """Return the image of the 1-based `page_number`, rendering it on first access."""
+        if not 1 <= page_number <= self.page_count:
+            raise IndexError(f"Page {page_number} is out of range (1-{self.page_count}).")
+        with self._lock:
+            image = self._images.get(page_number)
+            if image is None and page_number in self._spilled:
+                path, mode, size = self._spilled[page_number]
+                self._reserve(page_number, size[0] * size[1] * PILImage.getmodebands(mode))
+                image = self._load_spilled(page_number)
+                self._images[page_number] = image
+                self._enforce_memory_budget(keep=page_number)
+            elif image is None:
+                if page_number in self._released:
+                    logger.debug(f"Page {page_number} was already released, rendering it again.")
+                if not self.is_image:
+                    self._reserve(page_number, self._estimate_page_nbytes(page_number))
+                try:
+                    image = self._render(page_number)
+                except BaseException:
+                    self._unreserve(page_number)
+                    raise
+                self._images[page_number] = image
+                self._pending[page_number] = set(self.consumers)
+                self._enforce_memory_budget(keep=page_number)
+            return image
+
+    def get_region(
+        self,
+        page_number: int,
+        bbox: Sequence[float],
+        dpi: Optional[int] = None,
+    ) -> PILImage.Image:
+        """Return the image of the `bbox` region of the 1-based `page_number` rendered at `dpi`.
+
+        `bbox` is `(x1, y1, x2, y2)` in pixels of the page rendered at the store's DPI. When the
+        page image is already held by the store, in memory or spilled, and `dpi` is the store's
+        DPI, the region is cropped from it; a spilled page is not taken back into memory.
+        Otherwise only the region is rendered from the PDF, without rendering or holding the
+        whole page. Image frames have a fixed resolution, so `dpi` is ignored for images. Like
+        `PIL.Image.Image.crop()`, parts of the region outside the page are black.
+        """
+        if not 1 <= page_number <= self.page_count:
+            raise IndexError(f"Page {page_number} is out of range (1-{self.page_count}).")
+        dpi = dpi or self.dpi
+        if self.is_image:
+            return self.get_image(page_number).crop(tuple(bbox))
+        if dpi == self.dpi:
+            with self._lock:
+                image = self._images.get(page_number)
+                if image is not None:
+                    return image.crop(tuple(bbox))
+                spilled = self._spilled.get(page_number)
+                if spilled is not None:
+                    return _read_spilled(*spilled).crop(tuple(bbox))
+        return self._render_region(page_number, bbox, dpi)
+
+    def iter_images(self):
+        """Yield the images of all pages in page order."""
+        for page_number in range(1, self.page_count + 1):
+            yield self.get_image(page_number)
+
+    def release(self, page_number: int, consumer: str) -> None:
+        """Mark `page_number` as no longer needed by `consumer`; drop it once every registered
+        consumer has released it."""
+        with self._lock:
+            pending = self._pending.get(page_number)
+            if pending is None:
+                return
+            pending.discard(consumer)
+            if not pending:
+                self._drop(page_number)
+            elif not self.is_image and page_number in self._images:
+                self._spill(page_number)
+
+    def release_all(self, consumer: str) -> None:
+        """Release every page currently held for `consumer`."""
+        with self._lock:
+            for page_number in list(self._pending):
+                self.release(page_number, consumer)
+
+    def close(self) -> None:
+        """Drop every page image held by the store."""
+        with self._lock:
+            for page_number in list(self._images) + list(self._spilled):
+                self._drop(page_number)
+            self._frames = None
+            if self._pdfium_document is not None:
+                with pdfium_lock:
+                    self._pdfium_document.close()
+                self._pdfium_document = None
+            if self._spill_dir is not None:
+                self._spill_dir.cleanup()
+                self._spill_dir = None
+
+    @property
+    def cached_page_numbers(self) -> list[int]:
+        """Page numbers whose images are currently held in memory."""
+        return sorted(self._images)
+
+    def _drop(self, page_number: int) -> None:
+        self._pending.pop(page_number, None)
+        self._unreserve(page_number)
+        spilled = self._spilled.pop(page_number, None)
+        if spilled is not None:
+            os.remove(spilled[0])
+        image = self._images.pop(page_number, None)
+        if self.is_image:
+            if self._frames is not None:
+                self._frames[page_number - 1] = None
+        elif image is not None:
+            image.close()
+        self._released.add(page_number)
+
+    def _enforce_memory_budget(self, keep: int) -> None:
+        # NOTE: image frames are decoded together, so only rendered PDF pages are spilled
+        if self.memory_budget <= 0 or self.is_image:
+            return
+        held = {page_number: _image_nbytes(image) for page_number, image in self._images.items()}
+        total = sum(held.values())
+        for page_number in list(self._images):
+            if total <= self.memory_budget:
+                break
+            if page_number == keep:
+                continue
+            total -= held[page_number]
+            self._spill(page_number)
+
+    def _spill(self, page_number: int) -> None:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.TemporaryDirectory()
+        image = self._images.pop(page_number)
+        path = os.path.join(self._spill_dir.name, f"page-{page_number}.raw")
+        with open(path, "wb") as f:
+            f.write(image.tobytes())
+        self._unreserve(page_number)
+        # NOTE: not closed, a caller may still be using it; it is freed once they let go of it
+        self._spilled[page_number] = (path, image.mode, image.size)
+        self.spill_count += 1
+        logger.debug(f"Page image memory budget exceeded, spilled page {page_number} to disk.")
+
+    def _reserve(self, page_number: int, nbytes: int) -> None:
+        """Reserve `nbytes` for `page_number` in the page memory budget, spilling the pages held
+        by this store first when they do not fit."""
+        if self.page_memory_budget is None:
+            return
+        if not self.page_memory_budget.try_acquire(nbytes):
+            for held_page_number in list(self._images):
+                self._spill(held_page_number)
+            self.page_memory_budget.acquire(nbytes)
+        self._reserved[page_number] = nbytes
+
+    def _unreserve(self, page_number: int) -> None:
+        nbytes = self._reserved.pop(page_number, None)
+        if nbytes is not None and self.page_memory_budget is not None:
+            self.page_memory_budget.release(nbytes)
+
+    def _estimate_page_nbytes(self, page_number: int) -> int:
+        """The size of the RGB image of `page_number` rendered at the store's DPI."""
+        if self.page_memory_budget is None:
+            return 0
+        with pdfium_lock:
+            page = self._get_pdfium_document()[page_number - 1]
+            try:
+                width, height = page.get_size()
+            finally:
+                page.close()
+        scale = self.dpi / 72
+        return math.ceil(width * scale) * math.ceil(height * scale) * 3
+
+    def _get_pdfium_document(self):
+        # NOTE: callers hold `pdfium_lock`
+        if self._pdfium_document is None:
+            self._pdfium_document = open_pdfium_document(
+                self.filename if self._data is None else self._data, password=self.password
+            )
+        return self._pdfium_document
+
+    def _get_rotation_corrections(self) -> dict[int, int]:
+        """The extra rotation `convert_pdf_to_image()` applies to each rotated page (by 0-based
+        page index) to make its dominant text horizontal, estimated once for the document."""
+        if self._rotation_corrections is None:
+            with pdfium_lock:
+                pdf = self._get_pdfium_document()
+                rotated_page_indices = []
+                for page_index in range(len(pdf)):
+                    page = pdf[page_index]
+                    try:
+                        if page.get_rotation():
+                            rotated_page_indices.append(page_index)
+                    finally:
+                        page.close()
+            self._rotation_corrections = estimate_rotation_corrections(
+                self.filename if self._data is None else self._data,
+                rotated_page_indices,
+                self.password,
+            )
+        return self._rotation_corrections
+
+    def _load_spilled(self, page_number: int) -> PILImage.Image:
+        path, mode, size = self._spilled.pop(page_number)
+        image = _read_spilled(path, mode, size)
+        os.remove(path)
+        return image
+
+    def _render(self, page_number: int) -> PILImage.Image:
+        self.render_count += 1
+        if self.is_image:
+            image = self._load_frames()[page_number - 1]
+            if image is None:
+                self._frames = None
+                image = self._load_frames()[page_number - 1]
+            return cast(PILImage.Image, image)
+        correction = self._get_rotation_corrections().get(page_number - 1, 0)
+        scale = self.dpi / 72
+        with pdfium_lock:
+            page = self._get_pdfium_document()[page_number - 1]
+            try:
+                check_render_max_pixels(page, page_number, scale)
+                image = render_pdf_page(page, scale)
+                rotation = page.get_rotation()
+            finally:
+                page.close()
+        if correction:
+            image = image.rotate(correction, expand=True)
+        image.info["pdf_rotation"] = rotation
+        image.info["pdf_rotation_correction"] = correction
+        return image
+
+    def _render_region(self, page_number: int, bbox: Sequence[float], dpi: int) -> PILImage.Image:
+        """Render only the `bbox` region of the page, rotated and checked like `_render()`."""
+        scale = dpi / self.dpi
+        x1, y1, x2, y2 = (round(coordinate * scale) for coordinate in bbox)
+        if x2 <= x1 or y2 <= y1:
+            raise ValueError(f"Empty region {tuple(bbox)} on page {page_number}.")
+
+        correction = self._get_rotation_corrections().get(page_number - 1, 0)
+        render_scale = dpi / 72
+        with pdfium_lock:
+            page = self._get_pdfium_document()[page_number - 1]
+            try:
+                check_render_max_pixels(page, page_number, render_scale)
+                # -- size in pixels of the page as pdfium renders it, before the correction --
+                width, height = (math.ceil(size * render_scale) for size in page.get_size())
+                # -- the region in that rendering, undoing the correction rotation --
+                dx1, dy1, dx2, dy2 = _unrotate_box((x1, y1, x2, y2), correction, width, height)
+                left, top = max(dx1, 0), max(dy1, 0)
+                right, bottom = min(dx2, width), min(dy2, height)
+                region = None
+                if left < right and top < bottom:
+                    region = render_pdf_page(
+                        page,
+                        render_scale,
+                        crop=tuple(
+                            _crop_points(pixels, render_scale)
+                            for pixels in (left, height - bottom, width - right, top)
+                        ),
+                    )
+            finally:
+                page.close()
+        self.render_count += 1
+
+        image = PILImage.new("RGB", (dx2 - dx1, dy2 - dy1))
+        if region is not None:
+            image.paste(region, (left - dx1, top - dy1))
+        return image.rotate(correction, expand=True) if correction else image
+
+    def _load_frames(self) -> list[Optional[PILImage.Image]]:
+        if self._frames is None:
+            source = self.filename if self._data is None else BytesIO(self._data)
+            frames: list[Optional[PILImage.Image]] = []
+            with PILImage.open(source) as images:
+                image_format = images.format
+                for frame in ImageSequence.Iterator(images):
+                    frame = frame.convert("RGB")
+                    frame.format = image_format
+                    frames.append(frame)
+            self._frames = frames
+        return self._frames
+
+    def _count_pdf_pages(self) -> int:
+        with pdfium_lock:
+            return len(self._get_pdfium_document())
+
+
+def _unrotate_box(
+    box: tuple[int, int, int, int], rotation: int, width: int, height: int
+) -> tuple[int, int, int, int]:
+    """Map `box` on an image rotated counter-clockwise by `rotation` degrees (with `expand=True`)
+    back onto the `width` x `height` image it was rotated from."""
+    x1, y1, x2, y2 = box
+    if rotation == 90:
+        return width - y2, x1, width - y1, x2
+    if rotation == 180:
+        return width - x2, height - y2, width - x1, height - y1
+    if rotation == 270:
+        return y1, height - x2, y2, height - x1
+    return box
+
+
+def _crop_points(pixels: int, scale: float) -> float:
+    """The crop margin, in points, that pdfium rounds up to exactly `pixels` at `scale`."""
+    return max(pixels - 1e-3, 0) / scale
+
+
+def _read_spilled(path: str, mode: str, size: tuple[int, int]) -> PILImage.Image:
+    with open(path, "rb") as f:
+        return PILImage.frombytes(mode, size, f.read())
+
+
+def _image_nbytes(image: PILImage.Image) -> int:
+    return image.width * image.height * len(image.getbands())
+
+
+def _read_bytes(file: bytes | memoryview | IO[bytes]) -> bytes:
+    if isinstance(file, memoryview):
+        # NOTE: pdfium and PIL only take `bytes`, so this is the one copy of a non-bytes buffer
+        return file.tobytes()
+    try:
+        return convert_to_bytes(file)
+    except ValueError:
+        file.seek(0)
+        data = file.read()
+        file.seek(0)
+        return data
@@ -0,0 +1,105 @@
+"""A byte budget for the decoded page images held across documents, threads and processes.
+
+`PAGE_IMAGE_MEMORY_BUDGET` bounds the page images one `PageImageStore` holds, but concurrent
+partitioning calls and page-parallel workers each have their own stores, so nothing bounds their
+total. With `PAGE_IMAGE_MEMORY_LIMIT` set, every store reserves the decoded size of a PDF page in
+the process-wide `PageMemoryBudget` before rendering it and returns it once the page is dropped or
+spilled. A store that cannot reserve a page first spills the pages it holds itself, then waits
+until other stores release enough, so the page images in flight stay under the limit.
+
+The budget is backed by `multiprocessing` primitives, and page-parallel workers receive the budget
+of the parent process, so the limit holds across all of them.
+"""
+
+from __future__ import annotations
+
+import functools
+import multiprocessing
+import time
+from typing import Optional
+
+from unstructured.logger import logger
+from unstructured.partition.utils.config import env_config
+
+# -- a reservation waits at most this many seconds, e.g. for a crashed worker that never released
+# -- its pages, before it is granted over the limit --
+DEFAULT_MAX_WAIT = 600.0
+
+
+class PageMemoryBudget:
+    """A budget of `limit` bytes of page images.
+
+    `acquire()` blocks until the requested bytes fit in the budget. A request is always granted
+    when nothing is reserved, so a single page larger than the limit still gets rendered.
+    """
+
+    def __init__(self, limit: int, max_wait: float = DEFAULT_MAX_WAIT):
+        context = multiprocessing.get_context("spawn")
+        self.limit = limit
+        self.max_wait = max_wait
+        self._condition = context.Condition()
+        self._in_use = context.RawValue("q", 0)
+
+    @property
+    def in_use(self) -> int:
+        """Bytes currently reserved, by this process and every process sharing the budget."""
+        with self._condition:
+            return self._in_use.value
+
+    def try_acquire(self, nbytes: int) -> bool:
+        """Reserve `nbytes` when they fit in the budget, without waiting."""
+        with self._condition:
+            if not self._fits(nbytes):
+                return False
+            self._in_use.value += nbytes
+            return True
+
+    def acquire(self, nbytes: int) -> None:
+        """Reserve `nbytes`, waiting until they fit in the budget."""
+        deadline = time.monotonic() + self.max_wait
+        with self._condition:
+            while not self._fits(nbytes):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    logger.warning(
+                        f"Waited {self.max_wait:.0f}s for {nbytes} bytes of page image memory, "
+                        f"exceeding PAGE_IMAGE_MEMORY_LIMIT ({self.limit} bytes)."
+                    )
+                    break
+                self._condition.wait(remaining)
+            self._in_use.value += nbytes
+
+    def release(self, nbytes: int) -> None:
+        """Return `nbytes` reserved with `acquire()` or `try_acquire()` to the budget."""
+        with self._condition:
+            self._in_use.value = max(self._in_use.value - nbytes, 0)
+            self._condition.notify_all()
+
+    def _fits(self, nbytes: int) -> bool:
+        return self._in_use.value == 0 or self._in_use.value + nbytes <= self.limit
+
+
+# -- the budget of the parent process, installed in page-parallel workers --
+_inherited_page_memory_budget: Optional[PageMemoryBudget] = None
+
+
+@functools.lru_cache(maxsize=None)
+def _page_memory_budget(limit: int) -> PageMemoryBudget:
+    return PageMemoryBudget(limit)
+
+
+def get_page_memory_budget() -> Optional[PageMemoryBudget]:
+    """The process-wide page memory budget, or None when there is no limit
+    (`PAGE_IMAGE_MEMORY_LIMIT=0`)."""
+    if _inherited_page_memory_budget is not None:
+        return _inherited_page_memory_budget
+    limit = env_config.PAGE_IMAGE_MEMORY_LIMIT
+    if limit <= 0:
+        return None
+    return _page_memory_budget(limit)
+
+
+def set_page_memory_budget(budget: Optional[PageMemoryBudget]) -> None:
+    """Use `budget`, the budget of a parent process, as the process-wide page memory budget."""
+    global _inherited_page_memory_budget
+    _inherited_page_memory_budget = budget
@@ -0,0 +1,299 @@
+from __future__ import annotations
+
+import io
+import multiprocessing
+import warnings
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import IO, Any, Iterable, Iterator, Optional
+
+from pypdf import PdfReader, PdfWriter
+
+from unstructured.documents.elements import Element, ElementType
+from unstructured.logger import logger
+from unstructured.partition.common.common import convert_to_bytes
+from unstructured.partition.pdf_image.page_memory_budget import (
+    PageMemoryBudget,
+    get_page_memory_budget,
+    set_page_memory_budget,
+)
+from unstructured.partition.pdf_image.page_selection import group_page_runs
+from unstructured.partition.pdf_image.pdf_document import PdfDocumentHandle
+from unstructured.partition.utils.config import env_config
+from unstructured.partition.utils.constants import OCR_AGENT_TESSERACT
+
+
+def iter_pdf_page_ranges(
+    source: str | bytes | IO[bytes] | PdfDocumentHandle,
+    pages_per_range: int,
+    password: Optional[str] = None,
+) -> Iterator[tuple[int, bytes]]:
+    """Lazily split a PDF into standalone PDFs of at most `pages_per_range` consecutive pages.
+
+    `source` is a path, the PDF bytes, a binary stream or an opened `PdfDocumentHandle`, whose
+    reader is reused. Yields `(first_page_index, pdf_bytes)`
+    tuples in page order, where `first_page_index` is the 0-based index of the first page of the
+    range in the original document. Only one range is held in memory at a time.
+    """
+    reader = _open_pdf_reader(source, password)
+    num_pages = len(reader.pages)
+    for first_page_index in range(0, num_pages, pages_per_range):
+        last_page_index = min(first_page_index + pages_per_range, num_pages)
+        yield first_page_index, _write_pdf_pages(reader, first_page_index, last_page_index)
+
+
+def iter_pdf_page_subranges(
+    source: str | bytes | IO[bytes] | PdfDocumentHandle,
+    page_ranges: Iterable[tuple[int, int]],
+    password: Optional[str] = None,
+) -> Iterator[tuple[int, bytes]]:
+    """Lazily write the given `(first_page_index, stop_page_index)` ranges of a PDF as standalone
+    PDFs, yielding `(first_page_index, pdf_bytes)` tuples like `iter_pdf_page_ranges()`."""
+    reader = _open_pdf_reader(source, password)
+    for first_page_index, stop_page_index in page_ranges:
+        yield first_page_index, _write_pdf_pages(reader, first_page_index, stop_page_index)
+
+
+def _open_pdf_reader(
+    source: str | bytes | IO[bytes] | PdfDocumentHandle, password: Optional[str]
+) -> PdfReader:
+    if isinstance(source, PdfDocumentHandle):
+        return source.reader
+    reader = PdfReader(io.BytesIO(source) if isinstance(source, bytes) else source)
+    if reader.is_encrypted:
+        reader.decrypt(password or "")
+    return reader
+
+
+def _write_pdf_pages(reader: PdfReader, first_page_index: int, stop_page_index: int) -> bytes:
+    writer = PdfWriter()
+    for page_index in range(first_page_index, stop_page_index):
+        writer.add_page(reader.pages[page_index])
+    buffer = io.BytesIO()
+    writer.write(buffer)
+    return buffer.getvalue()
+
+
+def split_pdf_into_page_ranges(
+    data: bytes,
+    pages_per_range: int,
+    password: Optional[str] = None,
+) -> list[tuple[int, bytes]]:
+    """Split a PDF into standalone PDFs of at most `pages_per_range` consecutive pages.
+
+    Returns a list of `(first_page_index, pdf_bytes)` tuples in page order, see
+    `iter_pdf_page_ranges()`.
+    """
+    return list(iter_pdf_page_ranges(data, pages_per_range, password=password))
+
+
+def _init_hi_res_worker(
+    hi_res_model_name: str,
+    ocr_agent: str,
+    ocr_languages: str,
+    page_memory_budget: Optional[PageMemoryBudget] = None,
+):
+    """Load the layout model and OCR agent once per worker process, so every page range the
+    worker handles reuses them. Page images rendered by the worker count against
+    `page_memory_budget`, the budget of the parent process, so the limit holds across workers."""
+    from unstructured_inference.models.base import get_model
+
+    from unstructured.partition.pdf_image.ocr import get_ocr_agent
+
+    set_page_memory_budget(page_memory_budget)
+    get_model(hi_res_model_name)
+    get_ocr_agent(ocr_agent, ocr_languages)
+
+
+def _partition_page_range(
+    data: bytes,
+    starting_page_number: int,
+    partition_kwargs: dict[str, Any],
+) -> list[Element]:
+    from unstructured.partition.pdf import _partition_pdf_or_image_local
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return _partition_pdf_or_image_local(
+            file=io.BytesIO(data),
+            starting_page_number=starting_page_number,
+            **partition_kwargs,
+        )
+
+
+def _get_executor(max_workers: int, initargs: tuple[Any, ...]) -> Executor:
+    # NOTE: "spawn" because forking a process that already holds an inference session or
+    # tesseract handles can deadlock the child
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_hi_res_worker,
+        initargs=initargs,
+    )
+
+
+def partition_pdf_pages_in_parallel(
+    filename: str = "",
+    file: Optional[bytes | IO[bytes]] = None,
+    max_workers: int = 2,
+    pages_per_range: Optional[int] = None,
+    hi_res_model_name: Optional[str] = None,
+    ocr_agent: str = OCR_AGENT_TESSERACT,
+    ocr_languages: str = "eng",
+    starting_page_number: int = 1,
+    include_page_breaks: bool = False,
+    extract_images_in_pdf: bool = False,
+    extract_image_block_types: Optional[list[str]] = None,
+    extract_image_block_output_dir: Optional[str] = None,
+    extract_image_block_to_payload: bool = False,
+    pdf_image_dpi: Optional[int] = None,
+    password: Optional[str] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
+    page_indices: Optional[list[int]] = None,
+    **kwargs: Any,
+) -> list[Element]:
+    """Partition a PDF with the hi_res strategy by fanning ranges of consecutive pages out to
+    `max_workers` worker processes. When `page_indices` is given, only the pages at those sorted
+    0-based indices are partitioned.
+
+    Each worker loads the layout model and OCR agent once and partitions its page ranges with
+    `_partition_pdf_or_image_local`. Like a whole document, each range ends every page with a page
+    break, so the per-range elements are concatenated in page order and the output (and the hash
+    ids assigned from page and sequence numbers afterwards) matches a serial run.
+
+    Image blocks extracted to payload are cropped by the workers. Image blocks written to
+    `extract_image_block_output_dir` are cropped here after the merge so that their file names
+    are numbered across the whole document.
+    """
+    from unstructured.partition.pdf import (
+        check_pdf_hi_res_max_pages_exceeded,
+        default_hi_res_model,
+    )
+
+    hi_res_model_name = (
+        hi_res_model_name or kwargs.pop("model_name", None) or default_hi_res_model()
+    )
+    if pdf_document is None:
+        pdf_document = PdfDocumentHandle(
+            filename=filename,
+            file=convert_to_bytes(file) if file is not None else None,
+            password=password,
+        )
+    data = pdf_document.data
+    check_pdf_hi_res_max_pages_exceeded(
+        pdf_hi_res_max_pages=kwargs.pop("pdf_hi_res_max_pages", None),
+        pdf_document=pdf_document,
+        page_indices=page_indices,
+    )
+    if pages_per_range is None:
+        pages_per_range = env_config.PDF_HI_RES_PAGES_PER_WORKER_TASK
+    page_ranges = list(
+        iter_pdf_page_ranges(pdf_document, pages_per_range, password=password)
+        if page_indices is None
+        else iter_pdf_page_subranges(
+            pdf_document,
+            [
+                (first_page_index, min(first_page_index + pages_per_range, stop_page_index))
+                for run_first_page_index, stop_page_index in group_page_runs(page_indices)
+                for first_page_index in range(
+                    run_first_page_index, stop_page_index, pages_per_range
+                )
+            ],
+            password=password,
+        )
+    )
+
+    extract_in_workers = extract_image_block_to_payload or not (
+        extract_images_in_pdf or extract_image_block_types
+    )
+    partition_kwargs = {
+        "hi_res_model_name": hi_res_model_name,
+        "ocr_agent": ocr_agent,
+        "ocr_languages": ocr_languages,
+        "include_page_breaks": include_page_breaks,
+        "pdf_image_dpi": pdf_image_dpi,
+        "extract_images_in_pdf": extract_images_in_pdf and extract_in_workers,
+        "extract_image_block_types": extract_image_block_types if extract_in_workers else None,
+        "extract_image_block_output_dir": extract_image_block_output_dir,
+        "extract_image_block_to_payload": extract_image_block_to_payload,
+        **kwargs,
+    }
+    max_workers = min(max_workers, len(page_ranges))
+    logger.info(
+        f"Partitioning {len(page_ranges)} page ranges of up to {pages_per_range} pages "
+        f"with {max_workers} workers."
+    )
+
+    initargs = (hi_res_model_name, ocr_agent, ocr_languages, get_page_memory_budget())
+    with _get_executor(max_workers, initargs) as executor:
+        futures = [
+            executor.submit(
+                _partition_page_range,
+                range_data,
+                starting_page_number + first_page_index,
+                partition_kwargs,
+            )
+            for first_page_index, range_data in page_ranges
+        ]
+        range_elements = [future.result() for future in futures]
+
+    elements = [
+        element for page_range_elements in range_elements for element in page_range_elements
+    ]
+
+    if not extract_in_workers:
+        _save_image_blocks(
+            elements=elements,
+            data=data,
+            starting_page_number=starting_page_number,
+            extract_images_in_pdf=extract_images_in_pdf,
+            extract_image_block_types=extract_image_block_types,
+            extract_image_block_output_dir=extract_image_block_output_dir,
+            pdf_image_dpi=pdf_image_dpi,
+            password=password,
+        )
+
+    return elements
+
+
+def _save_image_blocks(
+    elements: list[Element],
+    data: bytes,
+    starting_page_number: int,
+    extract_images_in_pdf: bool,
+    extract_image_block_types: Optional[list[str]],
+    extract_image_block_output_dir: Optional[str],
+    pdf_image_dpi: Optional[int],
+    password: Optional[str],
+):
+    from unstructured.partition.pdf_image.pdf_image_utils import (
+        check_element_types_to_extract,
+        save_image_blocks,
+    )
+
+    element_types = check_element_types_to_extract(extract_image_block_types)
+    if extract_images_in_pdf:
+        element_types = [ElementType.IMAGE] + [t for t in element_types if t != ElementType.IMAGE]
+
+    save_image_blocks(
+        elements=elements,
+        starting_page_number=starting_page_number,
+        element_categories_to_save=element_types,
+        file=data,
+        pdf_image_dpi=pdf_image_dpi or env_config.PDF_RENDER_DPI,
+        output_dir_path=extract_image_block_output_dir,
+        password=password,
+    )
+
+
+def page_parallel_is_supported(
+    is_image: bool,
+    max_workers: Optional[int],
+    analysis: bool = False,
+) -> bool:
+    """Whether a hi_res call can be fanned out by `partition_pdf_pages_in_parallel`."""
+    if not max_workers or max_workers < 2 or is_image:
+        return False
+    if analysis:
+        logger.info("Page-parallel hi_res does not support analysis, partitioning serially.")
+        return False
+    return True
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import NamedTuple, Optional, Sequence
+
+from pdfminer.layout import LTFigure, LTImage, LTPage, LTTextBox
+
+from unstructured.partition.pdf_image.pdf_image_utils import cid_ratio
+from unstructured.partition.pdf_image.pdfminer_processing import count_low_fidelity_chars
+from unstructured.partition.pdf_image.pdfminer_utils import PDFMinerPage
+from unstructured.partition.utils.config import env_config
+from unstructured.partition.utils.constants import PartitionStrategy
+
+
+class PageRoute(NamedTuple):
+    """The strategy a single page is partitioned with and the text quality score it was routed
+    on; recorded in the `routing` and `routing_score` metadata of the page's elements."""
+
+    strategy: str
+    score: float
+
+
+def score_page_text_quality(page_layout: LTPage) -> float:
+    """Score (0-1) how usable the embedded text of a page is without layout detection and OCR.
+
+    The score is the fraction of characters that are neither invisible nor rotated (see
+    `text_is_embedded()`) times the fraction that are not unknown `(cid:x)` glyphs. A page without
+    characters scores 0. A page mostly covered by images with little text on it (e.g. a scan with a
+    stamped header) is scaled down by how far its text coverage falls short of
+    `PDF_PAGE_ROUTING_MIN_TEXT_COVERAGE`.
+    """
+    low_fidelity_chars, total_chars = count_low_fidelity_chars(page_layout)
+    if total_chars == 0:
+        return 0.0
+
+    text = "".join(obj.get_text() for obj in page_layout if isinstance(obj, LTTextBox))
+    score = (1 - low_fidelity_chars / total_chars) * (1 - cid_ratio(text))
+
+    page_area = max(page_layout.width * page_layout.height, 1.0)
+    text_coverage = min(
+        sum(obj.width * obj.height for obj in page_layout if isinstance(obj, LTTextBox))
+        / page_area,
+        1.0,
+    )
+    image_coverage = min(
+        sum(obj.width * obj.height for obj in page_layout if isinstance(obj, (LTImage, LTFigure)))
+        / page_area,
+        1.0,
+    )
+    min_text_coverage = env_config.PDF_PAGE_ROUTING_MIN_TEXT_COVERAGE
+    if (
+        image_coverage > env_config.PDF_PAGE_ROUTING_MAX_IMAGE_COVERAGE
+        and text_coverage < min_text_coverage
+    ):
+        score *= text_coverage / min_text_coverage
+    return score
+
+
+def route_pdf_pages(
+    pdfminer_pages: Sequence[PDFMinerPage],
+    deficient_page_strategy: str = PartitionStrategy.HI_RES,
+    min_text_quality: Optional[float] = None,
+) -> list[PageRoute]:
+    """Route each page to the fast strategy when its embedded text scores at least
+    `min_text_quality` (env_config.PDF_PAGE_ROUTING_MIN_TEXT_QUALITY by default), otherwise to
+    `deficient_page_strategy`."""
+    if min_text_quality is None:
+        min_text_quality = env_config.PDF_PAGE_ROUTING_MIN_TEXT_QUALITY
+
+    routes = []
+    for page in pdfminer_pages:
+        score = score_page_text_quality(page.layout)
+        strategy = PartitionStrategy.FAST if score >= min_text_quality else deficient_page_strategy
+        routes.append(PageRoute(strategy, score))
+    return routes
+
+
+def group_page_routes(routes: Sequence[PageRoute]) -> list[tuple[str, int, int]]:
+    """Group consecutive pages with the same strategy into `(strategy, first_page_index,
+    stop_page_index)` runs, in page order."""
+    runs: list[tuple[str, int, int]] = []
+    for page_index, route in enumerate(routes):
+        if runs and runs[-1][0] == route.strategy:
+            runs[-1] = (route.strategy, runs[-1][1], page_index + 1)
+        else:
+            runs.append((route.strategy, page_index, page_index + 1))
+    return runs
@@ -0,0 +1,117 @@
+"""Selection of the pages of a document to partition, the `pages` argument of `partition_pdf()`
+and `partition_image()`.
+
+Page numbers in a selection are the 1-based numbers of the pages in the source document,
+independent of `starting_page_number`. Internally a selection is a sorted list of 0-based page
+indices, and the pipelines that need a standalone document for each stretch of consecutive
+selected pages work on the `(first_page_index, stop_page_index)` runs of that list.
+"""
+
+from __future__ import annotations
+
+import io
+import numbers
+from typing import IO, Iterable, Iterator, Optional, Union
+
+from PIL import Image as PILImage
+
+PageSelection = Union[int, str, Iterable[int]]
+
+
+def resolve_page_selection(pages: PageSelection, page_count: int) -> list[int]:
+    """Sorted, de-duplicated 0-based indices of the pages selected by `pages`.
+
+    `pages` is a single page number, an iterable of page numbers (e.g. `[1, 3]` or
+    `range(1, 11)`) or a string of comma-separated page numbers and inclusive page ranges such as
+    `"1-3,7,10-"`, where a range without an end runs to the last page. Raises `ValueError` when
+    the selection is empty or names a page the document does not have.
+    """
+    if isinstance(pages, str):
+        page_numbers = _parse_page_ranges(pages, page_count)
+    elif isinstance(pages, numbers.Integral):
+        page_numbers = [pages]
+    else:
+        page_numbers = list(pages)
+
+    for page_number in page_numbers:
+        if (
+            isinstance(page_number, bool)
+            or not isinstance(page_number, numbers.Integral)
+            or not 1 <= page_number <= page_count
+        ):
+            raise ValueError(
+                f"Invalid page {page_number!r} in pages={pages!r}, the document has "
+                f"{page_count} page(s) numbered from 1."
+            )
+    if not page_numbers:
+        raise ValueError(f"pages={pages!r} selects no page.")
+    return sorted({int(page_number) - 1 for page_number in page_numbers})
+
+
+def _parse_page_ranges(pages: str, page_count: int) -> list[int]:
+    page_numbers: list[int] = []
+    for part in pages.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        first, sep, last = part.partition("-")
+        try:
+            first_page = int(first)
+            last_page = (int(last) if last.strip() else page_count) if sep else first_page
+        except ValueError:
+            raise ValueError(f"Invalid page range {part!r} in pages={pages!r}.") from None
+        if last_page < first_page:
+            raise ValueError(f"Invalid page range {part!r} in pages={pages!r}.")
+        page_numbers.extend(range(first_page, last_page + 1))
+    return page_numbers
+
+
+def group_page_runs(page_indices: Iterable[int]) -> list[tuple[int, int]]:
+    """Group sorted 0-based page indices into `(first_page_index, stop_page_index)` runs of
+    consecutive pages."""
+    runs: list[tuple[int, int]] = []
+    for page_index in page_indices:
+        if runs and runs[-1][1] == page_index:
+            runs[-1] = (runs[-1][0], page_index + 1)
+        else:
+            runs.append((page_index, page_index + 1))
+    return runs
+
+
+def count_image_frames(filename: str = "", file: Optional[bytes | IO[bytes]] = None) -> int:
+    """Number of frames (pages) of an image, e.g. of a multi-page TIFF."""
+    with open_image(filename, file) as image:
+        return getattr(image, "n_frames", 1)
+
+
+def iter_image_frame_subranges(
+    filename: str = "",
+    file: Optional[bytes | IO[bytes]] = None,
+    page_ranges: Iterable[tuple[int, int]] = (),
+) -> Iterator[tuple[int, bytes]]:
+    """Lazily write the given `(first_page_index, stop_page_index)` frame ranges of an image as
+    standalone TIFF images, yielding `(first_page_index, tiff_bytes)` tuples like
+    `iter_pdf_page_subranges()` does for PDFs."""
+    with open_image(filename, file) as image:
+        for first_page_index, stop_page_index in page_ranges:
+            frames = []
+            for page_index in range(first_page_index, stop_page_index):
+                image.seek(page_index)
+                frames.append(image.copy())
+            buffer = io.BytesIO()
+            frames[0].save(buffer, format="TIFF", save_all=True, append_images=frames[1:])
+            yield first_page_index, buffer.getvalue()
+
+
+def open_image(filename: str, file: Optional[bytes | IO[bytes]]) -> PILImage.Image:
+    """Open the image at `filename`, or in `file`, leaving the cursor of `file` where it is."""
+    if file is None:
+        return PILImage.open(filename)
+    if isinstance(file, bytes):
+        return PILImage.open(io.BytesIO(file))
+    # -- read from a copy so the caller's cursor stays where it is --
+    original_pos = file.tell()
+    file.seek(0)
+    data = file.read()
+    file.seek(original_pos)
+    return PILImage.open(io.BytesIO(data))
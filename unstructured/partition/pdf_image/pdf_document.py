@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import io
+from functools import cached_property
+from typing import IO, Optional
+
+from pypdf import PdfReader
+
+
+class PdfDocumentHandle:
+    """A PDF opened once per partitioning call and shared by every step that inspects it.
+
+    The complexity check, the hi_res page limit and the page-range splitting each used to build
+    their own `PdfReader`, parsing the cross-reference table again and decoding content streams
+    the previous reader had already decoded. The handle reads the document bytes and builds the
+    reader lazily on first use; pypdf caches resolved objects and decoded streams on the reader,
+    so later steps reuse them.
+
+    The reader parses an in-memory copy of the document, so it never moves the cursor of a `file`
+    the caller also reads from.
+
+    A document pdfminer cannot parse is repaired with pikepdf at most once per handle, by
+    `repair()`. From then on `data` and `reader` are those of the repaired document, so every later
+    step reads the repaired bytes from memory instead of repairing the document again.
+    """
+
+    def __init__(
+        self,
+        filename: str = "",
+        file: Optional[bytes | IO[bytes]] = None,
+        password: Optional[str] = None,
+    ):
+        if not filename and file is None:
+            raise ValueError("Either 'file' or 'filename' must be provided.")
+        self.filename = filename
+        self.file = file
+        self.password = password
+        self.is_repaired = False
+
+    @cached_property
+    def data(self) -> bytes:
+        """The bytes of the document."""
+        if self.file is None:
+            with open(self.filename, "rb") as f:
+                return f.read()
+        if isinstance(self.file, bytes):
+            return self.file
+        original_pos = self.file.tell()
+        try:
+            self.file.seek(0)
+            return self.file.read()
+        finally:
+            self.file.seek(original_pos)
+
+    @property
+    def file_size(self) -> int:
+        return len(self.data)
+
+    @cached_property
+    def reader(self) -> PdfReader:
+        """The pypdf reader of the document, decrypted with `password` when it is encrypted."""
+        reader = PdfReader(io.BytesIO(self.data))
+        if reader.is_encrypted:
+            reader.decrypt(self.password or "")
+        return reader
+
+    def repair(self) -> bytes:
+        """Rewrite the document with pikepdf, which fixes the broken objects and cross-reference
+        tables pdfminer trips over, and use the result as the document from now on. The repaired
+        document is not encrypted. Returns the repaired bytes."""
+        if not self.is_repaired:
+            import pikepdf
+
+            repaired = io.BytesIO()
+            with pikepdf.Pdf.open(io.BytesIO(self.data), password=self.password or "") as pdf:
+                # NOTE: a deterministic /ID, so the repaired bytes hash the same in every run
+                pdf.save(repaired, encryption=False, deterministic_id=True)
+            self.__dict__["data"] = repaired.getvalue()
+            self.__dict__.pop("reader", None)
+            self.is_repaired = True
+        return self.data
+
+    @property
+    def page_count(self) -> int:
+        return len(self.reader.pages)
@@ -5,10 +5,22 @@ import os
 import re
 import tempfile
 import unicodedata
+from concurrent.futures import Future, ThreadPoolExecutor
 from copy import deepcopy
 from io import BytesIO
 from pathlib import Path, PurePath
-from typing import IO, TYPE_CHECKING, BinaryIO, Iterator, List, Optional, Tuple, Union, cast
+from typing import (
+    IO,
+    TYPE_CHECKING,
+    BinaryIO,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+    cast,
+)
 
 import cv2
 import numpy as np
@@ -21,6 +33,7 @@ from unstructured.documents.elements import ElementType
 from unstructured.errors import UnprocessableEntityError
 from unstructured.logger import logger
 from unstructured.partition.common.common import convert_to_bytes, exactly_one
+from unstructured.partition.pdf_image.page_selection import group_page_runs
 from unstructured.partition.utils.config import env_config
 
 if TYPE_CHECKING:
@@ -29,6 +42,7 @@ if TYPE_CHECKING:
     from unstructured_inference.inference.layoutelement import LayoutElement
 
     from unstructured.documents.elements import Element
+    from unstructured.partition.pdf_image.page_image_store import PageImageStore
 
 
 def write_image(image: Union[Image.Image, np.ndarray], output_image_path: str):
@@ -62,6 +76,8 @@ def convert_pdf_to_image(
     output_folder: Optional[Union[str, PurePath]] = None,
     path_only: bool = False,
     password: Optional[str] = None,
+    first_page: Optional[int] = None,
+    last_page: Optional[int] = None,
 ) -> Union[List[Image.Image], List[str]]:
     exactly_one(filename=filename, file=file)
 
@@ -75,6 +91,8 @@ def convert_pdf_to_image(
             dpi=dpi,
             output_folder=output_folder,
             path_only=path_only,
+            first_page=first_page,
+            last_page=last_page,
             password=password,
             pdf_render_max_pixels_per_page=env_config.PDF_RENDER_MAX_PIXELS_PER_PAGE,
         )
@@ -125,6 +143,7 @@ def save_elements(
     extract_image_block_to_payload: bool = False,
     output_dir_path: str | None = None,
     password: Optional[str] = None,
+    page_image_store: Optional["PageImageStore"] = None,
 ):
     """
     Saves specific elements from a PDF as images either to a directory or embeds them in the
@@ -133,6 +152,46 @@ def save_elements(
     This function processes a list of elements partitioned from a PDF file. For each element of
     a specified category, it extracts and saves the image. The images can either be saved to
     a specified directory or embedded into the element's payload as a base64-encoded string.
+    See `save_image_blocks()`, which saves the elements of several categories in one pass.
+    """
+
+    save_image_blocks(
+        elements=elements,
+        starting_page_number=starting_page_number,
+        element_categories_to_save=[element_category_to_save],
+        pdf_image_dpi=pdf_image_dpi,
+        filename=filename,
+        file=file,
+        is_image=is_image,
+        extract_image_block_to_payload=extract_image_block_to_payload,
+        output_dir_path=output_dir_path,
+        password=password,
+        page_image_store=page_image_store,
+    )
+
+
+def save_image_blocks(
+    elements: List["Element"],
+    starting_page_number: int,
+    element_categories_to_save: Sequence[str],
+    pdf_image_dpi: int,
+    filename: str = "",
+    file: bytes | IO[bytes] | None = None,
+    is_image: bool = False,
+    extract_image_block_to_payload: bool = False,
+    output_dir_path: str | None = None,
+    password: Optional[str] = None,
+    page_image_store: Optional["PageImageStore"] = None,
+):
+    """
+    Saves the elements of every category in `element_categories_to_save` as images, either to a
+    directory or embedded in the element's payload, in a single pass over the elements.
+
+    Only the region of each element is taken from its page: it is cropped from the page image
+    when `page_image_store` already holds it, and otherwise only that region is rendered (at
+    env_config.EXTRACT_IMAGE_BLOCK_RENDER_DPI when set), so pages without a matching element are
+    never rendered. The JPEG (and base64) encoding of the blocks runs in a thread pool of
+    env_config.EXTRACT_IMAGE_BLOCK_ENCODE_WORKERS threads.
     """
 
     # Determine the output directory path
@@ -145,86 +204,113 @@ def save_elements(
 
         os.makedirs(output_dir_path, exist_ok=True)
 
-    with tempfile.TemporaryDirectory() as temp_dir:
-        if is_image:
-            if file is None:
-                image_paths = [filename]
-            else:
-                if isinstance(file, bytes):
-                    file_data = file
-                else:
-                    file.seek(0)
-                    file_data = file.read()
+    categories_to_save = set(element_categories_to_save)
+    if not any(el.category in categories_to_save for el in elements):
+        return
 
-                tmp_file_path = os.path.join(temp_dir, "tmp_file")
-                with open(tmp_file_path, "wb") as tmp_file:
-                    tmp_file.write(file_data)
-                image_paths = [tmp_file_path]
-        else:
-            _image_paths = convert_pdf_to_image(
-                filename,
-                file,
-                pdf_image_dpi,
-                output_folder=temp_dir,
-                path_only=True,
-                password=password,
-            )
-            image_paths = cast(List[str], _image_paths)
-
-        figure_number = 0
-        for el in elements:
-            if el.category != element_category_to_save:
-                continue
-
-            coordinates = el.metadata.coordinates
-            if not coordinates or not coordinates.points:
-                continue
-
-            points = coordinates.points
-            x1, y1 = points[0]
-            x2, y2 = points[2]
-            h_padding = env_config.EXTRACT_IMAGE_BLOCK_CROP_HORIZONTAL_PAD
-            v_padding = env_config.EXTRACT_IMAGE_BLOCK_CROP_VERTICAL_PAD
-            padded_bbox = cast(
-                Tuple[int, int, int, int], pad_bbox((x1, y1, x2, y2), (h_padding, v_padding))
-            )
+    own_page_image_store = None
+    if page_image_store is None:
+        from unstructured.partition.pdf_image.page_image_store import (
+            PAGE_CONSUMER_IMAGE_BLOCKS,
+            PageImageStore,
+        )
 
-            # The page number in the metadata may have been offset
-            # by starting_page_number. Make sure we use the right
-            # value for indexing!
-            assert el.metadata.page_number
-            metadata_page_number = el.metadata.page_number
-            page_index = metadata_page_number - starting_page_number
-
-            figure_number += 1
-            try:
-                image_path = image_paths[page_index]
-                image = Image.open(image_path)
-                cropped_image = image.crop(padded_bbox)
-
-                # PNG images with transparency need to be converted before saving
-                if cropped_image.mode == "RGBA":
-                    cropped_image = cropped_image.convert("RGB")
-
-                if extract_image_block_to_payload:
-                    buffered = BytesIO()
-                    cropped_image.save(buffered, format="JPEG")
-                    img_base64 = base64.b64encode(buffered.getvalue())
-                    img_base64_str = img_base64.decode()
-                    el.metadata.image_base64 = img_base64_str
-                    el.metadata.image_mime_type = "image/jpeg"
-                else:
+        # NOTE: pages are rendered in memory and only on demand, no temporary image files
+        page_image_store = own_page_image_store = PageImageStore(
+            filename=filename if file is None else "",
+            file=file,
+            is_image=is_image,
+            dpi=pdf_image_dpi,
+            password=password,
+            consumers=[PAGE_CONSUMER_IMAGE_BLOCKS],
+        )
+
+    render_dpi = env_config.EXTRACT_IMAGE_BLOCK_RENDER_DPI or None
+    h_padding = env_config.EXTRACT_IMAGE_BLOCK_CROP_HORIZONTAL_PAD
+    v_padding = env_config.EXTRACT_IMAGE_BLOCK_CROP_VERTICAL_PAD
+    # NOTE: figures are numbered per category, e.g. `figure-1-1.jpg` and `table-1-1.jpg`
+    figure_numbers = dict.fromkeys(categories_to_save, 0)
+    try:
+        with ThreadPoolExecutor(
+            max_workers=max(env_config.EXTRACT_IMAGE_BLOCK_ENCODE_WORKERS, 1)
+        ) as executor:
+            encodings: list[tuple["Element", Optional[str], Future]] = []
+            for el in elements:
+                if el.category not in categories_to_save:
+                    continue
+
+                coordinates = el.metadata.coordinates
+                if not coordinates or not coordinates.points:
+                    continue
+
+                points = coordinates.points
+                x1, y1 = points[0]
+                x2, y2 = points[2]
+                padded_bbox = cast(
+                    Tuple[int, int, int, int], pad_bbox((x1, y1, x2, y2), (h_padding, v_padding))
+                )
+
+                # The page number in the metadata may have been offset
+                # by starting_page_number. Make sure we use the right
+                # value for indexing!
+                assert el.metadata.page_number
+                metadata_page_number = el.metadata.page_number
+                page_index = metadata_page_number - starting_page_number
+
+                figure_numbers[el.category] += 1
+                output_f_path = None
+                if not extract_image_block_to_payload:
                     basename = "table" if el.category == ElementType.TABLE else "figure"
                     assert output_dir_path
                     output_f_path = os.path.join(
                         output_dir_path,
-                        f"{basename}-{metadata_page_number}-{figure_number}.jpg",
+                        f"{basename}-{metadata_page_number}-{figure_numbers[el.category]}.jpg",
+                    )
+                try:
+                    cropped_image = page_image_store.get_region(
+                        page_index + 1, padded_bbox, dpi=render_dpi
+                    )
+                except (ValueError, IOError):
+                    logger.warning(
+                        "Image Extraction Error: Skipping the failed image", exc_info=True
                     )
-                    write_image(cropped_image, output_f_path)
+                    continue
+                encoding = executor.submit(_encode_image_block, cropped_image, output_f_path)
+                encodings.append((el, output_f_path, encoding))
+
+            for el, output_f_path, encoding in encodings:
+                try:
+                    img_base64_str = encoding.result()
+                except (ValueError, IOError):
+                    logger.warning(
+                        "Image Extraction Error: Skipping the failed image", exc_info=True
+                    )
+                    continue
+                if output_f_path is None:
+                    el.metadata.image_base64 = img_base64_str
+                    el.metadata.image_mime_type = "image/jpeg"
+                else:
                     # add image path to element metadata
                     el.metadata.image_path = output_f_path
-            except (ValueError, IOError):
-                logger.warning("Image Extraction Error: Skipping the failed image", exc_info=True)
+    finally:
+        if own_page_image_store is not None:
+            own_page_image_store.close()
+
+
+def _encode_image_block(image: Image.Image, output_f_path: Optional[str]) -> Optional[str]:
+    """Write `image` as a JPEG to `output_f_path`, or return it as a base64-encoded JPEG when
+    `output_f_path` is None."""
+    # PNG images with transparency need to be converted before saving
+    if image.mode == "RGBA":
+        image = image.convert("RGB")
+
+    if output_f_path is not None:
+        write_image(image, output_f_path)
+        return None
+
+    buffered = BytesIO()
+    image.save(buffered, format="JPEG")
+    return base64.b64encode(buffered.getvalue()).decode()
 
 
 def check_element_types_to_extract(
@@ -398,7 +484,9 @@ def convert_pdf_to_images(
     file: Optional[bytes | IO[bytes]] = None,
     chunk_size: int = 10,
     password: Optional[str] = None,
+    page_indices: Optional[Sequence[int]] = None,
 ) -> Iterator[Image.Image]:
+    """Render the pages of a PDF, or only the pages at the sorted 0-based `page_indices`."""
     # Convert a PDF in small chunks of pages at a time (e.g. 1-10, 11-20... and so on)
     exactly_one(filename=filename, file=file)
     if file is not None:
@@ -409,8 +497,8 @@ def convert_pdf_to_images(
         info = pdf2image.pdfinfo_from_path(filename, userpw=password)
 
     total_pages = info["Pages"]
-    for start_page in range(1, total_pages + 1, chunk_size):
-        end_page = min(start_page + chunk_size - 1, total_pages)
+    page_ranges = group_page_runs(page_indices) if page_indices is not None else [(0, total_pages)]
+    for start_page, end_page in _iter_page_chunks(page_ranges, chunk_size):
         try:
             chunk_images = render_pdf_to_image(
                 filename=filename if f_bytes is None else None,
@@ -429,6 +517,16 @@ def convert_pdf_to_images(
             yield image
 
 
+def _iter_page_chunks(
+    page_ranges: list[tuple[int, int]], chunk_size: int
+) -> Iterator[tuple[int, int]]:
+    """Split `(first_page_index, stop_page_index)` ranges into inclusive 1-based
+    `(first_page, last_page)` chunks of at most `chunk_size` pages."""
+    for first_page_index, stop_page_index in page_ranges:
+        for start_page in range(first_page_index + 1, stop_page_index + 1, chunk_size):
+            yield start_page, min(start_page + chunk_size - 1, stop_page_index)
+
+
 def remove_control_characters(text: str) -> str:
     """Removes control characters from text."""
 
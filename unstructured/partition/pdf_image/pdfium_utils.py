@@ -0,0 +1,124 @@
+"""Rendering of PDF pages with pypdfium2 for the page image store and blank page detection.
+
+Pages are rendered the way `unstructured_inference`'s `convert_pdf_to_image()` renders them, with
+form field values painted, print-optimized, within `PDF_RENDER_MAX_PIXELS_PER_PAGE` and, for pages
+with a `/Rotate`, turned so that their dominant text is horizontal.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import math
+import threading
+from typing import Iterable, Optional
+
+from pdfminer.layout import LTChar, LTContainer, LTPage
+from PIL import Image as PILImage
+
+from unstructured.errors import UnprocessableEntityError
+from unstructured.partition.utils.config import env_config
+
+# NOTE: pdfium is not thread-safe, so every call into it from this package holds this lock
+pdfium_lock = threading.Lock()
+
+
+def open_pdfium_document(source: str | bytes, password: Optional[str] = None):
+    """Open the PDF at path `source`, or in bytes `source`, with form filling set up so that the
+    values of form fields are painted. Callers hold `pdfium_lock`."""
+    import pypdfium2 as pdfium
+
+    pdf = pdfium.PdfDocument(source, password=password)
+    with contextlib.suppress(pdfium.PdfiumError):
+        pdf.init_forms()
+    return pdf
+
+
+def check_render_max_pixels(page, page_number: int, scale: float) -> None:
+    """Refuse to render a page to more than `PDF_RENDER_MAX_PIXELS_PER_PAGE` pixels."""
+    maximum = env_config.PDF_RENDER_MAX_PIXELS_PER_PAGE
+    if maximum <= 0:
+        return
+    pixels = math.ceil(page.get_width() * scale) * math.ceil(page.get_height() * scale)
+    if pixels > maximum:
+        raise UnprocessableEntityError(
+            "PDF page would render to too many pixels for safe processing: "
+            f"page={page_number}, pixels={pixels}, maximum={maximum}. "
+            "Try splitting the PDF, reducing the page dimensions, or using a lower render DPI."
+        )
+
+
+def render_pdf_page(
+    page, scale: float, crop: tuple[float, float, float, float] = (0, 0, 0, 0)
+) -> PILImage.Image:
+    """Render `page` (or the `crop` margins, in points, off it) print-optimized and smoothed."""
+    bitmap = page.render(
+        scale=scale,
+        crop=crop,
+        no_smoothtext=False,
+        no_smoothimage=False,
+        no_smoothpath=False,
+        optimize_mode="print",
+    )
+    try:
+        return bitmap.to_pil()
+    finally:
+        bitmap.close()
+
+
+def estimate_rotation_corrections(
+    source: str | bytes,
+    rotated_page_indices: Iterable[int],
+    password: Optional[str] = None,
+) -> dict[int, int]:
+    """The extra counter-clockwise rotation that makes the dominant text of each of the rotated
+    pages horizontal, by 0-based page index. Empty when the pages cannot be read, so they are
+    rendered in their display frame instead."""
+    from pdfminer.high_level import extract_pages
+    from unstructured_inference.config import inference_config
+
+    page_indices = sorted(rotated_page_indices)
+    if not page_indices:
+        return {}
+    try:
+        return {
+            page_index: _dominant_text_rotation(
+                page_layout, inference_config.PDF_ROTATION_DOMINANT_ANGLE_THRESHOLD
+            )
+            for page_index, page_layout in zip(
+                page_indices,
+                extract_pages(
+                    io.BytesIO(source) if isinstance(source, bytes) else source,
+                    page_numbers=page_indices,
+                    password=password or "",
+                ),
+            )
+        }
+    except Exception:
+        return {}
+
+
+def _dominant_text_rotation(page_layout: LTPage, threshold: float) -> int:
+    """The rotation that makes the text of the page horizontal, or 0 unless one non-zero
+    orientation (a multiple of 90 degrees) holds at least `threshold` of the characters.
+
+    pdfminer character matrices are in the display frame of the page, the frame pdfium renders.
+    """
+    counts = {0: 0, 90: 0, 180: 0, 270: 0}
+    for char in _iter_chars(page_layout):
+        angle = math.degrees(math.atan2(char.matrix[1], char.matrix[0])) % 360
+        counts[min((0, 90, 180, 270, 360), key=lambda k: abs(k - angle)) % 360] += 1
+    total = sum(counts.values())
+    dominant = max(counts, key=lambda k: counts[k])
+    if not total or dominant == 0 or counts[dominant] / total < threshold:
+        return 0
+    # -- `PIL.Image.Image.rotate()` turns counter-clockwise, so undo the text angle --
+    return (360 - dominant) % 360
+
+
+def _iter_chars(obj):
+    if isinstance(obj, LTChar):
+        yield obj
+    elif isinstance(obj, LTContainer):
+        for child in obj:
+            yield from _iter_chars(child)
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import math
-import os
 from typing import TYPE_CHECKING, Any, BinaryIO, Iterable, List, Optional, Union, cast
 
 import numpy as np
@@ -14,16 +13,23 @@ from unstructured_inference.inference.elements import Rectangle
 
 from unstructured.documents.coordinates import PixelSpace, PointSpace
 from unstructured.documents.elements import CoordinatesMetadata, ElementType
+from unstructured.partition.pdf_image.pdf_document import PdfDocumentHandle
 from unstructured.partition.pdf_image.pdf_image_utils import remove_control_characters
 from unstructured.partition.pdf_image.pdfminer_utils import (
+    CharTable,
     PDFMinerConfig,
-    _is_duplicate_char,
+    PDFMinerPage,
+    duplicate_char_mask,
     extract_image_objects,
     extract_text_objects,
     get_text_with_deduplication,
     open_pdfminer_pages_generator,
     rect_to_bbox,
 )
+from unstructured.partition.pdf_image.spatial_index import (
+    candidate_box_pairs,
+    pair_areas_and_intersection_area,
+)
 from unstructured.partition.utils.config import env_config
 from unstructured.partition.utils.constants import SORT_MODE_BASIC, Source
 from unstructured.partition.utils.sorting import sort_text_regions
@@ -46,7 +52,17 @@ def process_file_with_pdfminer(
     password: Optional[str] = None,
     pdfminer_config: Optional[PDFMinerConfig] = None,
     rotation_corrections: Optional[List[int]] = None,
+    pdfminer_pages: Optional[List[PDFMinerPage]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
 ) -> tuple[List[List["TextRegion"]], List[List]]:
+    if pdfminer_pages is not None:
+        return process_data_with_pdfminer(
+            dpi=dpi,
+            pdfminer_config=pdfminer_config,
+            rotation_corrections=rotation_corrections,
+            pdfminer_pages=pdfminer_pages,
+        )
+
     with open_filename(filename, "rb") as fp:
         fp = cast(BinaryIO, fp)
         extracted_layout, layouts_links = process_data_with_pdfminer(
@@ -55,6 +71,7 @@ def process_file_with_pdfminer(
             password=password,
             pdfminer_config=pdfminer_config,
             rotation_corrections=rotation_corrections,
+            pdf_document=pdf_document,
         )
         return extracted_layout, layouts_links
 
@@ -431,6 +448,19 @@ def text_is_embedded(obj, threshold=env_config.PDF_MAX_EMBED_LOW_FIDELITY_TEXT_R
         last character is at the top (y position) and first character is at the bottom the extracted
         element would contain words written in reverse order. This makes the extraction low quality.
     """
+    low_fidelity_chars, total_chars = count_low_fidelity_chars(obj)
+    if total_chars > 0:
+        # when there are no-trivial amount of hidden characters in the object it means there are
+        # text that is not rendered -> most likely OCR'ed text for the image content overlying the
+        # text and not embedded text that also shows in the rendered pdf
+        low_fidelity_ratio = low_fidelity_chars / total_chars
+        return low_fidelity_ratio < threshold
+    return True
+
+
+def count_low_fidelity_chars(obj) -> tuple[int, int]:
+    """Count the low fidelity (invisible or rotated) characters and all characters of a pdfminer
+    layout object, see `text_is_embedded()`."""
     low_fidelity_chars = 0
     total_chars = 0
 
@@ -454,13 +484,7 @@ def text_is_embedded(obj, threshold=env_config.PDF_MAX_EMBED_LOW_FIDELITY_TEXT_R
                 extract_chars(child)
 
     extract_chars(obj)
-    if total_chars > 0:
-        # when there are no-trivial amount of hidden characters in the object it means there are
-        # text that is not rendered -> most likely OCR'ed text for the image content overlying the
-        # text and not embedded text that also shows in the rendered pdf
-        low_fidelity_ratio = low_fidelity_chars / total_chars
-        return low_fidelity_ratio < threshold
-    return True
+    return low_fidelity_chars, total_chars
 
 
 @requires_dependencies("unstructured_inference")
@@ -491,9 +515,9 @@ def process_page_layout_from_pdfminer(
                 page_number,
                 annotation_threshold,
             )
-            _, words = get_words_from_obj(obj, page_height)
-            for annot in annotations_within_element:
-                urls_metadata.append(map_bbox_and_index(words, annot))
+            if annotations_within_element:
+                _, words = get_words_from_obj(obj, page_height)
+                urls_metadata.extend(map_bboxes_and_indices(words, annotations_within_element))
 
         if hasattr(obj, "get_text"):
             inner_text_objects = extract_text_objects(obj)
@@ -571,6 +595,8 @@ def process_data_with_pdfminer(
     password: Optional[str] = None,
     pdfminer_config: Optional[PDFMinerConfig] = None,
     rotation_corrections: Optional[List[int]] = None,
+    pdfminer_pages: Optional[List[PDFMinerPage]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
 ) -> tuple[List[LayoutElements], List[List]]:
     """Loads the image and word objects from a pdf using pdfplumber and the image renderings of the
     pdf pages using pdf2image
@@ -579,6 +605,12 @@ def process_data_with_pdfminer(
     counter-clockwise) that unstructured-inference applied to the rendered page images to
     make their text upright. Mirroring those rotations onto the extracted coordinates keeps
     the pdfminer layer aligned with the object-detection layer.
+
+    ``pdfminer_pages`` are page layouts from an earlier pdfminer pass over the same document
+    with the same ``pdfminer_config``; when given, ``file`` is not parsed again.
+
+    ``pdf_document`` is the handle of the document in ``file``; pdfminer reads its repaired bytes
+    when it was repaired, and repairs the document through it when needed.
     """
 
     from unstructured_inference.inference.layoutelement import LayoutElements
@@ -587,21 +619,11 @@ def process_data_with_pdfminer(
     layouts_links = []
     # Coefficient to rescale bounding box to be compatible with images
     coef = dpi / 72
-    for page_number, (page, page_layout) in enumerate(
-        open_pdfminer_pages_generator(file, password=password, pdfminer_config=pdfminer_config)
+    for page_number, (page_layout, annotation_list, widget_list) in enumerate(
+        _iter_pdfminer_pages(file, password, pdfminer_config, pdfminer_pages, pdf_document)
     ):
         width, height = page_layout.width, page_layout.height
 
-        annotation_list = []
-        widget_list = []
-        coordinate_system = PixelSpace(
-            width=width,
-            height=height,
-        )
-        if page.annots:
-            annotation_list = get_uris(page.annots, height, coordinate_system, page_number)
-            widget_list = get_widget_text_from_annots(page.annots, height)
-
         layout, urls_metadata = process_page_layout_from_pdfminer(
             annotation_list, page_layout, height, page_number, coef, pdfminer_config, widget_list
         )
@@ -662,6 +684,36 @@ def process_data_with_pdfminer(
     return layouts, layouts_links
 
 
+def _iter_pdfminer_pages(
+    file: Optional[Union[bytes, BinaryIO]],
+    password: Optional[str],
+    pdfminer_config: Optional[PDFMinerConfig],
+    pdfminer_pages: Optional[List[PDFMinerPage]],
+    pdf_document: Optional[PdfDocumentHandle] = None,
+) -> Iterable[PDFMinerPage]:
+    """Yield the layout, link annotations and widget text of each page, reusing
+    `pdfminer_pages` when available. Link annotations are keyed by the 0-based page index."""
+    if pdfminer_pages is not None:
+        for page_number, (page_layout, annotation_list, widget_list) in enumerate(pdfminer_pages):
+            annotation_list = [{**annot, "page_number": page_number} for annot in annotation_list]
+            yield PDFMinerPage(page_layout, annotation_list, widget_list)
+        return
+
+    for page_number, (page, page_layout) in enumerate(
+        open_pdfminer_pages_generator(
+            file, password=password, pdfminer_config=pdfminer_config, pdf_document=pdf_document
+        )
+    ):
+        height = page_layout.height
+        annotation_list = []
+        widget_list = []
+        if page.annots:
+            coordinate_system = PixelSpace(width=page_layout.width, height=height)
+            annotation_list = get_uris(page.annots, height, coordinate_system, page_number)
+            widget_list = get_widget_text_from_annots(page.annots, height)
+        yield PDFMinerPage(page_layout, annotation_list, widget_list)
+
+
 def _create_text_region(x1, y1, x2, y2, coef, text, source, region_class):
     """Creates a text region of the specified class with scaled coordinates."""
     return region_class.from_coords(
@@ -712,6 +764,13 @@ def bboxes1_is_almost_subregion_of_bboxes2(
     coords1 = get_coords_from_bboxes(bboxes1, round_to=round_to)
     coords2 = get_coords_from_bboxes(bboxes2, round_to=round_to)
 
+    if _use_spatial_index(coords1, coords2, threshold):
+        return _pairs_to_matrix(
+            bboxes1_is_almost_subregion_of_bboxes2_pairs(coords1, coords2, threshold, round_to),
+            coords1,
+            coords2,
+        )
+
     inter_area, boxa_area, boxb_area = areas_of_boxes_and_intersection_area(
         coords1, coords2, round_to=round_to
     )
@@ -721,6 +780,24 @@ def bboxes1_is_almost_subregion_of_bboxes2(
     )
 
 
+def bboxes1_is_almost_subregion_of_bboxes2_pairs(
+    bboxes1, bboxes2, threshold: float = 0.5, round_to: int = DEFAULT_ROUND
+) -> tuple[np.ndarray, np.ndarray]:
+    """sparse form of `bboxes1_is_almost_subregion_of_bboxes2`: the `(rows, cols)` indices where
+    the matrix it returns is True, found by testing only the box pairs that can intersect"""
+    coords1 = get_coords_from_bboxes(bboxes1, round_to=round_to)
+    coords2 = get_coords_from_bboxes(bboxes2, round_to=round_to)
+
+    rows, cols = _candidate_pairs(coords1, coords2, threshold)
+    inter_area, boxa_area, boxb_area = pair_areas_and_intersection_area(
+        coords1, coords2, rows, cols, round_to=round_to
+    )
+    is_subregion = (inter_area / np.maximum(boxa_area, EPSILON_AREA) > threshold) & (
+        boxa_area <= boxb_area
+    )
+    return rows[is_subregion], cols[is_subregion]
+
+
 def boxes_self_iou(bboxes, threshold: float = 0.5, round_to: int = DEFAULT_ROUND) -> np.ndarray:
     """compute iou for a group of elements"""
     # only store one copy of coords in memory instead of calling get coords twice
@@ -737,6 +814,11 @@ def boxes_iou(
     coords1 = get_coords_from_bboxes(bboxes1, round_to=round_to)
     coords2 = get_coords_from_bboxes(bboxes2, round_to=round_to)
 
+    if _use_spatial_index(coords1, coords2, threshold):
+        return _pairs_to_matrix(
+            boxes_iou_pairs(coords1, coords2, threshold, round_to), coords1, coords2
+        )
+
     inter_area, boxa_area, boxb_area = areas_of_boxes_and_intersection_area(
         coords1, coords2, round_to=round_to
     )
@@ -745,6 +827,50 @@ def boxes_iou(
     return inter_area > (threshold * denom)
 
 
+def boxes_iou_pairs(
+    bboxes1, bboxes2, threshold: float = 0.75, round_to: int = DEFAULT_ROUND
+) -> tuple[np.ndarray, np.ndarray]:
+    """sparse form of `boxes_iou`: the `(rows, cols)` indices where the matrix it returns is
+    True, found by testing only the box pairs that can intersect"""
+    coords1 = get_coords_from_bboxes(bboxes1, round_to=round_to)
+    coords2 = get_coords_from_bboxes(bboxes2, round_to=round_to)
+
+    rows, cols = _candidate_pairs(coords1, coords2, threshold)
+    inter_area, boxa_area, boxb_area = pair_areas_and_intersection_area(
+        coords1, coords2, rows, cols, round_to=round_to
+    )
+    denom = np.maximum(EPSILON_AREA, boxa_area + boxb_area - inter_area)
+    is_match = inter_area > (threshold * denom)
+    return rows[is_match], cols[is_match]
+
+
+def _use_spatial_index(coords1: np.ndarray, coords2: np.ndarray, threshold: float) -> bool:
+    """whether to test only candidate pairs from the spatial index instead of all pairs; that
+    gives the same result only for non-negative thresholds, where boxes that do not intersect
+    never match"""
+    min_pairs = env_config.BBOX_SPATIAL_INDEX_MIN_PAIRS
+    return 0 < min_pairs <= len(coords1) * len(coords2) and threshold >= 0
+
+
+def _candidate_pairs(
+    coords1: np.ndarray, coords2: np.ndarray, threshold: float
+) -> tuple[np.ndarray, np.ndarray]:
+    """pairs to run the exact test on: those the spatial index finds intersecting, or every pair
+    for a negative threshold, which boxes that do not intersect can pass as well"""
+    if threshold >= 0:
+        return candidate_box_pairs(coords1, coords2)
+    rows, cols = np.indices((len(coords1), len(coords2)))
+    return rows.ravel(), cols.ravel()
+
+
+def _pairs_to_matrix(
+    pairs: tuple[np.ndarray, np.ndarray], coords1: np.ndarray, coords2: np.ndarray
+) -> np.ndarray:
+    matrix = np.zeros((len(coords1), len(coords2)), dtype=bool)
+    matrix[pairs] = True
+    return matrix
+
+
 @requires_dependencies("unstructured_inference")
 def pdfminer_elements_to_text_regions(layout_elements: LayoutElements) -> list[TextRegions]:
     """a temporary solution to convert layout elements to a list of either EmbeddedTextRegion or
@@ -867,27 +993,13 @@ def remove_duplicate_elements(
     """Removes duplicate text elements extracted by PDFMiner from a document layout."""
 
     coords = elements.element_coords
-    # experiments show 2e3 is the block size that constrains the peak memory around 1Gb for this
-    # function; that accounts for all the intermediate matricies allocated and memory for storing
-    # final results
-    memory_cap_in_gb = float(os.getenv("UNST_MATMUL_MEMORY_CAP_IN_GB", 1))
-    if memory_cap_in_gb <= 0:
-        raise ValueError("UNST_MATMUL_MEMORY_CAP_IN_GB must be > 0")
-    n_split = np.ceil(coords.shape[0] / 2e3 / memory_cap_in_gb)
-    splits = np.array_split(coords, n_split, axis=0)
-
     # A box is dropped only when it near-duplicates a *later* box (higher global index) -- the
-    # strict upper triangle of the full IoU matrix. Each split is a contiguous block of rows
-    # compared against all coords, so the triangle's diagonal must be offset by the split's
-    # global start index; otherwise rows in later splits match themselves (and earlier boxes)
-    # and get wrongly removed, decimating dense pages (> 2000 elements).
-    keep_masks = []
-    offset = 0
-    for split in splits:
-        iou = boxes_iou(split, coords, threshold)
-        keep_masks.append(~np.triu(iou, k=1 + offset).any(axis=1))
-        offset += split.shape[0]
-    return elements.slice(np.concatenate(keep_masks))
+    # strict upper triangle of the full IoU matrix. The spatial index only yields the pairs of
+    # boxes that intersect, so the full N x N matrix is never built.
+    rows, cols = boxes_iou_pairs(coords, coords, threshold)
+    keep_mask = np.ones(len(coords), dtype=bool)
+    keep_mask[rows[cols > rows]] = False
+    return elements.slice(keep_mask)
 
 
 def _aggregated_iou(box1s, box2):
@@ -946,6 +1058,35 @@ def aggregate_embedded_text_by_block(
     return text, is_extracted
 
 
+def aggregate_embedded_text_by_blocks(
+    target_regions: TextRegions,
+    source_regions: TextRegions,
+    subregion_threshold: float = env_config.EMBEDDED_TEXT_AGGREGATION_SUBREGION_THRESHOLD,
+) -> list[str]:
+    """Extracts the text aggregated from the elements of the given layout that lie within each of
+    the given blocks; the same text `aggregate_embedded_text_by_block` returns for each block, but
+    computed with one containment pass over all blocks."""
+
+    if len(target_regions) == 0:
+        return []
+    if len(source_regions) == 0:
+        return [""] * len(target_regions)
+
+    source_indices, target_indices = bboxes1_is_almost_subregion_of_bboxes2_pairs(
+        source_regions.element_coords,
+        target_regions.element_coords,
+        subregion_threshold,
+    )
+
+    # pairs come sorted by source index, so each block collects its texts in source order
+    block_texts: list[list[str]] = [[] for _ in range(len(target_regions))]
+    source_texts = source_regions.texts
+    for source_index, target_index in zip(source_indices, target_indices):
+        if text := source_texts[source_index]:
+            block_texts[target_index].append(text)
+    return [" ".join(texts) for texts in block_texts]
+
+
 def get_links_in_element(page_links: list, region: Rectangle) -> list:
     links_bboxes = [Rectangle(*link.get("bbox")) for link in page_links]
     results = bboxes1_is_almost_subregion_of_bboxes2(links_bboxes, [region])
@@ -1224,11 +1365,8 @@ def _deduplicate_ltchars(
     if threshold <= 0 or not chars:
         return chars
 
-    result = [chars[0]]
-    for char in chars[1:]:
-        if not _is_duplicate_char(result[-1], char, threshold):
-            result.append(char)
-    return result
+    mask = duplicate_char_mask(CharTable.from_text_lines([chars]), threshold)
+    return [char for char, is_duplicate in zip(chars, mask.tolist()) if not is_duplicate]
 
 
 def get_words_from_obj(
@@ -1248,68 +1386,112 @@ def get_words_from_obj(
             - list[dict[str,Any]]]: A list of dictionaries, each containing information about
                 a word, including its text, bounding box, and start index in the element's text.
     """
-    characters = []
-    words = []
-    text_len = 0
-    char_dedup_threshold = env_config.PDF_CHAR_DUPLICATE_THRESHOLD
-
-    for text_line in obj:
-        word = ""
-        x1, y1, x2, y2 = None, None, None, None
-        start_index = 0
-        last_char: LTChar | None = None  # Track last character for deduplication
-
-        for index, character in enumerate(text_line):
-            if isinstance(character, LTChar):
-                # Skip duplicate characters (fake bold fix)
-                if (
-                    char_dedup_threshold > 0
-                    and last_char is not None
-                    and _is_duplicate_char(last_char, character, char_dedup_threshold)
-                ):
-                    continue
+    table = CharTable.from_text_lines(obj)
+    is_kept = ~duplicate_char_mask(table, env_config.PDF_CHAR_DUPLICATE_THRESHOLD)
+    characters = [table.items[i] for i in np.flatnonzero(table.is_char & is_kept).tolist()]
+    return characters, _words_from_char_table(table, is_kept, height)
 
-                last_char = character
-                characters.append(character)
-                char = character.get_text()
 
-                if word and not char.strip():
-                    words.append(
-                        {"text": word, "bbox": (x1, y1, x2, y2), "start_index": start_index},
-                    )
-                    word = ""
-                    continue
+def _words_from_char_table(
+    table: CharTable, is_kept: np.ndarray, height: float
+) -> list[dict[str, Any]]:
+    """Split the kept items of `table` into words, as array operations over its columns.
+
+    Within a line, a word is a run of characters that are all alphanumeric or all not, and ends at
+    a non-`LTChar` item (which emits the current word even when it is empty), at a whitespace
+    character following a word (which is dropped) or where alphanumeric-ness changes. A
+    whitespace character that does not follow a word starts one, so in a run of whitespace
+    characters every other one is dropped. A word left open at the end of its line is not
+    emitted. Empty words carry the bounding box and start index of the previous word of their
+    line, or `None` coordinates and 0 when there is none.
+    """
+    # -- the events of the walk over each line: kept characters and the non-LTChar items --
+    events = np.flatnonzero(is_kept)
+    if not len(events):
+        return []
+    is_char = table.is_char[events]
+    lines = table.line_ids[events]
+    text_ids = table.text_ids[events]
+
+    # -- text ids number the distinct texts from 0, so classify each distinct text once --
+    _, first_of_text = np.unique(table.text_ids, return_index=True)
+    distinct_texts = [table.texts[i] for i in first_of_text.tolist()]
+    is_space_by_id = np.array([not text.strip() for text in distinct_texts], dtype=bool)
+    is_alnum_by_id = np.array([text.isalnum() for text in distinct_texts], dtype=bool)
+    is_space = is_char & is_space_by_id[text_ids]
+    is_alnum = is_char & is_alnum_by_id[text_ids]
+
+    def _previous(values: np.ndarray) -> np.ndarray:
+        """`values` of the previous event of the same line; False at the start of a line."""
+        previous = np.zeros(len(values), dtype=bool)
+        previous[1:] = values[:-1] & (lines[1:] == lines[:-1])
+        return previous
+
+    # -- whitespace characters alternate between dropped and starting a word; a run of them
+    # -- starts with a dropped one when it follows a word, which is always true after a character
+    is_dropped = np.zeros(len(events), dtype=bool)
+    starts_space_run = is_space & ~_previous(is_space)
+    if starts_space_run.any():
+        space_run_starts = np.flatnonzero(starts_space_run)
+        space_run_ids = np.maximum(np.cumsum(starts_space_run) - 1, 0)
+        position_in_run = np.arange(len(events)) - space_run_starts[space_run_ids]
+        run_follows_char = _previous(is_char)[space_run_starts][space_run_ids]
+        is_dropped = is_space & ((position_in_run % 2 == 0) == run_follows_char)
+    is_added = is_char & ~is_dropped
+
+    follows_added = _previous(is_added)
+    alnum_changes = np.zeros(len(events), dtype=bool)
+    alnum_changes[1:] = is_alnum[1:] != is_alnum[:-1]
+    starts_word = is_added & (is_space | ~follows_added | alnum_changes)
+    emits_word = ~is_char | is_dropped | (starts_word & follows_added)
+
+    # -- the words: runs of added characters from one word start to the next --
+    added = np.flatnonzero(is_added)
+    word_of_added = np.cumsum(starts_word[added]) - 1
+    first_added = np.flatnonzero(starts_word[added])
+    last_added = np.append(first_added[1:], len(added))[: len(first_added)] - 1
+    first_items = events[added[first_added]]
+    last_items = events[added[last_added]]
+    word_bboxes = list(
+        zip(
+            table.x0[first_items].tolist(),
+            (height - table.y1[first_items]).tolist(),
+            table.x1[last_items].tolist(),
+            (height - table.y0[last_items]).tolist(),
+        )
+    )
+    word_start_indexes = table.positions[first_items].tolist()
+    word_texts = [""] * len(first_added)
+    added_texts = [table.texts[i] for i in events[added].tolist()]
+    for word, (first, last) in enumerate(zip(first_added.tolist(), last_added.tolist())):
+        word_texts[word] = "".join(added_texts[first : last + 1])
+    word_lines = lines[added[first_added]]
+
+    # -- each emitting event emits the last word started before it on its line, which is the
+    # -- current word when the previous event added a character to it and empty otherwise --
+    last_word = np.full(len(events), -1, dtype=np.int64)
+    last_word[added] = word_of_added
+    last_word = np.maximum.accumulate(last_word)
+    previous_word = np.full(len(events), -1, dtype=np.int64)
+    previous_word[1:] = last_word[:-1]
 
-                # TODO(klaijan) - isalnum() only works with A-Z, a-z and 0-9
-                # will need to switch to some pattern matching once we support more languages
-                if not word:
-                    isalnum = char.isalnum()
-                if word and char.isalnum() != isalnum:
-                    isalnum = char.isalnum()
-                    words.append(
-                        {"text": word, "bbox": (x1, y1, x2, y2), "start_index": start_index},
-                    )
-                    word = ""
-
-                if len(word) == 0:
-                    start_index = text_len + index
-                    x1 = character.x0
-                    y2 = height - character.y0
-                    x2 = character.x1
-                    y1 = height - character.y1
-                else:
-                    x2 = character.x1
-                    y2 = height - character.y0
-
-                word += char
-            else:
-                # Non-LTChar items (e.g., LTAnno) act as word boundaries
-                words.append(
-                    {"text": word, "bbox": (x1, y1, x2, y2), "start_index": start_index},
-                )
-                word = ""
-        text_len += len(text_line)
-    return characters, words
+    words = []
+    for event, word, is_current in zip(
+        np.flatnonzero(emits_word).tolist(),
+        previous_word[emits_word].tolist(),
+        follows_added[emits_word].tolist(),
+    ):
+        if word < 0 or word_lines[word] != lines[event]:
+            words.append({"text": "", "bbox": (None, None, None, None), "start_index": 0})
+            continue
+        words.append(
+            {
+                "text": word_texts[word] if is_current else "",
+                "bbox": word_bboxes[word],
+                "start_index": word_start_indexes[word],
+            }
+        )
+    return words
 
 
 def map_bbox_and_index(words: list[dict[str, Any]], annot: dict[str, Any]):
@@ -1326,33 +1508,52 @@ def map_bbox_and_index(words: list[dict[str, Any]], annot: dict[str, Any]):
         dict: The updated annotation dictionary with "text" representing the mapped text and
             "start_index" representing the start index of the mapped text in the list of words.
     """
+    return map_bboxes_and_indices(words, [annot])[0]
+
+
+def map_bboxes_and_indices(
+    words: list[dict[str, Any]], annots: list[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Map each annotation of `annots` to its text and start index like `map_bbox_and_index()`,
+    comparing the bounding boxes of all annotations with those of all words at once.
+
+    Words without a bounding box (the empty words `get_words_from_obj()` emits before any word of
+    their line) are never the closest to an annotation.
+    """
     if len(words) == 0:
-        annot["text"] = ""
-        annot["start_index"] = -1
-        return annot
-    distance_from_bbox_start = np.sqrt(
-        (annot["bbox"][0] - np.array([word["bbox"][0] for word in words])) ** 2
-        + (annot["bbox"][1] - np.array([word["bbox"][1] for word in words])) ** 2,
+        for annot in annots:
+            annot["text"] = ""
+            annot["start_index"] = -1
+        return annots
+    if not annots:
+        return annots
+
+    word_bboxes = np.array(
+        [[np.inf if v is None else v for v in word["bbox"]] for word in words], dtype=np.float64
     )
-    distance_from_bbox_end = np.sqrt(
-        (annot["bbox"][2] - np.array([word["bbox"][2] for word in words])) ** 2
-        + (annot["bbox"][3] - np.array([word["bbox"][3] for word in words])) ** 2,
-    )
-    closest_start = try_argmin(distance_from_bbox_start)
-    closest_end = try_argmin(distance_from_bbox_end)
-
-    # NOTE(klaijan) - get the word from closest start only if the end index comes after start index
-    text = ""
-    if closest_end >= closest_start:
-        for _ in range(closest_start, closest_end + 1):
-            text += " "
-            text += words[_]["text"]
-    else:
-        text = words[closest_start]["text"]
-
-    annot["text"] = text.strip()
-    annot["start_index"] = words[closest_start]["start_index"]
-    return annot
+    annot_bboxes = np.array([annot["bbox"] for annot in annots], dtype=np.float64)
+    with np.errstate(invalid="ignore"):
+        distance_from_bbox_start = np.sqrt(
+            (annot_bboxes[:, [0]] - word_bboxes[:, 0]) ** 2
+            + (annot_bboxes[:, [1]] - word_bboxes[:, 1]) ** 2,
+        )
+        distance_from_bbox_end = np.sqrt(
+            (annot_bboxes[:, [2]] - word_bboxes[:, 2]) ** 2
+            + (annot_bboxes[:, [3]] - word_bboxes[:, 3]) ** 2,
+        )
+    closest_starts = np.argmin(distance_from_bbox_start, axis=1).tolist()
+    closest_ends = np.argmin(distance_from_bbox_end, axis=1).tolist()
+
+    for annot, closest_start, closest_end in zip(annots, closest_starts, closest_ends):
+        # NOTE(klaijan) - get the word from closest start only if the end index comes after start
+        # index
+        if closest_end >= closest_start:
+            text = " ".join(word["text"] for word in words[closest_start : closest_end + 1])
+        else:
+            text = words[closest_start]["text"]
+        annot["text"] = text.strip()
+        annot["start_index"] = words[closest_start]["start_index"]
+    return annots
 
 
 def calculate_intersection_area(
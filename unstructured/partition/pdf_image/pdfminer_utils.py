@@ -1,13 +1,35 @@
-import os
 import re
-import tempfile
 import zlib
-from typing import BinaryIO, List, Mapping, Optional, Tuple, Union
+from io import BytesIO
+from itertools import chain, count, islice
+from operator import attrgetter
+from typing import (
+    Any,
+    BinaryIO,
+    Iterable,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
 
+import numpy as np
+from numba import njit
 from pdfminer import settings as pdfminer_settings
 from pdfminer.cmapdb import CMap, CMapDB
 from pdfminer.converter import PDFPageAggregator
-from pdfminer.layout import LAParams, LTChar, LTContainer, LTImage, LTItem, LTTextLine
+from pdfminer.layout import (
+    LAParams,
+    LTChar,
+    LTContainer,
+    LTImage,
+    LTItem,
+    LTPage,
+    LTTextLine,
+)
 from pdfminer.pdffont import PDFCIDFont, PDFFontError
 from pdfminer.pdfinterp import LITERAL_FONT, PDFPageInterpreter, PDFResourceManager
 from pdfminer.pdfpage import PDFPage
@@ -23,6 +45,7 @@ from pdfminer.psparser import literal_name
 from pydantic import BaseModel
 
 from unstructured.logger import logger
+from unstructured.partition.pdf_image.pdf_document import PdfDocumentHandle
 from unstructured.partition.utils.config import env_config
 from unstructured.utils import requires_dependencies
 
@@ -306,6 +329,19 @@ class PDFMinerConfig(BaseModel):
     detect_vertical: Optional[bool] = None
 
 
+class PDFMinerPage(NamedTuple):
+    """The result of one pdfminer layout pass over a page, kept so that later stages can reuse it
+    instead of parsing the document again.
+
+    The link and widget annotations are resolved while the document is still open, because the
+    `PDFPage` they come from cannot resolve object references once its file is closed.
+    """
+
+    layout: LTPage
+    annotations: List[dict[str, Any]]
+    widgets: List[dict[str, Any]]
+
+
 def init_pdfminer(pdfminer_config: Optional[PDFMinerConfig] = None):
     rsrcmgr = CustomPDFResourceManager()
 
@@ -367,6 +403,123 @@ def rect_to_bbox(
     return (x1, y1, x2, y2)
 
 
+_CHAR_COORDS = attrgetter("x0", "y0", "x1", "y1")
+
+
+class CharTable(NamedTuple):
+    """Columnar view of the items of one or more `LTTextLine`s, built in a single pass so that
+    duplicate detection and word segmentation run as array operations instead of per-character
+    Python calls.
+
+    Items that are not `LTChar` (e.g. the `LTAnno` spaces and line ends pdfminer inserts) keep
+    their row, with `is_char` False and NaN coordinates.
+    """
+
+    items: List[Any]
+    line_count: int
+    texts: List[str]
+    # -- id of each distinct text, so that text comparisons are integer comparisons --
+    text_ids: np.ndarray
+    is_char: np.ndarray
+    line_ids: np.ndarray
+    # -- offset of each item in the concatenated items of all lines --
+    positions: np.ndarray
+    x0: np.ndarray
+    y0: np.ndarray
+    x1: np.ndarray
+    y1: np.ndarray
+
+    @classmethod
+    def from_text_lines(cls, text_lines: Iterable[Any]) -> "CharTable":
+        lines = [list(text_line) for text_line in text_lines]
+        items = [item for line in lines for item in line]
+        is_char = np.fromiter(
+            (isinstance(item, LTChar) for item in items), dtype=bool, count=len(items)
+        )
+        texts = [
+            item.get_text() if char or hasattr(item, "get_text") else ""
+            for item, char in zip(items, is_char.tolist())
+        ]
+        coords = np.full((len(items), 4), np.nan)
+        char_positions = np.flatnonzero(is_char)
+        coords[char_positions] = np.fromiter(
+            chain.from_iterable(map(_CHAR_COORDS, (items[i] for i in char_positions.tolist()))),
+            dtype=np.float64,
+            count=4 * len(char_positions),
+        ).reshape(-1, 4)
+        text_id_by_text = {text: text_id for text_id, text in enumerate(dict.fromkeys(texts))}
+        text_ids = np.array([text_id_by_text[text] for text in texts], dtype=np.int64)
+        return cls(
+            items=items,
+            line_count=len(lines),
+            texts=texts,
+            text_ids=text_ids,
+            is_char=is_char,
+            line_ids=np.repeat(np.arange(len(lines)), [len(line) for line in lines]),
+            positions=np.arange(len(items)),
+            x0=coords[:, 0],
+            y0=coords[:, 1],
+            x1=coords[:, 2],
+            y1=coords[:, 3],
+        )
+
+
+@njit(cache=True)
+def _duplicate_char_mask_kernel(
+    x0: np.ndarray,
+    y0: np.ndarray,
+    x1: np.ndarray,
+    text_ids: np.ndarray,
+    line_ids: np.ndarray,
+    threshold: float,
+    overlap_ratio_threshold: float,
+) -> np.ndarray:
+    """`_is_duplicate_char()` of each character against the last kept character of its line."""
+    mask = np.zeros(len(x0), dtype=np.bool_)
+    last_kept = -1
+    for i in range(len(x0)):
+        if (
+            last_kept >= 0
+            and line_ids[i] == line_ids[last_kept]
+            and text_ids[i] == text_ids[last_kept]
+        ):
+            x_diff = abs(x0[last_kept] - x0[i])
+            y_diff = abs(y0[last_kept] - y0[i])
+            if not (x_diff >= threshold or y_diff >= threshold):
+                avg_width = ((x1[last_kept] - x0[last_kept]) + (x1[i] - x0[i])) / 2
+                horizontal_overlap = max(0.0, min(x1[last_kept], x1[i]) - max(x0[last_kept], x0[i]))
+                overlap_ratio = horizontal_overlap / avg_width if avg_width > 0 else 0.0
+                if overlap_ratio > overlap_ratio_threshold:
+                    mask[i] = True
+                    continue
+        last_kept = i
+    return mask
+
+
+def duplicate_char_mask(table: CharTable, threshold: float) -> np.ndarray:
+    """Flag the `LTChar` items of `table` that `deduplicate_chars_in_text_line()` would drop as
+    fake-bold duplicates: a character is dropped when it duplicates the last kept character of
+    its line (see `_is_duplicate_char()`).
+    """
+    mask = np.zeros(len(table.items), dtype=bool)
+    if threshold <= 0:
+        return mask
+
+    char_positions = np.flatnonzero(table.is_char)
+    if len(char_positions) < 2:
+        return mask
+    mask[char_positions] = _duplicate_char_mask_kernel(
+        table.x0[char_positions],
+        table.y0[char_positions],
+        table.x1[char_positions],
+        table.text_ids[char_positions],
+        table.line_ids[char_positions],
+        float(threshold),
+        float(env_config.PDF_CHAR_OVERLAP_RATIO_THRESHOLD),
+    )
+    return mask
+
+
 def _is_duplicate_char(char1: LTChar, char2: LTChar, threshold: float) -> bool:
     """Detect if two characters are duplicates caused by fake bold rendering.
 
@@ -438,24 +591,17 @@ def deduplicate_chars_in_text_line(text_line: LTTextLine, threshold: float) -> s
     if threshold <= 0:
         return text_line.get_text()
 
-    # Build deduplicated text while preserving non-LTChar items (like LTAnno for spaces)
-    result_parts: List[str] = []
-    last_ltchar: Optional[LTChar] = None
+    return deduplicated_line_texts(CharTable.from_text_lines([text_line]), threshold)[0]
 
-    for item in text_line:
-        if isinstance(item, LTChar):
-            # Check if this is a duplicate of the last LTChar
-            if last_ltchar is not None and _is_duplicate_char(last_ltchar, item, threshold):
-                # Skip this duplicate character
-                continue
-            last_ltchar = item
-            result_parts.append(item.get_text())
-        else:
-            # Non-LTChar items (e.g., LTAnno for spaces) - keep as-is
-            if hasattr(item, "get_text"):
-                result_parts.append(item.get_text())
 
-    return "".join(result_parts)
+def deduplicated_line_texts(table: CharTable, threshold: float) -> List[str]:
+    """The text of each line of `table` without its fake-bold duplicate characters."""
+    mask = duplicate_char_mask(table, threshold)
+    parts: List[List[str]] = [[] for _ in range(table.line_count)]
+    for text, line_id, is_duplicate in zip(table.texts, table.line_ids.tolist(), mask.tolist()):
+        if not is_duplicate:
+            parts[line_id].append(text)
+    return ["".join(line_parts) for line_parts in parts]
 
 
 def get_text_with_deduplication(
@@ -478,10 +624,17 @@ def get_text_with_deduplication(
     if isinstance(text_obj, LTTextLine):
         return deduplicate_chars_in_text_line(text_obj, threshold)
     elif isinstance(text_obj, LTContainer):
+        children = list(text_obj)
+        text_lines = [child for child in children if isinstance(child, LTTextLine)]
+        line_texts = iter(
+            deduplicated_line_texts(CharTable.from_text_lines(text_lines), threshold)
+            if threshold > 0
+            else [text_line.get_text() for text_line in text_lines]
+        )
         parts: List[str] = []
-        for child in text_obj:
+        for child in children:
             if isinstance(child, LTTextLine):
-                parts.append(deduplicate_chars_in_text_line(child, threshold))
+                parts.append(next(line_texts))
             elif hasattr(child, "get_text"):
                 parts.append(child.get_text())
         return "".join(parts)
@@ -492,45 +645,70 @@ def get_text_with_deduplication(
 
 @requires_dependencies(["pikepdf", "pypdf"])
 def open_pdfminer_pages_generator(
-    fp: BinaryIO, password: Optional[str] = None, pdfminer_config: Optional[PDFMinerConfig] = None
+    fp: BinaryIO,
+    password: Optional[str] = None,
+    pdfminer_config: Optional[PDFMinerConfig] = None,
+    page_indices: Optional[Sequence[int]] = None,
+    pdf_document: Optional[PdfDocumentHandle] = None,
 ):
-    """Open PDF pages using PDFMiner, handling and repairing invalid dictionary constructs."""
+    """Open PDF pages using PDFMiner, handling and repairing invalid dictionary constructs.
 
-    import pikepdf
+    When `page_indices` (sorted 0-based page indices) is given, only those pages are interpreted
+    and yielded; the content streams of the other pages are never read.
 
-    from unstructured.partition.pdf_image.pypdf_utils import get_page_data
+    When pdfminer cannot parse the document or one of its pages, the document is repaired with
+    pikepdf and the remaining pages are read from the repaired document. The repair is done by
+    `pdf_document`, the handle of the document in `fp`, when it is given, so it happens at most
+    once per handle and a handle that was already repaired is read from its repaired bytes.
+    """
+    if pdf_document is None:
+        pdf_document = PdfDocumentHandle(file=fp, password=password)
+    if pdf_document.is_repaired:
+        yield from _iter_repaired_pdfminer_pages(pdf_document, pdfminer_config, page_indices)
+        return
 
+    pagenos = set(page_indices) if page_indices is not None else None
     device, interpreter = init_pdfminer(pdfminer_config=pdfminer_config)
-    with tempfile.TemporaryDirectory() as tmp_dir_path:
-        tmp_file_path = os.path.join(tmp_dir_path, "tmp_file")
-        try:
-            pages = PDFPage.get_pages(fp, password=password or "")
-            # Detect invalid dictionary construct for entire PDF
-            for i, page in enumerate(pages):
-                try:
-                    # Detect invalid dictionary construct for one page
-                    interpreter.process_page(page)
-                    page_layout = device.get_result()
-                except PSSyntaxError:
-                    logger.info("Detected invalid dictionary construct for PDFminer")
-                    logger.info(f"Repairing the PDF page {i + 1} ...")
-                    # find the error page from binary data fp
-                    error_page_data = get_page_data(fp, page_number=i)
-                    # repair the error page with pikepdf
-                    with pikepdf.Pdf.open(error_page_data) as pdf:
-                        pdf.save(tmp_file_path)
-                    page = next(PDFPage.get_pages(open(tmp_file_path, "rb")))  # noqa: SIM115
-                    interpreter.process_page(page)
-                    page_layout = device.get_result()
-                yield page, page_layout
-        except PSSyntaxError:
-            logger.info("Detected invalid dictionary construct for PDFminer")
-            logger.info("Repairing the PDF document ...")
-            # repair the entire doc with pikepdf
-            with pikepdf.Pdf.open(fp) as pdf:
-                pdf.save(tmp_file_path)
-            pages = PDFPage.get_pages(open(tmp_file_path, "rb"))  # noqa: SIM115
-            for page in pages:
+    pages_read = 0
+    try:
+        pages = PDFPage.get_pages(fp, pagenos=pagenos, password=password or "")
+        # Detect invalid dictionary construct for entire PDF
+        for i, page in zip(page_indices if page_indices is not None else count(), pages):
+            try:
+                # Detect invalid dictionary construct for one page
                 interpreter.process_page(page)
-                page_layout = device.get_result()
-                yield page, page_layout
+            except PSSyntaxError:
+                logger.info("Detected invalid dictionary construct for PDFminer")
+                logger.info(f"Repairing the PDF page {i + 1} ...")
+                break
+            yield page, device.get_result()
+            pages_read += 1
+        else:
+            return
+    except PSSyntaxError:
+        logger.info("Detected invalid dictionary construct for PDFminer")
+        logger.info("Repairing the PDF document ...")
+
+    yield from _iter_repaired_pdfminer_pages(
+        pdf_document, pdfminer_config, page_indices, skip_pages=pages_read
+    )
+
+
+def _iter_repaired_pdfminer_pages(
+    pdf_document: PdfDocumentHandle,
+    pdfminer_config: Optional[PDFMinerConfig],
+    page_indices: Optional[Sequence[int]],
+    skip_pages: int = 0,
+):
+    """Yield the pages of the repaired `pdf_document` like `open_pdfminer_pages_generator()`,
+    except for the first `skip_pages` pages, which were already read from the original."""
+    # NOTE: a fresh resource manager, its cached fonts are keyed by the object ids of the original
+    device, interpreter = init_pdfminer(pdfminer_config=pdfminer_config)
+    page_indices = page_indices[skip_pages:] if page_indices is not None else None
+    pages = PDFPage.get_pages(
+        BytesIO(pdf_document.repair()),
+        pagenos=set(page_indices) if page_indices is not None else None,
+    )
+    for page in pages if page_indices is not None else islice(pages, skip_pages, None):
+        interpreter.process_page(page)
+        yield page, device.get_result()
@@ -0,0 +1,129 @@
+"""Candidate pair search for bounding box containment and IoU tests.
+
+The dense helpers in `pdfminer_processing` compare every box of one group with every box of the
+other through `N x M` float matrices. On dense pages (tens of thousands of pdfminer characters or
+OCR words against hundreds of layout boxes) almost none of those pairs overlap. The functions here
+bucket the boxes into a uniform grid over their common bounding region and only return pairs of
+boxes sharing a grid cell, so the exact tests run on the (few) pairs that can intersect.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# -- upper bound on the number of grid cells along each axis --
+MAX_GRID_CELLS_PER_AXIS = 128
+
+
+def candidate_box_pairs(
+    coords1: np.ndarray,
+    coords2: np.ndarray,
+    max_cells_per_axis: int = MAX_GRID_CELLS_PER_AXIS,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Return `(rows, cols)` index arrays of the pairs of boxes in `coords1` and `coords2` that
+    can have a positive intersection area.
+
+    Coordinates are `[x1, y1, x2, y2]` rows and follow the inclusive pixel convention of
+    `areas_of_boxes_and_intersection_area()`, where two boxes intersect when
+    `min(x12, x22) - max(x11, x21) + 1 > 0` (and likewise for y). Every intersecting pair is
+    returned exactly once; some returned pairs may not intersect, so callers still apply their exact
+    test to the candidates. Pairs are sorted by row then column.
+    """
+    empty = np.zeros(0, dtype=np.int64)
+    if len(coords1) == 0 or len(coords2) == 0:
+        return empty, empty
+
+    # -- widen each box by half a pixel on every side so that the inclusive intersection rule
+    # -- becomes a plain closed interval overlap test --
+    boxes1 = np.asarray(coords1, dtype=np.float64) + [-0.5, -0.5, 0.5, 0.5]
+    boxes2 = np.asarray(coords2, dtype=np.float64) + [-0.5, -0.5, 0.5, 0.5]
+    if not (np.isfinite(boxes1).all() and np.isfinite(boxes2).all()):
+        return _all_pairs(len(coords1), len(coords2))
+
+    x_min = min(boxes1[:, 0].min(), boxes2[:, 0].min())
+    y_min = min(boxes1[:, 1].min(), boxes2[:, 1].min())
+    x_max = max(boxes1[:, 2].max(), boxes2[:, 2].max())
+    y_max = max(boxes1[:, 3].max(), boxes2[:, 3].max())
+
+    def _cell_ranges(boxes: np.ndarray, n_cells: int) -> np.ndarray:
+        cell_width = max((x_max - x_min) / n_cells, np.finfo(np.float64).eps)
+        cell_height = max((y_max - y_min) / n_cells, np.finfo(np.float64).eps)
+        cells = np.empty(boxes.shape, dtype=np.int64)
+        cells[:, [0, 2]] = np.floor((boxes[:, [0, 2]] - x_min) / cell_width)
+        cells[:, [1, 3]] = np.floor((boxes[:, [1, 3]] - y_min) / cell_height)
+        return np.clip(cells, 0, n_cells - 1)
+
+    # -- about one box per cell, with coarser cells when large boxes would fill too many cells --
+    n_cells = int(np.clip(np.sqrt(max(len(boxes1), len(boxes2))), 1, max_cells_per_axis))
+    max_entries = 8 * (len(boxes1) + len(boxes2))
+    while True:
+        cell_ranges1 = _cell_ranges(boxes1, n_cells)
+        cell_ranges2 = _cell_ranges(boxes2, n_cells)
+        n_entries = _count_cells(cell_ranges1).sum() + _count_cells(cell_ranges2).sum()
+        if n_entries <= max_entries or n_cells == 1:
+            break
+        n_cells = max(n_cells // 2, 1)
+
+    box_ids1, cell_ids1 = _expand_to_cells(cell_ranges1, n_cells)
+    box_ids2, cell_ids2 = _expand_to_cells(cell_ranges2, n_cells)
+
+    # -- join the (box, cell) entries of both groups on the cell id --
+    order = np.argsort(cell_ids2, kind="stable")
+    box_ids2, cell_ids2 = box_ids2[order], cell_ids2[order]
+    starts = np.searchsorted(cell_ids2, cell_ids1, side="left")
+    counts = np.searchsorted(cell_ids2, cell_ids1, side="right") - starts
+    if counts.sum() == 0:
+        return empty, empty
+    rows = np.repeat(box_ids1, counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    cols = box_ids2[np.repeat(starts, counts) + offsets]
+
+    # -- boxes spanning several cells meet in more than one cell; keep each pair once --
+    pair_ids = np.unique(rows * len(coords2) + cols)
+    return pair_ids // len(coords2), pair_ids % len(coords2)
+
+
+def pair_areas_and_intersection_area(
+    coords1: np.ndarray,
+    coords2: np.ndarray,
+    rows: np.ndarray,
+    cols: np.ndarray,
+    round_to: int,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Intersection area and own areas of the box pairs `(coords1[rows], coords2[cols])`, computed
+    like `areas_of_boxes_and_intersection_area()` computes them for all pairs."""
+    boxes1 = coords1[rows]
+    boxes2 = coords2[cols]
+    inter_area = np.maximum(
+        np.minimum(boxes1[:, 2], boxes2[:, 2]) - np.maximum(boxes1[:, 0], boxes2[:, 0]) + 1, 0
+    ) * np.maximum(
+        np.minimum(boxes1[:, 3], boxes2[:, 3]) - np.maximum(boxes1[:, 1], boxes2[:, 1]) + 1, 0
+    )
+    area1 = (boxes1[:, 2] - boxes1[:, 0] + 1) * (boxes1[:, 3] - boxes1[:, 1] + 1)
+    area2 = (boxes2[:, 2] - boxes2[:, 0] + 1) * (boxes2[:, 3] - boxes2[:, 1] + 1)
+    return inter_area.round(round_to), area1.round(round_to), area2.round(round_to)
+
+
+def _count_cells(cell_ranges: np.ndarray) -> np.ndarray:
+    """Number of grid cells covered by each `[cx1, cy1, cx2, cy2]` cell range; 0 for a box with
+    x2 < x1 or y2 < y1, which can intersect nothing."""
+    widths = np.maximum(cell_ranges[:, 2] - cell_ranges[:, 0] + 1, 0)
+    heights = np.maximum(cell_ranges[:, 3] - cell_ranges[:, 1] + 1, 0)
+    return widths * heights
+
+
+def _expand_to_cells(cell_ranges: np.ndarray, n_cells: int) -> tuple[np.ndarray, np.ndarray]:
+    """Expand `[cx1, cy1, cx2, cy2]` cell ranges into flat `(box_ids, cell_ids)` entries, one for
+    each grid cell a box covers."""
+    counts = _count_cells(cell_ranges)
+    box_ids = np.repeat(np.arange(len(cell_ranges)), counts)
+    offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    widths = cell_ranges[box_ids, 2] - cell_ranges[box_ids, 0] + 1
+    cx = cell_ranges[box_ids, 0] + offsets % widths
+    cy = cell_ranges[box_ids, 1] + offsets // widths
+    return box_ids, cy * n_cells + cx
+
+
+def _all_pairs(n1: int, n2: int) -> tuple[np.ndarray, np.ndarray]:
+    rows, cols = np.divmod(np.arange(n1 * n2, dtype=np.int64), n2)
+    return rows, cols
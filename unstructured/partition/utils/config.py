@@ -13,7 +13,11 @@ from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from unstructured.partition.utils.constants import OCR_AGENT_TESSERACT, STT_AGENT_WHISPER
+from unstructured.partition.utils.constants import (
+    OCR_AGENT_TESSERACT,
+    STT_AGENT_WHISPER,
+    TESSERACT_TEXT_HEIGHT_ESTIMATOR_OCR,
+)
 
 
 @lru_cache(maxsize=1)
@@ -54,6 +58,14 @@ class ENVConfig:
         Path(tmpdir).mkdir(parents=True, exist_ok=True)
         tempfile.tempdir = tmpdir
 
+    def settings_from_environment(self) -> dict[str, str]:
+        """The settings of this class that are set in the os environment, by variable name"""
+        return {
+            name: os.environ[name]
+            for name in dir(type(self))
+            if name.isupper() and name in os.environ
+        }
+
     @property
     def IMAGE_CROP_PAD(self) -> int:
         """extra image content to add around an identified element region; measured in pixels"""
@@ -96,6 +108,19 @@ class ENVConfig:
         """optimum text height for tesseract OCR"""
         return self._get_int("TESSERACT_OPTIMUM_TEXT_HEIGHT", 20)
 
+    @property
+    def TESSERACT_TEXT_HEIGHT_ESTIMATOR(self) -> str:
+        """how the page text height that picks the tesseract zoom is estimated
+
+        "ocr" (the default) runs a full OCR pass first and OCRs the page again if the text height
+        is outside the min/max band; "connected_components" measures the text on a binarized,
+        downsampled page before OCR so recognition runs once at the chosen zoom, falling back to
+        "ocr" when the page has too little text to measure
+        """
+        return self._get_string(
+            "TESSERACT_TEXT_HEIGHT_ESTIMATOR", TESSERACT_TEXT_HEIGHT_ESTIMATOR_OCR
+        )
+
     @property
     def TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD(self) -> int:
         """Tesseract predictions with confidence below this threshold are ignored"""
@@ -116,6 +141,24 @@ class ENVConfig:
         """Maximum number of OCR agents to cache per process"""
         return self._get_int("OCR_AGENT_CACHE_SIZE", 1)
 
+    @property
+    def OCR_RESULT_CACHE_SIZE(self) -> int:
+        """Maximum number of OCR results cached per process, keyed by the pixels of the OCR-ed
+        image; 0 disables the OCR result cache"""
+        return self._get_int("OCR_RESULT_CACHE_SIZE", 0)
+
+    @property
+    def OCR_RESULT_CACHE_DIR(self) -> str:
+        """Directory of an on-disk tier of the OCR result cache (see OCR_RESULT_CACHE_SIZE) that
+        can be shared by processes; empty keeps OCR results in process memory only"""
+        return self._get_string("OCR_RESULT_CACHE_DIR", "")
+
+    @property
+    def OCR_INDIVIDUAL_BLOCKS_BATCHED(self) -> bool:
+        """with `ocr_mode="individual_blocks"`, stitch the crops of the blocks of a page into one
+        image that is OCRed once instead of OCRing every block on its own"""
+        return self._get_bool("OCR_INDIVIDUAL_BLOCKS_BATCHED", False)
+
     @property
     def STT_AGENT_CACHE_SIZE(self) -> int:
         """Maximum number of speech-to-text agents to cache per process."""
@@ -177,6 +220,20 @@ class ENVConfig:
         """
         return self._get_int("EXTRACT_IMAGE_BLOCK_CROP_VERTICAL_PAD", 0)
 
+    @property
+    def EXTRACT_IMAGE_BLOCK_RENDER_DPI(self) -> int:
+        """DPI at which extracted image blocks (`Image`, `Table`) are rendered from a PDF; 0 uses
+        the DPI the page images were rendered at for layout detection
+        """
+        return self._get_int("EXTRACT_IMAGE_BLOCK_RENDER_DPI", 0)
+
+    @property
+    def EXTRACT_IMAGE_BLOCK_ENCODE_WORKERS(self) -> int:
+        """number of threads that encode extracted image blocks as JPEG (and base64 when they go
+        to the element payload)
+        """
+        return self._get_int("EXTRACT_IMAGE_BLOCK_ENCODE_WORKERS", 4)
+
     @property
     def EXTRACT_TABLE_AS_CELLS(self) -> bool:
         """adds `table_as_cells` to a Table element's metadata when it is True"""
@@ -310,6 +367,17 @@ class ENVConfig:
         """
         return self._get_float("PDF_CHAR_OVERLAP_RATIO_THRESHOLD", 0.5)
 
+    @property
+    def PARTITION_CACHE_DIR(self) -> str:
+        """Directory of the on-disk cache of `partition()` results; empty disables the cache"""
+        return self._get_string("PARTITION_CACHE_DIR", "")
+
+    @property
+    def PARTITION_CACHE_MAX_BYTES(self) -> int:
+        """Maximum total size of the `partition()` result cache entries in bytes; the least
+        recently used entries are evicted beyond it. 0 means no limit"""
+        return self._get_int("PARTITION_CACHE_MAX_BYTES", 10 * 1024**3)
+
     @property
     def PDF_RENDER_DPI(self) -> int:
         """The DPI to use for rendering PDF pages"""
@@ -320,5 +388,92 @@ class ENVConfig:
         """Maximum rendered pixels allowed for a single PDF page"""
         return self._get_int("PDF_RENDER_MAX_PIXELS_PER_PAGE", 1_000_000_000)
 
+    @property
+    def PDF_LAYOUT_RENDER_DPI(self) -> int:
+        """The DPI at which PDF pages are rendered for hi_res layout detection. When it is lower
+        than the page image DPI, only the regions that need OCR are rendered at the page image DPI;
+        0 renders everything at the page image DPI"""
+        return self._get_int("PDF_LAYOUT_RENDER_DPI", 0)
+
+    @property
+    def OCR_REGION_PAD(self) -> int:
+        """number of pixels added around the region of a page that is OCR-ed when PDF pages are
+        rendered at PDF_LAYOUT_RENDER_DPI for layout detection"""
+        return self._get_int("OCR_REGION_PAD", 20)
+
+    @property
+    def PDF_HI_RES_PAGES_PER_WORKER_TASK(self) -> int:
+        """Number of consecutive pages handed to a worker process at a time when hi_res
+        partitioning runs page-parallel (`pdf_hi_res_max_workers`)"""
+        return self._get_int("PDF_HI_RES_PAGES_PER_WORKER_TASK", 8)
+
+    @property
+    def PDF_HI_RES_CHECKPOINT_DIR(self) -> str:
+        """Directory where serial hi_res runs checkpoint the elements of every finished page, so
+        that a rerun of the same document and parameters resumes at the first unfinished page;
+        empty disables checkpointing"""
+        return self._get_string("PDF_HI_RES_CHECKPOINT_DIR", "")
+
+    @property
+    def PDF_HI_RES_CHECKPOINT_PAGES(self) -> int:
+        """Number of consecutive pages partitioned at a time between checkpoints of a hi_res run"""
+        return self._get_int("PDF_HI_RES_CHECKPOINT_PAGES", 1)
+
+    @property
+    def HI_RES_SKIP_BLANK_PAGES(self) -> bool:
+        """Whether hi_res partitioning skips layout detection and OCR of blank pages (see
+        BLANK_PAGE_MAX_INK_COVERAGE)"""
+        return self._get_bool("HI_RES_SKIP_BLANK_PAGES", False)
+
+    @property
+    def BLANK_PAGE_MAX_INK_COVERAGE(self) -> float:
+        """maximum fraction of the pixels of a page without embedded text, rendered at low
+        resolution, that may differ from the background for the page to be considered blank"""
+        return self._get_float("BLANK_PAGE_MAX_INK_COVERAGE", 0.001)
+
+    @property
+    def PAGE_IMAGE_MEMORY_BUDGET(self) -> int:
+        """Maximum bytes of rendered page images held in memory per document; pages over the
+        budget are spilled to temporary files. 0 means no limit"""
+        return self._get_int("PAGE_IMAGE_MEMORY_BUDGET", 0)
+
+    @property
+    def PAGE_IMAGE_MEMORY_LIMIT(self) -> int:
+        """Maximum bytes of rendered page images in flight across every document partitioned by
+        the process and its page-parallel workers; rendering waits until pages are released.
+        0 means no limit"""
+        return self._get_int("PAGE_IMAGE_MEMORY_LIMIT", 0)
+
+    @property
+    def PDF_PAGE_ROUTING_MIN_TEXT_QUALITY(self) -> float:
+        """minimum embedded text quality score (0-1) for a page to be partitioned with the fast
+        strategy when `pdf_page_routing` is on; lower scoring pages go through layout and OCR"""
+        return self._get_float("PDF_PAGE_ROUTING_MIN_TEXT_QUALITY", 0.9)
+
+    @property
+    def PDF_PAGE_ROUTING_MAX_IMAGE_COVERAGE(self) -> float:
+        """fraction of a page covered by images above which the page is scored as a scan when its
+        text covers less than PDF_PAGE_ROUTING_MIN_TEXT_COVERAGE of the page"""
+        return self._get_float("PDF_PAGE_ROUTING_MAX_IMAGE_COVERAGE", 0.5)
+
+    @property
+    def PDF_PAGE_ROUTING_MIN_TEXT_COVERAGE(self) -> float:
+        """fraction of a page that text must cover for an image-dominated page to keep its full
+        text quality score"""
+        return self._get_float("PDF_PAGE_ROUTING_MIN_TEXT_COVERAGE", 0.05)
+
+    @property
+    def BBOX_SPATIAL_INDEX_MIN_PAIRS(self) -> int:
+        """number of box pairs from which bounding box containment and IoU between two groups of
+        boxes only test the pairs a spatial index finds intersecting instead of all pairs; 0 always
+        tests all pairs"""
+        return self._get_int("BBOX_SPATIAL_INDEX_MIN_PAIRS", 250_000)
+
+    @property
+    def XY_CUT_MAX_DEPTH(self) -> int:
+        """number of nested cuts after which the XY-cut reading order sort orders the remaining
+        region line by line instead of cutting it further"""
+        return self._get_int("XY_CUT_MAX_DEPTH", 500)
+
 
 env_config = ENVConfig()
@@ -29,6 +29,7 @@ OCR_AGENT_TESSERACT_OLD = "tesseract"
 OCR_AGENT_PADDLE_OLD = "paddle"
 
 OCR_AGENT_TESSERACT = "unstructured.partition.utils.ocr_models.tesseract_ocr.OCRAgentTesseract"
+OCR_AGENT_TESSEROCR = "unstructured.partition.utils.ocr_models.tesserocr_ocr.OCRAgentTesserocr"
 OCR_AGENT_PADDLE = "unstructured.partition.utils.ocr_models.paddle_ocr.OCRAgentPaddle"
 OCR_AGENT_GOOGLEVISION = (
     "unstructured.partition.utils.ocr_models.google_vision_ocr.OCRAgentGoogleVision"
@@ -37,6 +38,7 @@ OCR_AGENT_GOOGLEVISION = (
 OCR_AGENT_MODULES_WHITELIST = os.getenv(
     "OCR_AGENT_MODULES_WHITELIST",
     "unstructured.partition.utils.ocr_models.tesseract_ocr,"
+    "unstructured.partition.utils.ocr_models.tesserocr_ocr,"
     "unstructured.partition.utils.ocr_models.paddle_ocr,"
     "unstructured.partition.utils.ocr_models.google_vision_ocr",
 ).split(",")
@@ -213,4 +215,8 @@ TESSERACT_MAX_SIZE = 2147483647
 # default image colors
 IMAGE_COLOR_DEPTH = 32
 
+# ways to estimate the page text height that picks the tesseract zoom
+TESSERACT_TEXT_HEIGHT_ESTIMATOR_OCR = "ocr"
+TESSERACT_TEXT_HEIGHT_ESTIMATOR_CONNECTED_COMPONENTS = "connected_components"
+
 HTML_MAX_PREDECESSOR_LEN = 15
@@ -9,6 +9,7 @@ from unstructured.logger import logger, trace_logger
 from unstructured.partition.utils.config import env_config
 from unstructured.partition.utils.constants import Source
 from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.partition.utils.ocr_models.ocr_result_cache import cache_ocr_result
 
 if TYPE_CHECKING:
     from PIL import Image as PILImage
@@ -33,6 +34,7 @@ class OCRAgentGoogleVision(OCRAgent):
     def is_text_sorted(self) -> bool:
         return True
 
+    @cache_ocr_result
     def get_text_from_image(self, image: PILImage.Image) -> str:
         image_context = ImageContext(language_hints=[self.language]) if self.language else None
         with BytesIO() as buffer:
@@ -44,6 +46,7 @@ class OCRAgentGoogleVision(OCRAgent):
         assert isinstance(document, TextAnnotation)
         return document.text
 
+    @cache_ocr_result
     def get_layout_from_image(self, image: PILImage.Image) -> TextRegions:
         trace_logger.detail("Processing entire page OCR with Google Vision API...")
         image_context = ImageContext(language_hints=[self.language]) if self.language else None
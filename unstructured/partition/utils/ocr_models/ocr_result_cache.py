@@ -0,0 +1,208 @@
+"""Cache of OCR results keyed by the pixels of the OCR-ed image.
+
+Scanned documents repeat pixel-identical pages and regions (cover sheets, letterheads, fax headers,
+blank separators), and every one of them is OCR-ed from scratch. OCR agent methods decorated with
+`cache_ocr_result` look their result up here first, keyed by the SHA-256 of the image pixels, the
+agent class and language and the `unstructured` environment settings that may change the output.
+
+The cache is off by default. With `OCR_RESULT_CACHE_SIZE` set, results are kept in an in-process LRU
+of that many entries. When `OCR_RESULT_CACHE_DIR` is also set, they are written to that directory
+too, so worker processes share them. Its entries are pickles, so point it only at a directory that
+no untrusted party can write to.
+"""
+
+from __future__ import annotations
+
+import copy
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Optional, TypeVar
+
+from unstructured.logger import logger, trace_logger
+from unstructured.partition.utils.config import env_config
+
+if TYPE_CHECKING:
+    from PIL import Image as PILImage
+
+_A = TypeVar("_A")
+_T = TypeVar("_T")
+
+
+class OCRResultCache:
+    """An LRU cache of at most `max_entries` OCR results, backed by `cache_dir` when it is set.
+
+    `hits` (of which `disk_hits` were read from `cache_dir`) and `misses` count lookups, and
+    `time_saved` sums the OCR time, in seconds, that the hits originally took.
+    """
+
+    def __init__(self, max_entries: int, cache_dir: str = ""):
+        self.max_entries = max_entries
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.time_saved = 0.0
+        self._entries: OrderedDict[str, tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+
+    def stats(self) -> dict[str, float]:
+        """The lookup counts, hit rate and OCR time saved (in seconds) of this cache."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "time_saved_s": self.time_saved,
+        }
+
+    def log_stats(self, since: Optional[dict[str, float]] = None) -> None:
+        """Log the lookups of this cache since `since`, an earlier result of `stats()`, or since
+        it was created; nothing is logged when there were none."""
+        stats = self.stats()
+        since = since or {}
+        hits, disk_hits, misses, time_saved = (
+            stats[name] - since.get(name, 0)
+            for name in ("hits", "disk_hits", "misses", "time_saved_s")
+        )
+        if hits + misses:
+            logger.info(
+                f"OCR result cache: {hits} hits ({disk_hits} from disk), {misses} misses, "
+                f"saved {time_saved:.2f}s of OCR."
+            )
+
+    def get_or_compute(self, key: str, compute: Callable[[], _T]) -> _T:
+        """The result cached under `key`, or the result of `compute()`, which is then cached.
+
+        Callers get their own copy of a cached result, so they are free to modify it.
+        """
+        entry = self._get(key)
+        if entry is not None:
+            result, elapsed = entry
+            with self._lock:
+                self.hits += 1
+                self.time_saved += elapsed
+            trace_logger.detail(f"OCR result cache hit, saved {elapsed:.2f}s of OCR")
+            return copy.deepcopy(result)
+
+        start = time.perf_counter()
+        result = compute()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.misses += 1
+        self._put(key, copy.deepcopy(result), elapsed)
+        return result
+
+    def _get(self, key: str) -> Optional[tuple[Any, float]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if not self.cache_dir:
+            return None
+
+        try:
+            with open(self._entry_path(key), "rb") as f:
+                entry = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            logger.warning(f"Ignoring unreadable OCR result cache entry for {key}", exc_info=True)
+            return None
+        with self._lock:
+            self.disk_hits += 1
+        self._remember(key, entry)
+        return entry
+
+    def _put(self, key: str, result: Any, elapsed: float) -> None:
+        self._remember(key, (result, elapsed))
+        if not self.cache_dir:
+            return
+
+        tmp_path = ""
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self.cache_dir, prefix=".tmp-", suffix=".pkl", delete=False
+            ) as f:
+                tmp_path = f.name
+                pickle.dump((result, elapsed), f)
+            os.replace(tmp_path, self._entry_path(key))
+        except Exception:
+            logger.warning(f"Could not write OCR result cache entry for {key}", exc_info=True)
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _remember(self, key: str, entry: tuple[Any, float]) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + ".pkl")
+
+
+@functools.lru_cache(maxsize=None)
+def _ocr_result_cache(max_entries: int, cache_dir: str) -> OCRResultCache:
+    return OCRResultCache(max_entries, cache_dir)
+
+
+def get_ocr_result_cache() -> Optional[OCRResultCache]:
+    """The process-wide OCR result cache configured by the environment, or None when it is
+    disabled (`OCR_RESULT_CACHE_SIZE=0`)."""
+    max_entries = env_config.OCR_RESULT_CACHE_SIZE
+    if max_entries <= 0:
+        return None
+    return _ocr_result_cache(max_entries, env_config.OCR_RESULT_CACHE_DIR)
+
+
+def cache_ocr_result(
+    method: Callable[[_A, PILImage.Image], _T],
+) -> Callable[[_A, PILImage.Image], _T]:
+    """Decorate an OCR agent method taking an image to reuse its results through the OCR result
+    cache."""
+
+    @functools.wraps(method)
+    def wrapper(self: _A, image: PILImage.Image) -> _T:
+        cache = get_ocr_result_cache()
+        if cache is None:
+            return method(self, image)
+        key = ocr_result_key(self, method.__name__, image)
+        return cache.get_or_compute(key, lambda: method(self, image))
+
+    return wrapper
+
+
+def ocr_result_key(agent: object, method: str, image: PILImage.Image) -> str:
+    """The cache key of calling `method` of OCR `agent` on `image`."""
+    digest = hashlib.sha256()
+    agent_cls = type(agent)
+    settings = {
+        name: value
+        for name, value in sorted(env_config.settings_from_environment().items())
+        if not name.startswith("OCR_RESULT_CACHE_")
+    }
+    digest.update(
+        repr(
+            (
+                f"{agent_cls.__module__}.{agent_cls.__qualname__}",
+                getattr(agent, "language", None),
+                method,
+                settings,
+                image.mode,
+                image.size,
+            )
+        ).encode()
+    )
+    digest.update(image.tobytes())
+    return digest.hexdigest()
@@ -9,6 +9,7 @@ from unstructured.documents.elements import ElementType
 from unstructured.logger import logger, trace_logger
 from unstructured.partition.utils.constants import Source
 from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.partition.utils.ocr_models.ocr_result_cache import cache_ocr_result
 from unstructured.utils import requires_dependencies
 
 if TYPE_CHECKING:
@@ -20,6 +21,7 @@ class OCRAgentPaddle(OCRAgent):
     """OCR service implementation for PaddleOCR."""
 
     def __init__(self, language: str = "en"):
+        self.language = language
         self.agent = self.load_agent(language)
 
     def load_agent(self, language: str):
@@ -68,6 +70,7 @@ class OCRAgentPaddle(OCRAgent):
     def is_text_sorted(self):
         return False
 
+    @cache_ocr_result
     def get_layout_from_image(self, image: PILImage.Image) -> TextRegions:
         """Get the OCR regions from image as a list of text regions with paddle."""
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import os
 import re
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 import cv2
 import numpy as np
@@ -17,9 +17,11 @@ from unstructured.partition.utils.constants import (
     IMAGE_COLOR_DEPTH,
     TESSERACT_MAX_SIZE,
     TESSERACT_TEXT_HEIGHT,
+    TESSERACT_TEXT_HEIGHT_ESTIMATOR_CONNECTED_COMPONENTS,
     Source,
 )
 from unstructured.partition.utils.ocr_models.ocr_interface import OCRAgent
+from unstructured.partition.utils.ocr_models.ocr_result_cache import cache_ocr_result
 from unstructured.utils import requires_dependencies
 
 if TYPE_CHECKING:
@@ -28,6 +30,11 @@ if TYPE_CHECKING:
 
 _RE_X_CONF = re.compile(r"x_conf (\d+\.\d+)")
 
+# -- the text height estimator measures the page at most this many pixels on its longest side --
+_TEXT_HEIGHT_ESTIMATE_MAX_SIDE = 1600
+# -- and needs at least this many glyph-like connected components to trust its estimate --
+_TEXT_HEIGHT_ESTIMATE_MIN_COMPONENTS = 20
+
 # -- force tesseract to be single threaded, otherwise we see major performance problems --
 if "OMP_THREAD_LIMIT" not in os.environ:
     os.environ["OMP_THREAD_LIMIT"] = "1"
@@ -44,53 +51,54 @@ class OCRAgentTesseract(OCRAgent):
     def is_text_sorted(self):
         return True
 
+    @cache_ocr_result
     def get_text_from_image(self, image: PILImage.Image) -> str:
         return unstructured_pytesseract.image_to_string(np.array(image), lang=self.language)
 
+    @cache_ocr_result
     def get_layout_from_image(self, image: PILImage.Image) -> TextRegions:
         """Get the OCR regions from image as a list of text regions with tesseract."""
 
         trace_logger.detail("Processing entire page OCR with tesseract...")
-        zoom = 1
-        ocr_df: pd.DataFrame = self.image_to_data_with_character_confidence_filter(
-            np.array(image),
-            lang=self.language,
-            character_confidence_threshold=env_config.TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD,
-        )
-        ocr_df = ocr_df.dropna()
 
         # tesseract performance degrades when the text height is out of the preferred zone so we
         # zoom the image (in or out depending on estimated text height) for optimum OCR results
         # but this needs to be evaluated based on actual use case as the optimum scaling also
         # depend on type of characters (font, language, etc); be careful about this
         # functionality
-        text_height = ocr_df[TESSERACT_TEXT_HEIGHT].quantile(
-            env_config.TESSERACT_TEXT_HEIGHT_QUANTILE
-        )
+        text_height = None
         if (
-            text_height < env_config.TESSERACT_MIN_TEXT_HEIGHT
-            or text_height > env_config.TESSERACT_MAX_TEXT_HEIGHT
+            env_config.TESSERACT_TEXT_HEIGHT_ESTIMATOR
+            == TESSERACT_TEXT_HEIGHT_ESTIMATOR_CONNECTED_COMPONENTS
         ):
-            max_zoom = max(
-                0,
-                np.round(np.sqrt(TESSERACT_MAX_SIZE / np.prod(image.size) / IMAGE_COLOR_DEPTH), 1),
-            )
-            # rounding avoids unnecessary precision and potential numerical issues associated
-            # with numbers very close to 1 inside cv2 image processing
-            zoom = min(
-                np.round(env_config.TESSERACT_OPTIMUM_TEXT_HEIGHT / text_height, 1),
-                max_zoom,
+            text_height = estimate_text_height(
+                image, quantile=env_config.TESSERACT_TEXT_HEIGHT_QUANTILE
             )
-            ocr_df = self.image_to_data_with_character_confidence_filter(
-                np.array(zoom_image(image, zoom)),
-                lang=self.language,
-                character_confidence_threshold=env_config.TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD,
+
+        if text_height is not None:
+            # -- the zoom is known up front so recognition runs once --
+            zoom = get_zoom_for_text_height(image, text_height)
+            ocr_df = self._ocr_zoomed_image(image, zoom)
+        else:
+            ocr_df = self._ocr_zoomed_image(image, 1)
+            text_height = ocr_df[TESSERACT_TEXT_HEIGHT].quantile(
+                env_config.TESSERACT_TEXT_HEIGHT_QUANTILE
             )
-            ocr_df = ocr_df.dropna()
+            zoom = get_zoom_for_text_height(image, text_height)
+            if zoom != 1:
+                ocr_df = self._ocr_zoomed_image(image, zoom)
         ocr_regions = self.parse_data(ocr_df, zoom=zoom)
 
         return ocr_regions
 
+    def _ocr_zoomed_image(self, image: PILImage.Image, zoom: float) -> pd.DataFrame:
+        ocr_df = self.image_to_data_with_character_confidence_filter(
+            np.array(zoom_image(image, zoom) if zoom != 1 else image),
+            lang=self.language,
+            character_confidence_threshold=env_config.TESSERACT_CHARACTER_CONFIDENCE_THRESHOLD,
+        )
+        return ocr_df.dropna()
+
     def image_to_data_with_character_confidence_filter(
         self,
         image: np.ndarray,
@@ -241,6 +249,70 @@ class OCRAgentTesseract(OCRAgent):
         )
 
 
+def get_zoom_for_text_height(image: PILImage.Image, text_height: float) -> float:
+    """zoom factor that brings `text_height` to the optimum tesseract text height; 1 when the text
+    height is already inside the [TESSERACT_MIN_TEXT_HEIGHT, TESSERACT_MAX_TEXT_HEIGHT] band"""
+    if not (
+        text_height < env_config.TESSERACT_MIN_TEXT_HEIGHT
+        or text_height > env_config.TESSERACT_MAX_TEXT_HEIGHT
+    ):
+        return 1
+    max_zoom = max(
+        0,
+        np.round(np.sqrt(TESSERACT_MAX_SIZE / np.prod(image.size) / IMAGE_COLOR_DEPTH), 1),
+    )
+    # rounding avoids unnecessary precision and potential numerical issues associated
+    # with numbers very close to 1 inside cv2 image processing
+    return min(
+        np.round(env_config.TESSERACT_OPTIMUM_TEXT_HEIGHT / text_height, 1),
+        max_zoom,
+    )
+
+
+def estimate_text_height(image: PILImage.Image, quantile: float = 0.5) -> Optional[float]:
+    """estimate the height of the words on a page, in pixels of `image`, without running OCR
+
+    The page is downsampled, binarized with Otsu's threshold and split into connected components.
+    Glyph-sized components give the typical character height, which sets how far glyphs are
+    smeared horizontally so that the letters of a word join into one component. The `quantile`
+    of those word heights approximates the word-box heights tesseract reports. Returns None when
+    the page has too little text to measure, in which case the caller should fall back to OCR.
+    """
+    gray = np.array(image.convert("L"))
+    scale = min(1.0, _TEXT_HEIGHT_ESTIMATE_MAX_SIDE / max(gray.shape))
+    if scale < 1:
+        gray = cv2.resize(gray, None, fx=scale, fy=scale, interpolation=cv2.INTER_AREA)
+    _, binary = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY_INV + cv2.THRESH_OTSU)
+
+    page_height = binary.shape[0]
+    _, _, stats, _ = cv2.connectedComponentsWithStats(binary, connectivity=8)
+    widths = stats[1:, cv2.CC_STAT_WIDTH]
+    heights = stats[1:, cv2.CC_STAT_HEIGHT]
+    fill_ratios = stats[1:, cv2.CC_STAT_AREA] / np.maximum(widths * heights, 1)
+    # -- glyphs: at least 2px tall, not page-scale, not rules or lines, neither hollow nor solid --
+    is_glyph = (
+        (heights >= 2)
+        & (heights <= page_height * 0.1)
+        & (widths <= heights * 4)
+        & (fill_ratios > 0.1)
+        & (fill_ratios < 0.95)
+    )
+    if is_glyph.sum() < _TEXT_HEIGHT_ESTIMATE_MIN_COMPONENTS:
+        return None
+    glyph_height = float(np.median(heights[is_glyph]))
+
+    smear = max(1, int(round(glyph_height * 0.6)))
+    words = cv2.dilate(binary, np.ones((1, smear), np.uint8))
+    _, _, stats, _ = cv2.connectedComponentsWithStats(words, connectivity=8)
+    word_heights = stats[1:, cv2.CC_STAT_HEIGHT]
+    word_heights = word_heights[
+        (word_heights >= glyph_height * 0.5) & (word_heights <= glyph_height * 3)
+    ]
+    if len(word_heights) < _TEXT_HEIGHT_ESTIMATE_MIN_COMPONENTS:
+        return None
+    return float(np.quantile(word_heights, quantile)) / scale
+
+
 def zoom_image(image: PILImage.Image, zoom: float = 1) -> PILImage.Image:
     """scale an image based on the zoom factor using cv2; the scaled image is post processed by
     dilation then erosion to improve edge sharpness for OCR tasks"""
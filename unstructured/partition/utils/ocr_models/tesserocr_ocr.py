@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import queue
+import shlex
+import threading
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator
+
+import numpy as np
+import pandas as pd
+from PIL import Image as PILImage
+
+from unstructured.logger import logger
+from unstructured.partition.utils.ocr_models.ocr_result_cache import cache_ocr_result
+from unstructured.partition.utils.ocr_models.tesseract_ocr import OCRAgentTesseract
+from unstructured.utils import requires_dependencies
+
+if TYPE_CHECKING:
+    from tesserocr import PyTessBaseAPI
+
+
+class OCRAgentTesserocr(OCRAgentTesseract):
+    """OCR service implementation for Tesseract that keeps engine handles loaded in-process.
+
+    `OCRAgentTesseract` runs every call through `unstructured_pytesseract`, which spawns a
+    `tesseract` process, writes the image to a temporary file and loads the language model again.
+    This agent calls the Tesseract C API through `tesserocr` instead: each engine handle loads the
+    traineddata of its language once and is reused for every page, table crop and text block.
+
+    A handle can only run one recognition at a time, so handles are checked out of a per-language
+    pool for each call; concurrent callers get their own handle and the pool grows to the peak
+    number of concurrent calls. The output (hOCR parsing, confidence filtering, zoom selection) is
+    the same as `OCRAgentTesseract`.
+    """
+
+    def __init__(self, language: str = "eng"):
+        super().__init__(language)
+        self._pools: dict[str, queue.LifoQueue[PyTessBaseAPI]] = {}
+        self._pools_lock = threading.Lock()
+
+    @cache_ocr_result
+    def get_text_from_image(self, image: PILImage.Image) -> str:
+        with self._engine(self.language) as api:
+            api.SetImage(image)
+            return api.GetUTF8Text()
+
+    def image_to_data_with_character_confidence_filter(
+        self,
+        image: np.ndarray,
+        lang: str = "eng",
+        config: str = "",
+        character_confidence_threshold: float = 0.0,
+    ) -> pd.DataFrame:
+        with self._engine(lang) as api, _engine_config(api, config + " -c hocr_char_boxes=1"):
+            api.SetImage(PILImage.fromarray(image))
+            hocr_page = api.GetHOCRText(0)
+
+        # NOTE: the C API returns only the page <div>; wrap it in a document carrying the XHTML
+        # namespace the hOCR parser looks words up with, like the `tesseract` CLI output does
+        hocr = (
+            f'<html xmlns="{self.hocr_namespace["h"]}"><body>{hocr_page}</body></html>'
+            if hocr_page
+            else ""
+        )
+        return self.hocr_to_dataframe(hocr, character_confidence_threshold)
+
+    @contextmanager
+    def _engine(self, lang: str) -> Iterator[PyTessBaseAPI]:
+        """Check an engine handle for `lang` out of the pool for the duration of one call."""
+        with self._pools_lock:
+            pool = self._pools.setdefault(lang, queue.LifoQueue())
+        try:
+            api = pool.get_nowait()
+        except queue.Empty:
+            api = _load_engine(lang)
+        try:
+            yield api
+        finally:
+            api.Clear()
+            pool.put(api)
+
+
+@requires_dependencies("tesserocr", extras="tesserocr")
+def _load_engine(lang: str) -> PyTessBaseAPI:
+    from tesserocr import PyTessBaseAPI
+
+    logger.info(f"Loading tesseract engine in-process for language={lang}...")
+    return PyTessBaseAPI(lang=lang)
+
+
+@contextmanager
+def _engine_config(api: PyTessBaseAPI, config: str) -> Iterator[None]:
+    """Apply tesseract CLI style `config` (`--psm N` and `-c name=value`) to `api` for one call
+    and restore the previous settings afterwards, since the handle is shared between calls."""
+    args = shlex.split(config)
+    previous_variables: dict[str, Any] = {}
+    previous_psm = api.GetPageSegMode()
+    try:
+        for flag, value in zip(args[::2], args[1::2]):
+            if flag == "-c":
+                name, _, variable_value = value.partition("=")
+                previous_variables.setdefault(name, api.GetVariableAsString(name))
+                api.SetVariable(name, variable_value)
+            elif flag == "--psm":
+                api.SetPageSegMode(int(value))
+            else:
+                raise ValueError(f"Unsupported tesseract config option for tesserocr: {flag}")
+        yield
+    finally:
+        for name, variable_value in previous_variables.items():
+            if variable_value is not None:
+                api.SetVariable(name, variable_value)
+        api.SetPageSegMode(previous_psm)
@@ -1,8 +1,11 @@
-from typing import List
+from __future__ import annotations
+
+from typing import Callable, Iterator, List, Optional, Sequence
 
 import numpy as np
 from numba import njit
 
+from unstructured.partition.utils.config import env_config
 from unstructured.utils import requires_dependencies
 
 """
@@ -93,123 +96,188 @@ def split_projection_profile(arr_values: np.ndarray, min_value: float, min_gap:
     return arr_start, arr_end
 
 
-def recursive_xy_cut(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
-    """
-
-    Args:
-        boxes: (N, 4)
-        indices: during the recursion process, the index of box in the original data
-         is always represented.
-        res: save output
+def split_boxes_along_axis(
+    sorted_boxes: np.ndarray, axis: int
+) -> Optional[tuple[np.ndarray, np.ndarray]]:
+    """Split boxes sorted by their start along `axis` at the gaps of their projection profile.
 
+    Returns the same start and end indexes as
+    `split_projection_profile(projection_by_bboxes(sorted_boxes, axis), 0, 1)` (`None` when no box
+    covers a pixel), but sweeps the box intervals instead of building a per-pixel histogram: boxes
+    sorted by start belong to the same group as long as they start at or before the furthest end
+    seen so far. The cost no longer grows with the page size in pixels.
     """
-    # project to the y-axis
-    assert len(boxes) == len(indices)
-
-    _indices = boxes[:, 1].argsort()
-    y_sorted_boxes = boxes[_indices]
-    y_sorted_indices = indices[_indices]
-
-    # debug_vis(y_sorted_boxes, y_sorted_indices)
+    starts = sorted_boxes[:, axis]
+    ends = sorted_boxes[:, axis + 2]
+    if len(starts) and starts[0] < 0:
+        # -- negative coordinates index the histogram from its end; keep that behavior --
+        return split_projection_profile(projection_by_bboxes(sorted_boxes, axis), 0, 1)
+
+    # -- boxes without extent along the axis cover no pixel of the profile --
+    non_empty = ends > starts
+    starts, ends = starts[non_empty], ends[non_empty]
+    if not len(starts):
+        return None
 
-    y_projection = projection_by_bboxes(boxes=y_sorted_boxes, axis=1)
-    pos_y = split_projection_profile(y_projection, 0, 1)
-    if not pos_y:
-        return
+    furthest_ends = np.maximum.accumulate(ends)
+    is_group_start = np.empty(len(starts), dtype=bool)
+    is_group_start[0] = True
+    is_group_start[1:] = starts[1:] > furthest_ends[:-1]
+    is_group_end = np.empty(len(starts), dtype=bool)
+    is_group_end[:-1] = is_group_start[1:]
+    is_group_end[-1] = True
+    return starts[is_group_start], furthest_ends[is_group_end]
 
-    arr_y0, arr_y1 = pos_y
-    for r0, r1 in zip(arr_y0, arr_y1):
-        # [r0, r1] means that the areas with bbox will be divided horizontally, and these areas
-        # will be divided vertically.
-        _indices = (r0 <= y_sorted_boxes[:, 1]) & (y_sorted_boxes[:, 1] < r1)
 
-        y_sorted_boxes_chunk = y_sorted_boxes[_indices]
-        y_sorted_indices_chunk = y_sorted_indices[_indices]
+def sweep_line_order(boxes: np.ndarray, indices: np.ndarray) -> list[int]:
+    """Order boxes line by line: boxes sorted by top are grouped into lines while they overlap the
+    vertical extent of the line so far, and each line is read left to right.
 
-        _indices = y_sorted_boxes_chunk[:, 0].argsort()
-        x_sorted_boxes_chunk = y_sorted_boxes_chunk[_indices]
-        x_sorted_indices_chunk = y_sorted_indices_chunk[_indices]
+    This is the default fallback of the XY-cut functions for regions nested deeper than their
+    `max_depth`.
+    """
+    if not len(boxes):
+        return []
+    order = np.argsort(boxes[:, 1], kind="stable")
+    tops = boxes[order, 1]
+    line_bottoms = np.maximum.accumulate(boxes[order, 3])
+    line_ids = np.zeros(len(order), dtype=np.int64)
+    line_ids[1:] = np.cumsum(tops[1:] >= line_bottoms[:-1])
+    order = order[np.lexsort((boxes[order, 0], line_ids))]
+    return list(indices[order])
+
+
+def _xy_cut(
+    boxes: np.ndarray,
+    indices: np.ndarray,
+    res: List[int],
+    first_axis: int,
+    max_depth: Optional[int],
+    fallback: Optional[Callable[[np.ndarray, np.ndarray], Sequence[int]]],
+):
+    """XY-cut with an explicit stack: split `boxes` along `first_axis`, split each of those groups
+    along the other axis, and cut again each group that splits in more than one part.
+
+    Visits the groups in the same order as a depth-first recursion would, so the output matches
+    the recursive algorithm from https://github.com/Sanster/xy-cut. Groups nested more than
+    `max_depth` cuts deep (env_config.XY_CUT_MAX_DEPTH by default) are ordered by `fallback`
+    (`sweep_line_order` by default) instead of being cut further.
+    """
+    assert len(boxes) == len(indices)
+    if max_depth is None:
+        max_depth = env_config.XY_CUT_MAX_DEPTH
+    if fallback is None:
+        fallback = sweep_line_order
+    second_axis = 1 - first_axis
+
+    # -- each item is either a group to cut with its depth, or a run of ordered indices --
+    stack: list[tuple[np.ndarray, np.ndarray, int] | np.ndarray | Sequence[int]] = [
+        (boxes, indices, 0)
+    ]
+    while stack:
+        item = stack.pop()
+        if not isinstance(item, tuple):
+            res.extend(item)
+            continue
 
-        # project in the x direction
-        x_projection = projection_by_bboxes(boxes=x_sorted_boxes_chunk, axis=0)
-        pos_x = split_projection_profile(x_projection, 0, 1)
-        if not pos_x:
+        boxes, indices, depth = item
+        if depth > max_depth:
+            res.extend(fallback(boxes, indices))
             continue
 
-        arr_x0, arr_x1 = pos_x
-        if len(arr_x0) == 1:
-            # x-direction cannot be divided
-            res.extend(x_sorted_indices_chunk)
+        _indices = boxes[:, first_axis].argsort()
+        sorted_boxes = boxes[_indices]
+        sorted_indices = indices[_indices]
+        groups = split_boxes_along_axis(sorted_boxes, first_axis)
+        if groups is None:
             continue
 
-        # can be separated in the x-direction and continue to call recursively
-        for c0, c1 in zip(arr_x0, arr_x1):
-            _indices = (c0 <= x_sorted_boxes_chunk[:, 0]) & (x_sorted_boxes_chunk[:, 0] < c1)
-            recursive_xy_cut(
-                x_sorted_boxes_chunk[_indices],
-                x_sorted_indices_chunk[_indices],
-                res,
-            )
+        # -- boxes are sorted by their start, so the boxes starting in a group are contiguous --
+        items: list[tuple[np.ndarray, np.ndarray, int] | np.ndarray] = []
+        for lo, hi in _group_slices(sorted_boxes[:, first_axis], groups):
+            boxes_chunk = sorted_boxes[lo:hi]
+            indices_chunk = sorted_indices[lo:hi]
+
+            _indices = boxes_chunk[:, second_axis].argsort()
+            boxes_chunk = boxes_chunk[_indices]
+            indices_chunk = indices_chunk[_indices]
+            sub_groups = split_boxes_along_axis(boxes_chunk, second_axis)
+            if sub_groups is None:
+                continue
+            if len(sub_groups[0]) == 1:
+                # -- the group cannot be divided along the second axis --
+                items.append(indices_chunk)
+                continue
+
+            for sub_lo, sub_hi in _group_slices(boxes_chunk[:, second_axis], sub_groups):
+                if sub_hi - sub_lo == 1 and _covers_a_pixel(boxes_chunk[sub_lo]):
+                    # -- a single box is its own reading order; skip cutting it --
+                    items.append(indices_chunk[sub_lo:sub_hi])
+                    continue
+                items.append((boxes_chunk[sub_lo:sub_hi], indices_chunk[sub_lo:sub_hi], depth + 1))
+
+        stack.extend(reversed(items))
+
+
+def _covers_a_pixel(box: np.ndarray) -> bool:
+    """Whether `box` has extent along both axes and non-negative coordinates."""
+    x1, y1, x2, y2 = box
+    return 0 <= x1 < x2 and 0 <= y1 < y2
+
+
+def _group_slices(
+    sorted_starts: np.ndarray, groups: tuple[np.ndarray, np.ndarray]
+) -> Iterator[tuple[int, int]]:
+    """Yield the `[lo, hi)` slice of the boxes starting in each `[start, end)` group."""
+    group_starts, group_ends = groups
+    los = np.searchsorted(sorted_starts, group_starts, side="left")
+    his = np.searchsorted(sorted_starts, group_ends, side="left")
+    yield from zip(los.tolist(), his.tolist())
+
+
+def recursive_xy_cut(
+    boxes: np.ndarray,
+    indices: np.ndarray,
+    res: List[int],
+    max_depth: Optional[int] = None,
+    fallback: Optional[Callable[[np.ndarray, np.ndarray], Sequence[int]]] = None,
+):
+    """
 
+    Args:
+        boxes: (N, 4)
+        indices: the index of each box in the original data
+        res: save output
+        max_depth: number of nested cuts after which a region is ordered by `fallback`;
+         env_config.XY_CUT_MAX_DEPTH by default
+        fallback: orders `(boxes, indices)` of a region nested deeper than `max_depth`;
+         `sweep_line_order` by default
 
-def recursive_xy_cut_swapped(boxes: np.ndarray, indices: np.ndarray, res: List[int]):
+    """
+    # first project to the y-axis, then split each horizontal band in the x direction
+    _xy_cut(boxes, indices, res, first_axis=1, max_depth=max_depth, fallback=fallback)
+
+
+def recursive_xy_cut_swapped(
+    boxes: np.ndarray,
+    indices: np.ndarray,
+    res: List[int],
+    max_depth: Optional[int] = None,
+    fallback: Optional[Callable[[np.ndarray, np.ndarray], Sequence[int]]] = None,
+):
     """
     Args:
         boxes: (N, 4) - Numpy array representing bounding boxes with shape (N, 4)
         where each row is (left, top, right, bottom)
         indices: An array representing indices that correspond to boxes in the original data
         res: A list to save the output results
+        max_depth: Number of nested cuts after which a region is ordered by `fallback`;
+        env_config.XY_CUT_MAX_DEPTH by default
+        fallback: Orders `(boxes, indices)` of a region nested deeper than `max_depth`;
+        `sweep_line_order` by default
     """
-
-    # Sort the bounding boxes based on x-coordinates (flipped)
-    assert len(boxes) == len(indices)
-    _indices = boxes[:, 0].argsort()
-    x_sorted_boxes = boxes[_indices]
-    x_sorted_indices = indices[_indices]
-
-    # Project the boxes onto the x-axis and split the projection profile
-    x_projection = projection_by_bboxes(boxes=x_sorted_boxes, axis=0)
-    pos_x = split_projection_profile(x_projection, 0, 1)
-
-    if not pos_x:
-        return
-
-    arr_x0, arr_x1 = pos_x
-
-    # Loop over the segments obtained from the x-axis projection
-    for c0, c1 in zip(arr_x0, arr_x1):
-        # Obtain sub-boxes in the x-axis segment
-        _indices = (c0 <= x_sorted_boxes[:, 0]) & (x_sorted_boxes[:, 0] < c1)
-        x_sorted_boxes_chunk = x_sorted_boxes[_indices]
-        x_sorted_indices_chunk = x_sorted_indices[_indices]
-
-        # Sort the sub-boxes based on y-coordinates (flipped)
-        _indices = x_sorted_boxes_chunk[:, 1].argsort()
-        y_sorted_boxes_chunk = x_sorted_boxes_chunk[_indices]
-        y_sorted_indices_chunk = x_sorted_indices_chunk[_indices]
-
-        # Project the sub-boxes onto the y-axis and split the projection profile
-        y_projection = projection_by_bboxes(boxes=y_sorted_boxes_chunk, axis=1)
-        pos_y = split_projection_profile(y_projection, 0, 1)
-
-        if not pos_y:
-            continue
-
-        arr_y0, arr_y1 = pos_y
-
-        if len(arr_y0) == 1:
-            # If there's no splitting along the y-axis, add the indices to the result
-            res.extend(y_sorted_indices_chunk)
-            continue
-
-        # Recursive call for sub-boxes along the y-axis segments
-        for r0, r1 in zip(arr_y0, arr_y1):
-            _indices = (r0 <= y_sorted_boxes_chunk[:, 1]) & (y_sorted_boxes_chunk[:, 1] < r1)
-            recursive_xy_cut_swapped(
-                y_sorted_boxes_chunk[_indices],
-                y_sorted_indices_chunk[_indices],
-                res,
-            )
+    # first project to the x-axis, then split each vertical band in the y direction
+    _xy_cut(boxes, indices, res, first_axis=0, max_depth=max_depth, fallback=fallback)
 
 
 def points_to_bbox(points):